@@ -64,6 +64,15 @@ STATIC_CONFIG: Dict[str, Any] = {
             'metadata_cache_seconds': 5,
             'temp_prefix': '.api-temp-',
         },
+        'headers': {
+            'continuation_token': 'X-Mrsm-Continuation-Token',
+        },
+        'media_types': {
+            'json': 'application/json',
+            'arrow': 'application/vnd.apache.arrow.stream',
+            'parquet': 'application/vnd.apache.parquet',
+            'ndjson': 'application/x-ndjson',
+        },
     },
     'sql': {
         'internal_schema': '_mrsm_internal',
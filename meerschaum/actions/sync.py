@@ -76,6 +76,7 @@ def _pipes_lap(
     from meerschaum.connectors.parse import parse_instance_keys
     from meerschaum.utils.packages import venv_exec
     from meerschaum.utils.process import poll_process
+    from meerschaum.config import get_config
     dill = attempt_import('dill')
 
     rich_table, rich_text, rich_box = attempt_import(
@@ -98,17 +99,30 @@ def _pipes_lap(
         'check_rowcounts_only': check_rowcounts_only,
         'skip_hooks': skip_hooks,
     })
-    locks = {'remaining_count': Lock(), 'results_dict': Lock(), 'pipes_threads': Lock(),}
+    locks = {
+        'remaining_count': Lock(),
+        'results_dict': Lock(),
+        'pipes_threads': Lock(),
+        'active_count': Lock(),
+    }
     pipes = get_pipes(
-        as_list=True, method='registered', debug=debug, mrsm_instance=mrsm_instance, **kw
+        as_list=True,
+        method='registered',
+        prefetch=True,
+        debug=debug,
+        mrsm_instance=mrsm_instance,
+        **kw
     )
     remaining_count = len(pipes)
     instance_connector = parse_instance_keys(mrsm_instance, debug=debug)
+    cores = multiprocessing.cpu_count()
+
+    ### Grow the instance's pool to fit the workers (see `SQLConnector.autosize_pool()`).
     conns = (
-        instance_connector.engine.pool.size() if instance_connector.type == 'sql'
+        instance_connector.autosize_pool(workers or cores, debug=debug)
+        if instance_connector.type == 'sql'
         else len(pipes)
     )
-    cores = multiprocessing.cpu_count()
     pipes_queue = queue.Queue(remaining_count)
     for pipe in pipes:
         pipes_queue.put_nowait(pipe)
@@ -140,13 +154,56 @@ def _pipes_lap(
         _progress.add_task(_task_label(len(pipes)), start=True, total=len(pipes))
     ) if _progress is not None else None
 
+    ### Syncs in subprocesses (with `timeout_seconds`) do not use this process's pool.
+    pool_config = get_config('system', 'connectors', 'sql', 'pool', warn=False) or {}
+    throttle_admission = (
+        instance_connector.type == 'sql'
+        and timeout_seconds is None
+        and pool_config.get('throttle', True)
+    )
+    throttle_wait_seconds = pool_config.get('throttle_wait_seconds', 0.5)
+    throttle_sleep_seconds = pool_config.get('throttle_sleep_seconds', 0.25)
+    active_count = 0
+
+    def wait_for_admission() -> bool:
+        """
+        Hold back a worker while checkouts from the instance's pool wait too long.
+        At least one sync is always admitted.
+        """
+        nonlocal active_count
+        while not stop_event.is_set() and not stop_requested():
+            with locks['active_count']:
+                if (
+                    not throttle_admission
+                    or active_count == 0
+                    or (
+                        instance_connector.get_pool_metrics()['wait_seconds']
+                        <= throttle_wait_seconds
+                    )
+                ):
+                    active_count += 1
+                    return True
+            time.sleep(throttle_sleep_seconds)
+        return False
+
+    def release_admission():
+        nonlocal active_count
+        with locks['active_count']:
+            active_count -= 1
+
     def worker_fn():
         while not stop_event.is_set() and not stop_requested():
+            if not wait_for_admission():
+                return
             try:
                 pipe = pipes_queue.get_nowait()
             except queue.Empty:
+                release_admission()
                 return
-            return_tuple = sync_pipe(pipe)
+            try:
+                return_tuple = sync_pipe(pipe)
+            finally:
+                release_admission()
             results_dict[pipe] = return_tuple
 
             if not nopretty:
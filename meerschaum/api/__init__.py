@@ -307,6 +307,20 @@ app = fastapi.FastAPI(
 HTMLResponse = fastapi_responses.HTMLResponse
 Request = fastapi.Request
 
+compression_config = sys_config.get('compression', None) or {}
+if compression_config.get('enabled', True):
+    from meerschaum.api._compression import CompressionMiddleware
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=compression_config.get('minimum_size', 1024),
+        levels=compression_config.get('levels', None),
+        max_decompressed_size=(
+            int(compression_config['max_decompressed_mb'] * 1024 * 1024)
+            if compression_config.get('max_decompressed_mb', None)
+            else None
+        ),
+    )
+
 app.mount('/static', fastapi_staticfiles.StaticFiles(directory=paths.API_STATIC_PATH.as_posix()), name='static')
 
 _custom_kwargs = {'mrsm_instance'}
@@ -5,9 +5,11 @@
 Utility functions for the retrieval, caching, and response of chunk data.
 """
 
+import io
 import random
+import queue
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Generator, Any, Union, Optional, List
+from typing import Dict, Generator, Iterator, Any, Union, Optional, List
 
 import meerschaum as mrsm
 from meerschaum.api import get_cache_connector
@@ -65,3 +67,133 @@ def deallocate_expired_generators():
     Periodically delete chunk tokens with an expired ttl timestamp.
     """
     chunk_tokens = list(CHUNKS_TOKENS_GENERATORS)
+
+
+def generate_pipe_data_stream(
+    pipe: mrsm.Pipe,
+    data_format: str = 'json',
+    limit: Optional[int] = None,
+    date_format: str = 'iso',
+    date_unit: str = 'us',
+    double_precision: int = 15,
+    geometry_format: str = 'wkb_hex',
+    debug: bool = False,
+    **get_data_kwargs: Any
+) -> Iterator[bytes]:
+    """
+    Yield a pipe's data as each chunk is read, so a response never holds more than one chunk.
+
+    Parameters
+    ----------
+    pipe: mrsm.Pipe
+        The pipe whose data to stream.
+
+    data_format: str, default 'json'
+        If `'json'`, yield newline-delimited JSON (one document per row).
+        Otherwise, yield each chunk as its own Arrow IPC stream.
+
+    limit: Optional[int], default None
+        If provided, stop after this many rows.
+
+    get_data_kwargs: Any
+        Remaining keyword arguments are passed to `Pipe.get_data()`.
+
+    Returns
+    -------
+    An iterator of encoded chunks.
+    """
+    from meerschaum.utils.dataframe import to_json, df_to_bytes
+    num_rows = 0
+    chunks = pipe.get_data(as_iterator=True, limit=limit, debug=debug, **get_data_kwargs)
+    for chunk in (chunks or []):
+        if chunk is None or len(chunk) == 0:
+            continue
+        if limit is not None:
+            if num_rows >= limit:
+                break
+            chunk = chunk.head(limit - num_rows)
+        num_rows += len(chunk)
+
+        if data_format == 'json':
+            lines = to_json(
+                chunk,
+                orient='records',
+                lines=True,
+                date_format=date_format,
+                date_unit=date_unit,
+                double_precision=double_precision,
+                geometry_format=geometry_format,
+            )
+            yield (lines.rstrip('\n') + '\n').encode('utf-8')
+        else:
+            yield df_to_bytes(chunk, data_format='arrow', geometry_format=geometry_format)
+
+
+class QueueReader(io.RawIOBase):
+    """
+    A blocking, read-only file over a queue of byte strings (ended by `None`),
+    so that a worker thread may parse a request body while the event loop receives it.
+    """
+
+    def __init__(self, chunks_queue: queue.Queue):
+        self.chunks_queue = chunks_queue
+        self._buffer = b''
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            if self._eof:
+                return 0
+            data = self.chunks_queue.get()
+            if data is None:
+                self._eof = True
+                return 0
+            self._buffer = data
+
+        num_bytes = min(len(b), len(self._buffer))
+        b[:num_bytes] = self._buffer[:num_bytes]
+        self._buffer = self._buffer[num_bytes:]
+        return num_bytes
+
+
+def generate_uploaded_chunks(
+    reader: io.RawIOBase,
+    data_format: str = 'ndjson',
+    chunksize: int = 100_000,
+) -> Iterator['pd.DataFrame']:
+    """
+    Yield DataFrames from a streamed upload as they are read.
+
+    Parameters
+    ----------
+    reader: io.RawIOBase
+        The file from which to read the request body (e.g. a `QueueReader`).
+
+    data_format: str, default 'ndjson'
+        Either `'arrow'` (consecutive Arrow IPC streams, one per chunk)
+        or `'ndjson'` (newline-delimited JSON, yielded every `chunksize` rows).
+
+    Returns
+    -------
+    An iterator of DataFrames.
+    """
+    from meerschaum.utils.dataframe import df_from_bytes
+    reader = io.BufferedReader(reader)
+    if data_format == 'arrow':
+        while reader.peek(1):
+            yield df_from_bytes(reader, data_format='arrow')
+        return
+
+    lines = []
+    for line in reader:
+        if not line.strip():
+            continue
+        lines.append(line)
+        if len(lines) >= chunksize:
+            yield df_from_bytes(lines, data_format='ndjson')
+            lines = []
+    if lines:
+        yield df_from_bytes(lines, data_format='ndjson')
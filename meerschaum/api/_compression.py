@@ -0,0 +1,201 @@
+#! /usr/bin/env python3
+# vim:fenc=utf-8
+
+"""
+Compress responses and decompress request bodies (see `meerschaum.utils.compression`).
+"""
+
+from typing import Any, Callable, Dict, Optional, List
+
+import meerschaum as mrsm
+from meerschaum.utils.compression import (
+    get_supported_encodings,
+    choose_encoding,
+    compress_bytes,
+    StreamCompressor,
+    StreamDecompressor,
+    DecompressedSizeExceeded,
+)
+
+fastapi = mrsm.attempt_import('fastapi', lazy=False)
+from starlette.datastructures import Headers, MutableHeaders
+
+### Bodies of these media types are already compressed.
+UNCOMPRESSED_MEDIA_TYPES_PREFIXES = (
+    'application/vnd.apache.parquet',
+    'application/zip',
+    'application/gzip',
+    'application/zstd',
+    'image/',
+    'audio/',
+    'video/',
+    'text/event-stream',
+)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware which decompresses `Content-Encoding: zstd` (or `gzip`) request bodies
+    and compresses responses of at least `minimum_size` bytes
+    with the client's preferred encoding from its `Accept-Encoding` header.
+
+    Every response includes an `Accept-Encoding` header
+    so that clients know which encodings they may send (RFC 7694).
+    Streaming responses are compressed piece by piece.
+
+    Request bodies which decompress to more than `max_decompressed_size` bytes
+    are rejected with `413 Content Too Large`.
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        minimum_size: int = 1024,
+        levels: Optional[Dict[str, int]] = None,
+        max_decompressed_size: Optional[int] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = levels or {}
+        self.max_decompressed_size = max_decompressed_size
+        self.encodings: List[str] = get_supported_encodings()
+        self.accept_encoding_header = ', '.join(self.encodings).encode('latin-1')
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        content_encoding = request_headers.get('content-encoding', '').strip().lower()
+        if content_encoding and content_encoding != 'identity':
+            if content_encoding not in self.encodings:
+                await self._send_unsupported_encoding(content_encoding, send)
+                return
+            scope, receive = self._decompress_request(scope, receive, content_encoding)
+
+        response_encoding = choose_encoding(
+            request_headers.get('accept-encoding', None),
+            self.encodings,
+        )
+        await self.app(scope, receive, self._wrap_send(send, response_encoding))
+
+    def _decompress_request(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable,
+        encoding: str,
+    ):
+        """
+        Return the scope (without the encoding and length headers) and `receive` callable
+        of the decompressed request.
+        """
+        decompressor = StreamDecompressor(encoding, max_size=self.max_decompressed_size)
+        scope = dict(scope)
+        scope['headers'] = [
+            (key, val)
+            for key, val in scope['headers']
+            if key.lower() not in (b'content-encoding', b'content-length')
+        ]
+
+        async def receive_decompressed() -> Dict[str, Any]:
+            message = await receive()
+            if message['type'] != 'http.request':
+                return message
+            ### Raise an `HTTPException` so that FastAPI responds with 413 (rather than 400 or 500)
+            ### from wherever the route reads the body.
+            try:
+                body = decompressor.decompress(message.get('body', b''))
+                if not message.get('more_body', False):
+                    body += decompressor.flush()
+            except DecompressedSizeExceeded as e:
+                raise fastapi.HTTPException(status_code=413, detail=str(e))
+            return {**message, 'body': body}
+
+        return scope, receive_decompressed
+
+    def _wrap_send(self, send: Callable, encoding: Optional[str]) -> Callable:
+        """
+        Return a `send` callable which compresses the response body with `encoding`.
+        """
+        start_message: Optional[Dict[str, Any]] = None
+        compressor: Optional[StreamCompressor] = None
+        passthrough = encoding is None
+
+        async def send_compressed(message: Dict[str, Any]) -> None:
+            nonlocal start_message, compressor, passthrough
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(raw=list(message.get('headers', [])))
+                headers['Accept-Encoding'] = self.accept_encoding_header.decode('latin-1')
+                message = {**message, 'headers': headers.raw}
+                if passthrough:
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if message['type'] != 'http.response.body' or passthrough:
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+            ### The first piece of the body decides whether to compress.
+            if start_message is not None:
+                headers = MutableHeaders(raw=start_message['headers'])
+                media_type = headers.get('content-type', '').lower()
+                skip = (
+                    'content-encoding' in headers
+                    or media_type.startswith(UNCOMPRESSED_MEDIA_TYPES_PREFIXES)
+                    or (not more_body and len(body) < self.minimum_size)
+                )
+                if skip:
+                    passthrough = True
+                    await send(start_message)
+                    start_message = None
+                    await send(message)
+                    return
+
+                headers['Content-Encoding'] = encoding
+                headers.add_vary_header('Accept-Encoding')
+                if not more_body:
+                    body = compress_bytes(body, encoding, level=self.levels.get(encoding, None))
+                    headers['Content-Length'] = str(len(body))
+                    await send(start_message)
+                    start_message = None
+                    await send({**message, 'body': body})
+                    return
+
+                del headers['Content-Length']
+                compressor = StreamCompressor(encoding, level=self.levels.get(encoding, None))
+                await send(start_message)
+                start_message = None
+
+            if compressor is None:
+                await send(message)
+                return
+
+            body = compressor.compress(body) if body else b''
+            if not more_body:
+                body += compressor.finish()
+            await send({**message, 'body': body})
+
+        return send_compressed
+
+    async def _send_unsupported_encoding(self, encoding: str, send: Callable) -> None:
+        """
+        Respond with `415 Unsupported Media Type` and the encodings which are supported.
+        """
+        import json
+        body = json.dumps({'detail': f"Unsupported content encoding '{encoding}'."}).encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': 415,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode('latin-1')),
+                (b'accept-encoding', self.accept_encoding_header),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})
@@ -114,6 +114,7 @@ async def shutdown():
     if debug:
         dprint("Closing connection...")
     if get_api_connector().type == 'sql':
+        await get_api_connector().dispose_async_engines()
         get_api_connector().engine.dispose()
 
     stop_check_jobs_thread()
@@ -13,7 +13,11 @@ import inspect
 from typing import List, Optional, Union
 
 from meerschaum.api import endpoints, CHECK_UPDATE, no_auth, debug
-from meerschaum.api._tokens import optional_token, get_token_from_authorization
+from meerschaum.api._tokens import (
+    optional_token,
+    get_token_from_authorization,
+    TOKENS_CACHE_CONFIG,
+)
 from meerschaum._internal.static import STATIC_CONFIG
 from meerschaum.utils.packages import attempt_import
 from meerschaum.core import User, Token
@@ -136,9 +140,14 @@ def ScopedAuth(scopes: List[str]):
         is_long_lived = authorization and 'mrsm-key:' in authorization
 
         current_scopes = []
-        ### For long-lived API tokens, always hit the database.
+        ### For long-lived API tokens, hit the database unless the token was recently verified
+        ### (the tokens cache is invalidated whenever a token is edited through the API,
+        ### but edits made elsewhere, e.g. via the CLI, apply after `api:tokens:cache:ttl_seconds`).
         if is_long_lived:
-            current_scopes = user_or_token.get_scopes(refresh=True, debug=debug)
+            current_scopes = user_or_token.get_scopes(
+                refresh=(not TOKENS_CACHE_CONFIG.get('enabled', True)),
+                debug=debug,
+            )
         
         ### For JWTs, trust the scopes in the token.
         else:
@@ -6,8 +6,13 @@ Define the authentication logic for Meerschaum Tokens.
 """
 
 import base64
+import hashlib
+import hmac
+import threading
+import time
 import uuid
-from typing import Optional, Union, List
+from collections import OrderedDict
+from typing import Optional, Union, List, Tuple, Dict, Any
 from datetime import datetime, timezone
 
 from fastapi import Depends, HTTPException, Request
@@ -17,19 +22,122 @@ from starlette import status
 import meerschaum as mrsm
 from meerschaum.api import (
     get_api_connector,
+    get_cache_connector,
     debug,
 )
 from meerschaum.core import Token, User
 from meerschaum.core.User import verify_password
+from meerschaum.utils.warnings import warn
 
 
 http_bearer = HTTPBearer(auto_error=False, scheme_name="APIKey")
 
+TOKENS_CACHE_CONFIG: Dict[str, Any] = mrsm.get_config('api', 'tokens', 'cache')
+TOKEN_GENERATION_KEY_TEMPLATE: str = 'mrsm_token_generation:{token_id}'
+
+### Map keyed hashes of credentials to verified tokens, their cache times, and generations.
+_tokens_cache: 'OrderedDict[str, Tuple[Token, float, Union[str, None]]]' = OrderedDict()
+_tokens_cache_lock = threading.Lock()
+
+
+def get_credential_cache_key(credential: str) -> str:
+    """
+    Return the HMAC-SHA256 of a presented credential (keyed by the server secret),
+    so that the tokens cache never holds secrets.
+    """
+    from meerschaum.api._oauth2 import SECRET
+    return hmac.new(SECRET, credential.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def get_token_generation(token_id: uuid.UUID) -> Union[str, None]:
+    """
+    Return the token's generation from the cache connector (shared across workers),
+    which changes whenever the token is edited, invalidated, or deleted.
+    Without a cache connector, return `None`.
+    """
+    conn = get_cache_connector()
+    if conn is None:
+        return None
+    return conn.get(TOKEN_GENERATION_KEY_TEMPLATE.format(token_id=token_id))
+
+
+def get_cached_token(cache_key: str) -> Union[Token, None]:
+    """
+    Return the verified token cached under `cache_key`
+    if it has not expired or been invalidated since.
+    """
+    with _tokens_cache_lock:
+        entry = _tokens_cache.get(cache_key, None)
+        if entry is None:
+            return None
+        token, cached_at, generation = entry
+        if (time.monotonic() - cached_at) > TOKENS_CACHE_CONFIG.get('ttl_seconds', 60):
+            _tokens_cache.pop(cache_key, None)
+            return None
+        _tokens_cache.move_to_end(cache_key)
+
+    try:
+        current_generation = get_token_generation(token.id)
+    except Exception as e:
+        warn(f"Failed to read the generation of token '{token.id}':\n{e}", stack=False)
+        return None
+
+    if current_generation != generation:
+        with _tokens_cache_lock:
+            _tokens_cache.pop(cache_key, None)
+        return None
+
+    return token
+
+
+def cache_token(cache_key: str, token: Token, generation: Union[str, None]) -> None:
+    """
+    Cache a verified token, evicting the least recently used tokens
+    beyond `api:tokens:cache:max_entries`.
+    """
+    max_entries = TOKENS_CACHE_CONFIG.get('max_entries', 10_000)
+    with _tokens_cache_lock:
+        _tokens_cache[cache_key] = (token, time.monotonic(), generation)
+        _tokens_cache.move_to_end(cache_key)
+        while len(_tokens_cache) > max_entries:
+            _tokens_cache.popitem(last=False)
+
+
+def invalidate_cached_token(token_id: Union[uuid.UUID, str]) -> None:
+    """
+    Remove a token from this worker's cache and bump its generation in the cache connector
+    so that other workers stop trusting their cached copies.
+    """
+    token_id = uuid.UUID(str(token_id))
+    with _tokens_cache_lock:
+        cache_keys = [
+            cache_key
+            for cache_key, (token, _, _) in _tokens_cache.items()
+            if token.id == token_id
+        ]
+        for cache_key in cache_keys:
+            del _tokens_cache[cache_key]
+
+    conn = get_cache_connector()
+    if conn is None:
+        return
+
+    ### An expired generation only causes cache misses, so keep it no longer than the TTL.
+    generation_key = TOKEN_GENERATION_KEY_TEMPLATE.format(token_id=token_id)
+    try:
+        conn.client.incr(generation_key)
+        conn.client.expire(generation_key, int(TOKENS_CACHE_CONFIG.get('ttl_seconds', 60)) * 2)
+    except Exception as e:
+        warn(f"Failed to invalidate token '{token_id}' across workers:\n{e}", stack=False)
+
 
 def get_token_from_authorization(authorization: str) -> Token:
     """
     Helper function to decode and verify a token from credentials.
     Raises HTTPException on failure.
+
+    Verified tokens are cached for `api:tokens:cache:ttl_seconds`
+    (keyed by a hash of the credential) to skip the database lookup and secret hashing.
     """
     if authorization.startswith('mrsm-key:'):
         authorization = authorization[len('mrsm-key:'):]
@@ -44,6 +152,30 @@ def get_token_from_authorization(authorization: str) -> Token:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cache_key = (
+        get_credential_cache_key(authorization)
+        if TOKENS_CACHE_CONFIG.get('enabled', True)
+        else None
+    )
+    if cache_key is not None:
+        token = get_cached_token(cache_key)
+        if token is not None:
+            if token.get_expiration_status(debug=debug):
+                invalidate_cached_token(token.id)
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token has expired.",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            return token
+
+        ### Read the generation before the token so a concurrent invalidation is not missed.
+        try:
+            generation = get_token_generation(token_id)
+        except Exception as e:
+            warn(f"Failed to read the generation of token '{token_id}':\n{e}", stack=False)
+            cache_key = None
+
     conn = get_api_connector()
     token = conn.get_token(token_id)
 
@@ -68,6 +200,9 @@ def get_token_from_authorization(authorization: str) -> Token:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if cache_key is not None:
+        cache_token(cache_key, token, generation)
+
     return token
 
 
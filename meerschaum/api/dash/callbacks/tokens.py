@@ -19,6 +19,7 @@ import dash.dcc as dcc
 import meerschaum as mrsm
 from meerschaum.api import get_api_connector, debug
 from meerschaum.api.dash import dash_app
+from meerschaum.api._tokens import invalidate_cached_token
 from meerschaum.api.dash.sessions import get_user_from_session
 from meerschaum.api.dash.components import alert_from_success_tuple, build_cards_grid
 from meerschaum.api.dash.tokens import (
@@ -302,6 +303,7 @@ def edit_token_submit_button_click(
     )
 
     success, msg = token.edit(debug=debug)
+    invalidate_cached_token(token.id)
     if not success:
         return dash.no_update, alert_from_success_tuple((success, msg))
 
@@ -355,6 +357,7 @@ def invalidate_token_confirm_click(n_clicks: int):
     )
 
     success, msg = token.invalidate(debug=debug)
+    invalidate_cached_token(token.id)
     if not success:
         return dash.no_update, dash.no_update, alert_from_success_tuple((success, msg))
 
@@ -385,6 +388,7 @@ def delete_token_confirm_click(n_clicks: int):
     )
 
     success, msg = token.delete(debug=debug)
+    invalidate_cached_token(token.id)
     if not success:
         return dash.no_update, dash.no_update, alert_from_success_tuple((success, msg))
 
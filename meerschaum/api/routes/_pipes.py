@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import io
 import json
+import queue
+import asyncio
 from datetime import datetime, timedelta
 
 import meerschaum as mrsm
@@ -41,24 +43,96 @@ from meerschaum.api.models import (
     FetchPipesKeysResponseModel,
     SyncPipeRequestModel,
 )
-from meerschaum.api._chunks import generate_chunks_cursor_token
+from meerschaum.api._chunks import (
+    generate_chunks_cursor_token,
+    generate_pipe_data_stream,
+    generate_uploaded_chunks,
+    QueueReader,
+)
 from meerschaum.utils.packages import attempt_import
-from meerschaum.utils.dataframe import to_json
-from meerschaum.utils.dtypes import are_dtypes_equal, json_serialize_value
+from meerschaum.utils.dataframe import to_json, df_to_bytes, df_from_bytes
+from meerschaum.utils.dtypes import are_dtypes_equal, json_serialize_value, round_time
 from meerschaum.utils.misc import (
     is_pipe_registered,
     is_int,
     replace_pipes_in_dict,
     string_to_dict,
 )
+from meerschaum.utils.pipes import get_keyset_token, parse_keyset_token
 from meerschaum.connectors.sql.tables import get_tables
+from meerschaum._internal.static import STATIC_CONFIG
 
 fastapi_responses = attempt_import('fastapi.responses', lazy=False)
+run_in_threadpool = attempt_import('fastapi.concurrency', lazy=False).run_in_threadpool
 StreamingResponse = fastapi_responses.StreamingResponse
 pipes_endpoint = endpoints['pipes']
 pd = attempt_import('pandas', lazy=False)
 
 MAX_RESPONSE_ROW_LIMIT: int = mrsm.get_config('api', 'data', 'max_response_row_limit')
+CONTINUATION_TOKEN_HEADER: str = STATIC_CONFIG['api']['headers']['continuation_token']
+UPLOAD_QUEUE_DEPTH: int = mrsm.get_config('api', 'data', 'upload_queue_depth')
+MEDIA_TYPES: Dict[str, str] = STATIC_CONFIG['api']['media_types']
+
+
+def get_supported_data_formats() -> List[str]:
+    """
+    Return the data formats this instance supports, in order of preference.
+    The binary formats require `pyarrow`.
+    """
+    from meerschaum.utils.packages import is_installed
+    if is_installed('pyarrow', venv=None):
+        return ['arrow', 'parquet', 'ndjson', 'json']
+    return ['ndjson', 'json']
+
+
+def get_media_type_data_format(media_type: Optional[str]) -> str:
+    """
+    Return the supported data format named in an `Accept` or `Content-Type` header,
+    falling back to `'json'`.
+    """
+    media_types = [
+        part.split(';', maxsplit=1)[0].strip().lower()
+        for part in (media_type or '').split(',')
+    ]
+    for data_format in get_supported_data_formats():
+        if MEDIA_TYPES[data_format] in media_types:
+            return data_format
+    return 'json'
+
+
+async def sync_pipe_stream(
+    pipe: mrsm.Pipe,
+    request: fastapi.Request,
+    data_format: str,
+    **kwargs: Any
+) -> mrsm.SuccessTuple:
+    """
+    Sync a streamed request body as a generator of chunks while it is being received.
+    At most `api:data:upload_queue_depth` unread pieces of the body are held in memory.
+    """
+    chunksize = mrsm.get_config('system', 'connectors', 'sql', 'chunksize')
+    chunks_queue = queue.Queue(maxsize=UPLOAD_QUEUE_DEPTH)
+    chunks = generate_uploaded_chunks(
+        QueueReader(chunks_queue),
+        data_format=data_format,
+        chunksize=chunksize,
+    )
+    sync_task = asyncio.ensure_future(run_in_threadpool(pipe.sync, chunks, **kwargs))
+
+    async def put(data: Union[bytes, None]) -> bool:
+        while not sync_task.done():
+            try:
+                chunks_queue.put_nowait(data)
+                return True
+            except queue.Full:
+                await asyncio.sleep(0.01)
+        return False
+
+    async for data in request.stream():
+        if data and not await put(data):
+            break
+    await put(None)
+    return await sync_task
 
 
 @app.post(
@@ -184,12 +258,18 @@ async def fetch_pipes_keys(
     When `as_dict` is `True`, return a dictionary mapping pipe IDs (as strings) to key lists.
     Otherwise return a list of 3-tuples for backward compatibility.
     """
-    keys = get_api_connector(instance_keys).fetch_pipes_keys(
-        connector_keys=json.loads(connector_keys),
-        metric_keys=json.loads(metric_keys),
-        location_keys=json.loads(location_keys),
-        tags=json.loads(tags),
-        params=json.loads(params),
+    conn = get_api_connector(instance_keys)
+    fetch_kwargs = {
+        'connector_keys': json.loads(connector_keys),
+        'metric_keys': json.loads(metric_keys),
+        'location_keys': json.loads(location_keys),
+        'tags': json.loads(tags),
+        'params': json.loads(params),
+    }
+    keys = (
+        await conn.fetch_pipes_keys_async(**fetch_kwargs)
+        if hasattr(conn, 'fetch_pipes_keys_async')
+        else await run_in_threadpool(conn.fetch_pipes_keys, **fetch_kwargs)
     )
     if isinstance(keys, dict):
         if as_dict:
@@ -201,6 +281,17 @@ async def fetch_pipes_keys(
     return [(t[0], t[1], t[2]) for t in keys_list]
 
 
+@app.get(pipes_endpoint + '/data_formats', tags=['Pipes: Data'])
+def get_data_formats(
+    curr_user = fastapi.Security(ScopedAuth(['pipes:read'])),
+) -> List[str]:
+    """
+    Return the formats in which this instance may send and receive pipes' data
+    (negotiated with the `Accept` and `Content-Type` headers of the `data` endpoints).
+    """
+    return get_supported_data_formats()
+
+
 @app.get(pipes_endpoint, tags=['Pipes: Attributes'])
 async def get_pipes(
     connector_keys: str = "",
@@ -325,7 +416,7 @@ async def get_pipe_by_connector_and_metric_and_location(
     pipes_endpoint + '/{connector_keys}/{metric_key}/{location_key}/sync_time',
     tags=['Pipes: Data'],
 )
-def get_sync_time(
+async def get_sync_time(
     connector_keys: str,
     metric_key: str,
     location_key: str,
@@ -342,12 +433,27 @@ def get_sync_time(
     """
     if location_key == '[None]':
         location_key = None
-    pipe = get_pipe(connector_keys, metric_key, location_key, instance_keys)
-    sync_time = pipe.get_sync_time(
-        params=params,
-        newest=newest,
-        round_down=round_down,
+    pipe = await run_in_threadpool(get_pipe, connector_keys, metric_key, location_key, instance_keys)
+    conn = pipe.instance_connector
+    ### A sync time prefetched by `get_pipes(prefetch=True)` is only read by `Pipe.get_sync_time()`.
+    use_async = (
+        hasattr(conn, 'get_sync_time_async')
+        and pipe.columns.get('datetime', None)
+        and pipe._get_cached_value('_prefetched_sync_time', debug=debug) is None
     )
+    if use_async:
+        sync_time = await conn.get_sync_time_async(pipe, params=params, newest=newest, debug=debug)
+        if round_down and isinstance(sync_time, datetime):
+            sync_time = round_time(sync_time, timedelta(minutes=1))
+        ### Coerce the timezone like `Pipe.get_sync_time()`.
+        sync_time = pipe.parse_date_bounds(sync_time)
+    else:
+        sync_time = await run_in_threadpool(
+            pipe.get_sync_time,
+            params=params,
+            newest=newest,
+            round_down=round_down,
+        )
     if isinstance(sync_time, datetime):
         sync_time = sync_time.isoformat()
     return sync_time
@@ -377,6 +483,15 @@ def get_sync_time(
                 'text/plain': {
                     'example': 'a:1,b:2',
                 },
+                STATIC_CONFIG['api']['media_types']['arrow']: {
+                    'schema': {'type': 'string', 'format': 'binary'},
+                },
+                STATIC_CONFIG['api']['media_types']['parquet']: {
+                    'schema': {'type': 'string', 'format': 'binary'},
+                },
+                STATIC_CONFIG['api']['media_types']['ndjson']: {
+                    'example': '{"timestamp": "2026-01-01", "id": 1, "value": 100.1}\n',
+                },
             },
             'required': True,
         },
@@ -393,19 +508,68 @@ async def sync_pipe(
     force: bool = False,
     workers: Optional[int] = None,
     columns: Optional[str] = None,
+    stream: bool = False,
     curr_user = fastapi.Security(ScopedAuth(['pipes:write'])),
 ) -> mrsm.SuccessTuple:
     """
     Add data to an existing Pipe.
     See [`meerschaum.Pipe.sync`](https://docs.meerschaum.io/meerschaum.html#Pipe.sync).
+
+    The body may be JSON, simple lines, an Arrow IPC stream
+    (`Content-Type: application/vnd.apache.arrow.stream`),
+    a Parquet file (`Content-Type: application/vnd.apache.parquet`),
+    or newline-delimited JSON (`Content-Type: application/x-ndjson`).
+
+    If `stream` is `True`, the body (consecutive Arrow IPC streams or newline-delimited JSON,
+    e.g. sent with chunked transfer encoding) is synced chunk by chunk as it is received.
     """
+    data_format = get_media_type_data_format(request.headers.get('content-type', None))
+    if stream:
+        if data_format not in ('arrow', 'ndjson'):
+            raise fastapi.HTTPException(
+                status_code=400,
+                detail="Streamed data must be Arrow IPC streams or newline-delimited JSON.",
+            )
+        pipe = await run_in_threadpool(
+            get_pipe, connector_keys, metric_key, location_key, instance_keys, refresh=True,
+        )
+        if pipe.target in ('mrsm_users', 'mrsm_plugins', 'mrsm_pipes', 'mrsm_tokens'):
+            raise fastapi.HTTPException(
+                status_code=409,
+                detail=f"Cannot sync data to protected table '{pipe.target}'.",
+            )
+        if not pipe.columns and columns is not None:
+            pipe.columns = json.loads(columns)
+
+        return await sync_pipe_stream(
+            pipe,
+            request,
+            data_format,
+            debug=debug,
+            check_existing=check_existing,
+            blocking=blocking,
+            force=force,
+            workers=workers,
+        )
+
     body = await request.body()
-    try:
-        data = json.loads(body)
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        data = body.decode('utf-8', errors='replace')
+    if data_format != 'json':
+        try:
+            data = await run_in_threadpool(df_from_bytes, body, data_format)
+        except Exception as e:
+            raise fastapi.HTTPException(
+                status_code=400,
+                detail=f"Failed to parse {data_format} data:\n{e}",
+            )
+        if len(data) == 0:
+            return True, "No data to sync."
+    else:
+        try:
+            data = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            data = body.decode('utf-8', errors='replace')
 
-    if not data:
+    if data_format == 'json' and not data:
         return True, "No data to sync."
 
     if isinstance(data, str) and data.strip() and not data.lstrip()[0] not in ('{', '['):
@@ -415,13 +579,15 @@ async def sync_pipe(
         except Exception:
             data = None
 
-    if not data:
+    if data is None or (data_format == 'json' and not data):
         raise fastapi.HTTPException(
             status=400,
             detail="Cannot sync given data.",
         )
 
-    pipe = get_pipe(connector_keys, metric_key, location_key, instance_keys, refresh=True)
+    pipe = await run_in_threadpool(
+        get_pipe, connector_keys, metric_key, location_key, instance_keys, refresh=True,
+    )
     if pipe.target in ('mrsm_users', 'mrsm_plugins', 'mrsm_pipes', 'mrsm_tokens'):
         raise fastapi.HTTPException(
             status_code=409,
@@ -431,7 +597,8 @@ async def sync_pipe(
     if not pipe.columns and columns is not None:
         pipe.columns = json.loads(columns)
 
-    success, msg = pipe.sync(
+    success, msg = await run_in_threadpool(
+        pipe.sync,
         data,
         debug=debug,
         check_existing=check_existing,
@@ -446,18 +613,21 @@ async def sync_pipe(
     pipes_endpoint + '/{connector_keys}/{metric_key}/{location_key}/data',
     tags=['Pipes: Data'],
 )
-def get_pipe_data(
+async def get_pipe_data(
     connector_keys: str,
     metric_key: str,
     location_key: str,
+    request: fastapi.Request,
     instance_keys: Optional[str] = None,
     select_columns: Optional[str] = None,
     omit_columns: Optional[str] = None,
     begin: Union[str, int, None] = None,
     end: Union[str, int, None] = None,
     params: Optional[str] = None,
-    limit: int = MAX_RESPONSE_ROW_LIMIT,
+    limit: Optional[int] = None,
     order: str = 'asc', 
+    after: Optional[str] = None,
+    stream: bool = False,
     date_format: str = 'iso',
     date_unit: str = 'us',
     double_precision: int = 15,
@@ -470,12 +640,25 @@ def get_pipe_data(
 
     Note that `select_columns`, `omit_columns`, and `params` are JSON-encoded strings.
 
+    The data are sent as JSON unless the `Accept` header requests an Arrow IPC stream
+    (`application/vnd.apache.arrow.stream`) or a Parquet file (`application/vnd.apache.parquet`).
+
     Parameters
     ----------
     instance_keys: Optional[str], default None
         The connector key to the instance on which the pipe is registered.
         Defaults to the configured value for `meerschaum:api_instance`.
 
+    after: Optional[str], default None
+        The continuation token from the previous page's `X-Mrsm-Continuation-Token` header.
+        A full page (i.e. `limit` rows) includes this header with the token for the next page.
+
+    stream: bool, default False
+        If `True`, stream the data chunk by chunk (not capped by `api:data:max_response_row_limit`)
+        as newline-delimited JSON or, if the `Accept` header requests a binary format,
+        as consecutive Arrow IPC streams (one per chunk).
+        Streams may not be combined with `after`.
+
     date_format: str, default 'iso'
         Serialzation format for datetime values.
         Accepted values are `'iso`' (ISO8601) and `'epoch'` (epoch milliseconds).
@@ -542,9 +725,23 @@ def get_pipe_data(
             detail="Omitted columns must be a JSON-encoded list.",
         )
 
-    pipe = get_pipe(connector_keys, metric_key, location_key, instance_keys)
+    if after is not None:
+        if stream:
+            raise fastapi.HTTPException(
+                status_code=400,
+                detail="Cannot stream data after a continuation token.",
+            )
+        try:
+            parse_keyset_token(after)
+        except ValueError as e:
+            raise fastapi.HTTPException(status_code=400, detail=str(e))
+
+    pipe = await run_in_threadpool(get_pipe, connector_keys, metric_key, location_key, instance_keys)
     begin, end = pipe.parse_date_bounds(begin, end)
-    if not is_pipe_registered(pipe, pipes(instance_keys, refresh=True)):
+    is_registered = await run_in_threadpool(
+        lambda: is_pipe_registered(pipe, pipes(instance_keys, refresh=True))
+    )
+    if not is_registered:
         raise fastapi.HTTPException(
             status_code=409,
             detail="Pipe must be registered with the datetime column specified."
@@ -556,32 +753,79 @@ def get_pipe_data(
             detail=f"Cannot retrieve data from protected table '{pipe.target}'.",
         )
 
-    df = pipe.get_data(
-        select_columns=_select_columns,
-        omit_columns=_omit_columns,
-        begin=begin,
-        end=end,
-        params=_params,
-        limit=min(limit, MAX_RESPONSE_ROW_LIMIT),
-        order=order,
-        debug=debug,
-    )
+    data_format = get_media_type_data_format(request.headers.get('accept', None))
+    if stream:
+        stream_format = 'arrow' if data_format in ('arrow', 'parquet') else 'json'
+        return StreamingResponse(
+            generate_pipe_data_stream(
+                pipe,
+                data_format=stream_format,
+                limit=limit,
+                date_format=date_format,
+                date_unit=date_unit,
+                double_precision=double_precision,
+                geometry_format=geometry_format,
+                select_columns=_select_columns,
+                omit_columns=_omit_columns,
+                begin=begin,
+                end=end,
+                params=_params,
+                order=order,
+                debug=debug,
+            ),
+            media_type=MEDIA_TYPES['ndjson' if stream_format == 'json' else stream_format],
+        )
+
+    limit = min(limit or MAX_RESPONSE_ROW_LIMIT, MAX_RESPONSE_ROW_LIMIT)
+    get_data_kwargs = {
+        'select_columns': _select_columns,
+        'omit_columns': _omit_columns,
+        'begin': begin,
+        'end': end,
+        'params': _params,
+        'limit': limit,
+        'order': order,
+        'debug': debug,
+        **({'after': after} if after is not None else {})
+    }
+    df = await pipe.get_data_async(**get_data_kwargs)
+
     if df is None:
         raise fastapi.HTTPException(
             status_code=400,
             detail="Could not fetch data with the given parameters.",
         )
 
-    json_content = to_json(
-        df,
-        date_format=date_format,
-        date_unit=date_unit,
-        geometry_format=geometry_format,
-        double_precision=double_precision,
+    content = (
+        await run_in_threadpool(
+            to_json,
+            df,
+            date_format=date_format,
+            date_unit=date_unit,
+            geometry_format=geometry_format,
+            double_precision=double_precision,
+            **({'lines': True} if data_format == 'ndjson' else {})
+        )
+        if data_format in ('json', 'ndjson')
+        else await run_in_threadpool(
+            df_to_bytes,
+            df,
+            data_format=data_format,
+            geometry_format=geometry_format,
+        )
     )
+
+    ### Only a full page may have rows after it.
+    headers = {}
+    if order and len(df) >= limit:
+        continuation_token = await run_in_threadpool(get_keyset_token, pipe, df)
+        if continuation_token is not None:
+            headers[CONTINUATION_TOKEN_HEADER] = continuation_token
+
     return fastapi.Response(
-        json_content,
-        media_type='application/json',
+        content,
+        media_type=MEDIA_TYPES[data_format],
+        headers=headers,
     )
 
 
@@ -961,7 +1205,7 @@ def create_metadata(
     pipes_endpoint + '/{connector_keys}/{metric_key}/{location_key}/rowcount',
     tags=['Pipes: Data'],
 )
-def get_pipe_rowcount(
+async def get_pipe_rowcount(
     connector_keys: str,
     metric_key: str,
     location_key: str,
@@ -998,13 +1242,27 @@ def get_pipe_rowcount(
         begin = int(begin)
     if is_int(end):
         end = int(end)
-    return get_pipe(connector_keys, metric_key, location_key, instance_keys).get_rowcount(
+    pipe = await run_in_threadpool(get_pipe, connector_keys, metric_key, location_key, instance_keys)
+    conn = pipe.instance_connector
+    if remote or not hasattr(conn, 'get_pipe_rowcount_async'):
+        return await run_in_threadpool(
+            pipe.get_rowcount,
+            begin=begin,
+            end=end,
+            params=params,
+            remote=remote,
+            debug=debug,
+        )
+
+    begin, end = pipe.parse_date_bounds(begin, end)
+    rowcount = await conn.get_pipe_rowcount_async(
+        pipe,
         begin=begin,
         end=end,
         params=params,
-        remote=remote,
         debug=debug,
     )
+    return rowcount or 0
 
 
 @app.get(
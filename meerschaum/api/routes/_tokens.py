@@ -26,7 +26,7 @@ from meerschaum.api.models import (
     GetTokenResponseModel,
     GetTokensResponseModel,
 )
-from meerschaum.api._tokens import get_current_token
+from meerschaum.api._tokens import get_current_token, invalidate_cached_token
 from meerschaum.utils.dtypes import json_serialize_value, value_is_null
 from meerschaum.utils.misc import is_uuid
 
@@ -183,7 +183,9 @@ def edit_token(
         label=token_model.label,
         instance=get_api_connector(),
     )
-    return token.edit(debug=debug)
+    edit_success_tuple = token.edit(debug=debug)
+    invalidate_cached_token(token.id)
+    return edit_success_tuple
 
 
 @app.post(
@@ -205,10 +207,12 @@ def invalidate_token(
         )
 
     _token_id = uuid.UUID(token_id)
-    return get_api_connector().invalidate_token(
+    invalidate_success_tuple = get_api_connector().invalidate_token(
         Token(id=_token_id, instance=get_api_connector()),
         debug=debug,
     )
+    invalidate_cached_token(_token_id)
+    return invalidate_success_tuple
 
 
 @app.delete(
@@ -230,7 +234,9 @@ def delete_token(
         )
 
     _token_id = uuid.UUID(token_id)
-    return get_api_connector().delete_token(
+    delete_success_tuple = get_api_connector().delete_token(
         Token(id=_token_id, instance=get_api_connector()),
         debug=debug,
     )
+    invalidate_cached_token(_token_id)
+    return delete_success_tuple
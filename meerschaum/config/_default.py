@@ -95,7 +95,14 @@ default_system_config = {
                 'timescaledb': True,
                 'timescaledb-ha': True,
                 'mssql': True,
+                'duckdb': True,
             },
+            ### Bulk insert into PostgreSQL flavors with `COPY ... FORMAT BINARY` ('binary')
+            ### or CSV text ('csv'). Types without a binary encoder fall back to CSV.
+            'copy_format': 'binary',
+            ### Load the staging tables of updates and upserts with the flavor's fastest loader
+            ### (COPY, OPENJSON, `executemany()`, or DuckDB registration) regardless of `bulk_insert`.
+            'stage_bulk_insert': True,
             'instance': {
                 'create_metadata_cache_minutes': 14400,
                 'stale_temporary_tables_minutes': 1440,
@@ -111,6 +118,53 @@ default_system_config = {
                 'max_partitions_per_sync': 10_000,
             },
             'chunksize': 100_000,
+            ### Read iterators and chunk hooks from server-side cursors
+            ### (PostgreSQL, MySQL, MariaDB, MSSQL, and Oracle).
+            'stream_results': True,
+            ### Split `get_pipe_data()` along the pipe's chunk interval (partition-aligned)
+            ### and read the ranges concurrently over the connection pool.
+            'parallel_reads': {
+                'enabled': False,
+                'workers': None,
+                'max_queries': 256,
+            },
+            ### Cache the parameterized SQL of repeated pipe queries (e.g. sync times, rowcounts)
+            ### per connector, keyed on the query kind, table, and shape of params.
+            'query_cache': {
+                'enabled': True,
+                'max_size': 10_000,
+            },
+            ### Batch sizes for fetching many pipes' metadata (`get_pipes(prefetch=True)`).
+            'prefetch': {
+                'tables_batchsize': 1000,
+                'sync_times_batchsize': 200,
+            },
+            ### Grow the pool for sync laps (within a share of the server's `max_connections`)
+            ### and hold back new syncs while checkouts wait longer than `throttle_wait_seconds`.
+            'pool': {
+                'autosize': True,
+                'max_connections_share': 0.5,
+                'metrics': True,
+                'throttle': True,
+                'throttle_wait_seconds': 0.5,
+                'throttle_sleep_seconds': 0.25,
+            },
+            ### Await API reads on an SQLAlchemy asyncio engine (when the async driver is installed).
+            'async_engine': {
+                'enabled': True,
+            },
+            ### Grow or shrink the insert chunksize of syncs (when `chunksize` is -1)
+            ### from the measured throughput. The learned size is cached per pipe.
+            'adaptive_chunksize': {
+                'enabled': True,
+                'min_chunksize': 1_000,
+                'max_chunksize': 1_000_000,
+                'step': 10_000,
+                'decrease_factor': 0.5,
+                'tolerance': 0.1,
+                'smoothing': 0.5,
+                'max_batch_mb': 256,
+            },
             'poolclass': 'sqlalchemy.pool.QueuePool',
             'create_engine': {
                 'method': 'multi',
@@ -121,6 +175,19 @@ default_system_config = {
             },
         },
         'api': {
+            'data_format': 'arrow',
+            'uploads': {
+                ### The number of chunks `sync_pipe()` keeps in flight.
+                'workers': 4,
+                ### Only chunks which could not reach the server are retried.
+                'retries': 0,
+                'retry_backoff_seconds': 0.5,
+            },
+            'compression': {
+                'enabled': True,
+                ### Only compress request bodies of at least this many bytes.
+                'minimum_size': 1024,
+            },
         },
     },
     'cli': {
@@ -187,16 +254,37 @@ default_api_config = {
     },
     'data': {
         'max_response_row_limit': 100_000,
+        ### The number of received pieces of a streamed upload to buffer while syncing.
+        'upload_queue_depth': 8,
         'chunks': {
             'ttl_seconds': 1800,
         },
     },
+    'compression': {
+        'enabled': True,
+        ### Only compress responses of at least this many bytes.
+        'minimum_size': 1024,
+        ### Reject request bodies which decompress to more than this (413).
+        'max_decompressed_mb': 1024,
+        'levels': {
+            'zstd': 3,
+            'gzip': 6,
+        },
+    },
     'endpoints': {
         'docs_in_production': True,
     },
     'tokens': {
         'valid_refresh_minutes': 60,
         'default_expiration_days': 366,
+        ### Skip re-verifying recently verified API keys.
+        ### Edits through the API evict cached keys, but scopes edited elsewhere
+        ### (e.g. via the CLI) may be stale for up to `ttl_seconds`.
+        'cache': {
+            'enabled': True,
+            'ttl_seconds': 60,
+            'max_entries': 10_000,
+        },
     },
     'permissions':       {
         'registration': {
@@ -246,6 +334,15 @@ default_pipes_config = {
     'sync': {
         'filter_params_index_limit': 250,
         'exists_cache_seconds': 60.0,
+        'prefetch_cache_seconds': 300.0,
+        'diff_method': 'merge',
+        'diff_backend': 'pandas',
+        ### The value hashes are only cached in memory, so the first sync in each process
+        ### fetches the digests and the full rows. Enable for long-running jobs.
+        'server_digests': False,
+        'chunks_queue_depth': 2,
+        'chunks_messages_limit': 100,
+        'schema_cache_size': 16,
     },
     'verify': {
         'max_chunks_syncs': 3,
@@ -256,6 +353,7 @@ default_pipes_config = {
     'dtypes': {
         'min_ratio_columns_changed_for_full_astype': 0.5,
         'columns_types_cache_seconds': 60.0,
+        'arrow': False,
     },
     'static': {
         'static_schema_cache_seconds': 3600.0,
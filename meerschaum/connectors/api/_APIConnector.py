@@ -28,6 +28,7 @@ class APIConnector(InstanceConnector):
 
     from ._request import (
         make_request,
+        _compress_request,
         get,
         post,
         put,
@@ -48,9 +49,11 @@ class APIConnector(InstanceConnector):
         fetch_pipes_keys,
         edit_pipe,
         sync_pipe,
+        _sync_pipe_stream,
         delete_pipe,
         delete_pipe_cache,
         get_pipe_data,
+        get_pipe_data_stream,
         get_pipe_id,
         get_pipe_attributes,
         get_sync_time,
@@ -68,6 +71,8 @@ class APIConnector(InstanceConnector):
         vacuum_pipe,
         analyze_pipe,
         partition_pipe,
+        get_data_formats,
+        get_data_format,
     )
     from ._fetch import fetch
     from ._plugins import (
@@ -200,6 +205,14 @@ class APIConnector(InstanceConnector):
             requests = attempt_import('requests', lazy=False)
             if requests:
                 self._session = requests.Session()
+
+                ### Keep a connection for each concurrent chunk upload.
+                from meerschaum.config import get_config
+                upload_workers = get_config('system', 'connectors', 'api', 'uploads', 'workers')
+                if upload_workers:
+                    adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(10, upload_workers))
+                    self._session.mount('http://', adapter)
+                    self._session.mount('https://', adapter)
             if self._session is None:
                 error("Failed to import requests. Is requests installed?")
         return self._session
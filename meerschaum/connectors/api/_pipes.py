@@ -14,7 +14,7 @@ from datetime import datetime, timedelta
 import meerschaum as mrsm
 from meerschaum.utils.debug import dprint
 from meerschaum.utils.warnings import warn, error
-from meerschaum.utils.typing import SuccessTuple, Union, Any, Optional, List, Dict, Tuple
+from meerschaum.utils.typing import SuccessTuple, Union, Any, Optional, List, Dict, Tuple, Iterator
 
 
 def pipe_r_url(
@@ -186,28 +186,121 @@ def fetch_pipes_keys(
     return [tuple(r) for r in j]
 
 
+def get_data_formats(self, debug: bool = False) -> List[str]:
+    """
+    Return the formats in which this instance may send and receive pipes' data.
+    Instances which predate binary formats only support `'json'`.
+    """
+    from meerschaum._internal.static import STATIC_CONFIG
+    data_formats = self.__dict__.get('_data_formats', None)
+    if data_formats is not None:
+        return data_formats
+
+    data_formats = ['json']
+    try:
+        response = self.get(
+            STATIC_CONFIG['api']['endpoints']['pipes'] + '/data_formats',
+            debug=debug,
+        )
+        if response.ok and isinstance(response.json(), list):
+            data_formats = response.json()
+    except Exception as e:
+        if debug:
+            dprint(f"[{self}] Failed to get the supported data formats:\n{e}")
+
+    self.__dict__['_data_formats'] = data_formats
+    return data_formats
+
+
+def get_data_format(self, debug: bool = False) -> str:
+    """
+    Return the format in which to transfer pipes' data with this instance:
+    the configured `system:connectors:api:data_format` if both sides support it,
+    otherwise `'json'`.
+    """
+    from meerschaum.utils.packages import is_installed
+    data_format = mrsm.get_config('system', 'connectors', 'api', 'data_format') or 'json'
+    if data_format == 'json':
+        return data_format
+    if not is_installed('pyarrow', venv=None):
+        return 'json'
+    if data_format not in self.get_data_formats(debug=debug):
+        return 'json'
+    return data_format
+
+
 def sync_pipe(
     self,
     pipe: mrsm.Pipe,
     df: Optional[Union['pd.DataFrame', Dict[Any, Any], str]] = None,
     chunksize: Optional[int] = -1,
+    upload_workers: Optional[int] = None,
+    stream: bool = False,
     debug: bool = False,
     **kw: Any
 ) -> SuccessTuple:
-    """Sync a DataFrame into a Pipe."""
-    from decimal import Decimal
+    """
+    Sync a DataFrame into a Pipe.
+
+    Chunks are posted concurrently with up to `upload_workers` requests in flight
+    (default `system:connectors:api:uploads:workers`) and acknowledged in order,
+    and a chunk which could not reach the server (e.g. the connection was refused)
+    is retried up to `uploads:retries` times (default 0).
+    Chunks which may have been received are never resent so that rows are not duplicated.
+    The first chunk is acknowledged before the rest are sent so that the server creates the table once.
+
+    Chunks for pipes with index columns (or `upsert`) are sent one at a time,
+    because chunks which share keys must be applied in order.
+    If a chunk fails, no more chunks are sent, the chunks in flight are awaited,
+    and the failure message lists the chunks which were synced.
+
+    Parameters
+    ----------
+    pipe: mrsm.Pipe
+        The pipe to sync into.
+
+    df: Optional[Union[pd.DataFrame, Dict[Any, Any], str]], default None
+        The data to sync.
+
+    chunksize: Optional[int], default -1
+        The number of rows per chunk (`-1` uses `system:connectors:sql:chunksize`).
+
+    upload_workers: Optional[int], default None
+        The maximum number of chunks in flight.
+        Ignored for pipes with index columns or `upsert`, whose chunks are sent in order.
+
+    stream: bool, default False
+        If `True`, send every chunk in a single chunked-transfer request,
+        which the server syncs as a generator of chunks.
+        Requires an instance which accepts newline-delimited JSON.
+
+    Returns
+    -------
+    A `SuccessTuple` indicating success.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
     from meerschaum.utils.debug import dprint
     from meerschaum.utils.dtypes import json_serialize_value
-    from meerschaum.utils.misc import items_str, interval_str
+    from meerschaum.utils.misc import interval_str, items_str
     from meerschaum.config import get_config
     from meerschaum.utils.packages import attempt_import
-    from meerschaum.utils.dataframe import get_special_cols, to_json
+    from meerschaum.utils.dataframe import to_json, df_to_bytes
+    from meerschaum._internal.static import STATIC_CONFIG
     begin = time.perf_counter()
-    more_itertools = attempt_import('more_itertools')
+    more_itertools, requests_exceptions, urllib3_exceptions = attempt_import(
+        'more_itertools', 'requests.exceptions', 'urllib3.exceptions',
+    )
     if df is None:
         msg = f"DataFrame is `None`. Cannot sync {pipe}."
         return False, msg
 
+    media_types = STATIC_CONFIG['api']['media_types']
+    uploads_config = get_config('system', 'connectors', 'api', 'uploads') or {}
+    retries = uploads_config.get('retries', 0) or 0
+    retry_backoff_seconds = uploads_config.get('retry_backoff_seconds', 0) or 0
+    upload_workers = max(1, upload_workers or uploads_config.get('workers', None) or 1)
+
     def get_json_str(c):
         if isinstance(c, str):
             return c
@@ -221,15 +314,15 @@ def sync_pipe(
         get_config('system', 'connectors', 'sql', 'chunksize') if chunksize == -1
         else chunksize
     ))
-    keys: List[str] = list(df.columns)
+    keys: List[str] = list(df.columns) if hasattr(df, 'columns') else list(df)
     chunks = []
     if hasattr(df, 'index'):
         df = df.reset_index(drop=True)
         is_dask = 'dask' in df.__module__
         chunks = (
-            (df.iloc[i] for i in more_itertools.chunked(df.index, _chunksize))
+            (df.iloc[i:(i + _chunksize)] for i in range(0, len(df), _chunksize))
             if not is_dask
-            else [partition.compute() for partition in df.partitions]
+            else (partition.compute() for partition in df.partitions)
         )
 
     elif isinstance(df, dict):
@@ -249,7 +342,7 @@ def sync_pipe(
                 except IndexError:
                     chunks.append(c)
     elif isinstance(df, list):
-        chunks = (df[i] for i in more_itertools.chunked(df, _chunksize))
+        chunks = more_itertools.chunked(df, _chunksize)
 
     ### Send columns in case the user has defined them locally.
     request_params = kw.copy()
@@ -257,30 +350,14 @@ def sync_pipe(
         request_params['columns'] = json.dumps(pipe.columns)
     request_params['instance_keys'] = self.get_pipe_instance_keys(pipe)
     r_url = pipe_r_url(pipe) + '/data'
+    data_format = self.get_data_format(debug=debug)
 
-    rowcount = 0
-    num_success_chunks = 0
-    for i, c in enumerate(chunks):
-        if debug:
-            dprint(f"[{self}] Posting chunk {i} to {r_url}...")
-        if len(c) == 0:
-            if debug:
-                dprint(f"[{self}] Skipping empty chunk...")
-            continue
-        json_str = get_json_str(c)
+    def get_chunk_len(c) -> int:
+        if isinstance(c, dict):
+            return len(next(iter(c.values()), []))
+        return len(c)
 
-        try:
-            response = self.post(
-                r_url,
-                params=request_params,
-                data=json_str,
-                debug=debug,
-            )
-        except Exception as e:
-            msg = f"Failed to post a chunk to {pipe}:\n{e}"
-            warn(msg)
-            return False, msg
-            
+    def parse_response(response) -> SuccessTuple:
         if not response:
             return False, f"Failed to sync a chunk:\n{response.text}"
 
@@ -299,11 +376,131 @@ def sync_pipe(
 
         if debug:
             dprint("Received response: " + str(j))
-        if not j[0]:
-            return j
+        return j
+
+    def is_undelivered(e: Exception) -> bool:
+        """
+        Return whether the request failed before the connection was established,
+        so that the server cannot have received any of the chunk.
+        """
+        if isinstance(e, requests_exceptions.ConnectTimeout):
+            return True
+        if not isinstance(e, requests_exceptions.ConnectionError):
+            return False
+        reason = e.args[0] if e.args else None
+        reason = getattr(reason, 'reason', reason)
+        return isinstance(reason, urllib3_exceptions.NewConnectionError)
+
+    def post_chunk(i: int, c) -> SuccessTuple:
+        ### Only DataFrames are sent in binary formats.
+        chunk_format = data_format if hasattr(c, 'columns') else 'json'
+        data = (
+            get_json_str(c)
+            if chunk_format == 'json'
+            else df_to_bytes(c, data_format=chunk_format, geometry_format='wkb_hex')
+        )
+
+        for attempt in range(retries + 1):
+            if attempt > 0:
+                if debug:
+                    dprint(f"[{self}] Retrying chunk {i} ( {attempt} / {retries} )...")
+                time.sleep(retry_backoff_seconds * (2 ** (attempt - 1)))
+            if debug:
+                dprint(f"[{self}] Posting chunk {i} to {r_url}...")
+
+            try:
+                response = self.post(
+                    r_url,
+                    params=request_params,
+                    data=data,
+                    headers={'Content-Type': media_types[chunk_format]},
+                    debug=debug,
+                )
+            except Exception as e:
+                msg = f"Failed to post a chunk to {pipe}:\n{e}"
+                if is_undelivered(e):
+                    continue
+                break
+
+            ### Server errors are not retried, because the chunk may have been synced already.
+            return parse_response(response)
+
+        warn(msg)
+        return False, msg
+
+    if stream:
+        if 'ndjson' not in self.get_data_formats(debug=debug):
+            return False, f"{self} does not accept streamed uploads."
+        return self._sync_pipe_stream(
+            pipe,
+            chunks,
+            r_url,
+            request_params,
+            ### Documents are always sent as newline-delimited JSON.
+            stream_format=(
+                'arrow'
+                if data_format in ('arrow', 'parquet') and hasattr(df, 'columns')
+                else 'ndjson'
+            ),
+            begin=begin,
+            debug=debug,
+        )
 
-        rowcount += len(c)
-        num_success_chunks += 1
+    ### Chunks which share keys would be applied out of order if sent concurrently.
+    if upload_workers > 1 and (pipe.upsert or any(pipe.columns.values())):
+        if debug:
+            dprint(f"[{self}] Sending chunks in order because {pipe} has index columns.")
+        upload_workers = 1
+
+    rowcount = 0
+    synced_chunks = []
+    failure_tuple = None
+    in_flight = deque()
+
+    def acknowledge(i: int, c, result: SuccessTuple) -> None:
+        nonlocal rowcount, failure_tuple
+        if not result[0]:
+            if failure_tuple is None:
+                failure_tuple = result
+            return
+        rowcount += get_chunk_len(c)
+        synced_chunks.append(i)
+
+    with ThreadPoolExecutor(max_workers=upload_workers) as executor:
+        for i, c in enumerate(chunks):
+            if failure_tuple is not None:
+                break
+            if get_chunk_len(c) == 0:
+                if debug:
+                    dprint(f"[{self}] Skipping empty chunk...")
+                continue
+
+            ### Wait for the first chunk (which may create the table) before pipelining.
+            if not synced_chunks or upload_workers == 1:
+                acknowledge(i, c, post_chunk(i, c))
+                continue
+
+            in_flight.append((i, c, executor.submit(post_chunk, i, c)))
+            while len(in_flight) >= upload_workers:
+                _i, _c, future = in_flight.popleft()
+                acknowledge(_i, _c, future.result())
+
+        ### Chunks already in flight may still be committed, so wait for them even after a failure.
+        for _i, _c, future in in_flight:
+            acknowledge(_i, _c, future.result())
+
+    num_success_chunks = len(synced_chunks)
+    if failure_tuple is not None:
+        if not synced_chunks:
+            return failure_tuple
+        self.delete_pipe_cache(pipe, debug=debug)
+        return False, (
+            failure_tuple[1]
+            + f"\n\nSynced {rowcount:,} row" + ('s' if rowcount != 1 else '')
+            + " from chunk" + ('s' if num_success_chunks != 1 else '') + " "
+            + items_str(sorted(synced_chunks), quotes=False)
+            + f" to {pipe} before failing."
+        )
 
     self.delete_pipe_cache(pipe, debug=debug)
     success_tuple = True, (
@@ -316,6 +513,81 @@ def sync_pipe(
     return success_tuple
 
 
+def _sync_pipe_stream(
+    self,
+    pipe: mrsm.Pipe,
+    chunks: Iterator[Any],
+    r_url: str,
+    request_params: Dict[str, Any],
+    stream_format: str = 'ndjson',
+    begin: Optional[float] = None,
+    debug: bool = False,
+) -> SuccessTuple:
+    """
+    Post every chunk in a single chunked-transfer request,
+    as consecutive Arrow IPC streams (DataFrames only) or newline-delimited JSON.
+    """
+    from meerschaum.utils.dtypes import json_serialize_value
+    from meerschaum.utils.misc import interval_str
+    from meerschaum.utils.dataframe import to_json, df_to_bytes
+    from meerschaum._internal.static import STATIC_CONFIG
+    begin = begin if begin is not None else time.perf_counter()
+    rowcount = 0
+
+    def generate_body():
+        nonlocal rowcount
+        for c in chunks:
+            if isinstance(c, dict):
+                c = [dict(zip(c, vals)) for vals in zip(*c.values())]
+            if len(c) == 0:
+                continue
+            rowcount += len(c)
+            if hasattr(c, 'columns'):
+                yield (
+                    df_to_bytes(c, data_format='arrow', geometry_format='wkb_hex')
+                    if stream_format == 'arrow'
+                    else (
+                        to_json(c, orient='records', lines=True, geometry_format='wkb_hex')
+                        .rstrip('\n') + '\n'
+                    ).encode('utf-8')
+                )
+                continue
+
+            yield ''.join(
+                json.dumps(doc, default=json_serialize_value) + '\n'
+                for doc in c
+            ).encode('utf-8')
+
+    try:
+        response = self.post(
+            r_url,
+            params={**request_params, 'stream': True},
+            data=generate_body(),
+            headers={'Content-Type': STATIC_CONFIG['api']['media_types'][stream_format]},
+            debug=debug,
+        )
+    except Exception as e:
+        msg = f"Failed to stream data to {pipe}:\n{e}"
+        warn(msg)
+        return False, msg
+
+    try:
+        j = response.json()
+    except Exception:
+        return False, response.text
+    if isinstance(j, dict) and 'detail' in j:
+        return False, j['detail']
+    if not response or not j[0]:
+        return tuple(j)
+
+    self.delete_pipe_cache(pipe, debug=debug)
+    return True, (
+        f"It took {interval_str(timedelta(seconds=(time.perf_counter() - begin)))} "
+        + f"to stream {rowcount:,} row" + ('s' if rowcount != 1 else '')
+        + f" to {pipe}."
+    )
+
+
 def delete_pipe_cache(
     self,
     pipe: mrsm.Pipe,
@@ -373,13 +645,60 @@ def get_pipe_data(
     begin: Union[str, datetime, int, None] = None,
     end: Union[str, datetime, int, None] = None,
     params: Optional[Dict[str, Any]] = None,
+    order: Optional[str] = 'asc',
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
     as_chunks: bool = False,
+    as_iterator: bool = False,
     debug: bool = False,
     **kw: Any
-) -> Union[pandas.DataFrame, None]:
-    """Fetch data from the API."""
+) -> Union[pandas.DataFrame, Iterator[pandas.DataFrame], None]:
+    """
+    Fetch data from the API.
+
+    Responses are capped at `api:data:max_response_row_limit` rows,
+    so follow the continuation tokens of full pages until `limit` rows are read.
+
+    Pages are requested in the format from `get_data_format()`
+    (an Arrow IPC stream by default) and decoded according to their `Content-Type`.
+
+    If `as_iterator` (or `as_chunks`) is `True`, stream the data in a single response
+    and yield each chunk as it arrives (see `get_pipe_data_stream()`).
+    """
+    from meerschaum._internal.static import STATIC_CONFIG
+    if as_iterator or as_chunks:
+        return self.get_pipe_data_stream(
+            pipe,
+            select_columns=select_columns,
+            omit_columns=omit_columns,
+            begin=begin,
+            end=end,
+            params=params,
+            order=order,
+            limit=limit,
+            debug=debug,
+        )
+
+    from meerschaum.utils.packages import import_pandas
+    from meerschaum.utils.dataframe import df_from_bytes
+    continuation_token_header = STATIC_CONFIG['api']['headers']['continuation_token']
+    media_types = STATIC_CONFIG['api']['media_types']
+    media_types_formats = {
+        media_type: data_format
+        for data_format, media_type in media_types.items()
+    }
+    max_response_row_limit = mrsm.get_config('api', 'data', 'max_response_row_limit')
+    data_format = self.get_data_format(debug=debug)
     r_url = pipe_r_url(pipe)
+    docs = []
+    dfs = []
+    num_rows = 0
     while True:
+        page_limit = (
+            min(limit - num_rows, max_response_row_limit)
+            if limit is not None
+            else max_response_row_limit
+        )
         try:
             response = self.get(
                 r_url + "/data",
@@ -390,19 +709,45 @@ def get_pipe_data(
                     'end': end,
                     'params': json.dumps(params, default=str),
                     'instance': self.get_pipe_instance_keys(pipe),
-                    'as_chunks': as_chunks,
+                    'limit': page_limit,
+                    **({'order': order} if order else {}),
+                    **({'after': after} if after else {}),
                 },
+                headers={'Accept': media_types[data_format]},
                 debug=debug
             )
             if not response.ok:
                 return None
-            j = response.json()
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+            response_format = media_types_formats.get(content_type, 'json')
+            if response_format == 'json':
+                j = response.json()
+                if isinstance(j, dict) and 'detail' in j:
+                    return False, j['detail']
+                docs.extend(j)
+                page_rowcount = len(j)
+            else:
+                page_df = df_from_bytes(response.content, data_format=response_format)
+                dfs.append(page_df)
+                page_rowcount = len(page_df)
         except Exception as e:
             warn(f"Failed to get data for {pipe}:\n{e}")
             return None
-        if isinstance(j, dict) and 'detail' in j:
-            return False, j['detail']
-        break
+
+        num_rows += page_rowcount
+        after = response.headers.get(continuation_token_header, None)
+        if not after or not page_rowcount or (limit is not None and num_rows >= limit):
+            break
+
+    pd = import_pandas()
+    if docs:
+        dfs.append(pd.DataFrame(docs))
+    if len(dfs) > 1:
+        j = pd.concat(dfs, ignore_index=True)
+    elif dfs:
+        j = dfs[0]
+    else:
+        j = docs
 
     from meerschaum.utils.dataframe import parse_df_datetimes, add_missing_cols_to_df
     from meerschaum.utils.dtypes import are_dtypes_equal
@@ -415,6 +760,7 @@ def get_pipe_data(
                 if not are_dtypes_equal(str(dtype), 'datetime')
             ],
             strip_timezone=(pipe.tzinfo is None),
+            dtypes=pipe.dtypes,
             debug=debug,
         )
     except Exception as e:
@@ -427,6 +773,130 @@ def get_pipe_data(
     return df
 
 
+def get_pipe_data_stream(
+    self,
+    pipe: mrsm.Pipe,
+    select_columns: Optional[List[str]] = None,
+    omit_columns: Optional[List[str]] = None,
+    begin: Union[str, datetime, int, None] = None,
+    end: Union[str, datetime, int, None] = None,
+    params: Optional[Dict[str, Any]] = None,
+    order: Optional[str] = 'asc',
+    limit: Optional[int] = None,
+    chunksize: Optional[int] = -1,
+    debug: bool = False,
+) -> Iterator[pandas.DataFrame]:
+    """
+    Stream a pipe's data from the API and yield DataFrames as they are received,
+    so memory use does not grow with the size of the result.
+
+    Parameters
+    ----------
+    pipe: mrsm.Pipe
+        The pipe whose data to stream.
+
+    chunksize: Optional[int], default -1
+        For newline-delimited JSON streams, yield a DataFrame every `chunksize` rows
+        (`-1` uses `system:connectors:sql:chunksize`).
+        Arrow streams are yielded chunk by chunk as the server reads them.
+
+    Returns
+    -------
+    An iterator of DataFrames.
+    Instances which cannot stream return a single DataFrame from `get_pipe_data()`.
+    """
+    import io
+    from meerschaum._internal.static import STATIC_CONFIG
+    from meerschaum.utils.packages import import_pandas
+    from meerschaum.utils.dataframe import parse_df_datetimes, df_from_bytes
+    from meerschaum.utils.dtypes import are_dtypes_equal
+    from meerschaum.utils.misc import string_to_dict
+    pd = import_pandas()
+    media_types = STATIC_CONFIG['api']['media_types']
+    if chunksize == -1:
+        chunksize = mrsm.get_config('system', 'connectors', 'sql', 'chunksize')
+    chunksize = chunksize or 1
+    data_format = self.get_data_format(debug=debug)
+    get_data_kwargs = {
+        'select_columns': select_columns,
+        'omit_columns': omit_columns,
+        'begin': begin,
+        'end': end,
+        'params': params,
+        'order': order,
+        'limit': limit,
+    }
+
+    def _parse_chunk(chunk):
+        return parse_df_datetimes(
+            chunk,
+            ignore_cols=[
+                col
+                for col, dtype in pipe.dtypes.items()
+                if not are_dtypes_equal(str(dtype), 'datetime')
+            ],
+            strip_timezone=(pipe.tzinfo is None),
+            dtypes=pipe.dtypes,
+            debug=debug,
+        )
+
+    try:
+        response = self.get(
+            pipe_r_url(pipe) + '/data',
+            params={
+                'select_columns': json.dumps(select_columns),
+                'omit_columns': json.dumps(omit_columns),
+                'begin': begin,
+                'end': end,
+                'params': json.dumps(params, default=str),
+                'instance': self.get_pipe_instance_keys(pipe),
+                'stream': True,
+                **({'limit': limit} if limit is not None else {}),
+                **({'order': order} if order else {}),
+            },
+            headers={'Accept': media_types[data_format]},
+            stream=True,
+            debug=debug,
+        )
+    except Exception as e:
+        warn(f"Failed to stream data for {pipe}:\n{e}")
+        return
+
+    with response:
+        if not response.ok:
+            warn(f"Failed to stream data for {pipe}:\n{response.text}")
+            return
+
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+
+        ### Older instances ignore `stream` and respond with a single page.
+        if content_type not in (media_types['ndjson'], media_types['arrow']):
+            response.close()
+            df = self.get_pipe_data(pipe, debug=debug, **get_data_kwargs)
+            if df is not None:
+                yield df
+            return
+
+        if content_type == media_types['arrow']:
+            ### Each chunk is sent as its own Arrow IPC stream.
+            response.raw.decode_content = True
+            reader = io.BufferedReader(response.raw)
+            while reader.peek(1):
+                yield _parse_chunk(df_from_bytes(reader, data_format='arrow'))
+            return
+
+        docs = []
+        for line in response.iter_lines():
+            if not line:
+                continue
+            docs.append(json.loads(line))
+            if len(docs) >= chunksize:
+                yield _parse_chunk(pd.DataFrame(docs))
+                docs = []
+        if docs:
+            yield _parse_chunk(pd.DataFrame(docs))
+
+
 def get_pipe_id(
     self,
     pipe: mrsm.Pipe,
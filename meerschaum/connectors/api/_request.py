@@ -68,6 +68,10 @@ def make_request(
     Returns
     -------
     A `requests.Reponse` object.
+
+    Request bodies of at least `system:connectors:api:compression:minimum_size` bytes
+    (and streamed bodies) are compressed with the best encoding
+    the server advertised in a previous response's `Accept-Encoding` header.
     """
     if method.upper() not in METHODS:
         raise ValueError(f"Method '{method}' is not supported.")
@@ -88,17 +92,63 @@ def make_request(
     if 'timeout' not in kwargs:
         kwargs['timeout'] = STATIC_CONFIG['api']['default_timeout']
 
+    self._compress_request(headers, kwargs)
+
     request_url = urllib.parse.urljoin(self.url, r_url)
     if debug:
         dprint(f"[{self}] Sending a '{method.upper()}' request to {request_url}")
 
-    return self.session.request(
+    response = self.session.request(
         method.upper(),
         request_url,
         headers=headers,
         **kwargs
     )
 
+    ### Servers list the encodings they accept for request bodies (RFC 7694).
+    server_accept_encoding = response.headers.get('Accept-Encoding', None)
+    if server_accept_encoding is not None:
+        self.__dict__['_server_accept_encoding'] = server_accept_encoding
+
+    return response
+
+
+def _compress_request(self, headers: Dict[str, Any], kwargs: Dict[str, Any]) -> None:
+    """
+    Advertise the response encodings this client may decode,
+    and compress the request body in place if the server accepts compressed bodies.
+    """
+    from meerschaum.config import get_config
+    from meerschaum.utils.packages import attempt_import
+    from meerschaum.utils.compression import choose_encoding, compress_bytes, compress_iterator
+    requests_utils = attempt_import('requests.utils', lazy=False)
+    compression_config = get_config('system', 'connectors', 'api', 'compression') or {}
+    if not compression_config.get('enabled', True):
+        headers.setdefault('Accept-Encoding', 'identity')
+        return
+
+    headers.setdefault('Accept-Encoding', requests_utils.DEFAULT_ACCEPT_ENCODING)
+    data = kwargs.get('data', None)
+    if data is None or 'Content-Encoding' in headers:
+        return
+
+    encoding = choose_encoding(self.__dict__.get('_server_accept_encoding', None))
+    if encoding is None:
+        return
+
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if isinstance(data, bytes):
+        if len(data) < compression_config.get('minimum_size', 1024):
+            return
+        kwargs['data'] = compress_bytes(data, encoding)
+    elif hasattr(data, '__next__'):
+        kwargs['data'] = compress_iterator(data, encoding)
+    else:
+        return
+
+    headers['Content-Encoding'] = encoding
+
 
 def get(self, r_url: str, **kwargs: Any) -> 'requests.Response':
     """
@@ -29,11 +29,14 @@ class SQLConnector(InstanceConnector):
     from ._create_engine import flavor_configs, create_engine
     from ._sql import (
         read,
+        _read_duckdb,
+        _stream_read_chunks,
         value,
         exec,
         execute,
         to_sql,
         exec_queries,
+        _get_bulk_insert_method,
         get_connection,
         _cleanup_connections,
     )
@@ -52,6 +55,39 @@ class SQLConnector(InstanceConnector):
         _get_columnstore_remove_policy_query,
         _get_columnstore_disable_query,
     )
+    from ._query_cache import (
+        get_cached_query,
+        cache_query,
+        clear_query_cache,
+        _is_query_cache_enabled,
+    )
+    from ._batch import (
+        get_pipes_columns_types,
+        get_pipes_columns_indices,
+        get_pipes_sync_times,
+        _group_pipes_by_schema,
+        _get_prefetch_batchsize,
+    )
+    from ._pool import (
+        get_pool_metrics,
+        autosize_pool,
+    )
+    from ._async import (
+        get_async_engine,
+        dispose_async_engines,
+        _execute_async,
+        value_async,
+        read_async,
+        fetch_pipes_keys_async,
+        get_sync_time_async,
+        get_pipe_rowcount_async,
+        get_pipe_data_async,
+        sync_pipe_async,
+    )
+    from ._chunksize import (
+        get_pipe_chunksize_controller,
+        cache_pipe_chunksize_controller,
+    )
     from ._maintenance import (
         vacuum_pipe,
         analyze_pipe,
@@ -85,6 +121,7 @@ class SQLConnector(InstanceConnector):
     )
     from ._pipes import (
         fetch_pipes_keys,
+        _get_fetch_pipes_keys_query,
         create_indices,
         drop_indices,
         get_create_index_queries,
@@ -93,8 +130,12 @@ class SQLConnector(InstanceConnector):
         get_alter_columns_queries,
         delete_pipe,
         get_pipe_data,
+        _get_pipe_data_dtypes,
+        get_pipe_data_chunk_bounds,
+        get_pipe_data_parallel,
         get_pipe_docs,
         get_pipe_data_query,
+        get_pipe_rows_digests,
         register_pipe,
         edit_pipe,
         get_pipe_id,
@@ -102,8 +143,10 @@ class SQLConnector(InstanceConnector):
         sync_pipe,
         sync_pipe_inplace,
         get_sync_time,
+        _get_sync_time_query,
         pipe_exists,
         get_pipe_rowcount,
+        _prepare_pipe_rowcount_query,
         drop_pipe,
         clear_pipe,
         deduplicate_pipe,
@@ -253,10 +296,18 @@ class SQLConnector(InstanceConnector):
         ### so we can dispose of the Pool in child processes or threads.
         import os
         import threading
+        import collections
+        from meerschaum.connectors.sql._pool import PoolMetrics
         self._pid = os.getpid()
         self._thread_ident = threading.current_thread().ident
         self._sessions = {}
-        self._locks = {'_sessions': threading.RLock(), }
+        self._query_cache = collections.OrderedDict()
+        self._pool_metrics = PoolMetrics()
+        self._locks = {
+            '_sessions': threading.RLock(),
+            '_query_cache': threading.RLock(),
+            '_pool': threading.RLock(),
+        }
 
         ### verify the flavor's requirements are met
         if self.flavor not in self.flavor_configs:
@@ -407,6 +458,18 @@ class SQLConnector(InstanceConnector):
         self._db_version = get_db_version(self)
         return self._db_version
 
+    @property
+    def db_max_connections(self) -> Union[int, None]:
+        """
+        Return the maximum number of connections the database server allows.
+        """
+        if '_db_max_connections' in self.__dict__:
+            return self._db_max_connections
+
+        from meerschaum.utils.sql import get_db_max_connections
+        self._db_max_connections = get_db_max_connections(self)
+        return self._db_max_connections
+
     @property
     def schema(self) -> Union[str, None]:
         """
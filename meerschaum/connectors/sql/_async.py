@@ -0,0 +1,421 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+
+"""
+Await pipe queries on an SQLAlchemy asyncio engine.
+
+The queries are built by the same methods as their synchronous counterparts
+(e.g. `_get_sync_time_query()`), which may read cached pipe metadata,
+so they run in a worker thread while the database round trip is awaited on the event loop.
+Flavors without an installed async driver fall back to running the synchronous method
+in a worker thread.
+
+The methods below are mixed into `SQLConnector`
+(see `meerschaum/connectors/sql/_SQLConnector.py`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from datetime import datetime
+
+import meerschaum as mrsm
+from meerschaum.utils.typing import Any, Optional, Dict, List, Tuple, Union, SuccessTuple
+from meerschaum.utils.debug import dprint
+from meerschaum.utils.warnings import warn
+
+### Map the SQLAlchemy backend names to the async drivers (and their import names) to use.
+### NOTE: PostgreSQL uses psycopg's async mode rather than `asyncpg`, which would reject
+###       the string values bound by `build_where()` for non-text columns.
+ASYNC_DRIVERS: Dict[str, Tuple[str, str]] = {
+    'postgresql': ('psycopg_async', 'psycopg'),
+    'mysql': ('aiomysql', 'aiomysql'),
+    'mariadb': ('aiomysql', 'aiomysql'),
+    'sqlite': ('aiosqlite', 'aiosqlite'),
+}
+
+### Only pass the pool settings through to the async engine.
+_ASYNC_ENGINE_KWARGS = ('pool_size', 'max_overflow', 'pool_recycle', 'pool_timeout', 'pool_pre_ping')
+
+
+async def _run_in_thread(func, *args, **kwargs) -> Any:
+    """
+    Await a blocking function in the event loop's default executor.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+def get_async_engine(
+    self,
+    debug: bool = False,
+) -> Union['sqlalchemy.ext.asyncio.AsyncEngine', None]:
+    """
+    Return the async engine for the running event loop,
+    or `None` if this flavor has no async driver installed
+    (or `system:connectors:sql:async_engine:enabled` is `False`).
+
+    Engines are kept per event loop because pooled async connections
+    may not be shared across loops.
+    """
+    from meerschaum.utils.packages import attempt_import, is_installed
+    async_config = self._sys_config.get('async_engine', None) or {}
+    if not async_config.get('enabled', True):
+        return None
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    async_engines = self.__dict__.setdefault('_async_engines', {})
+    engine = async_engines.get(id(loop), None)
+    if engine is not None:
+        return engine
+
+    ### Only check once whether an async engine may be created, since every API read calls this.
+    if self.__dict__.get('_async_engine_unavailable', False):
+        return None
+
+    ### SQLAlchemy's asyncio extension requires `greenlet` (no longer installed by SQLAlchemy 2.1).
+    if not is_installed('greenlet', venv=None):
+        self.__dict__['_async_engine_unavailable'] = True
+        return None
+
+    sqlalchemy, sqlalchemy_asyncio = attempt_import(
+        'sqlalchemy', 'sqlalchemy.ext.asyncio',
+        lazy=False,
+    )
+    url = sqlalchemy.engine.make_url(self.URI)
+    backend = url.get_backend_name()
+    driver, driver_import_name = ASYNC_DRIVERS.get(backend, (None, None))
+    if driver is None or not is_installed(driver_import_name, venv=None):
+        self.__dict__['_async_engine_unavailable'] = True
+        return None
+
+    ### A new connection to an in-memory database would not see this connector's tables.
+    if backend == 'sqlite' and url.database in (None, '', ':memory:'):
+        self.__dict__['_async_engine_unavailable'] = True
+        return None
+
+    create_engine_kwargs = {
+        **self._sys_config.get('create_engine', {}),
+        **self.__dict__.get('create_engine', {}),
+    }
+    engine_kwargs = {
+        key: val
+        for key, val in create_engine_kwargs.items()
+        if key in _ASYNC_ENGINE_KWARGS
+    }
+    try:
+        engine = sqlalchemy_asyncio.create_async_engine(
+            url.set(drivername=f"{backend}+{driver}"),
+            echo=debug,
+            **engine_kwargs
+        )
+    except Exception as e:
+        warn(f"Failed to create an async engine for '{self}':\n{e}", stack=False)
+        self.__dict__['_async_engine_unavailable'] = True
+        return None
+
+    if debug:
+        dprint(f"[{self}] Created async engine with driver '{driver}'.")
+    async_engines[id(loop)] = engine
+    return engine
+
+
+async def dispose_async_engines(self) -> None:
+    """
+    Close the connections of every async engine created for this connector.
+    """
+    async_engines = self.__dict__.pop('_async_engines', None) or {}
+    for engine in async_engines.values():
+        try:
+            await engine.dispose()
+        except Exception as e:
+            warn(f"Failed to dispose of an async engine for '{self}':\n{e}", stack=False)
+
+
+async def _execute_async(
+    self,
+    query: Union[str, 'sqlalchemy.sql.Executable'],
+    params: Optional[Dict[str, Any]] = None,
+    debug: bool = False,
+) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+    """
+    Execute a query on the async engine and return its column names and rows.
+    """
+    from meerschaum.utils.packages import attempt_import
+    sqlalchemy = attempt_import('sqlalchemy', lazy=False)
+    if isinstance(query, str):
+        query = sqlalchemy.text(query)
+    if debug:
+        dprint(f"[{self}] Executing query asynchronously:\n{query}")
+
+    engine = self.get_async_engine(debug=debug)
+    async with engine.connect() as connection:
+        result = await connection.execute(query, params or {})
+        return list(result.keys()), [tuple(row) for row in result.fetchall()]
+
+
+async def value_async(
+    self,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    debug: bool = False,
+) -> Any:
+    """
+    Await the query and return the first value (see `SQLConnector.value()`).
+    """
+    if self.get_async_engine(debug=debug) is None:
+        return await _run_in_thread(
+            self.value,
+            query,
+            *([params] if params else []),
+            silent=True,
+            debug=debug,
+        )
+
+    try:
+        _, rows = await self._execute_async(query, params=params, debug=debug)
+    except Exception as e:
+        warn(e, stacklevel=3)
+        return None
+    return rows[0][0] if rows else None
+
+
+async def read_async(
+    self,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    debug: bool = False,
+) -> Union['pd.DataFrame', None]:
+    """
+    Await the query and return its results as a DataFrame (see `SQLConnector.read()`).
+
+    Parameters
+    ----------
+    query: str
+        The query to execute.
+
+    params: Optional[Dict[str, Any]], default None
+        Bind values for the query.
+
+    dtype: Optional[Dict[str, Any]], default None
+        Optionally cast columns to these dtypes.
+
+    Returns
+    -------
+    A pandas DataFrame, or `None` if the query failed.
+    """
+    from meerschaum.utils.packages import import_pandas
+    if self.get_async_engine(debug=debug) is None:
+        return await _run_in_thread(self.read, query, params, dtype=dtype, debug=debug)
+
+    pd = import_pandas()
+    try:
+        columns, rows = await self._execute_async(query, params=params, debug=debug)
+    except Exception as e:
+        warn(f"Failed to read query:\n{e}", stack=False)
+        return None
+
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    for col, typ in (dtype or {}).items():
+        if col not in df.columns:
+            continue
+        try:
+            df[col] = df[col].astype(typ)
+        except Exception:
+            pass
+    return df
+
+
+async def fetch_pipes_keys_async(
+    self,
+    connector_keys: Optional[List[str]] = None,
+    metric_keys: Optional[List[str]] = None,
+    location_keys: Optional[List[str]] = None,
+    tags: Optional[List[str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    debug: bool = False,
+) -> Dict[int, Tuple[str, str, Union[str, None], Dict[str, Any]]]:
+    """
+    Await `fetch_pipes_keys()` on the async engine.
+    """
+    kwargs = {
+        'connector_keys': connector_keys,
+        'metric_keys': metric_keys,
+        'location_keys': location_keys,
+        'tags': tags,
+        'params': params,
+        'debug': debug,
+    }
+    if self.get_async_engine(debug=debug) is None:
+        return await _run_in_thread(self.fetch_pipes_keys, **kwargs)
+
+    q = await _run_in_thread(self._get_fetch_pipes_keys_query, **kwargs)
+    if q is None:
+        return {}
+
+    try:
+        _, rows = await self._execute_async(q, debug=debug)
+    except Exception as e:
+        warn(f"Failed to fetch pipes' keys:\n{e}", stack=False)
+        return {}
+
+    return {
+        row[0]: row[1:]
+        for row in rows
+    }
+
+
+async def get_sync_time_async(
+    self,
+    pipe: mrsm.Pipe,
+    params: Optional[Dict[str, Any]] = None,
+    newest: bool = True,
+    remote: bool = False,
+    debug: bool = False,
+) -> Union[datetime, int, None]:
+    """
+    Await `get_sync_time()` on the async engine.
+    """
+    from meerschaum.connectors.sql._pipes import _parse_sync_time
+    if remote or self.get_async_engine(debug=debug) is None:
+        return await _run_in_thread(
+            self.get_sync_time,
+            pipe,
+            params=params,
+            newest=newest,
+            remote=remote,
+            debug=debug,
+        )
+
+    query, bind_params = await _run_in_thread(
+        self._get_sync_time_query,
+        pipe,
+        params=params,
+        newest=newest,
+        debug=debug,
+    )
+    if query is None:
+        return None
+
+    try:
+        return _parse_sync_time(await self.value_async(query, params=bind_params, debug=debug))
+    except Exception as e:
+        warn(str(e))
+        return None
+
+
+async def get_pipe_rowcount_async(
+    self,
+    pipe: mrsm.Pipe,
+    begin: Union[datetime, int, None] = None,
+    end: Union[datetime, int, None] = None,
+    params: Optional[Dict[str, Any]] = None,
+    remote: bool = False,
+    debug: bool = False,
+) -> Union[int, None]:
+    """
+    Await `get_pipe_rowcount()` on the async engine.
+    """
+    if remote or self.get_async_engine(debug=debug) is None:
+        return await _run_in_thread(
+            self.get_pipe_rowcount,
+            pipe,
+            begin=begin,
+            end=end,
+            params=params,
+            remote=remote,
+            debug=debug,
+        )
+
+    query, bind_params = await _run_in_thread(
+        self._prepare_pipe_rowcount_query,
+        pipe,
+        begin=begin,
+        end=end,
+        params=params,
+        debug=debug,
+    )
+    if query is None:
+        return None
+
+    result = await self.value_async(query, params=bind_params, debug=debug)
+    try:
+        return int(result)
+    except Exception:
+        return None
+
+
+async def get_pipe_data_async(
+    self,
+    pipe: mrsm.Pipe,
+    select_columns: Optional[List[str]] = None,
+    omit_columns: Optional[List[str]] = None,
+    begin: Union[datetime, str, None] = None,
+    end: Union[datetime, str, None] = None,
+    params: Optional[Dict[str, Any]] = None,
+    order: str = 'asc',
+    limit: Optional[int] = None,
+    begin_add_minutes: int = 0,
+    end_add_minutes: int = 0,
+    debug: bool = False,
+    **kw: Any
+) -> Union['pd.DataFrame', None]:
+    """
+    Await `get_pipe_data()` on the async engine.
+    The entire result is fetched into a single DataFrame.
+    """
+    query_kwargs = {
+        'select_columns': select_columns,
+        'omit_columns': omit_columns,
+        'begin': begin,
+        'end': end,
+        'params': params,
+        'order': order,
+        'limit': limit,
+        'begin_add_minutes': begin_add_minutes,
+        'end_add_minutes': end_add_minutes,
+        'debug': debug,
+        **kw
+    }
+    if self.get_async_engine(debug=debug) is None:
+        return await _run_in_thread(self.get_pipe_data, pipe, **query_kwargs)
+
+    def _build_query() -> Tuple[Union[str, None], Dict[str, Any]]:
+        _select_columns, dtypes = self._get_pipe_data_dtypes(
+            pipe,
+            select_columns=select_columns,
+            omit_columns=omit_columns,
+            debug=debug,
+        )
+        query = self.get_pipe_data_query(
+            pipe,
+            **{**query_kwargs, 'select_columns': _select_columns}
+        )
+        return query, dtypes
+
+    query, dtypes = await _run_in_thread(_build_query)
+    if query is None:
+        return None
+    return await self.read_async(query, dtype=dtypes, debug=debug)
+
+
+async def sync_pipe_async(
+    self,
+    pipe: mrsm.Pipe,
+    df: Union['pd.DataFrame', str, Dict[Any, Any], List[Dict[str, Any]], None] = None,
+    **kw: Any
+) -> SuccessTuple:
+    """
+    Await `sync_pipe()` without blocking the event loop.
+
+    Syncs stage and merge through the bulk loaders of the synchronous drivers
+    (e.g. `COPY` on psycopg), so the sync itself runs in a worker thread.
+    """
+    return await _run_in_thread(self.sync_pipe, pipe, df, **kw)
@@ -0,0 +1,205 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+
+"""
+Fetch the metadata of many pipes in batched queries rather than one query per pipe.
+
+The methods below are mixed into `SQLConnector`
+(see `meerschaum/connectors/sql/_SQLConnector.py`).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+
+import meerschaum as mrsm
+from meerschaum.utils.typing import Optional, Dict, List, Union
+from meerschaum.utils.warnings import warn
+
+### These flavors reflect `get_pipe_columns_types()` through SQLAlchemy,
+### so their batched types would not match.
+REFLECTED_COLUMNS_TYPES_FLAVORS = {'oracle', 'mysql', 'mariadb', 'sqlite', 'geopackage'}
+
+
+def _group_pipes_by_schema(self, pipes: List[mrsm.Pipe]) -> Dict[Union[str, None], List[mrsm.Pipe]]:
+    """
+    Group pipes by the schemas of their target tables.
+    """
+    schemas_pipes = defaultdict(lambda: [])
+    for pipe in pipes:
+        schemas_pipes[self.get_pipe_schema(pipe)].append(pipe)
+    return dict(schemas_pipes)
+
+
+def _get_prefetch_batchsize(self, key: str, default: int) -> int:
+    """
+    Return a batch size from `system:connectors:sql:prefetch`.
+    """
+    return (self._sys_config.get('prefetch', None) or {}).get(key, None) or default
+
+
+def get_pipes_columns_types(
+    self,
+    pipes: List[mrsm.Pipe],
+    debug: bool = False,
+) -> Dict[mrsm.Pipe, Union[Dict[str, str], None]]:
+    """
+    Return the columns types of many pipes' target tables
+    (see `SQLConnector.get_pipe_columns_types()`), querying up to
+    `prefetch:tables_batchsize` tables at once.
+
+    Parameters
+    ----------
+    pipes: List[mrsm.Pipe]
+        The pipes whose tables to inspect.
+
+    Returns
+    -------
+    A dictionary mapping each pipe to its columns types
+    (an empty dictionary if its table does not exist, or `None` if its batch failed).
+    """
+    from meerschaum.utils.sql import get_tables_cols_types
+    if self.flavor in REFLECTED_COLUMNS_TYPES_FLAVORS:
+        return {
+            pipe: self.get_pipe_columns_types(pipe, debug=debug)
+            for pipe in pipes
+        }
+
+    batchsize = self._get_prefetch_batchsize('tables_batchsize', 1000)
+    pipes_columns_types = {}
+    for schema, schema_pipes in self._group_pipes_by_schema(pipes).items():
+        tables_cols_types = get_tables_cols_types(
+            list({pipe.target: None for pipe in schema_pipes}),
+            self,
+            flavor=self.flavor,
+            schema=schema,
+            batchsize=batchsize,
+            debug=debug,
+        )
+        for pipe in schema_pipes:
+            pipes_columns_types[pipe] = tables_cols_types.get(pipe.target, {})
+    return pipes_columns_types
+
+
+def get_pipes_columns_indices(
+    self,
+    pipes: List[mrsm.Pipe],
+    debug: bool = False,
+) -> Dict[mrsm.Pipe, Union[Dict[str, List[Dict[str, str]]], None]]:
+    """
+    Return the columns indices of many pipes' target tables
+    (see `SQLConnector.get_pipe_columns_indices()`), querying up to
+    `prefetch:tables_batchsize` tables at once.
+
+    Parameters
+    ----------
+    pipes: List[mrsm.Pipe]
+        The pipes whose tables to inspect.
+
+    Returns
+    -------
+    A dictionary mapping each pipe to a dictionary of columns and their indices
+    (or `None` if its batch failed).
+    """
+    from meerschaum.utils.sql import get_tables_cols_indices
+    pipes_columns_indices = {
+        pipe: {}
+        for pipe in pipes
+        if pipe.__dict__.get('_skip_check_indices', False)
+    }
+    pipes = [pipe for pipe in pipes if pipe not in pipes_columns_indices]
+
+    batchsize = self._get_prefetch_batchsize('tables_batchsize', 1000)
+    for schema, schema_pipes in self._group_pipes_by_schema(pipes).items():
+        tables_cols_indices = get_tables_cols_indices(
+            list({pipe.target: None for pipe in schema_pipes}),
+            self,
+            flavor=self.flavor,
+            schema=schema,
+            batchsize=batchsize,
+            debug=debug,
+        )
+        for pipe in schema_pipes:
+            pipes_columns_indices[pipe] = tables_cols_indices.get(pipe.target, {})
+    return pipes_columns_indices
+
+
+def get_pipes_sync_times(
+    self,
+    pipes: List[mrsm.Pipe],
+    newest: bool = True,
+    pipes_columns_types: Optional[Dict[mrsm.Pipe, Dict[str, str]]] = None,
+    debug: bool = False,
+) -> Dict[mrsm.Pipe, Union[datetime, int, None]]:
+    """
+    Return the sync times of many pipes (see `SQLConnector.get_sync_time()`)
+    with one `UNION ALL` query per datetime type and `prefetch:sync_times_batchsize` pipes.
+
+    Parameters
+    ----------
+    pipes: List[mrsm.Pipe]
+        The pipes whose sync times to fetch.
+
+    newest: bool, default True
+        If `True`, get the most recent datetime values (`MAX`), otherwise the oldest (`MIN`).
+
+    pipes_columns_types: Optional[Dict[mrsm.Pipe, Dict[str, str]]], default None
+        The pipes' columns types, if already fetched (see `get_pipes_columns_types()`).
+
+    Returns
+    -------
+    A dictionary mapping pipes to their sync times (`None` for pipes without a datetime axis,
+    table, or rows). Pipes whose batch (or columns types) failed are omitted.
+    """
+    from meerschaum.utils.sql import sql_item_name
+    from meerschaum.connectors.sql._pipes import _parse_sync_time
+    if pipes_columns_types is None:
+        pipes_columns_types = self.get_pipes_columns_types(pipes, debug=debug)
+
+    sync_times = {}
+    types_pipes = defaultdict(lambda: [])
+    for pipe in pipes:
+        dt_col = pipe.columns.get('datetime', None)
+        columns_types = pipes_columns_types.get(pipe, {})
+        ### The table's columns could not be read, so its sync time is unknown.
+        if columns_types is None:
+            continue
+        dt_typ = columns_types.get(dt_col, None) if dt_col else None
+        if dt_typ is None:
+            sync_times[pipe] = None
+            continue
+
+        ### Only union pipes of the same datetime type so the values are not coerced.
+        types_pipes[dt_typ].append(pipe)
+
+    agg_func = 'MAX' if newest else 'MIN'
+    ix_name = sql_item_name('ix', self.flavor, None)
+    sync_time_name = sql_item_name('sync_time', self.flavor, None)
+    batchsize = self._get_prefetch_batchsize('sync_times_batchsize', 200)
+    for type_pipes in types_pipes.values():
+        for i in range(0, len(type_pipes), max(1, batchsize)):
+            batch_pipes = type_pipes[i:(i + batchsize)]
+            query = "\nUNION ALL\n".join(
+                (
+                    f"SELECT {ix} AS {ix_name}, "
+                    f"{agg_func}({sql_item_name(pipe.columns['datetime'], self.flavor, None)}) "
+                    f"AS {sync_time_name}\n"
+                    f"FROM {sql_item_name(pipe.target, self.flavor, self.get_pipe_schema(pipe))}"
+                )
+                for ix, pipe in enumerate(batch_pipes)
+            )
+            try:
+                rows = self.execute(query, debug=debug).fetchall()
+            except Exception as e:
+                warn(f"Failed to fetch the sync times of {len(batch_pipes)} pipes:\n{e}")
+                continue
+
+            for ix, db_time in rows:
+                try:
+                    sync_times[batch_pipes[int(ix)]] = _parse_sync_time(db_time)
+                except Exception as e:
+                    warn(f"Failed to parse the sync time of {batch_pipes[int(ix)]}:\n{e}")
+
+    return sync_times
@@ -0,0 +1,286 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+
+"""
+Adapt the insert chunksize of SQL syncs to the measured throughput.
+
+The method `get_pipe_chunksize_controller()` is mixed into `SQLConnector`
+(see `meerschaum/connectors/sql/_SQLConnector.py`).
+"""
+
+from __future__ import annotations
+
+import meerschaum as mrsm
+from meerschaum.utils.typing import Any, Optional, Dict
+from meerschaum.utils.debug import dprint
+
+### The pipe cache key under which the learned controller state is stored.
+ADAPTIVE_CHUNKSIZE_CACHE_KEY: str = 'adaptive_chunksize'
+
+
+class AdaptiveChunksize:
+    """
+    Grow or shrink an insert chunksize with AIMD (additive increase, multiplicative decrease).
+
+    Each full insert batch reports its row count, byte size, and duration via `update()`.
+    While the rows/sec throughput keeps up with its running average (within `tolerance`),
+    the chunksize grows by `step`; when throughput falls behind, a batch fails,
+    or a batch exceeds `max_batch_bytes`, the chunksize is multiplied by `decrease_factor`.
+    The chunksize always stays within `[min_chunksize, max_chunksize]`.
+    """
+
+    def __init__(
+        self,
+        chunksize: Optional[int] = None,
+        min_chunksize: int = 1_000,
+        max_chunksize: int = 1_000_000,
+        step: int = 10_000,
+        decrease_factor: float = 0.5,
+        tolerance: float = 0.1,
+        smoothing: float = 0.5,
+        max_batch_bytes: Optional[int] = None,
+        rows_per_sec: Optional[float] = None,
+        bytes_per_sec: Optional[float] = None,
+    ):
+        """
+        Parameters
+        ----------
+        chunksize: Optional[int], default None
+            The starting chunksize. Defaults to `min_chunksize`.
+
+        min_chunksize: int, default 1_000
+            The smallest chunksize the controller may shrink to.
+
+        max_chunksize: int, default 1_000_000
+            The largest chunksize the controller may grow to.
+
+        step: int, default 10_000
+            How many rows to add after a batch which kept up with the average throughput.
+
+        decrease_factor: float, default 0.5
+            The factor by which to shrink the chunksize after a slow or failed batch.
+
+        tolerance: float, default 0.1
+            The fraction of the average throughput a batch may fall behind
+            before the chunksize is shrunk.
+
+        smoothing: float, default 0.5
+            The weight of the latest batch in the exponential moving average of throughput.
+
+        max_batch_bytes: Optional[int], default None
+            If provided, cap batches to roughly this many bytes of in-memory data.
+
+        rows_per_sec: Optional[float], default None
+            The average rows/sec throughput learned from previous batches.
+
+        bytes_per_sec: Optional[float], default None
+            The average bytes/sec throughput learned from previous batches.
+        """
+        self.max_chunksize = max(1, int(max_chunksize))
+        self.min_chunksize = max(1, min(int(min_chunksize), self.max_chunksize))
+        self.step = max(1, int(step))
+        self.decrease_factor = min(max(float(decrease_factor), 0.0), 1.0)
+        self.tolerance = max(float(tolerance), 0.0)
+        self.smoothing = min(max(float(smoothing), 0.0), 1.0)
+        self.max_batch_bytes = int(max_batch_bytes) if max_batch_bytes else None
+        self.rows_per_sec = rows_per_sec
+        self.bytes_per_sec = bytes_per_sec
+        self.chunksize = self._clamp(chunksize if chunksize else self.min_chunksize)
+
+    def _clamp(self, chunksize: int) -> int:
+        """
+        Keep a chunksize within the configured bounds.
+        """
+        return max(self.min_chunksize, min(int(chunksize), self.max_chunksize))
+
+    def increase(self) -> int:
+        """
+        Grow the chunksize by `step` and return the new chunksize.
+        """
+        self.chunksize = self._clamp(self.chunksize + self.step)
+        return self.chunksize
+
+    def decrease(self) -> int:
+        """
+        Shrink the chunksize by `decrease_factor` and return the new chunksize.
+        """
+        self.chunksize = self._clamp(self.chunksize * self.decrease_factor)
+        return self.chunksize
+
+    def get_batch_size(self, row_bytes: Optional[float] = None) -> int:
+        """
+        Return the number of rows to insert in the next batch.
+
+        Parameters
+        ----------
+        row_bytes: Optional[float], default None
+            The estimated in-memory size of a single row.
+            If provided, the batch is capped to `max_batch_bytes`.
+
+        Returns
+        -------
+        The current chunksize, capped by `max_batch_bytes` (but never below `min_chunksize`).
+        """
+        if not self.max_batch_bytes or not row_bytes or row_bytes <= 0:
+            return self.chunksize
+        return max(min(self.chunksize, int(self.max_batch_bytes // row_bytes)), self.min_chunksize)
+
+    def update(
+        self,
+        num_rows: int,
+        duration: float,
+        num_bytes: Optional[int] = None,
+        success: bool = True,
+    ) -> int:
+        """
+        Record a finished insert batch and adjust the chunksize.
+
+        Parameters
+        ----------
+        num_rows: int
+            The number of rows inserted in the batch.
+
+        duration: float
+            How many seconds the batch took.
+
+        num_bytes: Optional[int], default None
+            The in-memory size of the batch, if known.
+
+        success: bool, default True
+            Whether the batch was inserted successfully.
+
+        Returns
+        -------
+        The chunksize to use for the next batch.
+        """
+        if not success:
+            return self.decrease()
+
+        if num_rows <= 0 or duration <= 0:
+            return self.chunksize
+
+        rows_per_sec = num_rows / duration
+        bytes_per_sec = (num_bytes / duration) if num_bytes else None
+
+        ### A short (trailing) batch pays the same fixed overhead for fewer rows,
+        ### so it only seeds the average and never moves the chunksize.
+        if num_rows < self.chunksize and self.rows_per_sec is not None:
+            return self.chunksize
+
+        if self.max_batch_bytes and num_bytes and num_bytes > self.max_batch_bytes:
+            self.decrease()
+        elif (
+            self.rows_per_sec is None
+            or rows_per_sec >= self.rows_per_sec * (1.0 - self.tolerance)
+        ):
+            if num_rows >= self.chunksize:
+                self.increase()
+        else:
+            self.decrease()
+
+        self.rows_per_sec = self._smooth(self.rows_per_sec, rows_per_sec)
+        if bytes_per_sec is not None:
+            self.bytes_per_sec = self._smooth(self.bytes_per_sec, bytes_per_sec)
+        return self.chunksize
+
+    def _smooth(self, average: Optional[float], value: float) -> float:
+        """
+        Return the exponential moving average of `average` and `value`.
+        """
+        if average is None:
+            return value
+        return (self.smoothing * value) + ((1.0 - self.smoothing) * average)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the learned state to be cached between syncs.
+        """
+        return {
+            'chunksize': self.chunksize,
+            'rows_per_sec': self.rows_per_sec,
+            'bytes_per_sec': self.bytes_per_sec,
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        state: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> AdaptiveChunksize:
+        """
+        Build a controller from a cached state (see `to_dict()`).
+        Additional keyword arguments (e.g. bounds) are passed to the constructor.
+        """
+        state = state if isinstance(state, dict) else {}
+        params = {
+            key: state[key]
+            for key in ('chunksize', 'rows_per_sec', 'bytes_per_sec')
+            if state.get(key) is not None
+        }
+        return cls(**{**kwargs, **params})
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveChunksize(chunksize={self.chunksize}, "
+            f"min_chunksize={self.min_chunksize}, max_chunksize={self.max_chunksize})"
+        )
+
+
+def get_pipe_chunksize_controller(
+    self,
+    pipe: mrsm.Pipe,
+    debug: bool = False,
+) -> Optional[AdaptiveChunksize]:
+    """
+    Return the adaptive chunksize controller for a pipe's inserts,
+    resuming from the state learned during previous syncs.
+
+    Parameters
+    ----------
+    pipe: mrsm.Pipe
+        The pipe being synced.
+
+    Returns
+    -------
+    An `AdaptiveChunksize` controller, or `None` if `system:connectors:sql:adaptive_chunksize`
+    is disabled.
+    """
+    from meerschaum.connectors.sql._sql import _max_chunks_flavors
+    adaptive_config = self._sys_config.get('adaptive_chunksize', None) or {}
+    if not adaptive_config.get('enabled', False):
+        return None
+
+    max_chunksize = adaptive_config.get('max_chunksize', None) or 1_000_000
+    if self.flavor in _max_chunks_flavors:
+        max_chunksize = min(max_chunksize, _max_chunks_flavors[self.flavor])
+
+    max_batch_mb = adaptive_config.get('max_batch_mb', None)
+    controller = AdaptiveChunksize.from_dict(
+        pipe._get_cached_value(ADAPTIVE_CHUNKSIZE_CACHE_KEY, debug=debug),
+        chunksize=(self._sys_config.get('chunksize', None) or None),
+        min_chunksize=(adaptive_config.get('min_chunksize', None) or 1),
+        max_chunksize=max_chunksize,
+        step=(adaptive_config.get('step', None) or 1),
+        decrease_factor=adaptive_config.get('decrease_factor', 0.5),
+        tolerance=adaptive_config.get('tolerance', 0.1),
+        smoothing=adaptive_config.get('smoothing', 0.5),
+        max_batch_bytes=(int(max_batch_mb * 1024 * 1024) if max_batch_mb else None),
+    )
+    if debug:
+        dprint(f"Adaptive chunksize for {pipe}: {controller}")
+    return controller
+
+
+def cache_pipe_chunksize_controller(
+    self,
+    pipe: mrsm.Pipe,
+    controller: Optional[AdaptiveChunksize],
+    debug: bool = False,
+) -> None:
+    """
+    Remember a controller's learned state in the pipe's cache for the next sync.
+    """
+    if controller is None:
+        return
+    pipe._cache_value(ADAPTIVE_CHUNKSIZE_CACHE_KEY, controller.to_dict(), debug=debug)
@@ -0,0 +1,515 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+
+"""
+Encode dataframes into PostgreSQL's binary `COPY` format.
+
+Rather than serializing every cell into CSV text, each column is converted once into
+big-endian NumPy arrays (or a list of byte strings for variable-width types),
+and tuples are assembled into the `COPY ... FORMAT BINARY` wire format with vectorized scatters.
+See https://www.postgresql.org/docs/current/sql-copy.html#id-1.9.3.55.9.4.
+"""
+
+from __future__ import annotations
+
+import struct
+
+from meerschaum.utils.typing import Union, List, Dict, Any, Iterable, Optional, Tuple
+
+### The signature, flags, and header extension length which begin every binary `COPY`.
+PG_BINARY_COPY_HEADER: bytes = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+
+### The field count of -1 which ends a binary `COPY`.
+PG_BINARY_COPY_TRAILER: bytes = struct.pack('>h', -1)
+
+### Microseconds and days between the UNIX epoch and PostgreSQL's epoch (2000-01-01).
+PG_EPOCH_MICROSECONDS: int = 946_684_800 * 1_000_000
+PG_EPOCH_DAYS: int = 10_957
+
+### PostgreSQL base types (`pg_type.typname`) and their fixed-width big-endian NumPy dtypes.
+PG_BINARY_FIXED_TYPES: Dict[str, str] = {
+    'bool': '?',
+    'int2': '>i2',
+    'int4': '>i4',
+    'int8': '>i8',
+    'float4': '>f4',
+    'float8': '>f8',
+    'timestamp': '>i8',
+    'timestamptz': '>i8',
+    'date': '>i4',
+    'uuid': 'V16',
+}
+
+### PostgreSQL base types which are sent as variable-width byte strings.
+PG_BINARY_VARIABLE_TYPES = {
+    'text',
+    'varchar',
+    'bpchar',
+    'name',
+    'json',
+    'jsonb',
+    'bytea',
+    'numeric',
+}
+
+### The number of rows to assemble into a buffer per write.
+PG_BINARY_COPY_BLOCK_SIZE: int = 65_536
+
+
+class BinaryCopyUnsupported(Exception):
+    """
+    Raised when a dataframe cannot be encoded into the binary `COPY` format.
+    """
+
+
+def get_pg_table_base_types(
+    conn: 'sqlalchemy.engine.Connection',
+    table_name: str,
+) -> Dict[str, str]:
+    """
+    Return a dictionary mapping a table's columns to their base types (`pg_type.typname`).
+
+    Parameters
+    ----------
+    conn: sqlalchemy.engine.Connection
+        The connection on which the `COPY` will be executed.
+
+    table_name: str
+        The quoted (and schema-qualified) table name.
+
+    Returns
+    -------
+    A dictionary of column names to type names, e.g. `{'dt': 'timestamptz', 'id': 'int8'}`.
+    """
+    from meerschaum.utils.packages import attempt_import
+    sqlalchemy = attempt_import('sqlalchemy', lazy=False)
+    query = sqlalchemy.text(
+        "SELECT a.attname, t.typname\n"
+        "FROM pg_catalog.pg_attribute AS a\n"
+        "INNER JOIN pg_catalog.pg_type AS t\n"
+        "    ON t.oid = a.atttypid\n"
+        "WHERE a.attrelid = CAST(:table_name AS regclass)\n"
+        "    AND a.attnum > 0\n"
+        "    AND NOT a.attisdropped"
+    )
+    return {
+        str(col): str(typ)
+        for col, typ in conn.execute(query, {'table_name': table_name}).fetchall()
+    }
+
+
+def _encode_pg_numeric(value: Any) -> bytes:
+    """
+    Encode a decimal (or decimal string) into PostgreSQL's binary `NUMERIC` format:
+    the digit count, weight, sign, and display scale followed by base-10000 digits.
+    """
+    from decimal import Decimal
+    dec = value if isinstance(value, Decimal) else Decimal(str(value))
+    if dec.is_nan():
+        return struct.pack('>hhHH', 0, 0, 0xC000, 0)
+    if dec.is_infinite():
+        return struct.pack('>hhHH', 0, 0, (0xF000 if dec.is_signed() else 0xD000), 0)
+
+    sign, digits, exponent = dec.as_tuple()
+    digits_str = ''.join(str(digit) for digit in digits)
+    if exponent > 0:
+        digits_str += '0' * exponent
+        exponent = 0
+    dscale = -exponent
+    if len(digits_str) < dscale:
+        digits_str = digits_str.zfill(dscale)
+
+    int_str = digits_str[:(len(digits_str) - dscale)] or '0'
+    frac_str = digits_str[(len(digits_str) - dscale):]
+    int_str = int_str.zfill(-(-len(int_str) // 4) * 4)
+    frac_str = frac_str.ljust(-(-len(frac_str) // 4) * 4, '0')
+
+    int_groups = [int(int_str[i:(i + 4)]) for i in range(0, len(int_str), 4)]
+    groups = int_groups + [int(frac_str[i:(i + 4)]) for i in range(0, len(frac_str), 4)]
+    weight = len(int_groups) - 1
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+
+    return struct.pack(
+        f'>hhHH{len(groups)}H',
+        len(groups),
+        weight,
+        (0x4000 if sign else 0x0000),
+        dscale,
+        *groups
+    )
+
+
+def _encode_pg_text(value: Any) -> bytes:
+    """
+    Encode a value as UTF-8 text, serializing non-strings the same way as the CSV `COPY`.
+    NOTE: PostgreSQL doesn't support NUL chars in text, so they're removed from strings.
+    """
+    import json
+    from meerschaum.utils.dtypes import json_serialize_value
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=json_serialize_value)
+    elif not isinstance(value, str):
+        value = json_serialize_value(value, default_to_str=False)
+        if not isinstance(value, str):
+            value = str(value)
+    return value.replace('\0', '').replace('\\u0000', '').encode('utf-8')
+
+
+def _encode_pg_bytea(value: Any) -> bytes:
+    """
+    Return the raw bytes for a `BYTEA` value, decoding hex-escaped strings (`\\x...`).
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith('\\x') else value)
+    raise BinaryCopyUnsupported(f"Cannot encode {type(value)} as bytea.")
+
+
+def _get_datetime_series(series: 'pd.Series', pd: Any) -> 'pd.Series':
+    """
+    Return a datetime series as naive UTC microseconds.
+    """
+    if not str(series.dtype).startswith('datetime64'):
+        series = pd.to_datetime(series, utc=True, format='ISO8601')
+    if getattr(series.dt, 'tz', None) is not None:
+        series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+    return series.astype('datetime64[us]')
+
+
+def _prepare_fixed_column(
+    series: 'pd.Series',
+    typ: str,
+    pd: Any,
+    np: Any,
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Convert a column into a fixed-width big-endian array and its null mask.
+    """
+    import uuid
+    nulls = series.isna().to_numpy(dtype=bool)
+    if typ in ('timestamp', 'timestamptz'):
+        micros = _get_datetime_series(series, pd).to_numpy().view('i8')
+        values = np.where(nulls, 0, micros - PG_EPOCH_MICROSECONDS)
+    elif typ == 'date':
+        days = _get_datetime_series(series, pd).to_numpy().astype('datetime64[D]').view('i8')
+        values = np.where(nulls, 0, days - PG_EPOCH_DAYS)
+    elif typ == 'uuid':
+        values = np.array(
+            [
+                (
+                    (val if isinstance(val, uuid.UUID) else uuid.UUID(str(val))).bytes
+                    if not is_null
+                    else b'\0' * 16
+                )
+                for val, is_null in zip(series.to_numpy(dtype=object), nulls)
+            ],
+            dtype='V16',
+        )
+    elif typ == 'bool':
+        values = series.astype('boolean').fillna(False).to_numpy(dtype=bool)
+    else:
+        numeric_series = pd.to_numeric(series, errors='raise')
+        values = numeric_series.where(~nulls, 0).to_numpy()
+        if typ.startswith('int'):
+            _check_int_values(np.asarray(values), typ, np)
+
+    return np.asarray(values).astype(PG_BINARY_FIXED_TYPES[typ]), nulls
+
+
+def _check_int_values(values: 'np.ndarray', typ: str, np: Any) -> None:
+    """
+    Raise `BinaryCopyUnsupported` for values which the CSV `COPY` would reject
+    (out of range for `typ` or not integral), since NumPy would silently wrap or truncate them.
+    """
+    if len(values) == 0 or values.dtype.kind == 'b':
+        return
+    info = np.iinfo(PG_BINARY_FIXED_TYPES[typ])
+    if values.dtype.kind in 'iu':
+        if values.min() < info.min or values.max() > info.max:
+            raise BinaryCopyUnsupported(f"Values are out of range for '{typ}'.")
+        return
+    if values.dtype.kind == 'f':
+        ### Powers of two are exact as floats, unlike `info.max` for `int8`.
+        bound = 2.0 ** (info.bits - 1)
+        in_range = np.isfinite(values) & (values >= -bound) & (values < bound)
+        if not in_range.all():
+            raise BinaryCopyUnsupported(f"Values are out of range for '{typ}'.")
+        if not (values == np.trunc(values)).all():
+            raise BinaryCopyUnsupported(f"Values are not integers for '{typ}'.")
+        return
+    for val in values:
+        try:
+            is_valid = int(val) == val and info.min <= int(val) <= info.max
+        except (TypeError, ValueError, OverflowError):
+            is_valid = False
+        if not is_valid:
+            raise BinaryCopyUnsupported(f"Value '{val}' cannot be encoded as '{typ}'.")
+
+
+def _prepare_variable_column(
+    series: 'pd.Series',
+    typ: str,
+) -> List[Optional[bytes]]:
+    """
+    Convert a column into a list of encoded byte strings (`None` for nulls).
+    """
+    from meerschaum.utils.dtypes import value_is_null
+    encoder = (
+        _encode_pg_bytea
+        if typ == 'bytea'
+        else (
+            _encode_pg_numeric
+            if typ == 'numeric'
+            else _encode_pg_text
+        )
+    )
+    prefix = b'\x01' if typ == 'jsonb' else b''
+    return [
+        (
+            (prefix + encoder(val))
+            if not value_is_null(val)
+            else None
+        )
+        for val in series.to_numpy(dtype=object)
+    ]
+
+
+def prepare_pg_binary_columns(
+    df: 'pd.DataFrame',
+    keys: List[str],
+    cols_types: Dict[str, str],
+) -> List[Tuple[str, Any, Any]]:
+    """
+    Convert a dataframe's columns into their binary `COPY` representations.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The dataframe to be copied.
+
+    keys: List[str]
+        The columns to copy (in order).
+
+    cols_types: Dict[str, str]
+        The target table's columns and base types (see `get_pg_table_base_types()`).
+
+    Returns
+    -------
+    A list of `(kind, values, nulls)` tuples, one per column.
+    Fixed-width columns are `('fixed', array, null_mask)`, and variable-width columns
+    are `('variable', [bytes or None], None)`.
+
+    Raises
+    ------
+    `BinaryCopyUnsupported` if a column's type cannot be encoded.
+    """
+    from meerschaum.utils.packages import import_pandas, attempt_import
+    pd = import_pandas()
+    np = attempt_import('numpy', lazy=False)
+
+    prepared_cols = []
+    for key in keys:
+        typ = cols_types.get(key, None)
+        if key not in df.columns or typ is None:
+            raise BinaryCopyUnsupported(f"Cannot determine the type of column '{key}'.")
+
+        try:
+            if typ in PG_BINARY_FIXED_TYPES:
+                values, nulls = _prepare_fixed_column(df[key], typ, pd, np)
+                prepared_cols.append(('fixed', values, nulls))
+            elif typ in PG_BINARY_VARIABLE_TYPES:
+                prepared_cols.append(('variable', _prepare_variable_column(df[key], typ), None))
+            else:
+                raise BinaryCopyUnsupported(f"Type '{typ}' is not supported.")
+        except BinaryCopyUnsupported:
+            raise
+        except Exception as e:
+            raise BinaryCopyUnsupported(f"Failed to encode column '{key}' as '{typ}':\n{e}")
+
+    return prepared_cols
+
+
+def encode_pg_binary_tuples(
+    prepared_cols: List[Tuple[str, Any, Any]],
+    begin: int,
+    end: int,
+) -> bytes:
+    """
+    Assemble rows `[begin, end)` of prepared columns into binary `COPY` tuples.
+
+    Each tuple is a 16-bit field count followed by each field's 32-bit length
+    (-1 for `NULL`) and payload. Field positions are computed from the cumulative
+    field lengths, and each column is scattered into the buffer at once.
+    """
+    from meerschaum.utils.packages import attempt_import
+    np = attempt_import('numpy', lazy=False)
+
+    num_rows = end - begin
+    if num_rows <= 0:
+        return b''
+
+    ### Per-column payload lengths (-1 for nulls) and payloads.
+    cols_lengths = []
+    cols_payloads = []
+    for kind, values, nulls in prepared_cols:
+        if kind == 'fixed':
+            block_values = values[begin:end]
+            width = block_values.dtype.itemsize
+            lengths = np.where(nulls[begin:end], -1, width).astype('i8')
+            cols_payloads.append(block_values)
+        else:
+            block_values = values[begin:end]
+            lengths = np.fromiter(
+                ((len(val) if val is not None else -1) for val in block_values),
+                dtype='i8',
+                count=num_rows,
+            )
+            cols_payloads.append(b''.join(val for val in block_values if val is not None))
+        cols_lengths.append(lengths)
+
+    fields_sizes = [4 + np.maximum(lengths, 0) for lengths in cols_lengths]
+    rows_sizes = 2 + np.sum(fields_sizes, axis=0)
+    rows_offsets = np.concatenate(([0], np.cumsum(rows_sizes)[:-1]))
+    buffer = np.empty(int(rows_sizes.sum()), dtype=np.uint8)
+
+    field_count = np.frombuffer(struct.pack('>h', len(prepared_cols)), dtype=np.uint8)
+    buffer[rows_offsets[:, None] + np.arange(2)] = field_count
+
+    fields_offsets = rows_offsets + 2
+    for lengths, fields_size, payload in zip(cols_lengths, fields_sizes, cols_payloads):
+        length_bytes = lengths.astype('>i4').view(np.uint8).reshape(num_rows, 4)
+        buffer[fields_offsets[:, None] + np.arange(4)] = length_bytes
+
+        valid = lengths >= 0
+        payload_offsets = fields_offsets[valid] + 4
+        if isinstance(payload, bytes):
+            valid_lengths = lengths[valid]
+            if len(payload) > 0:
+                starts = np.cumsum(valid_lengths) - valid_lengths
+                indices = np.repeat(payload_offsets - starts, valid_lengths) + np.arange(len(payload))
+                buffer[indices] = np.frombuffer(payload, dtype=np.uint8)
+        else:
+            width = payload.dtype.itemsize
+            payload_bytes = payload[valid].view(np.uint8).reshape(-1, width)
+            buffer[payload_offsets[:, None] + np.arange(width)] = payload_bytes
+
+        fields_offsets = fields_offsets + fields_size
+
+    return buffer.tobytes()
+
+
+def iterate_pg_binary_copy(
+    df: 'pd.DataFrame',
+    keys: List[str],
+    cols_types: Dict[str, str],
+    block_size: int = PG_BINARY_COPY_BLOCK_SIZE,
+) -> Iterable[bytes]:
+    """
+    Yield the buffers of a binary `COPY` for a dataframe: the header, blocks of tuples,
+    and the trailer.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The dataframe to be copied.
+
+    keys: List[str]
+        The columns to copy (in order).
+
+    cols_types: Dict[str, str]
+        The target table's columns and base types (see `get_pg_table_base_types()`).
+
+    block_size: int, default 65536
+        How many rows to encode per buffer.
+
+    Raises
+    ------
+    `BinaryCopyUnsupported` (before yielding) if a column's type cannot be encoded.
+    """
+    prepared_cols = prepare_pg_binary_columns(df, keys, cols_types)
+
+    def _iterate():
+        yield PG_BINARY_COPY_HEADER
+        for begin in range(0, len(df), block_size):
+            yield encode_pg_binary_tuples(prepared_cols, begin, min(begin + block_size, len(df)))
+        yield PG_BINARY_COPY_TRAILER
+
+    return _iterate()
+
+
+def psql_insert_copy_binary(
+    table: 'pandas.io.sql.SQLTable',
+    conn: Union['sqlalchemy.engine.Engine', 'sqlalchemy.engine.Connection'],
+    keys: List[str],
+    data_iter: Iterable[Any],
+    debug: bool = False,
+) -> None:
+    """
+    Insert data for PostgreSQL via `COPY ... FROM STDIN WITH (FORMAT BINARY)`.
+
+    Instead of the row tuples in `data_iter`, the columns of the table's frame are encoded
+    directly, so this method must be called with a single chunk (`chunksize=None`).
+    Falls back to the CSV `COPY` (`psql_insert_copy()`) for indices and types
+    which cannot be encoded (e.g. geometries).
+
+    Parameters
+    ----------
+    table: pandas.io.sql.SQLTable
+
+    conn: Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection]
+
+    keys: List[str]
+        Column names
+
+    data_iter: Iterable[Any]
+        Iterable that iterates the values to be inserted (only used for the CSV fallback).
+
+    Returns
+    -------
+    None
+    """
+    import io
+    from meerschaum.utils.sql import sql_item_name
+    from meerschaum.utils.warnings import dprint
+    from meerschaum.connectors.sql._sql import psql_insert_copy
+
+    table_name = sql_item_name(table.name, 'postgresql', table.schema)
+    df = getattr(table, 'frame', None)
+    try:
+        if df is None or table.index is not None:
+            raise BinaryCopyUnsupported("Cannot copy indices.")
+        cols_types = get_pg_table_base_types(conn, table_name)
+        buffers = iterate_pg_binary_copy(df, keys, cols_types)
+    except BinaryCopyUnsupported as e:
+        if debug:
+            dprint(f"Falling back to CSV COPY for {table_name}: {e}")
+        return psql_insert_copy(table, conn, keys, data_iter, debug=debug)
+
+    columns = ', '.join(f'"{k}"' for k in keys)
+    sql = f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT BINARY)"
+    if debug:
+        dprint(sql)
+
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cur:
+        copy_method = getattr(cur, 'copy', None)
+        copy_expert_method = getattr(cur, 'copy_expert', None)
+        if copy_method is not None:
+            with cur.copy(sql) as copy:
+                for buffer in buffers:
+                    copy.write(buffer)
+        elif copy_expert_method is not None:
+            copy_expert_method(sql, io.BytesIO(b''.join(buffers)))
+        else:
+            raise SystemError(
+                "Cannot obtain `copy` or `copy_expert` from the PostgreSQL driver:\n"
+                f"{conn}\n{dbapi_conn}\n{cur}"
+            )
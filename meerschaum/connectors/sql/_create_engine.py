@@ -130,7 +130,7 @@ def create_engine(
     ###       2. System configuration
     ###       3. Connector configuration
     ###       4. Keyword arguments
-    _create_engine_args = flavor_configs.get(self.flavor, {}).get('create_engine', {})
+    _create_engine_args = dict(flavor_configs.get(self.flavor, {}).get('create_engine', {}))
     def _apply_create_engine_args(update):
         if 'ALL' not in flavor_configs[self.flavor].get('omit_create_engine', {}):
             _create_engine_args.update(
@@ -143,19 +143,24 @@ def create_engine(
     _apply_create_engine_args(self.__dict__.get('create_engine', {}))
     _apply_create_engine_args(_kw_copy)
 
+    ### I know this looks confusing, and maybe it's bad code,
+    ### but it's simple. It dynamically parses the config string
+    ### and splits it to separate the class name (QueuePool)
+    ### from the module name (sqlalchemy.pool).
+    poolclass = getattr(
+        attempt_import(
+            ".".join(self._sys_config['poolclass'].split('.')[:-1])
+        ),
+        self._sys_config['poolclass'].split('.')[-1]
+    )
+    if (self._sys_config.get('pool', None) or {}).get('metrics', True):
+        from meerschaum.connectors.sql._pool import get_metered_poolclass
+        poolclass = get_metered_poolclass(poolclass, self._pool_metrics)
+
     try:
         engine = sqlalchemy.create_engine(
             engine_str,
-            ### I know this looks confusing, and maybe it's bad code,
-            ### but it's simple. It dynamically parses the config string
-            ### and splits it to separate the class name (QueuePool)
-            ### from the module name (sqlalchemy.pool).
-            poolclass    = getattr(
-                attempt_import(
-                    ".".join(self._sys_config['poolclass'].split('.')[:-1])
-                ),
-                self._sys_config['poolclass'].split('.')[-1]
-            ),
+            poolclass    = poolclass,
             echo         = debug,
             **_create_engine_args
         )
@@ -163,11 +168,32 @@ def create_engine(
         warn(f"Failed to create connector '{self}':\n{traceback.format_exc()}", stack=False)
         engine = None
 
+    if engine is not None and self.flavor in ('sqlite', 'geopackage'):
+        sqlalchemy.event.listen(engine, 'connect', _register_sqlite_functions)
+
     if include_uri:
         return engine, engine_str
     return engine
 
 
+def _register_sqlite_functions(dbapi_connection, connection_record) -> None:
+    """
+    Register Meerschaum's user-defined functions on a new SQLite connection.
+    """
+    try:
+        dbapi_connection.create_function('mrsm_md5', -1, _sqlite_md5, deterministic=True)
+    except Exception as e:
+        dprint(f"Failed to register SQLite functions:\n{e}")
+
+
+def _sqlite_md5(*args) -> str:
+    """
+    Return the MD5 hex digest of a row's values (`mrsm_md5()` in SQLite).
+    """
+    import hashlib
+    return hashlib.md5(repr(args).encode('utf-8')).hexdigest()
+
+
 def _init_mssql_sqlalchemy():
     """
     When first instantiating a SQLAlchemy connection to MSSQL,
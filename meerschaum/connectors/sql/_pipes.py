@@ -140,7 +140,7 @@ def edit_pipe(
     return (result is not None), message
 
 
-def fetch_pipes_keys(
+def _get_fetch_pipes_keys_query(
     self,
     connector_keys: Optional[List[str]] = None,
     metric_keys: Optional[List[str]] = None,
@@ -148,36 +148,10 @@ def fetch_pipes_keys(
     tags: Optional[List[str]] = None,
     params: Optional[Dict[str, Any]] = None,
     debug: bool = False,
-) -> Dict[
-        int, Tuple[str, str, Union[str, None], Dict[str, Any]]
-    ]:
+) -> Union['sqlalchemy.sql.Select', None]:
     """
-    Return a dictionary mapping pipe IDs to key tuples corresponding to the parameters provided.
-
-    Parameters
-    ----------
-    connector_keys: Optional[List[str]], default None
-        List of connector_keys to search by.
-
-    metric_keys: Optional[List[str]], default None
-        List of metric_keys to search by.
-
-    location_keys: Optional[List[str]], default None
-        List of location_keys to search by.
-
-    tags: Optional[List[str]], default None
-        List of pipes to search by.
-
-    params: Optional[Dict[str, Any]], default None
-        Dictionary of additional parameters to search by.
-        E.g. `--params pipe_id:1`
-
-    debug: bool, default False
-        Verbosity toggle.
-
-    Returns
-    -------
-    A list of tuples of pipes' keys and parameters (connector_keys, metric_key, location_key, parameters).
+    Build the `SELECT` query for `fetch_pipes_keys()`,
+    or return `None` if the pipes table does not exist.
     """
     from meerschaum.utils.packages import attempt_import
     from meerschaum.utils.misc import separate_negation_values
@@ -231,7 +205,7 @@ def fetch_pipes_keys(
             parameters[col] = vals
 
     if not table_exists('mrsm_pipes', self, schema=self.instance_schema, debug=debug):
-        return {}
+        return None
 
     from meerschaum.connectors.sql.tables import get_tables
     pipes_tbl = get_tables(mrsm_instance=self, create=False, debug=debug)['pipes']
@@ -330,6 +304,59 @@ def fetch_pipes_keys(
         loc_asc,
     )
 
+    return q
+
+
+def fetch_pipes_keys(
+    self,
+    connector_keys: Optional[List[str]] = None,
+    metric_keys: Optional[List[str]] = None,
+    location_keys: Optional[List[str]] = None,
+    tags: Optional[List[str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    debug: bool = False,
+) -> Dict[
+        int, Tuple[str, str, Union[str, None], Dict[str, Any]]
+    ]:
+    """
+    Return a dictionary mapping pipe IDs to key tuples corresponding to the parameters provided.
+
+    Parameters
+    ----------
+    connector_keys: Optional[List[str]], default None
+        List of connector_keys to search by.
+
+    metric_keys: Optional[List[str]], default None
+        List of metric_keys to search by.
+
+    location_keys: Optional[List[str]], default None
+        List of location_keys to search by.
+
+    tags: Optional[List[str]], default None
+        List of pipes to search by.
+
+    params: Optional[Dict[str, Any]], default None
+        Dictionary of additional parameters to search by.
+        E.g. `--params pipe_id:1`
+
+    debug: bool, default False
+        Verbosity toggle.
+
+    Returns
+    -------
+    A list of tuples of pipes' keys and parameters (connector_keys, metric_key, location_key, parameters).
+    """
+    q = self._get_fetch_pipes_keys_query(
+        connector_keys=connector_keys,
+        metric_keys=metric_keys,
+        location_keys=location_keys,
+        tags=tags,
+        params=params,
+        debug=debug,
+    )
+    if q is None:
+        return {}
+
     ### execute the query and return a list of tuples
     if debug:
         dprint(q)
@@ -1090,6 +1117,8 @@ def get_pipe_data(
     end_add_minutes: int = 0,
     chunksize: Optional[int] = -1,
     as_iterator: bool = False,
+    parallel: Optional[bool] = None,
+    workers: Optional[int] = None,
     debug: bool = False,
     **kw: Any
 ) -> Union[pd.DataFrame, None]:
@@ -1137,6 +1166,14 @@ def get_pipe_data(
     as_iterator: bool, default False
         If `True`, return the chunks iterator directly.
 
+    parallel: Optional[bool], default None
+        If `True`, split `[begin, end)` along the pipe's chunk interval
+        and read the ranges concurrently (see `get_pipe_data_parallel()`).
+        Defaults to `system:connectors:sql:parallel_reads:enabled`.
+
+    workers: Optional[int], default None
+        The maximum number of concurrent range reads when `parallel` is `True`.
+
     debug: bool, default False
         Verbosity toggle.
 
@@ -1146,16 +1183,109 @@ def get_pipe_data(
 
     """
     from meerschaum.utils.packages import import_pandas
-    from meerschaum.utils.dtypes import to_pandas_dtype, are_dtypes_equal
+    pd = import_pandas()
+    is_dask = 'dask' in pd.__name__
+
+    select_columns, dtypes = self._get_pipe_data_dtypes(
+        pipe,
+        select_columns=select_columns,
+        omit_columns=omit_columns,
+        debug=debug,
+    )
+
+    parallel_config = self._sys_config.get('parallel_reads', None) or {}
+    if parallel is None:
+        parallel = parallel_config.get('enabled', False)
+    if (
+        parallel
+        and self.IS_THREAD_SAFE
+        and not as_iterator
+        and not is_dask
+        and limit is None
+        and not begin_add_minutes
+        and not end_add_minutes
+        and pipe.columns.get('datetime', None)
+    ):
+        chunk_bounds = self.get_pipe_data_chunk_bounds(pipe, begin=begin, end=end, debug=debug)
+        if len(chunk_bounds) > 1:
+            return self.get_pipe_data_parallel(
+                pipe,
+                chunk_bounds,
+                select_columns=select_columns,
+                omit_columns=omit_columns,
+                params=params,
+                order=order,
+                chunksize=chunksize,
+                dtype=dtypes,
+                workers=workers,
+                debug=debug,
+                **kw
+            )
+
+    query = self.get_pipe_data_query(
+        pipe,
+        select_columns=select_columns,
+        omit_columns=omit_columns,
+        begin=begin,
+        end=end,
+        params=params,
+        order=order,
+        limit=limit,
+        begin_add_minutes=begin_add_minutes,
+        end_add_minutes=end_add_minutes,
+        debug=debug,
+        **kw
+    )
+
+    read_kwargs = {}
+    if is_dask:
+        index_col = pipe.columns.get('datetime', None)
+        read_kwargs['index_col'] = index_col
+
+    chunks = self.read(
+        query,
+        chunksize=chunksize,
+        as_iterator=True,
+        coerce_float=False,
+        dtype=dtypes,
+        debug=debug,
+        **read_kwargs
+    )
+
+    if as_iterator:
+        return chunks
+
+    return pd.concat(chunks)
+
+
+def _get_pipe_data_dtypes(
+    self,
+    pipe: mrsm.Pipe,
+    select_columns: Optional[List[str]] = None,
+    omit_columns: Optional[List[str]] = None,
+    debug: bool = False,
+) -> Tuple[Optional[List[str]], Dict[str, Any]]:
+    """
+    Return the columns to select and the pandas dtypes to read for `get_pipe_data()`.
+    """
+    from meerschaum.utils.packages import import_pandas
+    from meerschaum.utils.dtypes import to_pandas_dtype, are_dtypes_equal, MRSM_PD_ARROW_DTYPES
     from meerschaum.utils.dtypes.sql import get_pd_type_from_db_type
     pd = import_pandas()
     is_dask = 'dask' in pd.__name__
 
     cols_types = pipe.get_columns_types(debug=debug) if pipe.enforce else {}
     pipe_dtypes = pipe.get_dtypes(infer=False, debug=debug) if pipe.enforce else {}
+    arrow = pipe.arrow and not is_dask
+
+    ### NOTE: Arrow decimals are cast by `enforce_dtypes()` after quantizing.
+    def _to_pandas_dtype(typ: str) -> str:
+        if arrow and typ in MRSM_PD_ARROW_DTYPES:
+            return MRSM_PD_ARROW_DTYPES[typ]
+        return to_pandas_dtype(typ)
 
     remote_pandas_types = {
-        col: to_pandas_dtype(get_pd_type_from_db_type(typ))
+        col: _to_pandas_dtype(get_pd_type_from_db_type(typ))
         for col, typ in cols_types.items()
     }
     remote_dt_cols_types = {
@@ -1175,7 +1305,7 @@ def get_pipe_data(
     }
 
     configured_pandas_types = {
-        col: to_pandas_dtype(typ)
+        col: _to_pandas_dtype(typ)
         for col, typ in pipe_dtypes.items()
     }
     configured_lower_precision_dt_cols_types = {
@@ -1226,40 +1356,146 @@ def get_pipe_data(
         dprint(f"[{self}] `read()` dtypes:")
         mrsm.pprint(dtypes)
 
-    query = self.get_pipe_data_query(
-        pipe,
-        select_columns=select_columns,
-        omit_columns=omit_columns,
-        begin=begin,
-        end=end,
-        params=params,
-        order=order,
-        limit=limit,
-        begin_add_minutes=begin_add_minutes,
-        end_add_minutes=end_add_minutes,
-        debug=debug,
-        **kw
-    )
+    return select_columns, dtypes
 
-    read_kwargs = {}
-    if is_dask:
-        index_col = pipe.columns.get('datetime', None)
-        read_kwargs['index_col'] = index_col
 
-    chunks = self.read(
-        query,
-        chunksize=chunksize,
-        as_iterator=True,
-        coerce_float=False,
-        dtype=dtypes,
-        debug=debug,
-        **read_kwargs
+def get_pipe_data_chunk_bounds(
+    self,
+    pipe: mrsm.Pipe,
+    begin: Union[datetime, int, str, None] = None,
+    end: Union[datetime, int, str, None] = None,
+    debug: bool = False,
+) -> List[Tuple[Union[datetime, int, None], Union[datetime, int, None]]]:
+    """
+    Return the ranges of a pipe's `datetime` axis to read concurrently.
+
+    The bounds are aligned to the epoch grid of the pipe's chunk interval,
+    the same grid used for native range partitions and TimescaleDB hypertable chunks,
+    so each range prunes to a single partition or chunk.
+    Adjacent ranges are merged to keep at most `parallel_reads:max_queries` queries.
+
+    Parameters
+    ----------
+    pipe: mrsm.Pipe
+        The pipe to be read.
+
+    begin: Union[datetime, int, str, None], default None
+        The lower bound (inclusive). If `None`, the first range is unbounded.
+
+    end: Union[datetime, int, str, None], default None
+        The upper bound (exclusive). If `None`, the last range is unbounded.
+
+    Returns
+    -------
+    A list of `(begin, end)` tuples in ascending order.
+    """
+    parallel_config = self._sys_config.get('parallel_reads', None) or {}
+    max_queries = parallel_config.get('max_queries', None) or 256
+    try:
+        chunk_bounds = pipe.get_chunk_bounds(
+            begin=begin,
+            end=end,
+            bounded=False,
+            chunk_interval=pipe.get_chunk_interval(debug=debug),
+            align=True,
+            debug=debug,
+        )
+    except Exception as e:
+        if debug:
+            dprint(f"Failed to get chunk bounds for {pipe}, reading in series:\n{e}")
+        return []
+
+    if len(chunk_bounds) <= max_queries:
+        return chunk_bounds
+
+    group_size = -(-len(chunk_bounds) // max_queries)
+    return [
+        (chunk_bounds[i][0], chunk_bounds[min(i + group_size, len(chunk_bounds)) - 1][1])
+        for i in range(0, len(chunk_bounds), group_size)
+    ]
+
+
+def get_pipe_data_parallel(
+    self,
+    pipe: mrsm.Pipe,
+    chunk_bounds: List[Tuple[Union[datetime, int, None], Union[datetime, int, None]]],
+    select_columns: Optional[List[str]] = None,
+    omit_columns: Optional[List[str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    order: Optional[str] = 'asc',
+    chunksize: Optional[int] = -1,
+    dtype: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+    debug: bool = False,
+    **kw: Any
+) -> Union[pd.DataFrame, None]:
+    """
+    Read a pipe's data by running one query per range concurrently over the connection pool
+    and concatenating the results in order.
+
+    Parameters
+    ----------
+    pipe: mrsm.Pipe
+        The pipe to be read.
+
+    chunk_bounds: List[Tuple[Union[datetime, int, None], Union[datetime, int, None]]]
+        The ascending `(begin, end)` ranges to read (see `get_pipe_data_chunk_bounds()`).
+
+    workers: Optional[int], default None
+        The maximum number of concurrent queries.
+        Defaults to `parallel_reads:workers` and is capped by the available pool connections.
+
+    Returns
+    -------
+    A `pd.DataFrame` of the pipe's data, or `None` if any range failed to read.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from meerschaum.utils.packages import import_pandas
+    pd = import_pandas()
+
+    parallel_config = self._sys_config.get('parallel_reads', None) or {}
+    queries = [
+        self.get_pipe_data_query(
+            pipe,
+            select_columns=select_columns,
+            omit_columns=omit_columns,
+            begin=chunk_begin,
+            end=chunk_end,
+            params=params,
+            order=order,
+            debug=debug,
+            **kw
+        )
+        for chunk_begin, chunk_end in chunk_bounds
+    ]
+    if str(order).lower() == 'desc':
+        queries = list(reversed(queries))
+
+    num_workers = min(
+        pipe.get_num_workers(workers or parallel_config.get('workers', None)),
+        len(queries),
     )
+    if debug:
+        dprint(f"Reading {pipe} in {len(queries)} ranges with {num_workers} workers.")
 
-    if as_iterator:
-        return chunks
+    def _read_range(query: Union[str, None]) -> Union[pd.DataFrame, None]:
+        if query is None:
+            return None
+        return self.read(
+            query,
+            chunksize=chunksize,
+            coerce_float=False,
+            dtype=dtype,
+            debug=debug,
+        )
 
-    return pd.concat(chunks)
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        dfs = list(executor.map(_read_range, queries))
+
+    if any(df is None for df in dfs):
+        return None
+
+    return pd.concat(dfs, ignore_index=True)
 
 
 def get_pipe_docs(
@@ -1287,6 +1523,7 @@ def get_pipe_docs(
         params=params,
         order=order,
         limit=limit,
+        after=kw.get('after', None),
         debug=debug,
     )
     if query is None:
@@ -1312,6 +1549,7 @@ def get_pipe_data_query(
     end_add_minutes: int = 0,
     replace_nulls: Optional[str] = None,
     skip_existing_cols_check: bool = False,
+    after: Optional[str] = None,
     debug: bool = False,
     **kw: Any
 ) -> Union[str, None]:
@@ -1365,6 +1603,11 @@ def get_pipe_data_query(
     skip_existing_cols_check: bool, default False
         If `True`, do not verify that querying columns are actually on the table.
 
+    after: Optional[str], default None
+        A continuation token from `meerschaum.utils.pipes.get_keyset_token()`.
+        If provided, only select the rows which follow the token's key tuple in `order`
+        (keyset pagination), so each page seeks the index rather than rescanning it.
+
     debug: bool, default False
         Verbosity toggle.
 
@@ -1513,6 +1756,34 @@ def get_pipe_data_query(
                 'WHERE', ('    AND' if is_dt_bound else "    ")
             )
 
+    if after is not None:
+        from meerschaum.utils.sql import build_keyset_where
+        from meerschaum.utils.pipes import parse_keyset_token
+        if order is None:
+            warn(f"Ignoring continuation token for {pipe} because `order` is `None`.", stack=False)
+            after = None
+
+    if after is not None:
+        keyset_keys = []
+        for col, value in parse_keyset_token(after):
+            if not (col in existing_cols or skip_existing_cols_check):
+                continue
+            if col == _dt and value is not None:
+                value = pipe.parse_date_bounds(value)
+                if isinstance(value, datetime) and dt_typ:
+                    value = coerce_timezone(value, strip_utc=('utc' not in dt_typ.lower()))
+            keyset_keys.append((col, value))
+
+        keyset_where = build_keyset_where(
+            keyset_keys,
+            flavor=self.flavor,
+            order=order,
+            datetime_column=_dt,
+            datetime_db_type=dt_db_type,
+        )
+        if keyset_where:
+            where += ("\n    AND " if where.strip() else "\n    ") + keyset_where
+
     if len(where) > 0:
         query += "\nWHERE " + where
 
@@ -1559,6 +1830,105 @@ def get_pipe_data_query(
     return query
 
 
+def get_pipe_rows_digests(
+    self,
+    pipe: mrsm.Pipe,
+    on_cols: Optional[List[str]] = None,
+    begin: Union[datetime, int, str, None] = None,
+    end: Union[datetime, int, str, None] = None,
+    params: Optional[Dict[str, Any]] = None,
+    chunksize: Optional[int] = -1,
+    debug: bool = False,
+    **kw: Any
+) -> Union[pd.DataFrame, None]:
+    """
+    Return the index columns and a per-row digest computed in the database,
+    so that existing rows may be compared without transferring their values.
+
+    Parameters
+    ----------
+    pipe: mrsm.Pipe
+        The pipe whose rows should be digested.
+
+    on_cols: Optional[List[str]], default None
+        The index columns to return alongside the digests.
+        Defaults to the pipe's index columns (or the primary key if set).
+
+    begin: Union[datetime, int, str, None], default None
+        If provided, only digest rows newer than or equal to this value.
+
+    end: Union[datetime, int, str, None], default None
+        If provided, only digest rows older than this value.
+
+    params: Optional[Dict[str, Any]], default None
+        Additional parameters to filter by.
+        See `meerschaum.utils.sql.build_where`.
+
+    chunksize: Optional[int], default -1
+        The chunksize used when reading the results.
+
+    debug: bool, default False
+        Verbosity toggle.
+
+    Returns
+    -------
+    A DataFrame of the `on_cols` and the column `_mrsm_digest` (an MD5 hex string),
+    or `None` if the flavor does not support row digests.
+    """
+    from meerschaum.utils.sql import sql_item_name, wrap_query_with_cte, ROW_DIGEST_EXPRESSIONS
+
+    digest_expression = ROW_DIGEST_EXPRESSIONS.get(self.flavor, None)
+    if digest_expression is None:
+        return None
+
+    existing_cols = pipe.get_columns_types(debug=debug)
+    if not existing_cols:
+        return None
+
+    primary_key = pipe.columns.get('primary', None)
+    on_cols = on_cols or (
+        [primary_key]
+        if primary_key
+        else [
+            col
+            for col_key, col in pipe.columns.items()
+            if col and col_key != 'value'
+        ]
+    )
+    on_cols = [col for col in on_cols if col in existing_cols]
+    if not on_cols:
+        return None
+
+    query = self.get_pipe_data_query(
+        pipe,
+        begin=begin,
+        end=end,
+        params=params,
+        order=None,
+        debug=debug,
+    )
+    if query is None:
+        return None
+
+    src_name = sql_item_name('src', self.flavor, None)
+    digest_cols_str = ', '.join(
+        f"{src_name}.{sql_item_name(col, self.flavor, None)}"
+        for col in existing_cols
+    )
+    on_cols_str = ', '.join(
+        f"{src_name}.{sql_item_name(col, self.flavor, None)}"
+        for col in on_cols
+    )
+    digest_col_name = sql_item_name('_mrsm_digest', self.flavor, None)
+    parent_query = (
+        f"SELECT {on_cols_str},\n"
+        f"    {digest_expression.format(cols=digest_cols_str)} AS {digest_col_name}\n"
+        f"FROM {src_name}"
+    )
+    digests_query = wrap_query_with_cte(query, parent_query, self.flavor)
+    return self.read(digests_query, chunksize=chunksize, silent=(not debug), debug=debug)
+
+
 def get_pipe_id(
     self,
     pipe: mrsm.Pipe,
@@ -1867,7 +2237,6 @@ def sync_pipe(
     from meerschaum.utils.dataframe import get_special_cols
     from meerschaum import Pipe
     import time
-    import copy
     pd = import_pandas()
     if df is None:
         msg = f"DataFrame is None. Cannot sync {pipe}."
@@ -1947,7 +2316,7 @@ def sync_pipe(
         kw.pop('name')
 
     ### Insert new data into the target table.
-    unseen_kw = copy.deepcopy(kw)
+    unseen_kw = kw.copy()
     unseen_kw.update({
         'name': pipe.target,
         'if_exists': if_exists,
@@ -1958,6 +2327,13 @@ def sync_pipe(
         'dtype': self.get_to_sql_dtype(pipe, unseen_df, update_dtypes=True),
         'schema': self.get_pipe_schema(pipe),
     })
+    chunksize_controller = (
+        self.get_pipe_chunksize_controller(pipe, debug=debug)
+        if chunksize == -1 and len(unseen_df) > 0
+        else None
+    )
+    if chunksize_controller is not None:
+        unseen_kw['chunksize_controller'] = chunksize_controller
 
     dt_col = pipe.columns.get('datetime', None)
     primary_key = pipe.columns.get('primary', None)
@@ -2055,6 +2431,9 @@ def sync_pipe(
                     if identity_off_result is None:
                         return False, f"Could not disable identity inserts on {pipe}."
 
+        if stats.get('success', False):
+            self.cache_pipe_chunksize_controller(pipe, chunksize_controller, debug=debug)
+
     if is_new:
         if not self.create_indices(pipe, debug=debug):
             warn(f"Failed to create indices for {pipe}. Continuing...")
@@ -2114,7 +2493,15 @@ def sync_pipe(
         temp_pipe._cache_value('_skip_check_indices', True, memory_only=True, debug=debug)
         now_ts = get_current_timestamp('ms', as_int=True) / 1000
         temp_pipe._cache_value('_columns_types_timestamp', now_ts, memory_only=True, debug=debug)
-        temp_success, temp_msg = temp_pipe.sync(update_df, check_existing=False, debug=debug)
+        ### Stage the updates in one transaction with the flavor's fastest loader
+        ### so that a single set-based merge may apply them.
+        temp_success, temp_msg = temp_pipe.sync(
+            update_df,
+            check_existing=False,
+            chunksize=None,
+            bulk_insert=(True if self._sys_config.get('stage_bulk_insert', True) else None),
+            debug=debug,
+        )
         if not temp_success:
             return temp_success, temp_msg
 
@@ -2262,6 +2649,8 @@ def sync_pipe_inplace(
     -------
     A SuccessTuple.
     """
+    ### DuckDB would inspect the uncommitted temporary tables on separate connections,
+    ### so sync through pandas instead (keeping the writes in one transaction).
     if self.flavor == 'duckdb':
         return pipe.sync(
             params=params,
@@ -2743,6 +3132,7 @@ def sync_pipe_inplace(
         with_results=True,
         debug=debug,
     ) if on_cols and not upsert else ((True, "Success"), [])
+
     apply_update_queries = (
         get_update_queries(
             pipe.target,
@@ -2839,23 +3229,61 @@ def get_sync_time(
     -------
     A `datetime` object (or `int` if using an integer axis) if the pipe exists, otherwise `None`.
     """
-    from meerschaum.utils.sql import sql_item_name, build_where, wrap_query_with_cte
-    src_name = sql_item_name('src', self.flavor)
-    table_name = sql_item_name(pipe.target, self.flavor, self.get_pipe_schema(pipe))
+    query, bind_params = self._get_sync_time_query(
+        pipe,
+        params=params,
+        newest=newest,
+        remote=remote,
+        debug=debug,
+    )
+    if query is None:
+        return None
+
+    try:
+        db_time = self.value(
+            query,
+            *([bind_params] if bind_params else []),
+            silent=True,
+            debug=debug,
+        )
+        sync_time = _parse_sync_time(db_time)
+    except Exception as e:
+        sync_time = None
+        warn(str(e))
 
+    return sync_time
+
+
+def _get_sync_time_query(
+    self,
+    pipe: mrsm.Pipe,
+    params: Optional[Dict[str, Any]] = None,
+    newest: bool = True,
+    remote: bool = False,
+    debug: bool = False,
+) -> Tuple[Union[str, None], Union[Dict[str, Any], None]]:
+    """
+    Return the query for `get_sync_time()` and its bind params (`None` if the values are inlined).
+    If the pipe has no sync time to query, return `(None, None)`.
+    """
+    from meerschaum.utils.sql import (
+        sql_item_name,
+        build_where,
+        wrap_query_with_cte,
+        get_params_shape,
+    )
     dt_col = pipe.columns.get('datetime', None)
     if dt_col is None:
-        return None
-    dt_col_name = sql_item_name(dt_col, self.flavor, None)
+        return None, None
 
     if remote and pipe.connector.type != 'sql':
         warn(f"Cannot get the remote sync time for {pipe}.")
-        return None
+        return None, None
 
     ASC_or_DESC = "DESC" if newest else "ASC"
     existing_cols = pipe.get_columns_types(debug=debug)
     if not remote and not existing_cols:
-        return None
+        return None, None
     valid_params = {}
     if params is not None:
         valid_params = {k: v for k, v in params.items() if k in existing_cols}
@@ -2865,81 +3293,108 @@ def get_sync_time(
     ### add IS NOT NULL to the WHERE clause.
     if dt_col not in valid_params:
         valid_params[dt_col] = '_None'
-    where = "" if not valid_params else build_where(valid_params, self)
-    src_query = (
-        f"SELECT {dt_col_name}\nFROM {table_name}{where}"
-        if not remote
-        else self.get_pipe_metadef(pipe, params=params, begin=None, end=None)
-    )
 
-    base_query = (
-        f"SELECT {dt_col_name}\n"
-        f"FROM {src_name}\n"
-        f"ORDER BY {dt_col_name} {ASC_or_DESC}\n"
-        f"LIMIT 1"
+    ### Reuse the parameterized query for this table and shape of params.
+    schema = self.get_pipe_schema(pipe)
+    should_partition = self._should_partition(pipe)
+    bind_params = {}
+    params_shape = (
+        get_params_shape(valid_params, bind_params=bind_params)
+        if not remote and self._is_query_cache_enabled()
+        else None
     )
-    if self.flavor == 'mssql':
-        base_query = (
-            f"SELECT TOP 1 {dt_col_name}\n"
-            f"FROM {src_name}\n"
-            f"ORDER BY {dt_col_name} {ASC_or_DESC}"
+    cache_key = (
+        ('sync_time', pipe.target, schema, dt_col, newest, should_partition, params_shape)
+        if params_shape is not None
+        else None
+    )
+    if cache_key is None:
+        bind_params = None
+    query = self.get_cached_query(cache_key) if cache_key is not None else None
+
+    if query is None:
+        src_name = sql_item_name('src', self.flavor)
+        table_name = sql_item_name(pipe.target, self.flavor, schema)
+        dt_col_name = sql_item_name(dt_col, self.flavor, None)
+        where = (
+            ""
+            if not valid_params
+            else build_where(
+                valid_params,
+                self,
+                bind_params=({} if bind_params is not None else None),
+            )
         )
-    elif self.flavor == 'oracle':
-        base_query = (
-            "SELECT * FROM (\n"
-            f"    SELECT {dt_col_name}\n"
-            f"    FROM {src_name}\n"
-            f"    ORDER BY {dt_col_name} {ASC_or_DESC}\n"
-            ") WHERE ROWNUM = 1"
+        src_query = (
+            f"SELECT {dt_col_name}\nFROM {table_name}{where}"
+            if not remote
+            else self.get_pipe_metadef(pipe, params=params, begin=None, end=None)
         )
 
-    ### NOTE: MariaDB has an optimizer bug where `ORDER BY <dt> DESC/ASC LIMIT 1` against a
-    ### `RANGE COLUMNS` partitioned table combined with a `WHERE` clause performs a partition
-    ### index scan that stops early and returns zero rows (observed on MariaDB 12.x). The
-    ### equivalent `MIN`/`MAX` aggregate scans the pruned partitions correctly, so use it for
-    ### the bounds on partitioned MariaDB tables instead.
-    if self.flavor == 'mariadb' and not remote and self._should_partition(pipe):
-        agg_func = "MAX" if newest else "MIN"
         base_query = (
-            f"SELECT {agg_func}({dt_col_name}) AS {dt_col_name}\n"
-            f"FROM {src_name}"
+            f"SELECT {dt_col_name}\n"
+            f"FROM {src_name}\n"
+            f"ORDER BY {dt_col_name} {ASC_or_DESC}\n"
+            f"LIMIT 1"
         )
+        if self.flavor == 'mssql':
+            base_query = (
+                f"SELECT TOP 1 {dt_col_name}\n"
+                f"FROM {src_name}\n"
+                f"ORDER BY {dt_col_name} {ASC_or_DESC}"
+            )
+        elif self.flavor == 'oracle':
+            base_query = (
+                "SELECT * FROM (\n"
+                f"    SELECT {dt_col_name}\n"
+                f"    FROM {src_name}\n"
+                f"    ORDER BY {dt_col_name} {ASC_or_DESC}\n"
+                ") WHERE ROWNUM = 1"
+            )
 
-    query = wrap_query_with_cte(src_query, base_query, flavor)
-
-    try:
-        db_time = self.value(query, silent=True, debug=debug)
+        ### NOTE: MariaDB has an optimizer bug where `ORDER BY <dt> DESC/ASC LIMIT 1` against a
+        ### `RANGE COLUMNS` partitioned table combined with a `WHERE` clause performs a partition
+        ### index scan that stops early and returns zero rows (observed on MariaDB 12.x). The
+        ### equivalent `MIN`/`MAX` aggregate scans the pruned partitions correctly, so use it for
+        ### the bounds on partitioned MariaDB tables instead.
+        if self.flavor == 'mariadb' and not remote and should_partition:
+            agg_func = "MAX" if newest else "MIN"
+            base_query = (
+                f"SELECT {agg_func}({dt_col_name}) AS {dt_col_name}\n"
+                f"FROM {src_name}"
+            )
 
-        ### No datetime could be found.
-        if db_time is None:
-            return None
-        ### sqlite returns str.
-        if isinstance(db_time, str):
-            dateutil_parser = mrsm.attempt_import('dateutil.parser')
-            st = dateutil_parser.parse(db_time)
-        ### Do nothing if a datetime object is returned.
-        elif isinstance(db_time, datetime):
-            if hasattr(db_time, 'to_pydatetime'):
-                st = db_time.to_pydatetime()
-            else:
-                st = db_time
-        ### Sometimes the datetime is actually a date.
-        elif isinstance(db_time, date):
-            st = datetime.combine(db_time, datetime.min.time())
-        ### Adding support for an integer datetime axis.
-        elif 'int' in str(type(db_time)).lower():
-            st = int(db_time)
-        ### Convert pandas timestamp to Python datetime.
-        else:
-            st = db_time.to_pydatetime()
+        query = wrap_query_with_cte(src_query, base_query, flavor)
+        if cache_key is not None:
+            self.cache_query(cache_key, query)
 
-        sync_time = st
+    return query, bind_params
 
-    except Exception as e:
-        sync_time = None
-        warn(str(e))
 
-    return sync_time
+def _parse_sync_time(db_time: Any) -> Union[datetime, int, None]:
+    """
+    Coerce the value returned by the sync time query into a `datetime` or `int`.
+    """
+    ### No datetime could be found.
+    if db_time is None:
+        return None
+    ### sqlite returns str.
+    if isinstance(db_time, str):
+        dateutil_parser = mrsm.attempt_import('dateutil.parser')
+        return dateutil_parser.parse(db_time)
+    ### Do nothing if a datetime object is returned.
+    if isinstance(db_time, datetime):
+        if hasattr(db_time, 'to_pydatetime'):
+            return db_time.to_pydatetime()
+        return db_time
+    ### Sometimes the datetime is actually a date.
+    if isinstance(db_time, date):
+        return datetime.combine(db_time, datetime.min.time())
+    ### Adding support for an integer datetime axis.
+    if 'int' in str(type(db_time)).lower():
+        return int(db_time)
+    ### Convert pandas timestamp to Python datetime.
+    return db_time.to_pydatetime()
 
 
 def pipe_exists(
@@ -3012,23 +3467,53 @@ def get_pipe_rowcount(
     An `int` for the number of rows if the `pipe` exists, otherwise `None`.
 
     """
-    from meerschaum.utils.sql import dateadd_str, sql_item_name, wrap_query_with_cte, build_where
-    from meerschaum.connectors.sql._fetch import get_pipe_query
+    query, bind_params = self._prepare_pipe_rowcount_query(
+        pipe,
+        begin=begin,
+        end=end,
+        params=params,
+        remote=remote,
+        debug=debug,
+    )
+    if query is None:
+        return None
+
+    conn = self if not remote else pipe.connector
+    result = conn.value(query, *([bind_params] if bind_params else []), debug=debug, silent=True)
+    try:
+        return int(result)
+    except Exception:
+        return None
+
+
+def _prepare_pipe_rowcount_query(
+    self,
+    pipe: mrsm.Pipe,
+    begin: Union[datetime, int, None] = None,
+    end: Union[datetime, int, None] = None,
+    params: Optional[Dict[str, Any]] = None,
+    remote: bool = False,
+    debug: bool = False,
+) -> Tuple[Union[str, None], Union[Dict[str, Any], None]]:
+    """
+    Return the query for `get_pipe_rowcount()` and its bind params (`None` if the values are inlined).
+    If the pipe's table (or fetch definition) does not exist, return `(None, None)`.
+    """
+    from meerschaum.utils.sql import sql_item_name, get_params_shape
     from meerschaum.utils.dtypes.sql import get_db_type_from_pd_type
+    from meerschaum.connectors.sql._query_cache import bind_dateadd_str, get_bound_shape
     if remote:
         msg = f"'fetch:definition' must be an attribute of {pipe} to get a remote rowcount."
         if 'fetch' not in pipe.parameters:
             error(msg)
-            return None
+            return None, None
         if 'definition' not in pipe.parameters['fetch']:
             error(msg)
-            return None
+            return None, None
     elif not pipe.exists(debug=debug):
-        return None
+        return None, None
 
     flavor = self.flavor if not remote else pipe.connector.flavor
-    conn = self if not remote else pipe.connector
-    _pipe_name = sql_item_name(pipe.target, flavor, self.get_pipe_schema(pipe))
     dt_col = pipe.columns.get('datetime', None)
     dt_typ = pipe.dtypes.get(dt_col, 'datetime') if dt_col else None
     dt_db_type = get_db_type_from_pd_type(dt_typ, flavor) if dt_typ else None
@@ -3058,6 +3543,90 @@ def get_pipe_rowcount(
                 )
 
 
+    ### Reuse the parameterized query for this table, bounds, and shape of params.
+    valid_params = None
+    if params is not None:
+        existing_cols = pipe.get_columns_types(debug=debug)
+        valid_params = {k: v for k, v in params.items() if k in existing_cols}
+
+    bind_params = {}
+    begin_da = end_da = None
+    cache_key = None
+    if not remote and self._is_query_cache_enabled():
+        if begin is not None:
+            begin_da = bind_dateadd_str(flavor, begin, 'mrsm_begin', bind_params, dt_db_type)
+        if end is not None:
+            end_da = bind_dateadd_str(flavor, end, 'mrsm_end', bind_params, dt_db_type)
+        params_shape = get_params_shape(valid_params, bind_params=bind_params)
+        if (
+            params_shape is not None
+            and (begin is None or begin_da is not None)
+            and (end is None or end_da is not None)
+        ):
+            cache_key = (
+                'rowcount',
+                pipe.target,
+                self.get_pipe_schema(pipe),
+                dt_col,
+                dt_db_type,
+                get_bound_shape(begin),
+                get_bound_shape(end),
+                tuple(params or {}),
+                params_shape,
+            )
+    if cache_key is None:
+        bind_params = None
+        begin_da = end_da = None
+    query = self.get_cached_query(cache_key) if cache_key is not None else None
+
+    if query is None:
+        query = _get_pipe_rowcount_query(
+            self,
+            pipe,
+            dt_col,
+            dt_name,
+            dt_db_type,
+            begin=begin,
+            end=end,
+            begin_da=begin_da,
+            end_da=end_da,
+            params=params,
+            valid_params=valid_params,
+            remote=remote,
+            bind_params=({} if bind_params is not None else None),
+        )
+        if cache_key is not None:
+            self.cache_query(cache_key, query)
+
+    return query, bind_params
+
+
+def _get_pipe_rowcount_query(
+    self,
+    pipe: mrsm.Pipe,
+    dt_col: Optional[str],
+    dt_name: Optional[str],
+    dt_db_type: Optional[str],
+    begin: Union[datetime, int, None] = None,
+    end: Union[datetime, int, None] = None,
+    begin_da: Optional[str] = None,
+    end_da: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    valid_params: Optional[Dict[str, Any]] = None,
+    remote: bool = False,
+    bind_params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Build the `COUNT(*)` query for `get_pipe_rowcount()`.
+    If `begin_da` or `end_da` are provided, use these bound expressions rather than rendering
+    `begin` and `end`, and if `bind_params` is provided, render the params as bind placeholders.
+    """
+    from meerschaum.utils.sql import dateadd_str, sql_item_name, wrap_query_with_cte, build_where
+    from meerschaum.connectors.sql._fetch import get_pipe_query
+    flavor = self.flavor if not remote else pipe.connector.flavor
+    conn = self if not remote else pipe.connector
+    _pipe_name = sql_item_name(pipe.target, flavor, self.get_pipe_schema(pipe))
+
     _datetime_name = sql_item_name(dt_col, flavor)
     _cols_names = [
         sql_item_name(col, flavor)
@@ -3086,32 +3655,25 @@ def get_pipe_rowcount(
     if begin is not None or end is not None:
         query += "\nWHERE"
     if begin is not None:
-        query += (
-            f"\n    {dt_name} >= "
-            + dateadd_str(flavor, datepart='minute', number=0, begin=begin, db_type=dt_db_type)
+        query += f"\n    {dt_name} >= " + (
+            begin_da
+            or dateadd_str(flavor, datepart='minute', number=0, begin=begin, db_type=dt_db_type)
         )
     if end is not None and begin is not None:
         query += "\n    AND"
     if end is not None:
-        query += (
-            f"\n    {dt_name} <  "
-            + dateadd_str(flavor, datepart='minute', number=0, begin=end, db_type=dt_db_type)
+        query += f"\n    {dt_name} <  " + (
+            end_da
+            or dateadd_str(flavor, datepart='minute', number=0, begin=end, db_type=dt_db_type)
         )
-    if params is not None:
-        existing_cols = pipe.get_columns_types(debug=debug)
-        valid_params = {k: v for k, v in params.items() if k in existing_cols}
-        if valid_params:
-            query += build_where(valid_params, conn).replace('WHERE', (
+    if valid_params:
+        query += build_where(valid_params, conn, bind_params=bind_params).replace('WHERE', (
                 'AND' if (begin is not None or end is not None)
                     else 'WHERE'
                 )
             )
 
-    result = conn.value(query, debug=debug, silent=True)
-    try:
-        return int(result)
-    except Exception:
-        return None
+    return query
 
 
 def drop_pipe(
@@ -3866,13 +4428,12 @@ def get_to_sql_dtype(
     >>> get_to_sql_dtype(pipe, df)
     {'a': <class 'sqlalchemy.sql.sqltypes.JSON'>}
     """
-    from meerschaum.utils.dataframe import get_special_cols
     from meerschaum.utils.dtypes.sql import get_db_type_from_pd_type
     df_dtypes = {
         col: str(typ)
         for col, typ in df.dtypes.items()
     }
-    special_cols = get_special_cols(df)
+    special_cols = pipe._get_special_cols(df)
     df_dtypes.update(special_cols)
 
     if update_dtypes:
@@ -0,0 +1,197 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+
+"""
+Measure and size the connection pool of an `SQLConnector`.
+
+The methods `get_pool_metrics()` and `autosize_pool()` are mixed into `SQLConnector`
+(see `meerschaum/connectors/sql/_SQLConnector.py`).
+"""
+
+from __future__ import annotations
+
+import time
+import threading
+
+from meerschaum.utils.typing import Any, Dict
+from meerschaum.utils.debug import dprint
+
+
+class PoolMetrics:
+    """
+    Track a connection pool's checkouts and how long each checkout waited for a connection.
+
+    `wait_seconds` is an exponential moving average of recent waits,
+    so it rises while threads queue for connections and falls once they stop queueing.
+    """
+
+    def __init__(self, smoothing: float = 0.2):
+        """
+        Parameters
+        ----------
+        smoothing: float, default 0.2
+            The weight of the latest checkout in the moving average of wait times.
+        """
+        self.smoothing = min(1.0, max(0.0, float(smoothing)))
+        self.checkouts = 0
+        self.failures = 0
+        self.wait_seconds = 0.0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, wait_seconds: float, success: bool = True) -> None:
+        """
+        Record a checkout which waited `wait_seconds` for a connection.
+
+        Parameters
+        ----------
+        wait_seconds: float
+            How long the checkout blocked.
+
+        success: bool, default True
+            `False` if the checkout raised (e.g. the pool timed out).
+        """
+        with self._lock:
+            self.checkouts += 1
+            if not success:
+                self.failures += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+            self.wait_seconds = (
+                self.smoothing * wait_seconds
+                + (1 - self.smoothing) * self.wait_seconds
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of the metrics.
+        """
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'failures': self.failures,
+                'wait_seconds': self.wait_seconds,
+                'mean_wait_seconds': (
+                    (self.total_wait_seconds / self.checkouts) if self.checkouts else 0.0
+                ),
+                'max_wait_seconds': self.max_wait_seconds,
+            }
+
+
+def get_metered_poolclass(poolclass: type, metrics: PoolMetrics) -> type:
+    """
+    Subclass a SQLAlchemy pool class to record the wait of every checkout into `metrics`.
+
+    The subclass survives `engine.dispose()`, which recreates the pool from its class.
+    """
+    def _do_get(pool):
+        start = time.perf_counter()
+        try:
+            connection_record = poolclass._do_get(pool)
+        except Exception:
+            metrics.update(time.perf_counter() - start, success=False)
+            raise
+        metrics.update(time.perf_counter() - start)
+        return connection_record
+
+    return type(f"Metered{poolclass.__name__}", (poolclass,), {'_do_get': _do_get})
+
+
+def get_pool_metrics(self) -> Dict[str, Any]:
+    """
+    Return checkout and wait-time metrics for this connector's connection pool.
+
+    Returns
+    -------
+    A dictionary with the keys `checkouts`, `failures`, `wait_seconds` (moving average),
+    `mean_wait_seconds`, `max_wait_seconds`, and the pool's current
+    `size`, `checkedout`, `checkedin`, and `overflow` (`None` if the pool does not report them).
+    """
+    stats = self._pool_metrics.get_stats()
+    pool = self.engine.pool
+    for key in ('size', 'checkedout', 'checkedin', 'overflow'):
+        try:
+            stats[key] = getattr(pool, key)()
+        except Exception:
+            stats[key] = None
+    return stats
+
+
+def autosize_pool(
+    self,
+    workers: int,
+    debug: bool = False,
+) -> int:
+    """
+    Grow the connection pool to serve `workers` concurrent threads,
+    within a share of the server's `max_connections`
+    (`system:connectors:sql:pool:max_connections_share`).
+    The pool is never shrunk.
+
+    Parameters
+    ----------
+    workers: int
+        The number of threads which will use the pool concurrently.
+
+    Returns
+    -------
+    The size of the pool in effect (`0` if the pool has no fixed size).
+    """
+    pool_config = self._sys_config.get('pool', None) or {}
+    try:
+        pool_size = self.engine.pool.size()
+    except Exception:
+        return 0
+
+    if (
+        not pool_config.get('autosize', True)
+        or not self.IS_THREAD_SAFE
+        or 'ALL' in self.flavor_configs[self.flavor].get('omit_create_engine', {})
+        or workers <= pool_size
+    ):
+        return pool_size
+
+    max_connections = self.db_max_connections
+    connections_budget = (
+        max(1, int(max_connections * pool_config.get('max_connections_share', 0.5)))
+        if max_connections
+        else None
+    )
+    target_pool_size = (
+        min(workers, connections_budget)
+        if connections_budget is not None
+        else workers
+    )
+    max_overflow = {
+        **self._sys_config.get('create_engine', {}),
+        **self.__dict__.get('create_engine', {}),
+    }.get('max_overflow', 0)
+    if connections_budget is not None:
+        max_overflow = max(0, min(max_overflow, connections_budget - target_pool_size))
+
+    with self._locks['_pool']:
+        old_engine = self.engine
+        pool_size = old_engine.pool.size()
+        if target_pool_size <= pool_size:
+            return pool_size
+
+        new_engine = self.create_engine(
+            pool_size=target_pool_size,
+            max_overflow=max_overflow,
+            debug=debug,
+        )
+        if new_engine is None:
+            return pool_size
+
+        if debug:
+            dprint(
+                f"[{self}] Resizing the connection pool from {pool_size} to {target_pool_size} "
+                f"(max overflow {max_overflow}, server max connections {max_connections})."
+            )
+        self._engine = new_engine
+        self.__dict__.pop('_Session', None)
+        old_engine.dispose()
+
+    return target_pool_size
@@ -0,0 +1,156 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+
+"""
+Cache the parameterized SQL text of frequently repeated pipe queries.
+
+Queries such as `get_sync_time()` and `get_pipe_rowcount()` are rendered once per
+query kind, pipe table, and shape of their params, with bind placeholders in place
+of the values. Later calls only compute the bind values, and because the SQL text
+stays the same, drivers which prepare repeated statements (e.g. psycopg 3) may do so.
+
+The methods below are mixed into `SQLConnector`
+(see `meerschaum/connectors/sql/_SQLConnector.py`).
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+
+from meerschaum.utils.typing import Any, Optional, Dict, Tuple, Hashable
+
+### DuckDB reads scalar values through pandas, which does not accept bind params here.
+BIND_PARAMS_FLAVORS = {
+    'postgresql',
+    'postgis',
+    'timescaledb',
+    'timescaledb-ha',
+    'citus',
+    'cockroachdb',
+    'mysql',
+    'mariadb',
+    'mssql',
+    'oracle',
+    'sqlite',
+    'geopackage',
+}
+
+_quoted_literal_pattern = re.compile(r"'([^']*)'")
+
+
+def bind_dateadd_str(
+    flavor: str,
+    value: Any,
+    bind_name: str,
+    bind_params: Dict[str, Any],
+    db_type: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Render the datetime bound `value` like `dateadd_str()`,
+    but with a bind placeholder in place of the quoted datetime literal.
+
+    Parameters
+    ----------
+    flavor: str
+        The database flavor.
+
+    value: Any
+        The datetime (or integer) bound.
+
+    bind_name: str
+        The name of the bind placeholder.
+
+    bind_params: Dict[str, Any]
+        The dictionary to which the bind value is added.
+
+    db_type: Optional[str], default None
+        The database type of the datetime column (see `dateadd_str()`).
+
+    Returns
+    -------
+    The SQL expression for the bound, or `None` if `value` cannot be bound
+    (e.g. an unparsed string).
+    """
+    from meerschaum.utils.sql import dateadd_str
+    if isinstance(value, bool):
+        return None
+    if 'int' in str(type(value)).lower():
+        bind_params[bind_name] = int(value)
+        return f":{bind_name}"
+    if not isinstance(value, datetime):
+        return None
+
+    rendered = dateadd_str(flavor, datepart='minute', number=0, begin=value, db_type=db_type)
+    match = _quoted_literal_pattern.search(rendered)
+    if match is None:
+        return None
+    bind_params[bind_name] = match.group(1)
+    return rendered[:match.start()] + f":{bind_name}" + rendered[match.end():]
+
+
+def get_bound_shape(value: Any) -> Hashable:
+    """
+    Return the part of a datetime bound which changes its rendered SQL
+    (i.e. whether it is present, an integer, or a timezone-aware datetime).
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return ('datetime', value.tzinfo is not None)
+    return type(value).__name__
+
+
+def get_cached_query(self, key: Tuple[Any, ...]) -> Optional[str]:
+    """
+    Return the cached SQL text for a query key, or `None` if it has not been cached.
+
+    Parameters
+    ----------
+    key: Tuple[Any, ...]
+        The key of the query, e.g. `('sync_time', table, schema, ..., params_shape)`.
+
+    Returns
+    -------
+    The parameterized SQL text, or `None`.
+    """
+    if not self._is_query_cache_enabled():
+        return None
+    with self._locks['_query_cache']:
+        query = self._query_cache.get(key, None)
+        if query is not None:
+            self._query_cache.move_to_end(key)
+    return query
+
+
+def cache_query(self, key: Tuple[Any, ...], query: str) -> None:
+    """
+    Remember the parameterized SQL text for a query key,
+    evicting the least recently used queries beyond `query_cache:max_size`.
+    """
+    if not self._is_query_cache_enabled():
+        return
+    max_size = (self._sys_config.get('query_cache', None) or {}).get('max_size', None) or 10_000
+    with self._locks['_query_cache']:
+        self._query_cache[key] = query
+        self._query_cache.move_to_end(key)
+        while len(self._query_cache) > max_size:
+            self._query_cache.popitem(last=False)
+
+
+def clear_query_cache(self) -> None:
+    """
+    Forget all cached SQL text for this connector.
+    """
+    with self._locks['_query_cache']:
+        self._query_cache.clear()
+
+
+def _is_query_cache_enabled(self) -> bool:
+    """
+    Return whether this connector may cache parameterized SQL text.
+    """
+    if self.flavor not in BIND_PARAMS_FLAVORS:
+        return False
+    return (self._sys_config.get('query_cache', None) or {}).get('enabled', True)
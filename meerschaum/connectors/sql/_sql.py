@@ -29,6 +29,20 @@ _bulk_flavors = {
 _disallow_chunks_flavors = ['duckdb']
 _max_chunks_flavors = {'sqlite': 1000, 'geopackage': 1000}
 SKIP_READ_TRANSACTION_FLAVORS: list[str] = ['mssql']
+### Flavors whose drivers can stream results from a server-side cursor
+### (named cursors on psycopg, `SSCursor` on PyMySQL).
+STREAM_RESULTS_FLAVORS = {
+    'postgresql',
+    'postgis',
+    'timescaledb',
+    'timescaledb-ha',
+    'citus',
+    'cockroachdb',
+    'mysql',
+    'mariadb',
+    'mssql',
+    'oracle',
+}
 
 
 def read(
@@ -47,6 +61,7 @@ def read(
     as_iterator: bool = False,
     as_dask: bool = False,
     index_col: Optional[str] = None,
+    arrow: bool = False,
     silent: bool = False,
     debug: bool = False,
     **kw: Any
@@ -119,6 +134,11 @@ def read(
         If using Dask, use this column as the index column.
         If omitted, a Pandas DataFrame will be fetched and converted to a Dask DataFrame.
 
+    arrow: bool, default False
+        If `True`, return Arrow-backed dtypes (`dtype_backend='pyarrow'`).
+        DuckDB results are always fetched natively as Arrow tables
+        and are only converted to NumPy-backed dtypes if `arrow` is `False`.
+
     silent: bool, default False
         If `True`, don't raise warnings in case of errors.
         Defaults to `False`.
@@ -268,8 +288,49 @@ def read(
 
         return result
 
+    ### DuckDB scans its results directly into Arrow, bypassing SQLAlchemy and `read_sql()`.
+    duckdb_query = (
+        str(str_query)
+        if (
+            self.flavor == 'duckdb'
+            and not is_dask
+            and not params
+            and isinstance(str_query, (str, sqlalchemy.sql.elements.TextClause))
+        )
+        else None
+    )
+    if duckdb_query is not None:
+        try:
+            df = self._read_duckdb(duckdb_query, dtype=dtype, arrow=arrow, debug=debug)
+        except Exception as e:
+            if debug:
+                dprint(f"[{self}] Failed to execute query:\n\n{query_or_table}\n\n")
+            if not silent:
+                warn(str(e), stacklevel=3)
+            return None
+
+        if as_iterator:
+            return iter([df])
+
+        hook_result = _process_chunk(df)
+        if as_hook_results:
+            return [hook_result]
+
+        for col in get_numeric_cols(df):
+            df[col] = df[col].apply(lambda x: x.canonical() if isinstance(x, Decimal) else x)
+        return [df] if as_chunks else df
+
+    ### Stream chunks from a server-side cursor on a dedicated connection
+    ### so that memory is bounded by the chunksize rather than the size of the result.
+    stream_results = (
+        (as_iterator or chunk_hook is not None)
+        and chunksize is not None
+        and not is_dask
+        and self.flavor in STREAM_RESULTS_FLAVORS
+        and self._sys_config.get('stream_results', True)
+    )
+
     try:
-        stream_results = not as_iterator and chunk_hook is not None and chunksize is not None
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore', 'case sensitivity issues')
 
@@ -279,6 +340,8 @@ def read(
                 'coerce_float': coerce_float,
                 'index_col': index_col,
             }
+            if arrow:
+                read_sql_query_kwargs['dtype_backend'] = 'pyarrow'
             if is_dask:
                 if index_col is None:
                     dd = None
@@ -300,10 +363,19 @@ def read(
             else:
 
                 def get_chunk_generator(connectable):
-                    chunk_generator = pd.read_sql_query(
-                        formatted_query,
-                        connectable, # NOTE: test this against `self.engine`.
-                        **read_sql_query_kwargs
+                    chunk_generator = (
+                        pd.read_sql_query(
+                            formatted_query,
+                            connectable, # NOTE: test this against `self.engine`.
+                            **read_sql_query_kwargs
+                        )
+                        if not stream_results
+                        else self._stream_read_chunks(
+                            formatted_query,
+                            chunksize,
+                            read_sql_query_kwargs,
+                            debug=debug,
+                        )
                     )
 
                     to_return = (
@@ -324,14 +396,13 @@ def read(
                     )
                     return chunk_generator, to_return
 
-                if self.flavor in SKIP_READ_TRANSACTION_FLAVORS:
+                if stream_results:
+                    chunk_generator, to_return = get_chunk_generator(None)
+                elif self.flavor in SKIP_READ_TRANSACTION_FLAVORS:
                     chunk_generator, to_return = get_chunk_generator(self.engine)
                 else:
-                    with self.engine.begin() as transaction:
-                        with transaction.execution_options(
-                            stream_results=stream_results,
-                        ) as connection:
-                            chunk_generator, to_return = get_chunk_generator(connection)
+                    with self.engine.begin() as connection:
+                        chunk_generator, to_return = get_chunk_generator(connection)
 
                 if to_return is not None:
                     return to_return
@@ -437,6 +508,129 @@ def read(
     return df
 
 
+def _stream_read_chunks(
+    self,
+    query: Union[str, sqlalchemy.sql.elements.TextClause],
+    chunksize: int,
+    read_sql_query_kwargs: Dict[str, Any],
+    debug: bool = False,
+) -> Iterable[pandas.DataFrame]:
+    """
+    Yield chunks of a query's results from a server-side cursor.
+
+    A dedicated connection is opened with `stream_results=True` and `max_row_buffer=chunksize`
+    when iteration begins and is closed once the generator is exhausted (or closed early),
+    so a generator which is never iterated does not hold a pooled connection.
+
+    Parameters
+    ----------
+    query: Union[str, sqlalchemy.sql.elements.TextClause]
+        The query to execute.
+
+    chunksize: int
+        How many rows to fetch per chunk.
+
+    read_sql_query_kwargs: Dict[str, Any]
+        Keyword arguments for `pandas.read_sql_query()` (must include `chunksize`).
+
+    Returns
+    -------
+    A generator of DataFrames.
+    """
+    from meerschaum.utils.packages import import_pandas
+    pd = import_pandas()
+
+    def _iterate_chunks():
+        connection = self.engine.connect().execution_options(
+            stream_results=True,
+            max_row_buffer=chunksize,
+        )
+        if debug:
+            dprint(f"[{self}] Streaming results with a chunksize of {chunksize}.")
+        try:
+            ### Named cursors on PostgreSQL must live inside a transaction.
+            if self.flavor in SKIP_READ_TRANSACTION_FLAVORS:
+                yield from pd.read_sql_query(query, connection, **read_sql_query_kwargs)
+            else:
+                with connection.begin():
+                    yield from pd.read_sql_query(query, connection, **read_sql_query_kwargs)
+        finally:
+            connection.close()
+
+    return _iterate_chunks()
+
+
+def _read_duckdb(
+    self,
+    query: str,
+    dtype: Optional[Dict[str, Any]] = None,
+    arrow: bool = False,
+    debug: bool = False,
+) -> pandas.DataFrame:
+    """
+    Execute a query on the native DuckDB connection and return its result as a DataFrame.
+
+    Parameters
+    ----------
+    query: str
+        The query to execute.
+
+    dtype: Optional[Dict[str, Any]], default None
+        Optionally cast columns to these dtypes.
+
+    arrow: bool, default False
+        If `True`, keep the Arrow-backed dtypes of the fetched Arrow table.
+
+    Returns
+    -------
+    A pandas DataFrame of the query's results.
+    """
+    from meerschaum.utils.packages import import_pandas, is_installed
+    pd = import_pandas()
+    if debug:
+        dprint(f"[{self}] Reading natively from DuckDB.")
+
+    with self.engine.connect() as connection:
+        duckdb_conn = get_duckdb_connection(connection)
+        result = duckdb_conn.execute(query)
+        if is_installed('pyarrow', venv=None):
+            ### `fetch_arrow_table()` is deprecated in favor of `to_arrow_table()` (`duckdb>=1.4`).
+            to_arrow_table = (
+                getattr(result, 'to_arrow_table', None)
+                or result.fetch_arrow_table
+            )
+            arrow_table = to_arrow_table()
+            df = (
+                arrow_table.to_pandas(types_mapper=pd.ArrowDtype)
+                if arrow
+                else arrow_table.to_pandas()
+            )
+        else:
+            df = result.fetchdf()
+
+    for col, typ in (dtype or {}).items():
+        if col not in df.columns:
+            continue
+        try:
+            df[col] = df[col].astype(typ)
+        except Exception:
+            pass
+
+    return df
+
+
+def get_duckdb_connection(
+    connection: Union[sqlalchemy.engine.Connection, Any],
+) -> 'duckdb.DuckDBPyConnection':
+    """
+    Return the native DuckDB connection underlying a SQLAlchemy connection.
+    """
+    dbapi_conn = getattr(connection, 'connection', connection)
+    driver_conn = getattr(dbapi_conn, 'driver_connection', None) or dbapi_conn
+    ### `duckdb_engine` wraps the native connection and delegates unknown attributes to it.
+    return getattr(driver_conn, '_ConnectionWrapper__c', driver_conn)
+
+
 def value(
     self,
     query: str,
@@ -743,6 +937,61 @@ def exec_queries(
     return results
 
 
+def _to_sql_adaptive(
+    df: 'pandas.DataFrame',
+    to_sql_kw: Dict[str, Any],
+    chunksize_controller: Any,
+) -> Dict[str, Any]:
+    """
+    Insert a dataframe in batches sized by an adaptive chunksize controller,
+    reporting each batch's throughput back to the controller.
+    Return the stats to merge into `to_sql()`'s stats.
+    """
+    import time
+    num_rows = len(df)
+    sample_df = df.head(1000)
+    row_bytes = (
+        (sample_df.memory_usage(index=False, deep=True).sum() / len(sample_df))
+        if len(sample_df) > 0
+        else None
+    )
+
+    offset, num_batches = 0, 0
+    total_duration, total_bytes = 0.0, 0
+    batch_kw = dict(to_sql_kw)
+    while True:
+        batch_size = chunksize_controller.get_batch_size(row_bytes)
+        batch_df = df.iloc[offset:(offset + batch_size)]
+        batch_num_rows = len(batch_df)
+        batch_num_bytes = int(row_bytes * batch_num_rows) if row_bytes else None
+
+        batch_kw['chunksize'] = max(batch_num_rows, 1)
+        batch_start = time.perf_counter()
+        try:
+            batch_df.to_sql(**batch_kw)
+        except Exception:
+            chunksize_controller.update(batch_num_rows, 0, success=False)
+            raise
+        batch_duration = time.perf_counter() - batch_start
+        chunksize_controller.update(batch_num_rows, batch_duration, num_bytes=batch_num_bytes)
+
+        ### Only the first batch may replace the table.
+        batch_kw['if_exists'] = 'append'
+        offset += batch_num_rows
+        num_batches += 1
+        total_duration += batch_duration
+        total_bytes += batch_num_bytes or 0
+        if offset >= num_rows:
+            break
+
+    return {
+        'chunksize': chunksize_controller.chunksize,
+        'num_batches': num_batches,
+        'rows_per_sec': ((num_rows / total_duration) if total_duration > 0 else None),
+        'bytes_per_sec': ((total_bytes / total_duration) if total_duration > 0 else None),
+    }
+
+
 def to_sql(
     self,
     df: pandas.DataFrame,
@@ -757,6 +1006,8 @@ def to_sql(
     debug: bool = False,
     as_tuple: bool = False,
     as_dict: bool = False,
+    bulk_insert: Optional[bool] = None,
+    chunksize_controller: Optional[Any] = None,
     _connection=None,
     _transaction=None,
     **kw
@@ -801,6 +1052,18 @@ def to_sql(
         If `True`, return a dictionary of transaction information.
         The keys are `success`, `msg`, `start`, `end`, `duration`, `num_rows`, `chunksize`,
         `method`, and `target`.
+        When a `chunksize_controller` is used, `num_batches`, `rows_per_sec`,
+        and `bytes_per_sec` are included as well.
+
+    bulk_insert: Optional[bool], default None
+        If `True`, insert with the flavor's fastest loader (see `_get_bulk_insert_method()`).
+        Defaults to `system:connectors:sql:bulk_insert:{flavor}`.
+
+    chunksize_controller: Optional[AdaptiveChunksize], default None
+        If provided, insert the dataframe in batches sized by this controller,
+        which measures each batch's throughput to adapt the chunksize
+        (see `meerschaum.connectors.sql._chunksize.AdaptiveChunksize`).
+        Ignores `chunksize` and is not used for Dask dataframes.
 
     kw: Any
         Additional arguments will be passed to the DataFrame's `to_sql` function
@@ -838,6 +1101,7 @@ def to_sql(
         get_uuid_cols,
         get_bytes_cols,
         get_geometry_cols,
+        copy_df,
     )
     from meerschaum.utils.dtypes import (
         are_dtypes_equal,
@@ -913,29 +1177,33 @@ def to_sql(
         for col, typ in cols_pd_types.items()
     }
 
-    enable_bulk_insert = mrsm.get_config(
-        'system', 'connectors', 'sql', 'bulk_insert', self.flavor,
-        warn=False,
+    enable_bulk_insert = (
+        bulk_insert
+        if bulk_insert is not None
+        else mrsm.get_config(
+            'system', 'connectors', 'sql', 'bulk_insert', self.flavor,
+            warn=False,
+        )
     ) or False
     stats = {'target': name}
     ### resort to defaults if None
     copied = False
     use_bulk_insert = False
+    single_chunk = False
     if method == "":
         if enable_bulk_insert:
-            method = (
-                functools.partial(mssql_insert_json, cols_types=cols_db_types, debug=debug)
-                if self.flavor == 'mssql'
-                else functools.partial(psql_insert_copy, debug=debug)
+            method, single_chunk = self._get_bulk_insert_method(
+                cols_types=cols_db_types,
+                debug=debug,
             )
-            use_bulk_insert = True
-        else:
+            use_bulk_insert = self.flavor in _bulk_flavors
+        if method == "":
             ### Should resolve to 'multi' or `None`.
             method = flavor_configs.get(self.flavor, {}).get('to_sql', {}).get('method', 'multi')
 
     if bytes_cols and (use_bulk_insert or self.flavor == 'oracle'):
         if safe_copy and not copied:
-            df = df.copy()
+            df = copy_df(df)
             copied = True
         bytes_serializer = (
             functools.partial(encode_bytes_for_bytea, with_prefix=(self.flavor != 'oracle'))
@@ -945,6 +1213,10 @@ def to_sql(
         for col in bytes_cols:
             df[col] = df[col].apply(bytes_serializer)
 
+    if safe_copy and not copied and (numeric_cols or geometry_cols):
+        df = copy_df(df)
+        copied = True
+
     ### Check for numeric columns.
     for col in numeric_cols:
         precision, scale = numeric_cols_precisions_scales.get(
@@ -990,6 +1262,9 @@ def to_sql(
                     stacklevel = 3,
                 )
             chunksize = _max_chunks_flavors[self.flavor]
+    ### Some bulk loaders consume the whole frame at once, so pandas must pass a single chunk.
+    if single_chunk:
+        chunksize = None
     stats['chunksize'] = chunksize
 
     success, msg = False, "Default to_sql message"
@@ -1090,7 +1365,10 @@ def to_sql(
     try:
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore')
-            df.to_sql(**to_sql_kw)
+            if chunksize_controller is not None and not is_dask:
+                stats.update(_to_sql_adaptive(df, to_sql_kw, chunksize_controller))
+            else:
+                df.to_sql(**to_sql_kw)
         success = True
     except Exception:
         if not silent:
@@ -1123,6 +1401,50 @@ def to_sql(
     return success
 
 
+def _get_bulk_insert_method(
+    self,
+    cols_types: Optional[Dict[str, str]] = None,
+    debug: bool = False,
+) -> Tuple[Union[str, Callable, None], bool]:
+    """
+    Return the fastest loader for this flavor as a `method` for `DataFrame.to_sql()`.
+
+    - PostgreSQL flavors: `COPY` (binary or CSV, see `system:connectors:sql:copy_format`)
+    - MSSQL: `INSERT ... SELECT FROM OPENJSON` (`mssql_insert_json()`)
+    - MySQL / MariaDB / SQLite: a single `executemany()` (method `None`)
+    - DuckDB: registering the frame and `INSERT ... SELECT` (`duckdb_insert_register()`)
+
+    Parameters
+    ----------
+    cols_types: Optional[Dict[str, str]], default None
+        The columns and database types to pass to `mssql_insert_json()`.
+
+    Returns
+    -------
+    A tuple of the method (`""` if this flavor has no bulk loader) and whether
+    the method must receive the entire frame in a single chunk.
+    """
+    import functools
+    if self.flavor == 'mssql':
+        return functools.partial(mssql_insert_json, cols_types=cols_types, debug=debug), False
+
+    if self.flavor in _bulk_flavors:
+        if self._sys_config.get('copy_format', 'csv') == 'binary':
+            from meerschaum.connectors.sql._copy import psql_insert_copy_binary
+            return functools.partial(psql_insert_copy_binary, debug=debug), True
+        return functools.partial(psql_insert_copy, debug=debug), False
+
+    ### Without multi-row VALUES, `executemany()` is not bound by the parameters limit,
+    ### and PyMySQL batches the rows into multi-row INSERTs itself.
+    if self.flavor in ('mysql', 'mariadb', 'sqlite'):
+        return None, True
+
+    if self.flavor == 'duckdb':
+        return functools.partial(duckdb_insert_register, debug=debug), True
+
+    return "", False
+
+
 def psql_insert_copy(
     table: pandas.io.sql.SQLTable,
     conn: Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection],
@@ -1287,6 +1609,58 @@ def mssql_insert_json(
     conn.exec_driver_sql(sql, (serialized_data,))
 
 
+def duckdb_insert_register(
+    table: pandas.io.sql.SQLTable,
+    conn: Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection],
+    keys: List[str],
+    data_iter: Iterable[Any],
+    debug: bool = False,
+) -> None:
+    """
+    Insert data for DuckDB by registering the table's frame and selecting from it.
+
+    DuckDB scans the registered frame directly, so the rows in `data_iter` are not used,
+    and this method must be called with a single chunk (`chunksize=None`).
+
+    Parameters
+    ----------
+    table: pandas.io.sql.SQLTable
+
+    conn: Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection]
+
+    keys: List[str]
+        Column names
+
+    data_iter: Iterable[Any]
+        Iterable that iterates the values to be inserted (only used when inserting indices).
+
+    Returns
+    -------
+    None
+    """
+    import uuid
+    from meerschaum.utils.sql import sql_item_name
+    from meerschaum.utils.warnings import dprint
+
+    df = getattr(table, 'frame', None)
+    if df is None or table.index is not None:
+        return table._execute_insert(conn, keys, data_iter)
+
+    table_name = sql_item_name(table.name, 'duckdb', table.schema)
+    view_name = '_mrsm_insert_' + uuid.uuid4().hex[:8]
+    columns = ', '.join(sql_item_name(str(key), 'duckdb') for key in keys)
+    sql = f"INSERT INTO {table_name} ({columns})\nSELECT {columns}\nFROM {view_name}"
+    if debug:
+        dprint(sql)
+
+    duckdb_conn = get_duckdb_connection(conn)
+    duckdb_conn.register(view_name, df[list(keys)])
+    try:
+        duckdb_conn.execute(sql)
+    finally:
+        duckdb_conn.unregister(view_name)
+
+
 def format_sql_query_for_dask(query: str) -> 'sqlalchemy.sql.selectable.Select':
     """
     Given a `SELECT` query, return a `sqlalchemy` query for Dask to use.
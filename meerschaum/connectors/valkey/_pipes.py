@@ -505,6 +505,7 @@ def get_pipe_data(
         ignore_cols=ignore_dt_cols,
         chunksize=kwargs.get('chunksize', None),
         strip_timezone=(pipe.tzinfo is None),
+        dtypes=pipe.dtypes,
         debug=debug,
     )
     for col, typ in valkey_dtypes.items():
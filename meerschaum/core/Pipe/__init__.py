@@ -93,6 +93,8 @@ class Pipe:
     )
     from ._data import (
         get_data,
+        get_data_async,
+        _finalize_data,
         get_backtrack_data,
         get_rowcount,
         get_size,
@@ -122,6 +124,7 @@ class Pipe:
         enforce,
         null_indices,
         mixed_numerics,
+        arrow,
         get_columns,
         get_columns_types,
         get_columns_indices,
@@ -174,9 +177,12 @@ class Pipe:
         get_sync_time,
         exists,
         filter_existing,
+        _merge_unchanged_columns,
+        _get_digest_diff_masks,
         _get_chunk_label,
         get_num_workers,
         _persist_new_special_columns,
+        _get_special_cols,
     )
     from ._verify import (
         verify,
@@ -214,6 +220,7 @@ class Pipe:
         enforce: Optional[bool] = None,
         null_indices: Optional[bool] = None,
         mixed_numerics: Optional[bool] = None,
+        arrow: Optional[bool] = None,
         compress: Union[bool, Dict[str, Any], None] = None,
         temporary: bool = False,
         cache: Optional[bool] = None,
@@ -304,6 +311,11 @@ class Pipe:
             Set to `False` to disable this behavior.
             Defaults to `True`.
 
+        arrow: Optional[bool], default None
+            If `True`, use Arrow-backed dtypes (e.g. `string[pyarrow]`, `decimal128`)
+            for the pipe's DataFrames where a lossless equivalent exists.
+            Defaults to the configured value (`pipes:dtypes:arrow`, `False`).
+
         compress: Union[bool, Dict[str, Any], None], default None
             If `True` (or a dictionary of compression settings), mark the pipe for compression.
             For TimescaleDB hypertables, a columnstore (compression) policy is installed
@@ -463,6 +475,9 @@ class Pipe:
         if isinstance(mixed_numerics, bool):
             self._attributes['parameters']['mixed_numerics'] = mixed_numerics
 
+        if isinstance(arrow, bool):
+            self._attributes['parameters']['arrow'] = arrow
+
         if isinstance(compress, (bool, dict)):
             self._attributes['parameters']['compress'] = compress
 
@@ -518,6 +518,26 @@ def mixed_numerics(self, _mixed_numerics: bool) -> None:
     self.update_parameters({'mixed_numerics': _mixed_numerics}, persist=False)
 
 
+@property
+def arrow(self) -> bool:
+    """
+    Return whether the pipe's DataFrames should be Arrow-backed.
+    Defaults to the configured value (`pipes:dtypes:arrow`).
+    """
+    _arrow = self.parameters.get('arrow', None)
+    if _arrow is None:
+        return bool(mrsm.get_config('pipes', 'dtypes', 'arrow'))
+    return bool(_arrow)
+
+
+@arrow.setter
+def arrow(self, _arrow: bool) -> None:
+    """
+    Set the `arrow` parameter for the pipe.
+    """
+    self.update_parameters({'arrow': _arrow}, persist=False)
+
+
 def get_columns(self, *args: str, error: bool = False) -> Union[str, Tuple[str]]:
     """
     Check if the requested columns are defined.
@@ -34,6 +34,7 @@ def get_data(
     chunk_interval: Union[timedelta, int, None] = None,
     order: Optional[str] = 'asc',
     limit: Optional[int] = None,
+    after: Optional[str] = None,
     fresh: bool = False,
     debug: bool = False,
     **kw: Any
@@ -73,6 +74,8 @@ def get_data(
     as_iterator: bool, default False
         If `True`, return a generator of chunks of pipe data.
         When combined with `as_docs=True`, yields `List[Dict]` per chunk instead of DataFrames.
+        Instance connectors which stream data (i.e. implement `get_pipe_data_stream()`)
+        yield the chunks of a single response.
 
     as_chunks: bool, default False
         Alias for `as_iterator`.
@@ -101,6 +104,17 @@ def get_data(
     limit: Optional[int], default None
         If provided, cap the dataframe to this many rows.
 
+    after: Optional[str], default None
+        A continuation token from `meerschaum.utils.pipes.get_keyset_token()`.
+        If provided, only return the rows which follow the last row of the previous page.
+        Combine with `limit` to page through a pipe's data:
+
+        ```
+        >>> from meerschaum.utils.pipes import get_keyset_token
+        >>> df = pipe.get_data(limit=1000)
+        >>> next_df = pipe.get_data(limit=1000, after=get_keyset_token(pipe, df))
+        ```
+
     fresh: bool, default False
         If `True`, skip local cache and directly query the instance connector.
 
@@ -116,11 +130,9 @@ def get_data(
     An `Iterator[List[Dict]]` if both `as_docs=True` and `as_chunks=True`.
 
     """
-    from meerschaum.utils.warnings import warn
     from meerschaum.utils.venv import Venv
     from meerschaum.connectors import get_connector_plugin
     from meerschaum.utils.dtypes import to_pandas_dtype
-    from meerschaum.utils.dataframe import add_missing_cols_to_df, df_is_chunk_generator
     from meerschaum.utils.packages import attempt_import
     from meerschaum.utils.warnings import dprint
     dd = attempt_import('dask.dataframe') if as_dask else None
@@ -137,34 +149,22 @@ def get_data(
 
     begin, end = self.parse_date_bounds(begin, end, debug=debug)
     as_iterator = as_iterator or as_chunks
-    dt_col = self.columns.get('datetime', None)
 
     def _sort_df(_df):
-        if df_is_chunk_generator(_df):
-            return _df
-        indices = [] if dt_col not in _df.columns else [dt_col]
-        non_dt_cols = [
-            col
-            for col_ix, col in self.columns.items()
-            if col_ix != 'datetime' and col in _df.columns
-        ]
-        indices.extend(non_dt_cols)
-        if 'dask' not in _df.__module__:
-            _df.sort_values(
-                by=indices,
-                inplace=True,
-                ascending=(str(order).lower() == 'asc'),
-            )
-            _df.reset_index(drop=True, inplace=True)
-        else:
-            _df = _df.sort_values(
-                by=indices,
-                ascending=(str(order).lower() == 'asc'),
-            )
-            _df = _df.reset_index(drop=True)
-        if limit is not None and len(_df) > limit:
-            return _df.head(limit)
-        return _df
+        return _sort_data(self, _df, order=order, limit=limit)
+
+    if as_iterator and not as_docs and hasattr(self.instance_connector, 'get_pipe_data_stream'):
+        return self.instance_connector.get_pipe_data_stream(
+            self,
+            select_columns=select_columns,
+            omit_columns=omit_columns,
+            begin=begin,
+            end=end,
+            params=params,
+            order=order,
+            limit=limit,
+            debug=debug,
+        )
 
     if as_iterator or as_chunks:
         df = self._get_data_as_iterator(
@@ -223,6 +223,9 @@ def get_data(
     if not self.exists(debug=debug):
         return [] if as_docs else None
 
+    if after is not None:
+        kw['after'] = after
+
     if as_docs:
         with Venv(get_connector_plugin(self.instance_connector)):
             docs = self.instance_connector.get_pipe_docs(
@@ -255,67 +258,220 @@ def get_data(
         if df is None:
             return df
 
-        if not select_columns:
-            select_columns = [col for col in df.columns]
-
-        pipe_dtypes = self.get_dtypes(refresh=False, debug=debug)
-        cols_to_omit = [
-            col
-            for col in df.columns
-            if (
-                col in (omit_columns or [])
-                or
-                col not in (select_columns or [])
-            )
-        ]
-        cols_to_add = [
-            col
-            for col in select_columns
-            if col not in df.columns
-        ] + ([
-            col
-            for col in pipe_dtypes
-            if col not in df.columns
-        ] if add_missing_columns else [])
-        if cols_to_omit:
-            warn(
-                (
-                    f"Received {len(cols_to_omit)} omitted column"
-                    + ('s' if len(cols_to_omit) != 1 else '')
-                    + f" for {self}. "
-                    + "Consider adding `select_columns` and `omit_columns` support to "
-                    + f"'{self.instance_connector.type}' connectors to improve performance."
-                ),
-                stack=False,
-            )
-            _cols_to_select = [col for col in df.columns if col not in cols_to_omit]
-            df = df[_cols_to_select]
+        return self._finalize_data(
+            df,
+            select_columns=select_columns,
+            omit_columns=omit_columns,
+            add_missing_columns=add_missing_columns,
+            order=order,
+            limit=limit,
+            debug=debug,
+        )
 
-        if cols_to_add:
-            if not add_missing_columns:
-                from meerschaum.utils.misc import items_str
-                warn(
-                    f"Will add columns {items_str(cols_to_add)} as nulls to dataframe.",
-                    stack=False,
-                )
 
-            df = add_missing_cols_to_df(
-                df,
-                {
-                    col: pipe_dtypes.get(col, 'string')
-                    for col in cols_to_add
-                },
+async def get_data_async(
+    self,
+    select_columns: Optional[List[str]] = None,
+    omit_columns: Optional[List[str]] = None,
+    begin: Union[datetime, int, str, None] = None,
+    end: Union[datetime, int, str, None] = None,
+    params: Optional[Dict[str, Any]] = None,
+    add_missing_columns: bool = False,
+    order: Optional[str] = 'asc',
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    debug: bool = False,
+    **kw: Any
+) -> Union['pd.DataFrame', None]:
+    """
+    Await a pipe's data as a single DataFrame (see `Pipe.get_data()`).
+
+    The query is awaited with the instance connector's `get_pipe_data_async()` (if available),
+    and the result is post-processed in a worker thread exactly like `Pipe.get_data()`.
+    Otherwise `Pipe.get_data()` is run in a worker thread.
+    """
+    import asyncio
+    import functools
+    from meerschaum.utils.venv import Venv
+    from meerschaum.connectors import get_connector_plugin
+    loop = asyncio.get_running_loop()
+
+    async def _run_in_thread(func, *args, **kwargs):
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    if not hasattr(self.instance_connector, 'get_pipe_data_async'):
+        return await _run_in_thread(
+            self.get_data,
+            select_columns=select_columns,
+            omit_columns=omit_columns,
+            begin=begin,
+            end=end,
+            params=params,
+            add_missing_columns=add_missing_columns,
+            order=order,
+            limit=limit,
+            after=after,
+            debug=debug,
+            **kw
+        )
+
+    if select_columns == '*':
+        select_columns = None
+    elif isinstance(select_columns, str):
+        select_columns = [select_columns]
+
+    if isinstance(omit_columns, str):
+        omit_columns = [omit_columns]
+
+    begin, end = self.parse_date_bounds(begin, end, debug=debug)
+    if not await _run_in_thread(self.exists, debug=debug):
+        return None
+
+    if after is not None:
+        kw['after'] = after
+
+    with Venv(get_connector_plugin(self.instance_connector)):
+        df = await self.instance_connector.get_pipe_data_async(
+            self,
+            select_columns=select_columns,
+            omit_columns=omit_columns,
+            begin=begin,
+            end=end,
+            params=params,
+            limit=limit,
+            order=order,
+            debug=debug,
+            **kw
+        )
+    if df is None:
+        return df
+
+    return await _run_in_thread(
+        self._finalize_data,
+        df,
+        select_columns=select_columns,
+        omit_columns=omit_columns,
+        add_missing_columns=add_missing_columns,
+        order=order,
+        limit=limit,
+        debug=debug,
+    )
+
+
+def _finalize_data(
+    self,
+    df: 'pd.DataFrame',
+    select_columns: Optional[List[str]] = None,
+    omit_columns: Optional[List[str]] = None,
+    add_missing_columns: bool = False,
+    order: Optional[str] = 'asc',
+    limit: Optional[int] = None,
+    debug: bool = False,
+) -> 'pd.DataFrame':
+    """
+    Select, fill, enforce, and sort the columns of a DataFrame read by the instance connector.
+    """
+    from meerschaum.utils.warnings import warn
+    from meerschaum.utils.dataframe import add_missing_cols_to_df
+    if not select_columns:
+        select_columns = [col for col in df.columns]
+
+    pipe_dtypes = self.get_dtypes(refresh=False, debug=debug)
+    cols_to_omit = [
+        col
+        for col in df.columns
+        if (
+            col in (omit_columns or [])
+            or
+            col not in (select_columns or [])
+        )
+    ]
+    cols_to_add = [
+        col
+        for col in select_columns
+        if col not in df.columns
+    ] + ([
+        col
+        for col in pipe_dtypes
+        if col not in df.columns
+    ] if add_missing_columns else [])
+    if cols_to_omit:
+        warn(
+            (
+                f"Received {len(cols_to_omit)} omitted column"
+                + ('s' if len(cols_to_omit) != 1 else '')
+                + f" for {self}. "
+                + "Consider adding `select_columns` and `omit_columns` support to "
+                + f"'{self.instance_connector.type}' connectors to improve performance."
+            ),
+            stack=False,
+        )
+        _cols_to_select = [col for col in df.columns if col not in cols_to_omit]
+        df = df[_cols_to_select]
+
+    if cols_to_add:
+        if not add_missing_columns:
+            from meerschaum.utils.misc import items_str
+            warn(
+                f"Will add columns {items_str(cols_to_add)} as nulls to dataframe.",
+                stack=False,
             )
 
-        enforced_df = self.enforce_dtypes(
+        df = add_missing_cols_to_df(
             df,
-            dtypes=pipe_dtypes,
-            debug=debug,
+            {
+                col: pipe_dtypes.get(col, 'string')
+                for col in cols_to_add
+            },
         )
 
-        if order:
-            return _sort_df(enforced_df)
-        return enforced_df
+    enforced_df = self.enforce_dtypes(
+        df,
+        dtypes=pipe_dtypes,
+        debug=debug,
+    )
+
+    if order:
+        return _sort_data(self, enforced_df, order=order, limit=limit)
+    return enforced_df
+
+
+def _sort_data(
+    self,
+    df: 'pd.DataFrame',
+    order: Optional[str] = 'asc',
+    limit: Optional[int] = None,
+) -> 'pd.DataFrame':
+    """
+    Sort a DataFrame by the pipe's datetime and other indices (and apply the `limit`).
+    """
+    from meerschaum.utils.dataframe import df_is_chunk_generator
+    if df_is_chunk_generator(df):
+        return df
+    dt_col = self.columns.get('datetime', None)
+    indices = [] if dt_col not in df.columns else [dt_col]
+    non_dt_cols = [
+        col
+        for col_ix, col in self.columns.items()
+        if col_ix != 'datetime' and col in df.columns
+    ]
+    indices.extend(non_dt_cols)
+    if 'dask' not in df.__module__:
+        df.sort_values(
+            by=indices,
+            inplace=True,
+            ascending=(str(order).lower() == 'asc'),
+        )
+        df.reset_index(drop=True, inplace=True)
+    else:
+        df = df.sort_values(
+            by=indices,
+            ascending=(str(order).lower() == 'asc'),
+        )
+        df = df.reset_index(drop=True)
+    if limit is not None and len(df) > limit:
+        return df.head(limit)
+    return df
 
 
 def _get_data_as_iterator(
@@ -64,6 +64,7 @@ def enforce_dtypes(
                         for col, dtype in pipe_dtypes.items()
                         if (not enforce or not are_dtypes_equal(dtype, 'datetime'))
                     ],
+                    dtypes=pipe_dtypes,
                 )
             else:
                 df = parse_df_datetimes(
@@ -76,6 +77,7 @@ def enforce_dtypes(
                     ignore_all=(not enforce),
                     strip_timezone=(self.tzinfo is None),
                     chunksize=chunksize,
+                    dtypes=pipe_dtypes,
                     debug=debug,
                 )
         elif isinstance(df, (dict, list, tuple)):
@@ -88,6 +90,7 @@ def enforce_dtypes(
                 ],
                 strip_timezone=(self.tzinfo is None),
                 chunksize=chunksize,
+                dtypes=pipe_dtypes,
                 debug=debug,
             )
     except Exception as e:
@@ -110,6 +113,7 @@ def enforce_dtypes(
         strip_timezone=(self.tzinfo is None),
         coerce_numeric=self.mixed_numerics,
         coerce_timezone=enforce,
+        arrow=self.arrow,
         debug=debug,
     )
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import time
+import collections
 import threading
 import multiprocessing
 import functools
@@ -26,6 +27,7 @@ from meerschaum.utils.typing import (
     SuccessTuple,
     Dict,
     List,
+    Iterator,
 )
 from meerschaum.utils.warnings import warn, error
 from meerschaum._internal.static import STATIC_CONFIG
@@ -97,6 +99,10 @@ def sync(
         If `True`, enforce dtypes on incoming data.
         Set this to `False` if the incoming rows are expected to be of the correct dtypes.
 
+    safe_copy: bool, default True
+        If `True`, sync a copy of `df` (shallow under copy-on-write) so the caller's frame is untouched.
+        Set this to `False` to hand ownership of `df` to the sync, which may then modify it in place.
+
     blocking: bool, default True
         If `True`, wait for sync to finish and return its result, otherwise
         asyncronously sync (oxymoron?) and return success. Defaults to `True`.
@@ -135,7 +141,7 @@ def sync(
     from meerschaum.utils.venv import Venv
     from meerschaum.connectors import get_connector_plugin
     from meerschaum.utils.misc import df_is_chunk_generator, filter_keywords, filter_arguments
-    from meerschaum.utils.pool import get_pool
+    from meerschaum.utils.dataframe import copy_df
     from meerschaum.config import get_config
     from meerschaum.utils.dtypes import are_dtypes_equal, get_current_timestamp
 
@@ -162,12 +168,21 @@ def sync(
         'error_callback': error_callback,
         'sync_chunks': sync_chunks,
         'chunksize': chunksize,
-        'safe_copy': True,
+        'safe_copy': kw.get('safe_copy', True),
     })
 
     self._invalidate_cache(debug=debug)
     self._cache_value('sync_ts', get_current_timestamp('ms'), debug=debug)
 
+    def _own_df(_df):
+        """
+        Return a frame which the sync may modify in place without affecting the caller.
+        Under copy-on-write, this is a shallow copy.
+        """
+        if not kw.get('safe_copy', True) or not hasattr(_df, 'columns'):
+            return _df
+        return copy_df(_df)
+
     def _sync(
         p: mrsm.Pipe,
         df: Union[
@@ -177,6 +192,7 @@ def sync(
             str,
             InferFetch
         ] = InferFetch,
+        _enforced: bool = False,
     ) -> SuccessTuple:
         if df is None:
             p._invalidate_cache(debug=debug)
@@ -314,7 +330,6 @@ def sync(
         if df_is_chunk_generator(df):
             kw['workers'] = p.get_num_workers(kw.get('workers', None))
             dt_col = p.columns.get('datetime', None)
-            pool = get_pool(workers=kw.get('workers', 1))
             if debug:
                 dprint(f"Received {type(df)}. Attempting to sync first chunk...")
 
@@ -330,12 +345,30 @@ def sync(
             if debug:
                 dprint("Successfully synced the first chunk, attemping the rest...")
 
+            def _enforce_chunk(_chunk):
+                if df_is_chunk_generator(_chunk):
+                    return _chunk
+                try:
+                    _enforced_chunk = p.enforce_dtypes(
+                        _own_df(_chunk),
+                        chunksize=chunksize,
+                        enforce=enforce_dtypes,
+                        safe_copy=False,
+                        dtypes=p.get_dtypes(debug=debug),
+                        debug=debug,
+                    )
+                except Exception:
+                    _enforced_chunk = None
+                return _enforced_chunk if _enforced_chunk is not None else _chunk
+
             def _process_chunk(_chunk):
+                ### Chunks are cast to DataFrames by the enforce stage.
+                _enforced = hasattr(_chunk, 'columns')
                 _chunk_attempts = 0
                 _max_chunk_attempts = 3
                 while _chunk_attempts < _max_chunk_attempts:
                     try:
-                        _chunk_success, _chunk_msg = _sync(p, _chunk)
+                        _chunk_success, _chunk_msg = _sync(p, _chunk, _enforced=_enforced)
                     except Exception as e:
                         _chunk_success, _chunk_msg = False, str(e)
                     if _chunk_success:
@@ -373,42 +406,81 @@ def sync(
                 mrsm.pprint((_chunk_success, _chunk_msg), calm=True)
                 return _chunk_success, _chunk_msg
 
-            results = sorted(
-                [(chunk_success, chunk_msg)] + (
-                    list(pool.imap(_process_chunk, df))
-                    if (
-                        not df_is_chunk_generator(chunk)  # Handle nested generators.
-                        and kw.get('workers', 1) != 1
-                    )
-                    else list(
-                        _process_chunk(_child_chunks)
-                        for _child_chunks in df
-                    )
-                )
+            ### Only keep the failures and the latest messages so memory stays flat
+            ### for long-running generators.
+            chunks_results = {
+                'succeeded': 1,
+                'failed': 0,
+                'failures': [],
+                'messages': collections.deque(
+                    [chunk_msg],
+                    maxlen=max(get_config('pipes', 'sync', 'chunks_messages_limit'), 1),
+                ),
+            }
+
+            def _collect_result(_result):
+                _chunk_success, _chunk_msg = _result
+                chunks_results['succeeded' if _chunk_success else 'failed'] += 1
+                (
+                    chunks_results['messages']
+                    if _chunk_success
+                    else chunks_results['failures']
+                ).append(_chunk_msg)
+
+            ### Nested generators are synced sequentially.
+            sync_workers = (
+                kw.get('workers', 1)
+                if not df_is_chunk_generator(chunk)
+                else 1
+            ) or 1
+            stages_stats, source_exception = _run_chunks_pipeline(
+                df,
+                [
+                    ('enforce', _enforce_chunk, 1),
+                    ('sync', _process_chunk, sync_workers),
+                ],
+                _collect_result,
+                queue_depth=get_config('pipes', 'sync', 'chunks_queue_depth'),
+                max_attempts=2,
             )
-            chunk_messages = [chunk_msg for _, chunk_msg in results]
-            success_bools = [chunk_success for chunk_success, _ in results]
-            num_successes = len([chunk_success for chunk_success, _ in results if chunk_success])
-            num_failures = len([chunk_success for chunk_success, _ in results if not chunk_success])
-            success = all(success_bools)
+            if source_exception is not None:
+                _collect_result((False, f"Failed to fetch chunks for {p}:\n{source_exception}"))
+
+            num_successes = chunks_results['succeeded']
+            num_failures = chunks_results['failed']
+            num_chunks = num_successes + num_failures
+            chunk_messages = chunks_results['failures'] + list(chunks_results['messages'])
+            num_omitted = num_successes - len(chunks_results['messages'])
+            success = num_failures == 0
             msg = (
                 'Synced '
-                + f'{len(chunk_messages):,} chunk'
-                + ('s' if len(chunk_messages) != 1 else '')
+                + f'{num_chunks:,} chunk'
+                + ('s' if num_chunks != 1 else '')
                 + f' to {p}\n({num_successes} succeeded, {num_failures} failed):\n\n'
+                + _format_stages_stats(stages_stats)
+                + '\n\n'
+                + (
+                    f"(Omitted messages for {num_omitted:,} earlier chunks.)\n\n"
+                    if num_omitted > 0
+                    else ''
+                )
                 + '\n\n'.join(chunk_messages).lstrip().rstrip()
             ).lstrip().rstrip()
             return success, msg
 
         ### Cast to a dataframe and ensure datatypes are what we expect.
+        ### From here on the frame is owned by the sync and is modified in place.
         dtypes = p.get_dtypes(debug=debug)
-        df = p.enforce_dtypes(
-            df,
-            chunksize=chunksize,
-            enforce=enforce_dtypes,
-            dtypes=dtypes,
-            debug=debug,
-        )
+        df = _own_df(df)
+        if not _enforced:
+            df = p.enforce_dtypes(
+                df,
+                chunksize=chunksize,
+                enforce=enforce_dtypes,
+                safe_copy=False,
+                dtypes=dtypes,
+                debug=debug,
+            )
         if p.autotime:
             dt_col = p.columns.get('datetime', None)
             ts_col = dt_col or mrsm.get_config(
@@ -461,9 +533,9 @@ def sync(
             with Venv(get_connector_plugin(self.instance_connector)):
                 return_tuple = p.instance_connector.sync_pipe(
                     pipe=p,
-                    df=df,
+                    df=(copy_df(df) if force and hasattr(df, 'columns') else df),
                     debug=debug,
-                    **kw
+                    **{**kw, 'safe_copy': False}
                 )
             _retries += 1
             run = (not return_tuple[0]) and force and _retries <= retries
@@ -480,6 +552,7 @@ def sync(
         ### CHECKPOINT: Finished syncing.
         _checkpoint(**kw)
         p._invalidate_cache(debug=debug)
+        p._clear_cache_key('_prefetched_sync_time', debug=debug)
 
         ### Automatically apply a compression policy if the pipe is configured for compression.
         if return_tuple[0] and p.parameters.get('compress', False):
@@ -571,10 +644,7 @@ def get_sync_time(
     A `datetime` or int, if the pipe exists, otherwise `None`.
 
     """
-    from meerschaum.utils.venv import Venv
-    from meerschaum.connectors import get_connector_plugin
-    from meerschaum.utils.misc import filter_keywords
-    from meerschaum.utils.dtypes import round_time
+    from meerschaum.utils.dtypes import round_time, get_current_timestamp
     from meerschaum.utils.warnings import warn
 
     if not self.columns.get('datetime', None):
@@ -584,6 +654,61 @@ def get_sync_time(
     if isinstance(connector, str) or connector is None:
         return None
 
+    ### Use a sync time prefetched by `get_pipes(prefetch=True)` once.
+    prefetched = (
+        self._get_cached_value('_prefetched_sync_time', debug=debug)
+        if params is None and newest and not remote
+        else None
+    )
+    if prefetched is not None:
+        self._clear_cache_key('_prefetched_sync_time', debug=debug)
+        prefetched_ts, prefetched_sync_time = prefetched
+        prefetch_cache_seconds = mrsm.get_config('pipes', 'sync', 'prefetch_cache_seconds')
+        now = get_current_timestamp('ms', as_int=True) / 1000
+        if (now - prefetched_ts) >= prefetch_cache_seconds:
+            prefetched = None
+
+    if prefetched is not None:
+        sync_time = prefetched_sync_time
+    else:
+        sync_time = _get_connector_sync_time(
+            self,
+            connector,
+            params=params,
+            newest=newest,
+            remote=remote,
+            debug=debug,
+        )
+
+    if round_down and isinstance(sync_time, datetime):
+        sync_time = round_time(sync_time, timedelta(minutes=1))
+
+    if apply_backtrack_interval and sync_time is not None:
+        backtrack_interval = self.get_backtrack_interval(debug=debug)
+        try:
+            sync_time -= backtrack_interval
+        except Exception as e:
+            warn(f"Failed to apply backtrack interval:\n{e}")
+
+    return self.parse_date_bounds(sync_time)
+
+
+def _get_connector_sync_time(
+    self,
+    connector: mrsm.connectors.Connector,
+    params: Optional[Dict[str, Any]] = None,
+    newest: bool = True,
+    remote: bool = False,
+    debug: bool = False,
+) -> Union['datetime', int, None]:
+    """
+    Return the sync time from the connector's `get_sync_time()`.
+    """
+    from meerschaum.utils.venv import Venv
+    from meerschaum.connectors import get_connector_plugin
+    from meerschaum.utils.misc import filter_keywords
+    from meerschaum.utils.warnings import warn
+
     with Venv(get_connector_plugin(connector)):
         if not hasattr(connector, 'get_sync_time'):
             warn(
@@ -602,18 +727,7 @@ def get_sync_time(
                 debug=debug,
             )
         )
-
-    if round_down and isinstance(sync_time, datetime):
-        sync_time = round_time(sync_time, timedelta(minutes=1))
-
-    if apply_backtrack_interval and sync_time is not None:
-        backtrack_interval = self.get_backtrack_interval(debug=debug)
-        try:
-            sync_time -= backtrack_interval
-        except Exception as e:
-            warn(f"Failed to apply backtrack interval:\n{e}")
-
-    return self.parse_date_bounds(sync_time)
+    return sync_time
 
 
 def exists(
@@ -670,6 +784,8 @@ def filter_existing(
     include_unchanged_columns: bool = False,
     enforce_dtypes: bool = False,
     chunksize: Optional[int] = -1,
+    diff_method: Optional[str] = None,
+    diff_backend: Optional[str] = None,
     debug: bool = False,
     **kw
 ) -> Tuple['pd.DataFrame', 'pd.DataFrame', 'pd.DataFrame']:
@@ -700,6 +816,17 @@ def filter_existing(
     chunksize: Optional[int], default -1
         The `chunksize` used when fetching existing data.
 
+    diff_method: Optional[str], default None
+        How to detect new and changed rows: `'merge'` (left join the existing data)
+        or `'hash'` (compare vectorized per-row hashes of the index and value columns).
+        Defaults to `pipes:sync:diff_method` (`'merge'`).
+        Note that `'hash'` only compares the columns present in `df`.
+
+    diff_backend: Optional[str], default None
+        If `'polars'`, run the `'merge'` method's joins multithreaded in Polars
+        (falling back to pandas if the frames cannot be converted).
+        Defaults to `pipes:sync:diff_backend` (`'pandas'`).
+
     debug: bool, default False
         Verbosity toggle.
 
@@ -714,6 +841,9 @@ def filter_existing(
         filter_unseen_df,
         add_missing_cols_to_df,
         get_unhashable_cols,
+        get_hash_diff_masks,
+        get_polars_anti_join_mask,
+        copy_df,
     )
     from meerschaum.utils.dtypes import (
         to_pandas_dtype,
@@ -737,6 +867,13 @@ def filter_existing(
         merge = pd.merge
         NA = pd.NA
 
+    diff_method = diff_method or get_config('pipes', 'sync', 'diff_method')
+    if diff_method not in ('merge', 'hash'):
+        warn(f"Invalid diff method '{diff_method}', falling back to 'merge'.")
+        diff_method = 'merge'
+    if diff_method == 'hash' and is_dask:
+        diff_method = 'merge'
+
     parameters = self.parameters
     pipe_columns = self.columns
     primary_key = pipe_columns.get('primary', None)
@@ -747,7 +884,7 @@ def filter_existing(
 
     if primary_key and autoincrement and df is not None and primary_key in df.columns:
         if safe_copy:
-            df = df.copy()
+            df = copy_df(df)
             safe_copy = False
         if df[primary_key].isnull().all():
             del df[primary_key]
@@ -755,7 +892,7 @@ def filter_existing(
 
     if dt_col and autotime and df is not None and dt_col in df.columns:
         if safe_copy:
-            df = df.copy()
+            df = copy_df(df)
             safe_copy = False
         if df[dt_col].isnull().all():
             del df[dt_col]
@@ -886,6 +1023,37 @@ def filter_existing(
             **kw
         )
 
+    use_server_digests = (
+        diff_method == 'hash'
+        and not include_unchanged_columns
+        and get_config('pipes', 'sync', 'server_digests')
+    )
+    digest_masks = self._get_digest_diff_masks(
+        df,
+        [
+            col
+            for col_key, col in pipe_columns.items()
+            if col and col_key != 'value' and col in df.columns
+        ] if not primary_key else [primary_key],
+        begin=begin,
+        end=end,
+        params=params,
+        chunksize=chunksize,
+        debug=debug,
+        **kw
+    ) if use_server_digests else None
+    if digest_masks is not None:
+        new_rows_mask, changed_rows_mask = digest_masks
+        unseen_df = df[new_rows_mask].reset_index(drop=True)
+        update_df = df[changed_rows_mask].reset_index(drop=True)
+        delta_df = df[new_rows_mask | changed_rows_mask].reset_index(drop=True)
+        if debug:
+            dprint(
+                f"Detected {len(unseen_df):,} new and {len(update_df):,} changed rows "
+                f"out of {len(df):,} for {self} (using row digests)."
+            )
+        return unseen_df, update_df, delta_df
+
     backtrack_df = self.get_data(
         begin=begin,
         end=end,
@@ -918,6 +1086,38 @@ def filter_existing(
         )
     ] if not primary_key else [primary_key]
 
+    if diff_method == 'hash':
+        new_rows_mask, changed_rows_mask = get_hash_diff_masks(
+            backtrack_df,
+            df,
+            on_cols=on_cols,
+            debug=debug,
+        )
+        unseen_df = df[new_rows_mask].reset_index(drop=True)
+        update_df = (
+            df[changed_rows_mask].reset_index(drop=True)
+            if on_cols
+            else get_empty_df()
+        )
+        delta_df = df[new_rows_mask | changed_rows_mask].reset_index(drop=True)
+        if debug:
+            dprint(
+                f"Detected {len(unseen_df):,} new and {len(update_df):,} changed rows "
+                f"out of {len(df):,} for {self}."
+            )
+
+        return self._merge_unchanged_columns(
+            backtrack_df,
+            unseen_df,
+            update_df,
+            delta_df,
+            on_cols,
+            include_unchanged_columns=include_unchanged_columns,
+            enforce_dtypes=enforce_dtypes,
+            chunksize=chunksize,
+            debug=debug,
+        )
+
     self_dtypes = self.get_dtypes(debug=debug) if self.enforce else {}
     on_cols_dtypes = {
         col: to_pandas_dtype(typ)
@@ -936,6 +1136,7 @@ def filter_existing(
             },
             safe_copy=safe_copy,
             coerce_mixed_numerics=(not self.static),
+            diff_backend=diff_backend,
             debug=debug
         ),
         on_cols_dtypes,
@@ -957,6 +1158,13 @@ def filter_existing(
         backtrack_df[col] = backtrack_df[col].apply(serializer)
     casted_cols = set(unhashable_delta_cols + unhashable_backtrack_cols)
 
+    diff_backend = diff_backend or get_config('pipes', 'sync', 'diff_backend')
+    polars_new_rows_mask = (
+        get_polars_anti_join_mask(delta_df, backtrack_df, on_cols, debug=debug)
+        if on_cols and diff_backend == 'polars' and not is_dask
+        else None
+    )
+
     joined_df = merge(
         delta_df.infer_objects().fillna(NA),
         backtrack_df.infer_objects().fillna(NA),
@@ -964,16 +1172,33 @@ def filter_existing(
         on=on_cols,
         indicator=True,
         suffixes=('', '_old'),
-    ) if on_cols else delta_df
+    ) if on_cols and polars_new_rows_mask is None else delta_df
+
+    ### `joined_df` may be `delta_df` itself, so only deserialize each frame once.
+    deserialize_dfs = [joined_df] + ([delta_df] if delta_df is not joined_df else [])
     for col in casted_cols:
-        if col in joined_df.columns:
-            joined_df[col] = joined_df[col].apply(deserializer)
-        if col in delta_df.columns:
-            delta_df[col] = delta_df[col].apply(deserializer)
+        for _df in deserialize_dfs:
+            if col in _df.columns:
+                _df[col] = _df[col].apply(deserializer)
+
+    cols = list(delta_df.columns)
+    if polars_new_rows_mask is not None:
+        unseen_df = delta_df[polars_new_rows_mask].reset_index(drop=True)
+        update_df = delta_df[~polars_new_rows_mask].reset_index(drop=True)
+        return self._merge_unchanged_columns(
+            backtrack_df,
+            unseen_df,
+            update_df,
+            delta_df,
+            on_cols,
+            include_unchanged_columns=include_unchanged_columns,
+            enforce_dtypes=enforce_dtypes,
+            chunksize=chunksize,
+            debug=debug,
+        )
 
     ### Determine which rows are completely new.
     new_rows_mask = (joined_df['_merge'] == 'left_only') if on_cols else None
-    cols = list(delta_df.columns)
 
     unseen_df = (
         joined_df
@@ -990,24 +1215,241 @@ def filter_existing(
         .reset_index(drop=True)
     ) if on_cols else get_empty_df()
 
-    if include_unchanged_columns and on_cols:
-        unchanged_backtrack_cols = [
-            col
-            for col in backtrack_df.columns
-            if col in on_cols or col not in update_df.columns
-        ]
-        if enforce_dtypes:
-            update_df = self.enforce_dtypes(update_df, chunksize=chunksize, debug=debug)
-        update_df = merge(
-            backtrack_df[unchanged_backtrack_cols],
-            update_df,
-            how='inner',
-            on=on_cols,
-        )
+    return self._merge_unchanged_columns(
+        backtrack_df,
+        unseen_df,
+        update_df,
+        delta_df,
+        on_cols,
+        include_unchanged_columns=include_unchanged_columns,
+        enforce_dtypes=enforce_dtypes,
+        chunksize=chunksize,
+        debug=debug,
+    )
+
+
+def _merge_unchanged_columns(
+    self,
+    backtrack_df: 'pd.DataFrame',
+    unseen_df: 'pd.DataFrame',
+    update_df: 'pd.DataFrame',
+    delta_df: 'pd.DataFrame',
+    on_cols: List[str],
+    include_unchanged_columns: bool = False,
+    enforce_dtypes: bool = False,
+    chunksize: Optional[int] = -1,
+    debug: bool = False,
+) -> Tuple['pd.DataFrame', 'pd.DataFrame', 'pd.DataFrame']:
+    """
+    If `include_unchanged_columns`, fill the update dataframe with the backtrack columns.
+    """
+    if not include_unchanged_columns or not on_cols:
+        return unseen_df, update_df, delta_df
+
+    is_dask = hasattr(update_df, '__module__') and 'dask' in update_df.__module__
+    if is_dask:
+        dd = mrsm.attempt_import('dask.dataframe')
+        merge = dd.merge
+    else:
+        pd = mrsm.attempt_import('pandas')
+        merge = pd.merge
+
+    unchanged_backtrack_cols = [
+        col
+        for col in backtrack_df.columns
+        if col in on_cols or col not in update_df.columns
+    ]
+    if enforce_dtypes:
+        update_df = self.enforce_dtypes(update_df, chunksize=chunksize, debug=debug)
+    update_df = merge(
+        backtrack_df[unchanged_backtrack_cols],
+        update_df,
+        how='inner',
+        on=on_cols,
+    )
 
     return unseen_df, update_df, delta_df
 
 
+def _get_digest_diff_masks(
+    self,
+    df: 'pd.DataFrame',
+    on_cols: List[str],
+    begin: Union[datetime, int, None] = None,
+    end: Union[datetime, int, None] = None,
+    params: Optional[Dict[str, Any]] = None,
+    chunksize: Optional[int] = -1,
+    debug: bool = False,
+    **kw
+) -> Union[Tuple['np.ndarray', 'np.ndarray'], None]:
+    """
+    Classify the rows of `df` as new or changed using row digests computed by the instance,
+    only fetching the full rows whose digests have not been seen before.
+
+    The value hashes of previously fetched rows are cached in memory alongside their digests,
+    so unchanged rows are not transferred again on subsequent syncs.
+
+    Returns
+    -------
+    A tuple of boolean arrays (new rows, changed rows) aligned with `df`,
+    or `None` if the instance cannot compute row digests.
+    """
+    from meerschaum.utils.debug import dprint
+    from meerschaum.utils.dataframe import get_hash_dtypes, hash_df_rows, add_missing_cols_to_df
+    from meerschaum.utils.dtypes import to_pandas_dtype, none_if_null
+    from meerschaum.config import get_config
+    np = mrsm.attempt_import('numpy', lazy=False)
+    pandas = mrsm.attempt_import('pandas', lazy=False)
+
+    get_pipe_rows_digests = getattr(self.instance_connector, 'get_pipe_rows_digests', None)
+    if get_pipe_rows_digests is None or not on_cols:
+        return None
+    if any(col not in df.columns for col in on_cols):
+        return None
+
+    try:
+        digests_df = get_pipe_rows_digests(
+            self,
+            on_cols=on_cols,
+            begin=begin,
+            end=end,
+            params=params,
+            chunksize=chunksize,
+            debug=debug,
+        )
+    except Exception as e:
+        if debug:
+            dprint(f"Failed to fetch row digests for {self}:\n{e}")
+        digests_df = None
+
+    if digests_df is None or any(col not in digests_df.columns for col in on_cols):
+        return None
+
+    new_rows_mask = np.ones(len(df), dtype=bool)
+    changed_rows_mask = np.zeros(len(df), dtype=bool)
+    if len(digests_df) == 0:
+        return new_rows_mask, changed_rows_mask
+
+    digests_df = self.enforce_dtypes(digests_df, chunksize=chunksize, debug=debug)
+
+    ### Hash with the pipe's dtypes so hashes are comparable between syncs.
+    schema_df = add_missing_cols_to_df(
+        pandas.DataFrame([]),
+        {
+            col: to_pandas_dtype(typ)
+            for col, typ in self.get_dtypes(debug=debug).items()
+        },
+    )
+    value_cols = list(df.columns)
+    key_hash_dtypes = get_hash_dtypes(digests_df, df, on_cols)
+    value_hash_dtypes = get_hash_dtypes(schema_df, df, value_cols)
+
+    server_keys_index = pandas.Index(hash_df_rows(digests_df, on_cols, key_hash_dtypes))
+    server_digests = pandas.util.hash_pandas_object(
+        digests_df['_mrsm_digest'].astype('string'),
+        index=False,
+    ).to_numpy()
+    if not server_keys_index.is_unique:
+        keep_mask = ~server_keys_index.duplicated(keep='last')
+        server_keys_index = server_keys_index[keep_mask]
+        server_digests = server_digests[keep_mask]
+
+    new_keys_hashes = hash_df_rows(df, on_cols, key_hash_dtypes)
+    positions = server_keys_index.get_indexer(new_keys_hashes)
+    new_rows_mask = positions == -1
+    matched_mask = ~new_rows_mask
+    if not matched_mask.any():
+        return new_rows_mask, changed_rows_mask
+
+    new_values_hashes = hash_df_rows(df, value_cols, value_hash_dtypes)
+
+    ### Value hashes of existing rows are only valid while the digest and columns are the same.
+    signature = (tuple(value_cols), tuple(sorted(value_hash_dtypes.items())))
+    cache = self._get_cached_value('rows_digests', debug=debug)
+    if not cache or cache.get('signature', None) != signature:
+        cache = {
+            'signature': signature,
+            'keys': pandas.Index([], dtype='uint64'),
+            'digests': np.array([], dtype='uint64'),
+            'values': np.array([], dtype='uint64'),
+        }
+
+    server_values_hashes = np.zeros(len(server_keys_index), dtype='uint64')
+    cache_positions = cache['keys'].get_indexer(server_keys_index)
+    known_mask = cache_positions != -1
+    known_mask[known_mask] = (
+        cache['digests'][cache_positions[known_mask]] == server_digests[known_mask]
+    )
+    server_values_hashes[known_mask] = cache['values'][cache_positions[known_mask]]
+
+    ### Only fetch the full rows for keys which changed since they were last seen.
+    unknown_rows_mask = matched_mask.copy()
+    unknown_rows_mask[matched_mask] = ~known_mask[positions[matched_mask]]
+    if unknown_rows_mask.any():
+        unknown_df = df[unknown_rows_mask]
+        filter_params_index_limit = get_config('pipes', 'sync', 'filter_params_index_limit')
+        fetch_params = dict(params or {})
+        dt_col = self.columns.get('datetime', None)
+        for col in on_cols:
+            if col == dt_col:
+                continue
+            unique_vals = unknown_df[col].unique()
+            if len(unique_vals) <= filter_params_index_limit:
+                fetch_params[col] = [none_if_null(val) for val in unique_vals]
+
+        backtrack_df = self.get_data(
+            begin=begin,
+            end=end,
+            params=fetch_params,
+            chunksize=chunksize,
+            debug=debug,
+            **kw
+        )
+        if backtrack_df is not None and len(backtrack_df) > 0:
+            missing_cols = [col for col in value_cols if col not in backtrack_df.columns]
+            if missing_cols:
+                backtrack_df = backtrack_df.assign(**{
+                    col: df[col].iloc[:0].reindex(pandas.RangeIndex(len(backtrack_df))).to_numpy()
+                    for col in missing_cols
+                })
+            backtrack_positions = server_keys_index.get_indexer(
+                hash_df_rows(backtrack_df, on_cols, key_hash_dtypes)
+            )
+            fetched_mask = backtrack_positions != -1
+            server_values_hashes[backtrack_positions[fetched_mask]] = hash_df_rows(
+                backtrack_df[fetched_mask],
+                value_cols,
+                value_hash_dtypes,
+            )
+            known_mask[backtrack_positions[fetched_mask]] = True
+
+        if debug:
+            dprint(
+                f"Fetched {len(backtrack_df) if backtrack_df is not None else 0:,} rows "
+                f"with unseen digests for {self}."
+            )
+
+    ### Rows we still couldn't compare are treated as changed and upserted.
+    matched_positions = positions[matched_mask]
+    changed_rows_mask[matched_mask] = (
+        ~known_mask[matched_positions]
+        | (server_values_hashes[matched_positions] != new_values_hashes[matched_mask])
+    )
+
+    self._cache_value(
+        'rows_digests',
+        {
+            'signature': signature,
+            'keys': server_keys_index[known_mask],
+            'digests': server_digests[known_mask],
+            'values': server_values_hashes[known_mask],
+        },
+        memory_only=True,
+        debug=debug,
+    )
+    return new_rows_mask, changed_rows_mask
+
+
 @staticmethod
 def _get_chunk_label(
     chunk: Union[
@@ -1080,11 +1522,10 @@ def _persist_new_special_columns(
     """
     Check for new special columns and update the parameters accordingly.
     """
-    from meerschaum.utils.dataframe import get_special_cols
     from meerschaum.utils.dtypes import is_dtype_special
     from meerschaum.utils.warnings import dprint
 
-    special_cols = get_special_cols(df)
+    special_cols = self._get_special_cols(df, debug=debug)
     dtypes = dtypes or self.get_dtypes(debug=debug)
     existing_special_cols = {
         col: typ
@@ -1105,3 +1546,257 @@ def _persist_new_special_columns(
 
     self._clear_cache_key('_attributes_sync_time', debug=debug)
     return self.update_parameters({'dtypes': new_special_cols}, debug=debug)
+
+
+def _get_special_cols(
+    self,
+    df: 'pd.DataFrame',
+    debug: bool = False,
+) -> Dict[str, str]:
+    """
+    Return the special columns of a dataframe, reusing the resolved types
+    from previous dataframes with the same schema.
+
+    The cache is keyed on the dataframe's column names and pandas dtypes
+    (and the type of the first value of each object column, which is what the detection inspects),
+    so a new column, dtype change, or new kind of object value triggers a fresh detection.
+    Schemas with geometry columns are always detected afresh.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The incoming dataframe to inspect.
+
+    Returns
+    -------
+    A dictionary mapping special columns to their dtypes (see `get_special_cols()`).
+    """
+    from meerschaum.utils.dataframe import get_special_cols
+    from meerschaum.utils.warnings import dprint
+
+    if df is None or 'pandas' not in str(type(df)):
+        return get_special_cols(df)
+
+    cache_size = mrsm.get_config('pipes', 'sync', 'schema_cache_size')
+    fingerprint = tuple(
+        (
+            str(col),
+            str(typ),
+            (_get_first_value_type(df[col]) if str(typ) == 'object' else None),
+        )
+        for col, typ in df.dtypes.items()
+    )
+    schemas_special_cols = self._get_cached_value('schemas_special_cols', debug=debug) or {}
+    cached_special_cols = schemas_special_cols.get(fingerprint, None)
+    if cached_special_cols is not None:
+        return dict(cached_special_cols)
+
+    special_cols = get_special_cols(df)
+
+    ### Object columns without any values may hold special values in later chunks,
+    ### so only remember schemas which were fully resolved.
+    has_unresolved_cols = any(
+        str(typ) == 'object'
+        and col not in special_cols
+        and not df[col].notna().any()
+        for col, typ in df.dtypes.items()
+    )
+    ### Geometry types and SRIDs are detected from every value, so they may change between chunks.
+    has_geometry_cols = any(
+        str(typ).startswith(('geometry', 'geography'))
+        for typ in special_cols.values()
+    )
+    if has_unresolved_cols or has_geometry_cols or not cache_size or cache_size <= 0:
+        return special_cols
+
+    if debug:
+        dprint(f"Caching special columns for new schema of {self}:\n{special_cols}")
+
+    schemas_special_cols = {
+        key: val
+        for key, val in schemas_special_cols.items()
+        if key != fingerprint
+    }
+    schemas_special_cols[fingerprint] = dict(special_cols)
+    while len(schemas_special_cols) > cache_size:
+        schemas_special_cols.pop(next(iter(schemas_special_cols)))
+
+    self._cache_value('schemas_special_cols', schemas_special_cols, memory_only=True, debug=debug)
+    return special_cols
+
+
+def _get_first_value_type(series: 'pd.Series') -> Union[str, None]:
+    """
+    Return the type name of the first non-null value in a series (or `None` if it has none).
+    """
+    ix = series.first_valid_index()
+    if ix is None:
+        return None
+    val = series.loc[ix]
+    ### Duplicate index labels return every matching value.
+    if val.__class__.__name__ == 'Series':
+        val = val.iloc[0]
+    return type(val).__name__
+
+
+def _get_num_chunk_rows(chunk: Any) -> int:
+    """
+    Return the number of rows in a chunk (or 0 if it cannot be determined cheaply).
+    """
+    from meerschaum.utils.dataframe import df_is_chunk_generator
+    if df_is_chunk_generator(chunk):
+        return 0
+    if isinstance(chunk, dict):
+        return len(next(iter(chunk.values()), []))
+    try:
+        return len(chunk)
+    except Exception:
+        return 0
+
+
+def _run_chunks_pipeline(
+    chunks: Iterator[Any],
+    stages: List[Tuple[str, Callable[[Any], Any], int]],
+    callback: Callable[[Any], Any],
+    queue_depth: int = 2,
+    max_attempts: int = 1,
+) -> Tuple[Dict[str, Dict[str, Union[int, float]]], Union[Exception, None]]:
+    """
+    Consume a chunk generator through stages of worker threads joined by bounded queues.
+    A full queue blocks the stage before it, so at most `queue_depth` chunks wait between stages.
+    If a stage keeps raising for a chunk, the callback receives a failed `SuccessTuple`
+    for that chunk (skipping the remaining stages) so that no chunk is silently dropped.
+
+    Parameters
+    ----------
+    chunks: Iterator[Any]
+        The source iterator, consumed in its own thread (the `'fetch'` stage).
+
+    stages: List[Tuple[str, Callable[[Any], Any], int]]
+        The name, function, and number of workers for each stage.
+        Each stage's output is the next stage's input.
+
+    callback: Callable[[Any], Any]
+        Called (one at a time) with the output of the final stage.
+
+    queue_depth: int, default 2
+        The maximum number of chunks buffered between stages.
+
+    max_attempts: int, default 1
+        How many times a stage is called for a chunk before the chunk is reported as failed.
+
+    Returns
+    -------
+    A tuple of the per-stage statistics (`chunks`, `rows`, and busy `seconds`)
+    and the exception raised by the source iterator (if any).
+    """
+    import queue
+    from meerschaum.utils.threading import Thread, Lock
+    done = object()
+    queue_depth = max(int(queue_depth or 1), 1)
+    max_attempts = max(int(max_attempts or 1), 1)
+    queues = [queue.Queue(maxsize=queue_depth) for _ in stages]
+    stages_stats = {
+        name: {'chunks': 0, 'rows': 0, 'seconds': 0.0}
+        for name in ['fetch'] + [stage_name for stage_name, _, _ in stages]
+    }
+    remaining_workers = [max(int(num_workers or 1), 1) for _, _, num_workers in stages]
+    source_exceptions = []
+    stats_lock, callback_lock = Lock(), Lock()
+
+    def _record(name: str, chunk: Any, seconds: float) -> None:
+        num_rows = _get_num_chunk_rows(chunk)
+        with stats_lock:
+            stages_stats[name]['chunks'] += 1
+            stages_stats[name]['rows'] += num_rows
+            stages_stats[name]['seconds'] += seconds
+
+    def _source_worker():
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    chunk = next(chunks)
+                except StopIteration:
+                    break
+                _record('fetch', chunk, time.perf_counter() - start)
+                queues[0].put(chunk)
+        except Exception as e:
+            source_exceptions.append(e)
+        finally:
+            queues[0].put(done)
+
+    def _stage_worker(ix: int):
+        name, func, _ = stages[ix]
+        in_queue = queues[ix]
+        out_queue = queues[ix + 1] if ix + 1 < len(queues) else None
+        while True:
+            chunk = in_queue.get()
+            if chunk is done:
+                ### Let sibling workers see the sentinel, and the last one out closes the stage.
+                in_queue.put(done)
+                with stats_lock:
+                    remaining_workers[ix] -= 1
+                    is_last_worker = remaining_workers[ix] == 0
+                if is_last_worker and out_queue is not None:
+                    out_queue.put(done)
+                return
+
+            start = time.perf_counter()
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    result = func(chunk)
+                    failed = False
+                    break
+                except Exception as e:
+                    warn(
+                        (
+                            f"Failed to process chunk in stage '{name}' "
+                            f"(attempt {attempt} / {max_attempts}):\n{e}"
+                        ),
+                        stack=False,
+                    )
+                    result = (False, f"Failed to process a chunk in stage '{name}':\n{e}")
+                    failed = True
+            _record(name, chunk, time.perf_counter() - start)
+
+            if out_queue is not None and not failed:
+                out_queue.put(result)
+                continue
+
+            with callback_lock:
+                callback(result)
+
+    threads = [Thread(target=_source_worker, daemon=True)] + [
+        Thread(target=_stage_worker, args=(ix,), daemon=True)
+        for ix, num_workers in enumerate(remaining_workers)
+        for _ in range(num_workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return stages_stats, (source_exceptions[0] if source_exceptions else None)
+
+
+def _format_stages_stats(stages_stats: Dict[str, Dict[str, Union[int, float]]]) -> str:
+    """
+    Format the per-stage throughput returned by `_run_chunks_pipeline()`.
+    """
+    name_width = max(len(name) for name in stages_stats)
+    lines = ['Stage throughput:']
+    for name, stats in stages_stats.items():
+        rows_per_second = (
+            stats['rows'] / stats['seconds']
+            if stats['seconds'] > 0
+            else 0.0
+        )
+        lines.append(
+            f"    {(name + ':').ljust(name_width + 1)} "
+            f"{stats['chunks']:,} chunk{'s' if stats['chunks'] != 1 else ''}, "
+            f"{stats['rows']:,} row{'s' if stats['rows'] != 1 else ''} "
+            f"in {round(stats['seconds'], 2)} s "
+            f"({round(rows_per_second):,} rows / s)"
+        )
+    return '\n'.join(lines)
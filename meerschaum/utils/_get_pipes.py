@@ -40,6 +40,7 @@ def get_pipes(
     as_targets_dict: bool = False,
     method: str = 'registered',
     workers: Optional[int] = None,
+    prefetch: bool = False,
     debug: bool = False,
     _cache_parameters: bool = True,
     **kw: Any
@@ -105,6 +106,11 @@ def get_pipes(
         for the pool to fetch tags or targets.
         Only takes effect if the instance connector supports multi-threading.
 
+    prefetch: bool, default False
+        If `True` and the instance connector supports it, fetch the pipes' columns types,
+        indices, and sync times in batched queries and cache them on the pipes in memory.
+        The prefetched sync time is used by the next call to `Pipe.get_sync_time()`.
+
     **kw: Any:
         Keyword arguments to pass to the `meerschaum.Pipe` constructor.
 
@@ -345,10 +351,13 @@ def get_pipes(
                     target_name = truncate_item_name(target_name, connector_flavor)
             targets_pipes[(schema, target_name)].append(pipe)
 
+    from meerschaum.utils.pipes import flatten_pipes_dict
+    if prefetch and hasattr(connector, 'get_pipes_columns_types'):
+        _prefetch_pipes_metadata(flatten_pipes_dict(pipes), connector, debug=debug)
+
     if not as_list and not as_tags_dict and not as_targets_dict:
         return pipes
 
-    from meerschaum.utils.pipes import flatten_pipes_dict
     pipes_list = flatten_pipes_dict(pipes)
     if as_list:
         return pipes_list
@@ -375,6 +384,56 @@ def get_pipes(
     raise NotImplementedError("No futher options for returning pipes.")
 
 
+def _prefetch_pipes_metadata(
+    pipes: List[mrsm.Pipe],
+    connector: InstanceConnector,
+    debug: bool = False,
+) -> None:
+    """
+    Cache the columns types, indices, and sync times of many pipes
+    from the connector's batched methods.
+    """
+    from meerschaum.utils.dtypes import get_current_timestamp
+    from meerschaum.utils.warnings import warn
+    if not pipes:
+        return
+
+    try:
+        pipes_columns_types = connector.get_pipes_columns_types(pipes, debug=debug)
+        pipes_columns_indices = connector.get_pipes_columns_indices(pipes, debug=debug)
+        pipes_sync_times = connector.get_pipes_sync_times(
+            pipes,
+            pipes_columns_types=pipes_columns_types,
+            debug=debug,
+        )
+    except Exception as e:
+        warn(f"Failed to prefetch the metadata of {len(pipes)} pipes:\n{e}", stack=False)
+        return
+
+    now = get_current_timestamp('ms', as_int=True) / 1000
+    for pipe in pipes:
+        ### Tables whose batch failed map to `None` and are left to be fetched on demand.
+        columns_types = pipes_columns_types.get(pipe, None)
+        if columns_types is not None:
+            pipe._cache_value('_columns_types', columns_types, memory_only=True, debug=debug)
+            pipe._cache_value('_columns_types_timestamp', now, memory_only=True, debug=debug)
+            pipe._cache_value('_exists', bool(columns_types), memory_only=True, debug=debug)
+            pipe._cache_value('_exists_timestamp', now, memory_only=True, debug=debug)
+
+        columns_indices = pipes_columns_indices.get(pipe, None)
+        if columns_indices is not None:
+            pipe._cache_value('_columns_indices', columns_indices, memory_only=True, debug=debug)
+            pipe._cache_value('_columns_indices_timestamp', now, memory_only=True, debug=debug)
+
+        if pipe in pipes_sync_times:
+            pipe._cache_value(
+                '_prefetched_sync_time',
+                (now, pipes_sync_times[pipe]),
+                memory_only=True,
+                debug=debug,
+            )
+
+
 def fetch_pipes_keys(
     method: str,
     connector: 'mrsm.connectors.InstanceConnector',
@@ -0,0 +1,241 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+
+"""
+Compress and decompress HTTP bodies with zstd (if `zstandard` is installed) or gzip.
+"""
+
+from __future__ import annotations
+
+import zlib
+
+from meerschaum.utils.typing import Any, Optional, List, Iterator
+
+### In order of preference.
+ENCODINGS: List[str] = ['zstd', 'gzip']
+
+### `wbits` for a gzip header and trailer.
+_GZIP_WBITS: int = zlib.MAX_WBITS | 16
+
+### A `zstandard` decompressobj cannot limit its output,
+### so bounded bodies are fed to it in slices of this many bytes.
+_ZSTD_BOUNDED_INPUT_SIZE: int = 1024
+
+
+class DecompressedSizeExceeded(ValueError):
+    """
+    Raised when a body decompresses to more than the allowed number of bytes.
+    """
+
+
+def get_supported_encodings() -> List[str]:
+    """
+    Return the content encodings which may be compressed and decompressed here,
+    in order of preference.
+    """
+    from meerschaum.utils.packages import is_installed
+    return [
+        encoding
+        for encoding in ENCODINGS
+        if encoding != 'zstd' or is_installed('zstandard', venv=None)
+    ]
+
+
+def parse_encodings_header(header: Optional[str]) -> List[str]:
+    """
+    Return the encodings listed in an `Accept-Encoding` header
+    (omitting those with a quality of 0), sorted by quality.
+
+    Examples
+    --------
+    >>> parse_encodings_header('gzip;q=0.5, zstd, br;q=0')
+    ['zstd', 'gzip']
+    """
+    encodings_qualities = []
+    for part in (header or '').split(','):
+        encoding, *params = [item.strip() for item in part.split(';')]
+        if not encoding:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, val = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(val)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            encodings_qualities.append((encoding.lower(), quality))
+
+    return [
+        encoding
+        for encoding, _ in sorted(encodings_qualities, key=lambda item: -item[1])
+    ]
+
+
+def choose_encoding(
+    header: Optional[str],
+    supported_encodings: Optional[List[str]] = None,
+) -> Optional[str]:
+    """
+    Return the most preferred supported encoding named in an `Accept-Encoding` header,
+    or `None` if none is supported.
+    """
+    supported_encodings = (
+        supported_encodings
+        if supported_encodings is not None
+        else get_supported_encodings()
+    )
+    accepted_encodings = parse_encodings_header(header)
+    if '*' in accepted_encodings:
+        return supported_encodings[0] if supported_encodings else None
+    for encoding in supported_encodings:
+        if encoding in accepted_encodings:
+            return encoding
+    return None
+
+
+def compress_bytes(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress `data` with the given content encoding (`'zstd'` or `'gzip'`).
+    """
+    if encoding == 'zstd':
+        from meerschaum.utils.packages import attempt_import
+        zstandard = attempt_import('zstandard', lazy=False, venv=None)
+        return zstandard.ZstdCompressor(level=(level or 3)).compress(data)
+    if encoding == 'gzip':
+        compressor = zlib.compressobj(level if level is not None else 6, zlib.DEFLATED, _GZIP_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    raise ValueError(f"Unsupported encoding '{encoding}'.")
+
+
+def decompress_bytes(data: bytes, encoding: str) -> bytes:
+    """
+    Decompress `data` from the given content encoding (`'zstd'` or `'gzip'`).
+    """
+    decompressor = StreamDecompressor(encoding)
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+class StreamCompressor:
+    """
+    Incrementally compress a body whose pieces must each be sent as soon as they are ready.
+    """
+
+    def __init__(self, encoding: str, level: Optional[int] = None):
+        self.encoding = encoding
+        if encoding == 'zstd':
+            from meerschaum.utils.packages import attempt_import
+            self._zstandard = attempt_import('zstandard', lazy=False, venv=None)
+            self._compressor = self._zstandard.ZstdCompressor(level=(level or 3)).compressobj()
+        elif encoding == 'gzip':
+            self._compressor = zlib.compressobj(
+                level if level is not None else 6,
+                zlib.DEFLATED,
+                _GZIP_WBITS,
+            )
+        else:
+            raise ValueError(f"Unsupported encoding '{encoding}'.")
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress `data` and flush it, so that the receiver may decompress it right away.
+        """
+        flush_mode = (
+            self._zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            if self.encoding == 'zstd'
+            else zlib.Z_SYNC_FLUSH
+        )
+        return self._compressor.compress(data) + self._compressor.flush(flush_mode)
+
+    def finish(self) -> bytes:
+        """
+        Return the end of the compressed body.
+        """
+        return self._compressor.flush()
+
+
+class StreamDecompressor:
+    """
+    Incrementally decompress a body as its pieces are received.
+
+    If `max_size` is set, raise `DecompressedSizeExceeded`
+    as soon as the body decompresses to more than `max_size` bytes
+    (rather than inflating a "decompression bomb" into memory).
+    """
+
+    def __init__(self, encoding: str, max_size: Optional[int] = None):
+        self.encoding = encoding
+        self.max_size = max_size
+        self.size = 0
+        if encoding == 'zstd':
+            from meerschaum.utils.packages import attempt_import
+            zstandard = attempt_import('zstandard', lazy=False, venv=None)
+            ### A `zstandard` decompressobj only reads a single frame.
+            self._decompressor = zstandard.ZstdDecompressor().decompressobj(read_across_frames=True)
+        elif encoding == 'gzip':
+            self._decompressor = zlib.decompressobj(_GZIP_WBITS)
+        else:
+            raise ValueError(f"Unsupported encoding '{encoding}'.")
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Return the decompressed bytes available from `data`.
+        """
+        if not data:
+            return b''
+        if self.max_size is None:
+            return self._decompressor.decompress(data)
+
+        if self.encoding == 'gzip':
+            ### Stop one byte past the limit so that the overflow is detected.
+            return self._check_size(
+                self._decompressor.decompress(data, self.max_size - self.size + 1)
+            )
+
+        pieces = []
+        for i in range(0, len(data), _ZSTD_BOUNDED_INPUT_SIZE):
+            pieces.append(self._check_size(
+                self._decompressor.decompress(data[i:(i + _ZSTD_BOUNDED_INPUT_SIZE)])
+            ))
+        return b''.join(pieces)
+
+    def flush(self) -> bytes:
+        """
+        Return any remaining decompressed bytes.
+        """
+        flush = getattr(self._decompressor, 'flush', None)
+        if flush is None:
+            return b''
+        if self.max_size is None or self.encoding != 'gzip':
+            return self._check_size(flush())
+        return self._check_size(flush(self.max_size - self.size + 1))
+
+    def _check_size(self, body: bytes) -> bytes:
+        """
+        Count the decompressed bytes and raise `DecompressedSizeExceeded` beyond `max_size`.
+        """
+        self.size += len(body)
+        if self.max_size is not None and self.size > self.max_size:
+            raise DecompressedSizeExceeded(
+                f"The body decompresses to more than {self.max_size} bytes."
+            )
+        return body
+
+
+def compress_iterator(
+    chunks: Iterator[Any],
+    encoding: str,
+    level: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Compress the pieces of a streamed body as they are produced.
+    """
+    compressor = StreamCompressor(encoding, level=level)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        if chunk:
+            yield compressor.compress(chunk)
+    yield compressor.finish()
@@ -87,6 +87,7 @@ def filter_unseen_df(
     dtypes: Optional[Dict[str, Any]] = None,
     include_unchanged_columns: bool = False,
     coerce_mixed_numerics: bool = True,
+    diff_backend: Optional[str] = None,
     debug: bool = False,
 ) -> 'pd.DataFrame':
     """
@@ -114,6 +115,11 @@ def filter_unseen_df(
         If `True`, cast mixed integer and float columns between the old and new dataframes into
         numeric values (`decimal.Decimal`).
 
+    diff_backend: Optional[str], default None
+        If `'polars'`, find the unseen rows with a multithreaded Polars anti-join
+        (falling back to a pandas merge if the frames cannot be converted).
+        Defaults to `pipes:sync:diff_backend` (`'pandas'`).
+
     debug: bool, default False
         Verbosity toggle.
 
@@ -138,8 +144,8 @@ def filter_unseen_df(
         return new_df
 
     if safe_copy:
-        old_df = old_df.copy()
-        new_df = new_df.copy()
+        old_df = copy_df(old_df)
+        new_df = copy_df(new_df)
 
     import json
     import functools
@@ -361,16 +367,27 @@ def filter_unseen_df(
     geometry_cols = set(new_geometry_cols + old_geometry_cols)
 
     na_pattern = r'(?i)^(none|nan|na|nat|natz|<na>)$'
-    joined_df = merge(
-        new_df.infer_objects().replace(na_pattern, pd.NA, regex=True).fillna(NA),
-        old_df.infer_objects().replace(na_pattern, pd.NA, regex=True).fillna(NA),
-        how='left',
-        on=None,
-        indicator=True,
-    )
-    changed_rows_mask = (joined_df['_merge'] == 'left_only')
+    new_df = new_df.infer_objects().replace(na_pattern, pd.NA, regex=True).fillna(NA)
+    old_df = old_df.infer_objects().replace(na_pattern, pd.NA, regex=True).fillna(NA)
     new_cols = list(new_df_dtypes)
-    delta_df = joined_df[new_cols][changed_rows_mask].reset_index(drop=True)
+    diff_backend = diff_backend or mrsm.get_config('pipes', 'sync', 'diff_backend')
+    changed_rows_mask = (
+        get_polars_anti_join_mask(new_df, old_df, debug=debug)
+        if diff_backend == 'polars' and not is_dask
+        else None
+    )
+    if changed_rows_mask is not None:
+        delta_df = new_df[new_cols][changed_rows_mask].reset_index(drop=True)
+    else:
+        joined_df = merge(
+            new_df,
+            old_df,
+            how='left',
+            on=None,
+            indicator=True,
+        )
+        changed_rows_mask = (joined_df['_merge'] == 'left_only')
+        delta_df = joined_df[new_cols][changed_rows_mask].reset_index(drop=True)
 
     delta_json_cols = get_json_cols(delta_df)
     for json_col in json_cols:
@@ -444,6 +461,317 @@ def filter_unseen_df(
     return delta_df
 
 
+def get_hash_dtypes(
+    old_df: 'pd.DataFrame',
+    new_df: 'pd.DataFrame',
+    cols: Optional[List[str]] = None,
+) -> Dict[str, Union[str, None]]:
+    """
+    Determine the common dtypes to which columns must be cast
+    so that equal values hash identically across both dataframes.
+
+    Parameters
+    ----------
+    old_df: pd.DataFrame
+        The original (target) dataframe.
+
+    new_df: pd.DataFrame
+        The fetched (source) dataframe.
+
+    cols: Optional[List[str]], default None
+        The columns to inspect. Defaults to the columns of `new_df`.
+
+    Returns
+    -------
+    A dictionary mapping columns to hashing dtypes
+    (`None` means the column may be hashed as-is).
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> old_df = pd.DataFrame({'a': [1.0], 'b': ['x']})
+    >>> new_df = pd.DataFrame({'a': [1], 'b': ['x']})
+    >>> get_hash_dtypes(old_df, new_df)
+    {'a': 'Float64', 'b': None}
+    """
+    import re
+    from meerschaum.utils.dtypes import are_dtypes_equal, is_arrow_dtype
+    cols = list(new_df.columns) if cols is None else cols
+    json_cols = set(get_json_cols(old_df) + get_json_cols(new_df))
+    numeric_cols = set(get_numeric_cols(old_df) + get_numeric_cols(new_df))
+    bytes_cols = set(get_bytes_cols(old_df) + get_bytes_cols(new_df))
+    units = ['s', 'ms', 'us', 'ns']
+    unit_regex = r'\[(s|ms|us|ns)[,\]]'
+
+    hash_dtypes = {}
+    for col in cols:
+        pd_typs = [
+            _df.dtypes[col]
+            for _df in (old_df, new_df)
+            if col in _df.columns
+        ]
+        typs = [str(typ) for typ in pd_typs]
+        if len(pd_typs) > 1 and pd_typs[0] == pd_typs[1] and is_arrow_dtype(pd_typs[0]):
+            hash_dtypes[col] = None
+        elif col in json_cols:
+            hash_dtypes[col] = 'json'
+        elif col in numeric_cols:
+            hash_dtypes[col] = 'numeric'
+        elif col in bytes_cols:
+            hash_dtypes[col] = 'bytes'
+        elif any(are_dtypes_equal(typ, 'datetime') for typ in typs):
+            typs_units = [
+                match.group(1)
+                for typ in typs
+                if (match := re.search(unit_regex, typ))
+            ]
+            unit = min(typs_units, key=units.index) if typs_units else 'us'
+            hash_dtypes[col] = f'datetime64[{unit}]'
+        elif all(
+            are_dtypes_equal(typ, 'int')
+            or are_dtypes_equal(typ, 'float')
+            or are_dtypes_equal(typ, 'bool')
+            for typ in typs
+        ):
+            hash_dtypes[col] = (
+                'Float64'
+                if any(are_dtypes_equal(typ, 'float') for typ in typs)
+                else (
+                    'Int64'
+                    if any(are_dtypes_equal(typ, 'int') for typ in typs)
+                    else 'boolean'
+                )
+            )
+        elif len(typs) > 1 and not are_dtypes_equal(typs[0], typs[1]):
+            hash_dtypes[col] = 'string'
+        else:
+            hash_dtypes[col] = None
+
+    return hash_dtypes
+
+
+def hash_df_rows(
+    df: 'pd.DataFrame',
+    cols: Optional[List[str]] = None,
+    hash_dtypes: Optional[Dict[str, Union[str, None]]] = None,
+) -> 'np.ndarray':
+    """
+    Compute a vectorized 64-bit hash for each row of a dataframe.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The dataframe whose rows should be hashed.
+
+    cols: Optional[List[str]], default None
+        The columns to include in the hash (order matters).
+        Defaults to all of the columns of `df`.
+
+    hash_dtypes: Optional[Dict[str, Union[str, None]]], default None
+        If provided, cast columns to these dtypes before hashing
+        (see `meerschaum.utils.dataframe.get_hash_dtypes()`).
+
+    Returns
+    -------
+    A NumPy array of `uint64` hashes (one per row).
+    """
+    import json
+    import functools
+    from meerschaum.utils.packages import attempt_import
+    from meerschaum.utils.dtypes import serialize_decimal, coerce_timezone
+    np = attempt_import('numpy', lazy=False)
+    pandas = attempt_import('pandas', lazy=False)
+    cols = list(df.columns) if cols is None else cols
+    hash_dtypes = hash_dtypes or {}
+    serializer = functools.partial(json.dumps, sort_keys=True, separators=(',', ':'), default=str)
+
+    def _get_hashable_series(series, hash_dtype):
+        if hash_dtype is None:
+            return series
+        if hash_dtype == 'json':
+            return series.map(lambda x: serializer(x) if isinstance(x, (dict, list)) else x)
+        if hash_dtype == 'numeric':
+            return series.map(serialize_decimal)
+        if hash_dtype == 'bytes':
+            return series.astype(object)
+        if hash_dtype.startswith('datetime64'):
+            unit = hash_dtype.split('[', maxsplit=1)[-1].rstrip(']')
+            return coerce_timezone(series, strip_utc=True).dt.as_unit(unit)
+        return series.astype(hash_dtype)
+
+    ### Mix each column's hash into the row hash (FNV-1a style) to avoid building a new frame.
+    row_hashes = np.zeros(len(df), dtype='uint64')
+    prime = np.uint64(1099511628211)
+    for col in cols:
+        series = df[col]
+        try:
+            series = _get_hashable_series(series, hash_dtypes.get(col, None))
+        except Exception:
+            series = series.astype('string')
+
+        col_hashes = pandas.util.hash_pandas_object(series, index=False).to_numpy()
+        row_hashes = (row_hashes ^ col_hashes) * prime
+
+    return row_hashes
+
+
+def get_hash_diff_masks(
+    old_df: 'pd.DataFrame',
+    new_df: 'pd.DataFrame',
+    on_cols: Optional[List[str]] = None,
+    debug: bool = False,
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Classify the rows of `new_df` as new, changed, or unchanged by comparing row hashes
+    against `old_df` (without joining the two dataframes).
+
+    Parameters
+    ----------
+    old_df: pd.DataFrame
+        The original (target) dataframe.
+
+    new_df: pd.DataFrame
+        The fetched (source) dataframe.
+
+    on_cols: Optional[List[str]], default None
+        The index columns which identify a row.
+        If omitted, rows are compared in full and none are considered changed.
+
+    debug: bool, default False
+        Verbosity toggle.
+
+    Returns
+    -------
+    A tuple of two boolean NumPy arrays aligned with `new_df`:
+    the rows whose keys do not exist in `old_df` and the rows whose values have changed.
+    Rows which are neither are unchanged.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> old_df = pd.DataFrame({'id': [1, 2], 'val': [10, 20]})
+    >>> new_df = pd.DataFrame({'id': [1, 2, 3], 'val': [10, 99, 30]})
+    >>> get_hash_diff_masks(old_df, new_df, on_cols=['id'])
+    (array([False, False,  True]), array([False,  True, False]))
+    """
+    from meerschaum.utils.packages import attempt_import
+    from meerschaum.utils.debug import dprint
+    np = attempt_import('numpy', lazy=False)
+    pandas = attempt_import('pandas', lazy=False)
+
+    on_cols = [
+        col
+        for col in (on_cols or [])
+        if col in new_df.columns and col in old_df.columns
+    ]
+    value_cols = [col for col in new_df.columns if col not in on_cols]
+    hash_dtypes = get_hash_dtypes(old_df, new_df, on_cols + value_cols)
+    if debug:
+        dprint(f"Hashing on columns {on_cols} with dtypes:\n{hash_dtypes}")
+
+    ### Columns missing from the old dataframe are treated as null.
+    missing_cols = [col for col in value_cols if col not in old_df.columns]
+    if missing_cols:
+        old_df = old_df.assign(**{
+            col: new_df[col].iloc[:0].reindex(pandas.RangeIndex(len(old_df))).to_numpy()
+            for col in missing_cols
+        })
+
+    new_values_hashes = hash_df_rows(new_df, value_cols, hash_dtypes)
+    old_values_hashes = hash_df_rows(old_df, value_cols, hash_dtypes)
+    if not on_cols:
+        new_rows_mask = ~np.isin(new_values_hashes, old_values_hashes)
+        return new_rows_mask, np.zeros(len(new_df), dtype=bool)
+
+    if len(old_df) == 0:
+        return np.ones(len(new_df), dtype=bool), np.zeros(len(new_df), dtype=bool)
+
+    new_keys_hashes = hash_df_rows(new_df, on_cols, hash_dtypes)
+    old_keys_hashes = hash_df_rows(old_df, on_cols, hash_dtypes)
+
+    ### Keep the last occurrence of duplicate keys in the old dataframe.
+    old_keys_index = pandas.Index(old_keys_hashes)
+    if not old_keys_index.is_unique:
+        keep_mask = ~old_keys_index.duplicated(keep='last')
+        old_keys_index = old_keys_index[keep_mask]
+        old_values_hashes = old_values_hashes[keep_mask]
+
+    positions = old_keys_index.get_indexer(new_keys_hashes)
+    new_rows_mask = positions == -1
+    changed_rows_mask = (~new_rows_mask) & (old_values_hashes[positions] != new_values_hashes)
+    return new_rows_mask, changed_rows_mask
+
+
+def get_polars_anti_join_mask(
+    left_df: 'pd.DataFrame',
+    right_df: 'pd.DataFrame',
+    on_cols: Optional[List[str]] = None,
+    debug: bool = False,
+) -> Union['np.ndarray', None]:
+    """
+    Flag the rows of `left_df` which have no match in `right_df`,
+    running the anti-join multithreaded in Polars.
+    Null values are considered equal (like `pd.merge()`).
+
+    Parameters
+    ----------
+    left_df: pd.DataFrame
+        The dataframe whose rows should be flagged (e.g. the new rows).
+
+    right_df: pd.DataFrame
+        The dataframe to match against (e.g. the existing rows).
+
+    on_cols: Optional[List[str]], default None
+        The columns to join on. Defaults to all of the columns of `left_df`.
+
+    debug: bool, default False
+        Verbosity toggle.
+
+    Returns
+    -------
+    A boolean NumPy array aligned with `left_df` (`True` for unmatched rows),
+    or `None` if Polars is not available or the dataframes could not be converted
+    (e.g. columns of Python objects or mismatched types), in which case fall back to pandas.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> old_df = pd.DataFrame({'id': [1, 2], 'val': [10, 20]})
+    >>> new_df = pd.DataFrame({'id': [1, 2, 3], 'val': [10, 99, 30]})
+    >>> get_polars_anti_join_mask(new_df, old_df)
+    array([False,  True,  True])
+    >>> get_polars_anti_join_mask(new_df, old_df, on_cols=['id'])
+    array([False, False,  True])
+    """
+    from meerschaum.utils.debug import dprint
+    from meerschaum.utils.packages import attempt_import
+    np = attempt_import('numpy', lazy=False)
+    on_cols = list(left_df.columns) if on_cols is None else list(on_cols)
+    if not on_cols or any(col not in right_df.columns for col in on_cols):
+        return None
+
+    try:
+        pl = attempt_import('polars', lazy=False, warn=False)
+        if pl is None:
+            return None
+
+        ix_col = '_mrsm_ix'
+        left = pl.from_pandas(left_df[on_cols]).with_row_index(ix_col)
+        right = pl.from_pandas(right_df[on_cols])
+        try:
+            unmatched_df = left.join(right, on=on_cols, how='anti', nulls_equal=True)
+        except TypeError:
+            unmatched_df = left.join(right, on=on_cols, how='anti', join_nulls=True)
+    except Exception as e:
+        if debug:
+            dprint(f"Unable to anti-join with Polars, falling back to pandas:\n{e}")
+        return None
+
+    mask = np.zeros(len(left_df), dtype=bool)
+    mask[unmatched_df[ix_col].to_numpy()] = True
+    return mask
+
+
 def parse_df_datetimes(
     df: 'pd.DataFrame',
     ignore_cols: Optional[Iterable[str]] = None,
@@ -453,6 +781,8 @@ def parse_df_datetimes(
     ignore_all: bool = False,
     precision_unit: Optional[str] = None,
     coerce_utc: bool = True,
+    dtypes: Optional[Dict[str, str]] = None,
+    sample_size: Optional[int] = 1000,
     debug: bool = False,
 ) -> 'pd.DataFrame':
     """
@@ -486,6 +816,14 @@ def parse_df_datetimes(
     coerce_utc: bool, default True
         Coerce the datetime columns to UTC (see `meerschaum.utils.dtypes.to_datetime()`).
 
+    dtypes: Optional[Dict[str, str]], default None
+        If provided, parse the columns declared as datetimes without inspecting their values
+        (unless they are in `ignore_cols`).
+
+    sample_size: Optional[int], default 1000
+        Detect datetime columns from at most this many evenly spaced rows.
+        If `None`, inspect every row.
+
     debug: bool, default False
         Verbosity toggle.
 
@@ -514,7 +852,13 @@ def parse_df_datetimes(
     from meerschaum.utils.debug import dprint
     from meerschaum.utils.warnings import warn
     from meerschaum.utils.misc import items_str
-    from meerschaum.utils.dtypes import to_datetime, MRSM_PD_DTYPES
+    from meerschaum.utils.dtypes import (
+        to_datetime,
+        are_dtypes_equal,
+        MRSM_PD_DTYPES,
+        MRSM_PRECISION_UNITS_ALIASES,
+        MRSM_PRECISION_UNITS_ABBREVIATIONS,
+    )
     import traceback
 
     pd = import_pandas()
@@ -577,25 +921,58 @@ def parse_df_datetimes(
             if 'datetime' in str(dtype)
         ]
     )
+    declared_datetime_cols = [
+        col
+        for col, typ in (dtypes or {}).items()
+        if (
+            col in pdf.columns
+            and col not in ignore_cols
+            and are_dtypes_equal(str(typ), 'datetime')
+        )
+    ] if not ignore_all else []
     cols_to_inspect = [
         col
         for col in pdf.columns
-        if col not in ignore_cols
+        if col not in ignore_cols and col not in declared_datetime_cols
     ] if not ignore_all else []
 
-    if len(cols_to_inspect) == 0:
+    if len(cols_to_inspect) == 0 and not declared_datetime_cols:
         if debug:
             dprint("All columns are ignored, skipping datetime detection...")
         return df.infer_objects().fillna(pandas.NA)
 
+    ### Only inspect a sample of evenly spaced rows (including the first and last).
+    sample_pdf = pdf[cols_to_inspect]
+    if sample_size and len(sample_pdf) > sample_size:
+        sample_ix = sorted(set(
+            [
+                int(ix)
+                for ix in range(0, len(sample_pdf), max(len(sample_pdf) // sample_size, 1))
+            ][:sample_size - 1] + [len(sample_pdf) - 1]
+        ))
+        sample_pdf = sample_pdf.iloc[sample_ix]
+
     ### apply regex to columns to determine which are ISO datetimes
     iso_dt_regex = r'\d{4}-\d{2}-\d{2}.\d{2}\:\d{2}\:\d+'
-    dt_mask = pdf[cols_to_inspect].astype(str).apply(
+    dt_mask = sample_pdf.astype(str).apply(
         lambda s: s.str.match(iso_dt_regex).all()
-    )
+    ) if cols_to_inspect else pandas.Series([], dtype=bool)
 
     ### list of datetime column names
-    datetime_cols = [col for col in pdf[cols_to_inspect].loc[:, dt_mask]]
+    datetime_cols = declared_datetime_cols + [
+        col
+        for col, is_dt in dt_mask.items()
+        if is_dt
+    ]
+
+    ### Columns detected from a sample must parse in every row (checked while converting below),
+    ### so mixed columns are left alone.
+    sampled_datetime_cols = set(
+        col
+        for col in datetime_cols
+        if col not in declared_datetime_cols
+    ) if len(sample_pdf) < len(pdf) else set()
+
     if not datetime_cols:
         if debug:
             dprint("No columns detected as datetimes, returning...")
@@ -607,9 +984,60 @@ def parse_df_datetimes(
     def _parse_to_datetime(x):
         return to_datetime(x, precision_unit=precision_unit, coerce_utc=coerce_utc)
 
+    true_precision_unit = MRSM_PRECISION_UNITS_ALIASES.get(
+        precision_unit or 'microsecond',
+        precision_unit or 'microsecond',
+    )
+    precision_abbreviation = MRSM_PRECISION_UNITS_ABBREVIATIONS.get(true_precision_unit, 'us')
+
+    def _parse_series_to_datetime(series, verify: bool = False):
+        """
+        Parse a whole column as ISO strings at once and only parse the failed cells individually.
+        If `verify` is `True`, return `None` if any value is not an ISO datetime.
+        """
+        if are_dtypes_equal(str(series.dtype), 'datetime'):
+            return _parse_to_datetime(series)
+
+        try:
+            parsed = pandas.to_datetime(
+                series,
+                format='ISO8601',
+                utc=coerce_utc,
+                errors='coerce',
+            )
+            parsed = parsed.dt.as_unit(precision_abbreviation)
+        except Exception:
+            return _parse_to_datetime(series)
+
+        failed_mask = parsed.isna() & series.notna()
+        if not failed_mask.any():
+            return parsed
+
+        if verify:
+            return None
+
+        if debug:
+            dprint(f"Parsing {failed_mask.sum():,} values individually for column '{series.name}'.")
+
+        try:
+            parsed_failed = series[failed_mask].map(_parse_to_datetime)
+            if not all(isinstance(val, datetime) for val in parsed_failed):
+                parsed = parsed.astype(object)
+            parsed[failed_mask] = parsed_failed
+        except Exception:
+            return _parse_to_datetime(series)
+        return parsed
+
     try:
         if not using_dask:
-            df[datetime_cols] = df[datetime_cols].apply(_parse_to_datetime)
+            for col in list(datetime_cols):
+                parsed = _parse_series_to_datetime(df[col], verify=(col in sampled_datetime_cols))
+                if parsed is None:
+                    if debug:
+                        dprint(f"Not all values in column '{col}' are datetimes, skipping...")
+                    datetime_cols.remove(col)
+                    continue
+                df[col] = parsed
         else:
             df[datetime_cols] = df[datetime_cols].apply(
                 _parse_to_datetime,
@@ -1241,6 +1669,7 @@ def enforce_dtypes(
     coerce_numeric: bool = False,
     coerce_timezone: bool = True,
     strip_timezone: bool = False,
+    arrow: bool = False,
     debug: bool = False,
 ) -> 'pd.DataFrame':
     """
@@ -1273,6 +1702,10 @@ def enforce_dtypes(
         If `coerce_timezone` and `strip_timezone` are `True`,
         remove timezone information from datetimes.
 
+    arrow: bool, default False
+        If `True`, cast columns to Arrow-backed dtypes where possible
+        (see `meerschaum.utils.dtypes.to_arrow_dtype()`).
+
     debug: bool, default False
         Verbosity toggle.
 
@@ -1287,11 +1720,17 @@ def enforce_dtypes(
     from meerschaum.utils.dtypes import (
         are_dtypes_equal,
         to_pandas_dtype,
+        to_arrow_dtype,
+        MRSM_PD_ARROW_DTYPES,
         is_dtype_numeric,
         attempt_cast_to_numeric,
         attempt_cast_to_uuid,
         attempt_cast_to_bytes,
         attempt_cast_to_geometry,
+        cast_series_to_numeric,
+        cast_series_to_uuid,
+        cast_series_to_bytes,
+        cast_series_to_json,
         coerce_timezone as _coerce_timezone,
         get_geometry_type_srid,
     )
@@ -1299,12 +1738,49 @@ def enforce_dtypes(
     pandas = mrsm.attempt_import('pandas')
     is_dask = 'dask' in df.__module__
     if safe_copy:
-        df = df.copy()
+        df = copy_df(df)
     if len(df.columns) == 0:
         if debug:
             dprint("Incoming DataFrame has no columns. Skipping enforcement...")
         return df
 
+    if arrow and not is_dask:
+        ### Compare dtype objects, since dtype strings vary between Pandas versions.
+        arrow_dtypes = {
+            col: pandas.api.types.pandas_dtype(arrow_typ)
+            for col, typ in dtypes.items()
+            if col in df.columns and (arrow_typ := to_arrow_dtype(typ)) is not None
+        }
+        ### Strings and columns which are already Arrow-backed skip the object-based casting.
+        df = enforce_dtypes(
+            df,
+            {
+                col: typ
+                for col, typ in dtypes.items()
+                if col not in arrow_dtypes or (
+                    typ not in MRSM_PD_ARROW_DTYPES
+                    and df.dtypes[col] != arrow_dtypes[col]
+                )
+            },
+            explicit_dtypes=explicit_dtypes,
+            safe_copy=False,
+            coerce_numeric=coerce_numeric,
+            coerce_timezone=coerce_timezone,
+            strip_timezone=strip_timezone,
+            debug=debug,
+        )
+        for col, typ in arrow_dtypes.items():
+            if df.dtypes[col] == typ:
+                continue
+            try:
+                ### Arrow decimals represent nulls as nulls rather than `Decimal('NaN')`.
+                series = df[col]
+                df[col] = series.where(series.notna(), None).astype(typ)
+            except Exception as e:
+                if debug:
+                    dprint(f"Unable to cast column '{col}' to Arrow type {typ}:\n{e}")
+        return df
+
     explicit_dtypes = explicit_dtypes or {}
     pipe_pandas_dtypes = {
         col: to_pandas_dtype(typ)
@@ -1353,12 +1829,16 @@ def enforce_dtypes(
         for col in json_cols:
             if col in df.columns:
                 try:
-                    df[col] = df[col].apply(
-                        (
-                            lambda x: (
-                                json.loads(x)
-                                if isinstance(x, str)
-                                else x
+                    df[col] = (
+                        cast_series_to_json(df[col])
+                        if not is_dask
+                        else df[col].apply(
+                            (
+                                lambda x: (
+                                    json.loads(x)
+                                    if isinstance(x, str)
+                                    else x
+                                )
                             )
                         )
                     )
@@ -1373,13 +1853,22 @@ def enforce_dtypes(
             precision, scale = get_numeric_precision_scale(None, dtypes.get(col, ''))
             if col in df.columns:
                 try:
-                    df[col] = df[col].apply(
-                        functools.partial(
-                            attempt_cast_to_numeric,
+                    df[col] = (
+                        cast_series_to_numeric(
+                            df[col],
                             quantize=True,
                             precision=precision,
                             scale=scale,
                         )
+                        if not is_dask
+                        else df[col].apply(
+                            functools.partial(
+                                attempt_cast_to_numeric,
+                                quantize=True,
+                                precision=precision,
+                                scale=scale,
+                            )
+                        )
                     )
                 except Exception as e:
                     if debug:
@@ -1391,7 +1880,11 @@ def enforce_dtypes(
         for col in uuid_cols:
             if col in df.columns:
                 try:
-                    df[col] = df[col].apply(attempt_cast_to_uuid)
+                    df[col] = (
+                        cast_series_to_uuid(df[col])
+                        if not is_dask
+                        else df[col].apply(attempt_cast_to_uuid)
+                    )
                 except Exception as e:
                     if debug:
                         dprint(f"Unable to parse column '{col}' as UUID:\n{e}")
@@ -1402,7 +1895,11 @@ def enforce_dtypes(
         for col in bytes_cols:
             if col in df.columns:
                 try:
-                    df[col] = df[col].apply(attempt_cast_to_bytes)
+                    df[col] = (
+                        cast_series_to_bytes(df[col])
+                        if not is_dask
+                        else df[col].apply(attempt_cast_to_bytes)
+                    )
                 except Exception as e:
                     if debug:
                         dprint(f"Unable to parse column '{col}' as bytes:\n{e}")
@@ -1553,8 +2050,8 @@ def enforce_dtypes(
             dprint(msg)
 
         if cast_to_numeric:
-            common_dtypes[col] = attempt_cast_to_numeric
-            common_diff_dtypes[col] = attempt_cast_to_numeric
+            common_dtypes[col] = attempt_cast_to_numeric if is_dask else cast_series_to_numeric
+            common_diff_dtypes[col] = common_dtypes[col]
 
     for d in common_diff_dtypes:
         t = common_dtypes[d]
@@ -1562,7 +2059,7 @@ def enforce_dtypes(
             dprint(f"Casting column {d} to dtype {t}.")
         try:
             df[d] = (
-                df[d].apply(t)
+                (t(df[d]) if t is cast_series_to_numeric else df[d].apply(t))
                 if callable(t)
                 else df[d].astype(t)
             )
@@ -1743,6 +2240,60 @@ def chunksize_to_npartitions(chunksize: Optional[int]) -> int:
     return -1 * chunksize
 
 
+def pandas_has_copy_on_write(pandas: Any = None) -> Union[bool, None]:
+    """
+    Return whether pandas copy-on-write semantics are currently in effect.
+
+    Parameters
+    ----------
+    pandas: Any, default None
+        The imported `pandas` module. If omitted, import it here.
+
+    Returns
+    -------
+    `True` if copy-on-write is enabled (always for `pandas>=3`),
+    `False` if it is supported but disabled, and `None` if unsupported (`pandas<2`).
+    """
+    if pandas is None:
+        pandas = mrsm.attempt_import('pandas', lazy=False)
+    try:
+        major_version = int(pandas.__version__.split('.', maxsplit=1)[0])
+    except Exception:
+        return None
+    if major_version >= 3:
+        return True
+    if major_version < 2:
+        return None
+    return pandas.options.mode.copy_on_write is True
+
+
+def copy_df(df: 'pd.DataFrame', deep: Optional[bool] = None) -> 'pd.DataFrame':
+    """
+    Return a copy of a DataFrame which may be modified without affecting the original.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The DataFrame to copy.
+
+    deep: Optional[bool], default None
+        If `None`, only make a shallow copy when copy-on-write is in effect
+        (see `pandas_has_copy_on_write()`), otherwise fall back to a deep copy.
+
+    Returns
+    -------
+    A new DataFrame (or `df` if it cannot be copied).
+    """
+    if not hasattr(df, 'copy'):
+        return df
+    if 'dask' in df.__module__:
+        return df.copy()
+    if deep is None:
+        pandas = mrsm.attempt_import('pandas', lazy=False)
+        deep = not pandas_has_copy_on_write(pandas)
+    return df.copy(deep=deep)
+
+
 def df_from_literal(
     pipe: Optional[mrsm.Pipe] = None,
     literal: Optional[str] = None,
@@ -2116,7 +2667,7 @@ def to_json(
         for col in geometry_cols
     } if 'geodataframe' in str(type(df)).lower() else {}
     if safe_copy and bool(uuid_cols or bytes_cols or geometry_cols or numeric_cols):
-        df = df.copy()
+        df = copy_df(df)
     if 'geodataframe' in str(type(df)).lower():
         geometry_data = {
             col: df[col]
@@ -2154,6 +2705,195 @@ def to_json(
     )
 
 
+def to_arrow_table(
+    df: 'pd.DataFrame',
+    geometry_format: str = 'wkb_hex',
+) -> 'pyarrow.Table':
+    """
+    Convert a DataFrame into an Arrow table, keeping the columns' types where Arrow supports them.
+
+    UUID, JSON, and geometry columns are serialized as strings
+    (to be parsed by `enforce_dtypes()`), and any other object columns
+    which Arrow cannot convert (e.g. mixed types) fall back to strings.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The DataFrame to convert.
+
+    geometry_format: str, default 'wkb_hex'
+        The serialization format for geometry data.
+        Accepted values are `geojson`, `wkb_hex`, and `wkt`.
+
+    Returns
+    -------
+    A `pyarrow.Table` with the same columns as `df`.
+    """
+    import json
+    import warnings
+    from meerschaum.utils.packages import import_pandas, attempt_import
+    from meerschaum.utils.dtypes import serialize_geometry, json_serialize_value, value_is_null
+    pd = import_pandas()
+    pa = attempt_import('pyarrow', lazy=False)
+
+    uuid_cols = set(get_uuid_cols(df))
+    json_cols = set(get_json_cols(df))
+    geometry_cols = set(get_geometry_cols(df))
+    geometry_cols_srids = {
+        col: int((getattr(df[col].crs, 'srs', '') or '').split(':', maxsplit=1)[-1] or '0')
+        for col in geometry_cols
+    } if 'geodataframe' in str(type(df)).lower() else {}
+
+    def _to_strings(series: 'pd.Series', serializer) -> List[Union[str, None]]:
+        return [None if value_is_null(val) else serializer(val) for val in series]
+
+    arrays = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for col in df.columns:
+            series = df[col]
+            if col in uuid_cols:
+                arrays[col] = pa.array(_to_strings(series, str), type=pa.string())
+                continue
+            if col in json_cols:
+                arrays[col] = pa.array(
+                    _to_strings(
+                        series,
+                        lambda val: json.dumps(val, default=json_serialize_value, separators=(',', ':')),
+                    ),
+                    type=pa.string(),
+                )
+                continue
+            if col in geometry_cols:
+                srid = geometry_cols_srids.get(col, None) or None
+                geoms = [
+                    serialize_geometry(val, geometry_format=geometry_format, srid=srid)
+                    for val in pd.Series(ob for ob in series)
+                ]
+                arrays[col] = pa.array(
+                    [
+                        (
+                            json.dumps(geom)
+                            if isinstance(geom, dict)
+                            else (geom.hex() if isinstance(geom, bytes) else geom)
+                        )
+                        for geom in geoms
+                    ],
+                    type=pa.string(),
+                )
+                continue
+
+            try:
+                arrays[col] = pa.array(series, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                arrays[col] = pa.array(_to_strings(series, str), type=pa.string())
+
+    return pa.table(arrays)
+
+
+def df_to_bytes(
+    df: 'pd.DataFrame',
+    data_format: str = 'arrow',
+    geometry_format: str = 'wkb_hex',
+) -> bytes:
+    """
+    Serialize a DataFrame into an Arrow IPC stream, Parquet file, or JSON document.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The DataFrame to serialize.
+
+    data_format: str, default 'arrow'
+        Accepted values are `'arrow'` (Arrow IPC stream), `'parquet'`, `'json'`,
+        and `'ndjson'` (newline-delimited JSON).
+
+    geometry_format: str, default 'wkb_hex'
+        The serialization format for geometry data.
+
+    Returns
+    -------
+    The serialized bytes (see `df_from_bytes()`).
+    """
+    if data_format == 'json':
+        return to_json(df, geometry_format=geometry_format).encode('utf-8')
+    if data_format == 'ndjson':
+        lines = to_json(df, orient='records', lines=True, geometry_format=geometry_format)
+        return (lines.rstrip('\n') + '\n').encode('utf-8') if lines else b''
+
+    from meerschaum.utils.packages import attempt_import
+    pa, pq = attempt_import('pyarrow', 'pyarrow.parquet', lazy=False)
+    table = to_arrow_table(df, geometry_format=geometry_format)
+    sink = pa.BufferOutputStream()
+    if data_format == 'arrow':
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    elif data_format == 'parquet':
+        pq.write_table(table, sink)
+    else:
+        raise ValueError(f"Unsupported data format '{data_format}'.")
+    return sink.getvalue().to_pybytes()
+
+
+def df_from_bytes(
+    data: Union[bytes, 'io.BufferedIOBase'],
+    data_format: str = 'arrow',
+) -> 'pd.DataFrame':
+    """
+    Deserialize a DataFrame from the output of `df_to_bytes()`.
+
+    Integer and boolean columns are read as nullable dtypes (e.g. `Int64`)
+    so that nulls do not coerce them to floats.
+
+    Parameters
+    ----------
+    data: Union[bytes, io.BufferedIOBase]
+        The serialized DataFrame, or a binary file-like object to read it from
+        (or for `'ndjson'`, any iterable of lines).
+        Only one Arrow IPC stream is read from a file-like object,
+        so consecutive streams may be read with repeated calls.
+
+    data_format: str, default 'arrow'
+        Accepted values are `'arrow'` (Arrow IPC stream), `'parquet'`, `'json'`,
+        and `'ndjson'` (newline-delimited JSON).
+
+    Returns
+    -------
+    A `pd.DataFrame`.
+    """
+    import json
+    from meerschaum.utils.packages import import_pandas, attempt_import
+    pd = import_pandas()
+    is_bytes = isinstance(data, (bytes, bytearray, memoryview))
+    if data_format == 'json':
+        return pd.DataFrame(json.loads(data) if is_bytes else json.load(data))
+    if data_format == 'ndjson':
+        lines = bytes(data).splitlines() if is_bytes else data
+        return pd.DataFrame([json.loads(line) for line in lines if line.strip()])
+
+    pa, pq = attempt_import('pyarrow', 'pyarrow.parquet', lazy=False)
+    source = pa.BufferReader(data) if is_bytes else data
+    if data_format == 'arrow':
+        table = pa.ipc.open_stream(source).read_all()
+    elif data_format == 'parquet':
+        table = pq.read_table(source)
+    else:
+        raise ValueError(f"Unsupported data format '{data_format}'.")
+
+    nullable_dtypes = {
+        pa.int8(): pd.Int8Dtype(),
+        pa.int16(): pd.Int16Dtype(),
+        pa.int32(): pd.Int32Dtype(),
+        pa.int64(): pd.Int64Dtype(),
+        pa.uint8(): pd.UInt8Dtype(),
+        pa.uint16(): pd.UInt16Dtype(),
+        pa.uint32(): pd.UInt32Dtype(),
+        pa.uint64(): pd.UInt64Dtype(),
+        pa.bool_(): pd.BooleanDtype(),
+    }
+    return table.to_pandas(types_mapper=nullable_dtypes.get)
+
+
 def to_simple_lines(df: 'pd.DataFrame') -> str:
     """
     Serialize a Pandas Dataframe as lines of simple dictionaries.
@@ -11,6 +11,8 @@ import json
 import uuid
 import time
 import struct
+import operator
+import itertools
 from datetime import timezone, datetime, date, timedelta
 from decimal import Decimal, Context, InvalidOperation, ROUND_HALF_UP
 
@@ -55,6 +57,15 @@ MRSM_PD_DTYPES: Dict[Union[str, None], str] = {
     None: 'object',
 }
 
+MRSM_PD_ARROW_DTYPES: Dict[str, str] = {
+    'str': 'string[pyarrow]',
+    'string': 'string[pyarrow]',
+}
+MAX_ARROW_DECIMAL_PRECISION: int = 38
+
+_NULL_STRINGS: Tuple[str, ...] = ('none', 'nan', 'na', 'nat', 'natz', '', '<na>')
+_NULL_STRINGS_MAX_LEN: int = max(len(null_string) for null_string in _NULL_STRINGS)
+
 MRSM_PRECISION_UNITS_SCALARS: Dict[str, Union[int, float]] = {
     'nanosecond': 1_000_000_000,
     'microsecond': 1_000_000,
@@ -131,6 +142,77 @@ def to_pandas_dtype(dtype: str) -> str:
     return 'object'
 
 
+def to_arrow_dtype(dtype: str) -> Union['pd.ArrowDtype', str, None]:
+    """
+    Cast a supported Meerschaum dtype to an Arrow-backed Pandas dtype.
+
+    Parameters
+    ----------
+    dtype: str
+        The Meerschaum dtype (e.g. `str`, `numeric[10,2]`).
+
+    Returns
+    -------
+    The Arrow-backed Pandas dtype, or `None` if the default Pandas dtype should be used
+    (e.g. `json`, `uuid`, and unbounded `numeric` have no lossless Arrow equivalent,
+    and `int`, `bool`, and `bytes` are already Arrow-backed).
+
+    Examples
+    --------
+    >>> to_arrow_dtype('str')
+    'string[pyarrow]'
+    >>> to_arrow_dtype('numeric[10,2]')
+    decimal128(10, 2)[pyarrow]
+    >>> to_arrow_dtype('json') is None
+    True
+    """
+    dtype = MRSM_ALIAS_DTYPES.get(dtype, dtype)
+    known_dtype = MRSM_PD_ARROW_DTYPES.get(dtype, None)
+    if known_dtype is not None:
+        return known_dtype
+
+    if dtype.startswith('numeric'):
+        from meerschaum.utils.dtypes.sql import get_numeric_precision_scale
+        precision, scale = get_numeric_precision_scale(None, dtype)
+        if precision is None or scale is None or precision > MAX_ARROW_DECIMAL_PRECISION:
+            return None
+        pd, pa = mrsm.attempt_import('pandas', 'pyarrow', lazy=False)
+        return pd.ArrowDtype(pa.decimal128(precision, scale))
+
+    return None
+
+
+def is_arrow_dtype(dtype: Any) -> bool:
+    """
+    Determine whether a Pandas dtype is backed by Arrow.
+    The dtype object is checked because dtype strings vary between Pandas versions
+    (e.g. Pandas 3 prints `string[pyarrow]` as `string`).
+
+    Parameters
+    ----------
+    dtype: Any
+        The Pandas dtype (or dtype string) to check.
+
+    Returns
+    -------
+    A `bool` indicating whether `dtype` is an `ArrowDtype` or stored with `pyarrow`.
+
+    Examples
+    --------
+    >>> is_arrow_dtype('string[pyarrow]')
+    True
+    >>> is_arrow_dtype('object')
+    False
+    """
+    pd = mrsm.attempt_import('pandas', lazy=False)
+    if isinstance(dtype, str):
+        try:
+            dtype = pd.api.types.pandas_dtype(dtype)
+        except Exception:
+            return False
+    return isinstance(dtype, pd.ArrowDtype) or getattr(dtype, 'storage', None) == 'pyarrow'
+
+
 def are_dtypes_equal(
     ldtype: Union[str, Dict[str, str]],
     rdtype: Union[str, Dict[str, str]],
@@ -176,6 +258,12 @@ def are_dtypes_equal(
     ldtype = str(ldtype).split('[', maxsplit=1)[0]
     rdtype = str(rdtype).split('[', maxsplit=1)[0]
 
+    ### Arrow decimals (e.g. `decimal128(10, 2)[pyarrow]`) are numerics.
+    if ldtype.startswith('decimal'):
+        ldtype = 'numeric'
+    if rdtype.startswith('decimal'):
+        rdtype = 'numeric'
+
     if ldtype in MRSM_ALIAS_DTYPES:
         ldtype = MRSM_ALIAS_DTYPES[ldtype]
 
@@ -346,6 +434,246 @@ def attempt_cast_to_bytes(value: Any) -> Any:
         return value
 
 
+def _get_series_values_types(series: 'pd.Series') -> Tuple['np.ndarray', 'np.ndarray', set]:
+    """
+    Return the object values of a series, its null mask, and the set of its non-null types.
+    """
+    np = mrsm.attempt_import('numpy', lazy=False)
+    values = series.to_numpy(dtype=object, na_value=None)
+    null_mask = np.fromiter(
+        map(operator.is_, values, itertools.repeat(None)),
+        dtype=bool,
+        count=len(values),
+    )
+    return values, null_mask, set(map(type, values[~null_mask]))
+
+
+def _get_null_strings_mask(strings: 'np.ndarray') -> 'np.ndarray':
+    """
+    Return a mask of the null-like strings (see `value_is_null()`).
+    """
+    np = mrsm.attempt_import('numpy', lazy=False)
+    ### Only the short strings may be null-like, so skip lowering the rest.
+    mask = np.fromiter(map(len, strings), dtype='int64', count=len(strings)) <= _NULL_STRINGS_MAX_LEN
+    if mask.any():
+        mask[mask] = np.fromiter(
+            map(frozenset(_NULL_STRINGS).__contains__, map(str.lower, strings[mask])),
+            dtype=bool,
+        )
+    return mask
+
+
+def cast_series_to_numeric(
+    series: 'pd.Series',
+    quantize: bool = False,
+    precision: Optional[int] = None,
+    scale: Optional[int] = None,
+) -> 'pd.Series':
+    """
+    Cast an entire series to `Decimal` values at once.
+    Mixed columns fall back to `attempt_cast_to_numeric()` per element.
+
+    Parameters
+    ----------
+    series: pd.Series
+        The series to be cast to Decimals.
+
+    quantize: bool, default False
+        If `True`, quantize the decimals to the specified precision and scale.
+
+    precision: Optional[int], default None
+        If `quantize` is `True`, use this precision.
+
+    scale: Optional[int], default None
+        If `quantize` is `True`, use this scale.
+
+    Returns
+    -------
+    A series of `Decimal` objects (nulls become `Decimal('NaN')`).
+    """
+    import functools
+    pandas = mrsm.attempt_import('pandas', lazy=False)
+    np = mrsm.attempt_import('numpy', lazy=False)
+    fallback = functools.partial(
+        attempt_cast_to_numeric,
+        quantize=quantize,
+        precision=precision,
+        scale=scale,
+    )
+    quantize = quantize and precision and scale
+    values, null_mask, types = _get_series_values_types(series)
+    if types == {Decimal} and not quantize and not null_mask.any():
+        return series
+
+    try:
+        strings = np.fromiter(map(str, values), dtype=object, count=len(values))
+        null_mask |= _get_null_strings_mask(strings)
+        decimals = np.empty(len(values), dtype=object)
+        decimals[null_mask] = Decimal('NaN')
+        not_null_decimals = (
+            values[~null_mask]
+            if types == {Decimal}
+            else np.fromiter(map(Decimal, strings[~null_mask]), dtype=object)
+        )
+        if quantize:
+            quantizer = Decimal(('1' * (precision - scale)) + '.' + ('1' * scale))
+            not_null_decimals = np.fromiter(
+                map(
+                    functools.partial(
+                        Decimal.quantize,
+                        exp=quantizer,
+                        context=Context(prec=precision),
+                        rounding=ROUND_HALF_UP,
+                    ),
+                    not_null_decimals,
+                ),
+                dtype=object,
+            )
+        decimals[~null_mask] = not_null_decimals
+    except Exception:
+        return series.apply(fallback)
+
+    return pandas.Series(decimals, index=series.index, name=series.name, dtype=object)
+
+
+def _uuid_from_int(
+    value: int,
+    _new=object.__new__,
+    _setattr=object.__setattr__,
+    _safe=uuid.SafeUUID.unknown,
+) -> uuid.UUID:
+    """
+    Build a UUID from its 128-bit integer without validating (like `UUID(int=value)`).
+    """
+    uuid_value = _new(uuid.UUID)
+    _setattr(uuid_value, 'int', value)
+    _setattr(uuid_value, 'is_safe', _safe)
+    return uuid_value
+
+
+def cast_series_to_uuid(series: 'pd.Series') -> 'pd.Series':
+    """
+    Cast an entire series to `UUID` values at once, parsing from strings or 16-byte values.
+    Mixed columns fall back to `attempt_cast_to_uuid()` per element.
+    """
+    pandas = mrsm.attempt_import('pandas', lazy=False)
+    np = mrsm.attempt_import('numpy', lazy=False)
+    values, null_mask, types = _get_series_values_types(series)
+    if types.issubset({uuid.UUID}) and not null_mask.any():
+        return series
+
+    try:
+        uuids = np.empty(len(values), dtype=object)
+        not_null_values = values[~null_mask]
+        if types == {bytes}:
+            if any(map(operator.ne, map(len, not_null_values), itertools.repeat(16))):
+                raise ValueError("Not all bytes are 16 bytes long.")
+            ints = map(int.from_bytes, not_null_values, itertools.repeat('big'))
+            not_null_uuids = np.fromiter(
+                map(_uuid_from_int, ints),
+                dtype=object,
+                count=len(not_null_values),
+            )
+        elif types == {str}:
+            strings_null_mask = _get_null_strings_mask(not_null_values)
+            strings = not_null_values[~strings_null_mask]
+
+            ### Normalize the strings as `UUID(hex)` does, then parse the integers in bulk.
+            hex_strings = list(map(str.replace, strings, itertools.repeat('-'), itertools.repeat('')))
+            if any(map(operator.ne, map(len, hex_strings), itertools.repeat(32))):
+                hex_strings = [
+                    val.replace('urn:', '').replace('uuid:', '').strip('{}').replace('-', '')
+                    for val in strings
+                ]
+            if any(map(operator.ne, map(len, hex_strings), itertools.repeat(32))):
+                raise ValueError("Not all strings are UUIDs.")
+            not_null_uuids = np.empty(len(not_null_values), dtype=object)
+            not_null_uuids[~strings_null_mask] = np.fromiter(
+                map(_uuid_from_int, map(int, hex_strings, itertools.repeat(16))),
+                dtype=object,
+                count=len(strings),
+            )
+        elif types == {uuid.UUID}:
+            not_null_uuids = not_null_values
+        else:
+            return series.apply(attempt_cast_to_uuid)
+        uuids[~null_mask] = not_null_uuids
+    except Exception:
+        return series.apply(attempt_cast_to_uuid)
+
+    return pandas.Series(uuids, index=series.index, name=series.name, dtype=object)
+
+
+def cast_series_to_bytes(series: 'pd.Series') -> 'pd.Series':
+    """
+    Cast an entire series to bytes at once, decoding hex- (`'\\x'`-prefixed) and base64-strings.
+    Mixed columns fall back to `attempt_cast_to_bytes()` per element.
+    """
+    import binascii
+    pandas = mrsm.attempt_import('pandas', lazy=False)
+    np = mrsm.attempt_import('numpy', lazy=False)
+    values, null_mask, types = _get_series_values_types(series)
+    if types.issubset({bytes}):
+        return (
+            series
+            if not null_mask.any() and series.dtype == object
+            else pandas.Series(values, index=series.index, name=series.name, dtype=object)
+        )
+    if types != {str}:
+        return series.apply(attempt_cast_to_bytes)
+
+    try:
+        not_null_values = values[~null_mask]
+        strings_null_mask = _get_null_strings_mask(not_null_values)
+        hex_mask = np.fromiter(
+            map(str.startswith, not_null_values, itertools.repeat('\\x')),
+            dtype=bool,
+            count=len(not_null_values),
+        )
+        hex_mask &= ~strings_null_mask
+        base64_mask = ~(hex_mask | strings_null_mask)
+
+        not_null_bytes = np.empty(len(not_null_values), dtype=object)
+        not_null_bytes[hex_mask] = np.fromiter(
+            (binascii.unhexlify(val[2:]) for val in not_null_values[hex_mask]),
+            dtype=object,
+        )
+        not_null_bytes[base64_mask] = np.fromiter(
+            map(binascii.a2b_base64, not_null_values[base64_mask]),
+            dtype=object,
+        )
+        bytes_values = np.empty(len(values), dtype=object)
+        bytes_values[~null_mask] = not_null_bytes
+    except Exception:
+        return series.apply(attempt_cast_to_bytes)
+
+    return pandas.Series(bytes_values, index=series.index, name=series.name, dtype=object)
+
+
+def cast_series_to_json(series: 'pd.Series') -> 'pd.Series':
+    """
+    Decode the JSON strings of a series at once (other values are left as-is).
+
+    Raises
+    ------
+    A `ValueError` if a string cannot be decoded.
+    """
+    pandas = mrsm.attempt_import('pandas', lazy=False)
+    np = mrsm.attempt_import('numpy', lazy=False)
+    values = series.to_numpy(dtype=object)
+    str_mask = np.fromiter(
+        map(isinstance, values, itertools.repeat(str)),
+        dtype=bool,
+        count=len(values),
+    )
+    if not str_mask.any():
+        return series
+
+    decoded = values.copy()
+    decoded[str_mask] = np.fromiter(map(json.loads, values[str_mask]), dtype=object)
+    return pandas.Series(decoded, index=series.index, name=series.name, dtype=object)
+
+
 def attempt_cast_to_geometry(value: Any) -> Any:
     """
     Given a value, attempt to coerce it into a `shapely` (`geometry`) object.
@@ -520,7 +848,7 @@ def value_is_null(value: Any) -> bool:
     """
     Determine if a value is a null-like string.
     """
-    return str(value).lower() in ('none', 'nan', 'na', 'nat', 'natz', '', '<na>')
+    return str(value).lower() in _NULL_STRINGS
 
 
 def none_if_null(value: Any) -> Any:
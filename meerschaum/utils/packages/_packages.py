@@ -127,6 +127,7 @@ packages: Dict[str, Dict[str, str]] = {
         'cmd2'                       : 'cmd2>=1.4.0',
         'ruamel.yaml'                : 'ruamel.yaml>=0.16.12',
         'modin'                      : 'modin[ray]>=0.8.3',
+        'polars'                     : 'polars>=1.0.0',
         'nanoid'                     : 'nanoid>=2.0.0',
         'importlib_metadata'         : 'importlib-metadata>=4.12.0',
     },
@@ -140,6 +141,7 @@ packages['sql'] = {
     'pytz'                           : 'pytz',
     'joblib'                         : 'joblib>=1.5.1',
     'sqlalchemy'                     : 'SQLAlchemy>=2.0.41',
+    'greenlet'                       : 'greenlet>=3.0.0',
     'geoalchemy2'                    : 'GeoAlchemy2>=0.18.0',
     'databases'                      : 'databases>=0.9.0',
     'aiosqlite'                      : 'aiosqlite>=0.21.0',
@@ -171,6 +173,7 @@ packages['api'] = {
     'httpcore'                       : 'httpcore>=1.0.9',
     'valkey'                         : 'valkey>=6.1.0',
     'jose'                           : 'python-jose>=3.5.0',
+    'zstandard'                      : 'zstandard>=0.22.0',
 }
 packages['api'].update(packages['sql'])
 packages['api'].update(packages['formatting'])
@@ -405,3 +405,109 @@ def flatten_pipes_dict(pipes_dict: PipesDict) -> list[mrsm.Pipe]:
         for mk in ck.values():
             pipes_list.extend(list(mk.values()))
     return pipes_list
+
+
+def get_keyset_columns(pipe: mrsm.Pipe) -> list[str]:
+    """
+    Return the columns by which a pipe's data are ordered (see `Pipe.get_data()`),
+    i.e. the datetime axis followed by the other index columns.
+
+    Parameters
+    ----------
+    pipe: mrsm.Pipe
+        The pipe whose index columns to order by.
+
+    Returns
+    -------
+    A list of column names (empty if the pipe has no index columns).
+    """
+    columns = pipe.columns
+    if not columns:
+        return []
+
+    dt_col = columns.get('datetime', None) or pipe.guess_datetime()
+    keyset_cols = [dt_col] if dt_col else []
+    for ix, col in columns.items():
+        if ix == 'datetime' or not col or col in keyset_cols:
+            continue
+        keyset_cols.append(col)
+    return keyset_cols
+
+
+def get_keyset_token(pipe: mrsm.Pipe, df: 'pd.DataFrame') -> Optional[str]:
+    """
+    Return an opaque continuation token for reading a pipe's data after the last row of `df`
+    (pass as `after` to `Pipe.get_data()`).
+
+    Parameters
+    ----------
+    pipe: mrsm.Pipe
+        The pipe from which `df` was read.
+
+    df: pd.DataFrame
+        A page of the pipe's data, ordered by its index columns.
+
+    Returns
+    -------
+    A URL-safe token encoding the last row's index values, or `None` if `df` is empty
+    or missing any of the index columns.
+    """
+    import base64
+    from meerschaum.utils.dtypes import json_serialize_value
+    keyset_cols = get_keyset_columns(pipe)
+    if not keyset_cols or df is None or len(df) == 0:
+        return None
+    if any(col not in df.columns for col in keyset_cols):
+        return None
+
+    def _serialize_key(value: Any) -> Any:
+        ### Keep numbers as JSON numbers so they are compared as numbers.
+        value = json_serialize_value(value, default_to_str=False)
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            return value
+        if hasattr(value, 'item'):
+            value = value.item()
+        return value if isinstance(value, (int, float, bool)) else str(value)
+
+    ### Select from each column so the values keep their columns' types.
+    keys = [[col, _serialize_key(df[col].iloc[-1])] for col in keyset_cols]
+    return base64.urlsafe_b64encode(
+        json.dumps(keys, separators=(',', ':')).encode('utf-8')
+    ).decode('utf-8')
+
+
+def parse_keyset_token(token: str) -> list[tuple[str, Any]]:
+    """
+    Decode a continuation token from `get_keyset_token()`.
+
+    Parameters
+    ----------
+    token: str
+        The token to decode.
+
+    Returns
+    -------
+    A list of `(column, value)` pairs of the last row read.
+    Numbers keep their types, and other values are serialized (e.g. datetimes as ISO strings).
+
+    Raises
+    ------
+    A `ValueError` if the token is malformed.
+    """
+    import base64
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(token.encode('utf-8')).decode('utf-8'))
+    except Exception as e:
+        raise ValueError(f"Invalid continuation token '{token}'.") from e
+
+    if (
+        not isinstance(keys, list)
+        or not keys
+        or not all(
+            isinstance(key, list) and len(key) == 2 and isinstance(key[0], str)
+            for key in keys
+        )
+    ):
+        raise ValueError(f"Invalid continuation token '{token}'.")
+
+    return [(col, value) for col, value in keys]
@@ -40,6 +40,17 @@ version_queries = {
     'mssql': "SELECT @@version",
     'oracle': "SELECT version from PRODUCT_COMPONENT_VERSION WHERE rownum = 1",
 }
+max_connections_queries = {
+    'postgresql': "SELECT CAST(setting AS INTEGER) FROM pg_settings WHERE name = 'max_connections'",
+    'postgis': "SELECT CAST(setting AS INTEGER) FROM pg_settings WHERE name = 'max_connections'",
+    'timescaledb': "SELECT CAST(setting AS INTEGER) FROM pg_settings WHERE name = 'max_connections'",
+    'timescaledb-ha': "SELECT CAST(setting AS INTEGER) FROM pg_settings WHERE name = 'max_connections'",
+    'citus': "SELECT CAST(setting AS INTEGER) FROM pg_settings WHERE name = 'max_connections'",
+    'mysql': "SELECT @@max_connections",
+    'mariadb': "SELECT @@max_connections",
+    'mssql': "SELECT @@MAX_CONNECTIONS",
+    'oracle': "SELECT value FROM v$parameter WHERE name = 'sessions'",
+}
 SKIP_IF_EXISTS_FLAVORS = {'mssql', 'oracle'}
 DROP_IF_EXISTS_FLAVORS = {
     'timescaledb',
@@ -655,6 +666,24 @@ NO_CTE_FLAVORS = {
     'mysql',
     'mariadb',
 }
+### Expressions which compute a per-row MD5 digest (as a hex string) of the given columns.
+### `{cols}` is replaced with the comma-separated, quoted column names.
+ROW_DIGEST_EXPRESSIONS = {
+    'postgresql': "MD5(CAST(ROW({cols}) AS TEXT))",
+    'postgis': "MD5(CAST(ROW({cols}) AS TEXT))",
+    'timescaledb': "MD5(CAST(ROW({cols}) AS TEXT))",
+    'timescaledb-ha': "MD5(CAST(ROW({cols}) AS TEXT))",
+    'citus': "MD5(CAST(ROW({cols}) AS TEXT))",
+    'duckdb': "MD5(CAST(ROW({cols}) AS VARCHAR))",
+    'mysql': "MD5(JSON_ARRAY({cols}))",
+    'mariadb': "MD5(JSON_ARRAY({cols}))",
+    'mssql': (
+        "CONVERT(VARCHAR(32), HASHBYTES('MD5', "
+        "(SELECT {cols} FOR JSON PATH, INCLUDE_NULL_VALUES, WITHOUT_ARRAY_WRAPPER)), 2)"
+    ),
+    'sqlite': "mrsm_md5({cols})",
+    'geopackage': "mrsm_md5({cols})",
+}
 NO_SELECT_INTO_FLAVORS = {
     'sqlite',
     'geopackage',
@@ -663,6 +692,19 @@ NO_SELECT_INTO_FLAVORS = {
     'mariadb',
     'duckdb',
 }
+### Flavors which sort `NULL` before all values when ascending (and after them when descending).
+NULLS_SMALLEST_FLAVORS = {
+    'mysql',
+    'mariadb',
+    'sqlite',
+    'geopackage',
+    'mssql',
+    'cockroachdb',
+}
+### Flavors which sort `NULL` last in both directions.
+NULLS_LAST_FLAVORS = {
+    'duckdb',
+}
 
 
 def clean(substring: str) -> None:
@@ -1087,6 +1129,8 @@ def build_where(
     connector: Optional[mrsm.connectors.sql.SQLConnector] = None,
     with_where: bool = True,
     flavor: str = 'postgresql',
+    bind_params: Optional[Dict[str, Any]] = None,
+    bind_prefix: str = 'mrsm_param_',
 ) -> str:
     """
     Build the `WHERE` clause based on the input criteria.
@@ -1109,6 +1153,14 @@ def build_where(
     flavor: str, default 'postgresql'
         If `connector` is `None`, fall back to this flavor.
 
+    bind_params: Optional[Dict[str, Any]], default None
+        If provided, render each value as a bind placeholder (e.g. `:mrsm_param_0`)
+        and add the value to this dictionary rather than quoting it into the clause.
+        The clause then depends only on the shape of `params` (see `get_params_shape()`).
+
+    bind_prefix: str, default 'mrsm_param_'
+        The prefix for the names of bind placeholders.
+
     Returns
     -------
     A `str` of the `WHERE` clause from the input `params` dictionary for the connector's flavor.
@@ -1140,6 +1192,17 @@ def build_where(
     query_flavor = getattr(connector, 'flavor', flavor) if connector is not None else flavor
     where = ""
     leading_and = "\n    AND "
+
+    bind_names = []
+
+    def _literal(value: Any) -> str:
+        if bind_params is None:
+            return "'" + str(value).replace("'", "''") + "'"
+        bind_name = f"{bind_prefix}{len(bind_names)}"
+        bind_names.append(bind_name)
+        bind_params[bind_name] = str(value)
+        return f":{bind_name}"
+
     for key, value in params.items():
         _key = sql_item_name(key, query_flavor, None)
         ### search across a list (i.e. IN syntax)
@@ -1164,8 +1227,7 @@ def build_where(
             if not_null_includes:
                 where += f"{_key} IN ("
                 for item in not_null_includes:
-                    quoted_item = str(item).replace("'", "''")
-                    where += f"'{quoted_item}', "
+                    where += f"{_literal(item)}, "
                 where = where[:-2] + ")"
             if null_includes:
                 where += ("\n    OR " if not_null_includes else "") + f"{_key} IS NULL"
@@ -1177,8 +1239,7 @@ def build_where(
             if not_null_excludes:
                 where += f"{_key} NOT IN ("
                 for item in not_null_excludes:
-                    quoted_item = str(item).replace("'", "''")
-                    where += f"'{quoted_item}', "
+                    where += f"{_literal(item)}, "
                 where = where[:-2] + ")"
             if null_excludes:
                 where += ("\n    AND " if not_null_excludes else "") + f"{_key} IS NOT NULL"
@@ -1190,7 +1251,7 @@ def build_where(
         ### search a dictionary
         elif isinstance(value, dict):
             import json
-            where += (f"{leading_and}CAST({_key} AS TEXT) = '" + json.dumps(value) + "'")
+            where += f"{leading_and}CAST({_key} AS TEXT) = {_literal(json.dumps(value))}"
             continue
 
         eq_sign = '='
@@ -1207,10 +1268,9 @@ def build_where(
             if value_is_null(value):
                 value = None
                 is_null = 'IS NOT NULL'
-        quoted_value = str(value).replace("'", "''")
         where += (
             f"{leading_and}{_key} "
-            + (is_null if value is None else f"{eq_sign} '{quoted_value}'")
+            + (is_null if value is None else f"{eq_sign} {_literal(value)}")
         )
 
     if len(where) > 1:
@@ -1218,6 +1278,218 @@ def build_where(
     return where
 
 
+def get_params_shape(
+    params: Optional[Dict[str, Any]],
+    bind_params: Optional[Dict[str, Any]] = None,
+    bind_prefix: str = 'mrsm_param_',
+) -> Union[Tuple[Any, ...], None]:
+    """
+    Return a hashable description of the `WHERE` clause `build_where()` would render for `params`,
+    ignoring the values themselves (i.e. the clause rendered with `bind_params`).
+
+    Parameters
+    ----------
+    params: Optional[Dict[str, Any]]
+        The params dictionary passed to `build_where()`.
+
+    bind_params: Optional[Dict[str, Any]], default None
+        If provided, add the bind values `build_where(params, bind_params=...)` would add,
+        so that a cached clause may be reused without rendering it again.
+
+    bind_prefix: str, default 'mrsm_param_'
+        The prefix for the names of bind placeholders.
+
+    Returns
+    -------
+    A tuple of `(key, kind)` pairs, or `None` if the clause cannot be reused
+    (i.e. `build_where()` would reject the values).
+
+    Examples
+    --------
+    >>> get_params_shape({'a': 1, 'b': ['_x', 'y', None]})
+    (('a', '='), ('b', ('in', 1, True, 'not in', 1, False)))
+    """
+    import json
+    from meerschaum._internal.static import STATIC_CONFIG
+    from meerschaum.utils.dtypes import value_is_null, none_if_null
+    if not params:
+        return ()
+
+    negation_prefix = STATIC_CONFIG['system']['fetch_pipes_keys']['negation_prefix']
+    try:
+        params_json = json.dumps(params)
+    except Exception:
+        params_json = str(params)
+    if any(word in params_json.lower() for word in ('drop ', '--', ';')):
+        return None
+
+    bind_values = []
+    shape = []
+    for key, value in params.items():
+        if isinstance(value, Iterable) and not isinstance(value, (dict, str)):
+            includes = [
+                none_if_null(item)
+                for item in value
+                if not str(item).startswith(negation_prefix)
+            ]
+            excludes = [
+                none_if_null(str(item)[len(negation_prefix):])
+                for item in value
+                if str(item).startswith(negation_prefix)
+            ]
+            not_null_includes = [item for item in includes if item is not None]
+            not_null_excludes = [item for item in excludes if item is not None]
+            bind_values.extend(not_null_includes + not_null_excludes)
+            shape.append((key, (
+                'in',
+                len(not_null_includes),
+                len(not_null_includes) < len(includes),
+                'not in',
+                len(not_null_excludes),
+                len(not_null_excludes) < len(excludes),
+            )))
+            continue
+
+        if isinstance(value, dict):
+            bind_values.append(json.dumps(value))
+            shape.append((key, 'json'))
+            continue
+
+        is_negated = str(value).startswith(negation_prefix)
+        if value_is_null(str(value).lstrip(negation_prefix)):
+            shape.append((key, ('IS NOT NULL' if is_negated else 'IS NULL')))
+            continue
+        if is_negated:
+            value = str(value)[len(negation_prefix):]
+            if value_is_null(value):
+                shape.append((key, 'IS NOT NULL'))
+                continue
+        bind_values.append(value)
+        shape.append((key, ('!=' if is_negated else '=')))
+
+    if bind_params is not None:
+        for i, value in enumerate(bind_values):
+            bind_params[f"{bind_prefix}{i}"] = str(value)
+
+    return tuple(shape)
+
+
+def build_keyset_where(
+    keys: List[Tuple[str, Any]],
+    flavor: str = 'postgresql',
+    order: str = 'asc',
+    datetime_column: Optional[str] = None,
+    datetime_db_type: Optional[str] = None,
+) -> str:
+    """
+    Build the condition which selects the rows after a key tuple
+    when ordered by the keys' columns (i.e. keyset pagination).
+
+    The condition is expanded from `(a, b) > (:a, :b)` into comparisons per column
+    so that `NULL` values follow the flavor's sort order.
+
+    Parameters
+    ----------
+    keys: List[Tuple[str, Any]]
+        The `(column, value)` pairs of the last row read, in `ORDER BY` order.
+
+    flavor: str, default 'postgresql'
+        The database flavor of the query.
+
+    order: str, default 'asc'
+        The sort order (`'asc'` or `'desc'`) of the query.
+
+    datetime_column: Optional[str], default None
+        If provided, render this column's value as a datetime bound (see `dateadd_str()`).
+
+    datetime_db_type: Optional[str], default None
+        The database type of `datetime_column`.
+
+    Returns
+    -------
+    The condition to add to the `WHERE` clause (without the leading `WHERE`).
+
+    Examples
+    --------
+    >>> print(build_keyset_where([('id', 1), ('name', 'a')], flavor='sqlite'))
+    "id" >= 1 AND ("id" > 1 OR ("id" = 1 AND "name" > 'a'))
+    """
+    if not keys:
+        return ''
+
+    import math
+    from meerschaum.utils.packages import attempt_import
+    dateutil_parser = attempt_import('dateutil.parser')
+    is_desc = str(order).lower() == 'desc'
+    cmp_sign = '<' if is_desc else '>'
+    nulls_last = (
+        is_desc
+        if flavor in NULLS_SMALLEST_FLAVORS
+        else (True if flavor in NULLS_LAST_FLAVORS else not is_desc)
+    )
+
+    def _literal(col: str, value: Any) -> str:
+        is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if col == datetime_column and not is_number:
+            ### SQLite stores datetimes as text, so the bound must match the stored format.
+            if flavor in ('sqlite', 'geopackage'):
+                dt_value = value
+                if not isinstance(dt_value, datetime):
+                    try:
+                        dt_value = dateutil_parser.parse(str(value))
+                    except Exception:
+                        dt_value = None
+                if dt_value is not None:
+                    if dt_value.tzinfo is not None:
+                        dt_value = dt_value.astimezone(timezone.utc).replace(tzinfo=None)
+                    return "'" + dt_value.strftime('%Y-%m-%d %H:%M:%S.%f') + "'"
+            return dateadd_str(
+                flavor=flavor,
+                datepart='minute',
+                number=0,
+                begin=value,
+                db_type=datetime_db_type,
+            )
+        if is_number and math.isfinite(value):
+            return str(value)
+        return "'" + str(value).replace("'", "''") + "'"
+
+    ### Build from the last column so each column nests the comparisons of the columns after it.
+    after = None
+    for col, value in reversed(keys):
+        col_name = sql_item_name(col, flavor, None)
+        terms = []
+        if value is None:
+            if not nulls_last:
+                terms.append(f"{col_name} IS NOT NULL")
+            if after:
+                terms.append(f"({col_name} IS NULL AND {after})")
+        else:
+            literal = _literal(col, value)
+            terms.append(f"{col_name} {cmp_sign} {literal}")
+            if nulls_last:
+                terms.append(f"{col_name} IS NULL")
+            if after:
+                terms.append(f"({col_name} = {literal} AND {after})")
+        after = (
+            (terms[0] if len(terms) == 1 else "(" + " OR ".join(terms) + ")")
+            if terms
+            else None
+        )
+
+    if after is None:
+        return "1 = 0"
+
+    ### Bound the first column so the rows may be found with an index seek.
+    first_col, first_value = keys[0]
+    if first_value is not None and not nulls_last:
+        seek_sign = '<=' if is_desc else '>='
+        first_col_name = sql_item_name(first_col, flavor, None)
+        after = f"{first_col_name} {seek_sign} {_literal(first_col, first_value)} AND {after}"
+
+    return after
+
+
 def table_exists(
     table: str,
     connector: mrsm.connectors.sql.SQLConnector,
@@ -1435,69 +1707,288 @@ def get_table_cols_types(
             }
             for row in result_rows
         ]
-        cols_types_docs_filtered = [
-            doc
-            for doc in cols_types_docs
-            if (
-                (
-                    not schema
-                    or doc['schema'] == schema
-                )
-                and
-                (
-                    not database
-                    or doc['database'] == database
-                )
-            )
-        ]
+        return _parse_cols_types_docs(
+            cols_types_docs,
+            table,
+            connectable,
+            flavor=flavor,
+            schema=schema,
+            database=database,
+            debug=debug,
+        )
+    except Exception as e:
+        warn(f"Failed to fetch columns for table '{table}':\n{e}")
+        return {}
 
-        ### NOTE: This may return incorrect columns if the schema is not explicitly stated.
-        if cols_types_docs and not cols_types_docs_filtered:
-            cols_types_docs_filtered = cols_types_docs
 
-        ### NOTE: Check for PostGIS GEOMETRY columns.
-        geometry_cols_types = {}
-        user_defined_cols = [
-            doc
-            for doc in cols_types_docs_filtered
-            if str(doc.get('type', None)).upper() == 'USER-DEFINED'
-        ]
-        if user_defined_cols:
-            geometry_cols_types.update(
-                get_postgis_geo_columns_types(
-                    connectable,
+def get_tables_cols_types(
+    tables: List[str],
+    connectable: Union[
+        'mrsm.connectors.sql.SQLConnector',
+        'sqlalchemy.orm.session.Session',
+        'sqlalchemy.engine.base.Engine'
+    ],
+    flavor: Optional[str] = None,
+    schema: Optional[str] = None,
+    database: Optional[str] = None,
+    batchsize: int = 1000,
+    debug: bool = False,
+) -> Dict[str, Union[Dict[str, str], None]]:
+    """
+    Return the columns and types of many tables (see `get_table_cols_types()`),
+    querying up to `batchsize` tables at once.
+
+    Parameters
+    ----------
+    tables: List[str]
+        The names of the tables (unquoted).
+
+    connectable: Union[SQLConnector, Session, Engine]
+        The connection object used to fetch the columns and types.
+
+    flavor: Optional[str], default None
+        The database dialect flavor to use for the query.
+        If omitted, default to `connectable.flavor`.
+
+    schema: Optional[str], default None
+        If provided, restrict the query to this schema.
+
+    database: Optional[str]. default None
+        If provided, restrict the query to this database.
+
+    batchsize: int, default 1000
+        The maximum number of tables to query at once.
+
+    Returns
+    -------
+    A dictionary mapping each table name to a dictionary of its column names and data types.
+    Tables which do not exist map to empty dictionaries,
+    and tables whose batch failed to be queried map to `None`.
+    """
+    from meerschaum.connectors import SQLConnector
+    sqlalchemy = mrsm.attempt_import('sqlalchemy', lazy=False)
+    flavor = flavor or getattr(connectable, 'flavor', None)
+    if not flavor:
+        raise ValueError("Please provide a database flavor.")
+    if flavor == 'duckdb' and not isinstance(connectable, SQLConnector):
+        raise ValueError("You must provide a SQLConnector when using DuckDB.")
+    if flavor in NO_SCHEMA_FLAVORS:
+        schema = None
+    if schema is None:
+        schema = DEFAULT_SCHEMA_FLAVORS.get(flavor, None)
+    if flavor in ('sqlite', 'duckdb', 'oracle', 'geopackage'):
+        database = None
+
+    ### MSSQL temporary tables are read from `tempdb`.
+    tables_cols_types = {
+        table: get_table_cols_types(
+            table,
+            connectable,
+            flavor=flavor,
+            schema=schema,
+            database=database,
+            debug=debug,
+        )
+        for table in tables
+        if flavor == 'mssql' and table.startswith('#')
+    }
+    tables = [table for table in tables if table not in tables_cols_types]
+
+    cols = ['database', 'schema', 'table', 'column', 'type', 'numeric_precision', 'numeric_scale']
+    result_cols_ix = dict(enumerate(cols))
+    debug_kwargs = {'debug': debug} if isinstance(connectable, SQLConnector) else {}
+
+    for i in range(0, len(tables), max(1, batchsize)):
+        batch_tables = tables[i:(i + batchsize)]
+        cols_types_query = sqlalchemy.text(
+            _format_tables_query(
+                columns_types_queries.get(flavor, columns_types_queries['default']),
+                batch_tables,
+                flavor,
+            )
+        )
+        if not debug_kwargs and debug:
+            dprint(cols_types_query)
+
+        try:
+            result_rows = (
+                [
+                    row
+                    for row in connectable.execute(cols_types_query, **debug_kwargs).fetchall()
+                ]
+                if flavor != 'duckdb'
+                else [
+                    tuple([doc[col] for col in cols])
+                    for doc in connectable.read(cols_types_query, debug=debug).to_dict(orient='records')
+                ]
+            )
+            tables_docs = _group_docs_by_table(
+                [
+                    {
+                        result_cols_ix[i]: val
+                        for i, val in enumerate(row)
+                    }
+                    for row in result_rows
+                ],
+                batch_tables,
+                flavor,
+            )
+            for table in batch_tables:
+                tables_cols_types[table] = _parse_cols_types_docs(
+                    tables_docs.get(table, []),
                     table,
+                    connectable,
+                    flavor=flavor,
                     schema=schema,
+                    database=database,
                     debug=debug,
                 )
-            )
+        except Exception as e:
+            warn(f"Failed to fetch columns for {len(batch_tables)} tables:\n{e}")
+            for table in batch_tables:
+                tables_cols_types[table] = None
+
+    return tables_cols_types
+
 
-        cols_types = {
+def _parse_cols_types_docs(
+    cols_types_docs: List[Dict[str, Any]],
+    table: str,
+    connectable: Union[
+        'mrsm.connectors.sql.SQLConnector',
+        'sqlalchemy.orm.session.Session',
+        'sqlalchemy.engine.base.Engine'
+    ],
+    flavor: str,
+    schema: Optional[str] = None,
+    database: Optional[str] = None,
+    debug: bool = False,
+) -> Dict[str, str]:
+    """
+    Build the columns types dictionary from the rows of a `columns_types_queries` query.
+    """
+    cols_types_docs_filtered = [
+        doc
+        for doc in cols_types_docs
+        if (
             (
-                doc['column']
-                if flavor != 'oracle' else (
-                    (
-                        doc['column'].lower()
-                        if (doc['column'].isupper() and doc['column'].replace('_', '').isalpha())
-                        else doc['column']
-                    )
-                )
-            ): doc['type'].upper() + (
-                f'({precision},{scale})'
-                if (
-                    (precision := doc.get('numeric_precision', None))
-                     and
-                    (scale := doc.get('numeric_scale', None))
+                not schema
+                or doc['schema'] == schema
+            )
+            and
+            (
+                not database
+                or doc['database'] == database
+            )
+        )
+    ]
+
+    ### NOTE: This may return incorrect columns if the schema is not explicitly stated.
+    if cols_types_docs and not cols_types_docs_filtered:
+        cols_types_docs_filtered = cols_types_docs
+
+    ### NOTE: Check for PostGIS GEOMETRY columns.
+    geometry_cols_types = {}
+    user_defined_cols = [
+        doc
+        for doc in cols_types_docs_filtered
+        if str(doc.get('type', None)).upper() == 'USER-DEFINED'
+    ]
+    if user_defined_cols:
+        geometry_cols_types.update(
+            get_postgis_geo_columns_types(
+                connectable,
+                table,
+                schema=schema,
+                debug=debug,
+            )
+        )
+
+    cols_types = {
+        (
+            doc['column']
+            if flavor != 'oracle' else (
+                (
+                    doc['column'].lower()
+                    if (doc['column'].isupper() and doc['column'].replace('_', '').isalpha())
+                    else doc['column']
                 )
-                else ''
             )
-            for doc in cols_types_docs_filtered
-        }
-        cols_types.update(geometry_cols_types)
-        return cols_types
-    except Exception as e:
-        warn(f"Failed to fetch columns for table '{table}':\n{e}")
-        return {}
+        ): doc['type'].upper() + (
+            f'({precision},{scale})'
+            if (
+                (precision := doc.get('numeric_precision', None))
+                 and
+                (scale := doc.get('numeric_scale', None))
+            )
+            else ''
+        )
+        for doc in cols_types_docs_filtered
+    }
+    cols_types.update(geometry_cols_types)
+    return cols_types
+
+
+def _format_tables_query(
+    query_template: str,
+    tables: List[str],
+    flavor: str,
+    schema: Optional[str] = None,
+) -> str:
+    """
+    Render a template from `columns_types_queries` or `columns_indices_queries` for many tables.
+    The templates filter with `IN ('{table}', '{table_trunc}', ...)`,
+    so each placeholder expands to the escaped names of every table.
+    """
+    import textwrap
+
+    def _esc(s: str) -> str:
+        return s.replace("'", "''")
+
+    def _names(transform) -> str:
+        return "', '".join(_esc(transform(table)) for table in tables)
+
+    return textwrap.dedent(query_template.format(
+        table=_names(lambda table: table),
+        table_trunc=_names(lambda table: truncate_item_name(table, flavor=flavor)),
+        table_lower=_names(lambda table: table.lower()),
+        table_lower_trunc=_names(lambda table: truncate_item_name(table.lower(), flavor=flavor)),
+        table_upper=_names(lambda table: table.upper()),
+        table_upper_trunc=_names(lambda table: truncate_item_name(table.upper(), flavor=flavor)),
+        db_prefix='',
+        schema=_esc(schema) if schema else schema,
+    )).lstrip().rstrip()
+
+
+def _group_docs_by_table(
+    docs: List[Dict[str, Any]],
+    tables: List[str],
+    flavor: str,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group the rows of a multi-table query by the table names which were requested,
+    matching exact names before truncated or case-folded names.
+    """
+    from collections import defaultdict
+    transforms = (
+        lambda table: table,
+        lambda table: truncate_item_name(table, flavor=flavor),
+        lambda table: table.lower(),
+        lambda table: truncate_item_name(table.lower(), flavor=flavor),
+        lambda table: table.upper(),
+        lambda table: truncate_item_name(table.upper(), flavor=flavor),
+    )
+    tables_lookup = {}
+    for transform in transforms:
+        for table in tables:
+            tables_lookup.setdefault(transform(table), table)
+
+    tables_docs = defaultdict(lambda: [])
+    for doc in docs:
+        table = tables_lookup.get(doc.get('table', None), None)
+        if table is not None:
+            tables_docs[table].append(doc)
+    return dict(tables_docs)
 
 
 def get_table_cols_indices(
@@ -1548,7 +2039,6 @@ def get_table_cols_indices(
     A dictionary mapping column names to a list of indices.
     """
     import textwrap
-    from collections import defaultdict
     from meerschaum.connectors import SQLConnector
     sqlalchemy = mrsm.attempt_import('sqlalchemy', lazy=False)
     flavor = flavor or getattr(connectable, 'flavor', None)
@@ -1620,48 +2110,197 @@ def get_table_cols_indices(
             }
             for row in result_rows
         ]
-        cols_types_docs_filtered = [
-            doc
-            for doc in cols_types_docs
-            if (
-                (
-                    not schema
-                    or doc['schema'] == schema
-                )
-                and
-                (
-                    not database
-                    or doc['database'] == database
-                )
+        return _parse_cols_indices_docs(
+            cols_types_docs,
+            flavor=flavor,
+            schema=schema,
+            database=database,
+        )
+    except Exception as e:
+        warn(f"Failed to fetch columns for table '{table}':\n{e}")
+        return {}
+
+
+def get_tables_cols_indices(
+    tables: List[str],
+    connectable: Union[
+        'mrsm.connectors.sql.SQLConnector',
+        'sqlalchemy.orm.session.Session',
+        'sqlalchemy.engine.base.Engine'
+    ],
+    flavor: Optional[str] = None,
+    schema: Optional[str] = None,
+    database: Optional[str] = None,
+    batchsize: int = 1000,
+    debug: bool = False,
+) -> Dict[str, Union[Dict[str, List[Dict[str, Any]]], None]]:
+    """
+    Return the columns' indices of many tables (see `get_table_cols_indices()`),
+    querying up to `batchsize` tables at once.
+    SQLite and GeoPackage tables are still queried one at a time.
+
+    Parameters
+    ----------
+    tables: List[str]
+        The names of the tables (unquoted).
+
+    connectable: Union[SQLConnector, Session, Engine]
+        The connection object used to fetch the indices.
+
+    flavor: Optional[str], default None
+        The database dialect flavor to use for the query.
+        If omitted, default to `connectable.flavor`.
+
+    schema: Optional[str], default None
+        If provided, restrict the query to this schema.
+
+    database: Optional[str]. default None
+        If provided, restrict the query to this database.
+
+    batchsize: int, default 1000
+        The maximum number of tables to query at once.
+
+    Returns
+    -------
+    A dictionary mapping each table name to a dictionary of column names and lists of indices
+    (or `None` if the table's batch failed to be queried).
+    """
+    from meerschaum.connectors import SQLConnector
+    sqlalchemy = mrsm.attempt_import('sqlalchemy', lazy=False)
+    flavor = flavor or getattr(connectable, 'flavor', None)
+    if not flavor:
+        raise ValueError("Please provide a database flavor.")
+    if flavor == 'duckdb' and not isinstance(connectable, SQLConnector):
+        raise ValueError("You must provide a SQLConnector when using DuckDB.")
+    if flavor in NO_SCHEMA_FLAVORS:
+        schema = None
+    if schema is None:
+        schema = DEFAULT_SCHEMA_FLAVORS.get(flavor, None)
+    if flavor in ('sqlite', 'duckdb', 'oracle', 'geopackage'):
+        database = None
+
+    ### The SQLite queries read each table's pragmas,
+    ### and MSSQL temporary tables are read from `tempdb`.
+    tables_cols_indices = {
+        table: get_table_cols_indices(
+            table,
+            connectable,
+            flavor=flavor,
+            schema=schema,
+            database=database,
+            debug=debug,
+        )
+        for table in tables
+        if flavor in ('sqlite', 'geopackage') or (flavor == 'mssql' and table.startswith('#'))
+    }
+    tables = [table for table in tables if table not in tables_cols_indices]
+
+    cols = ['database', 'schema', 'table', 'column', 'index', 'index_type']
+    if flavor == 'mssql':
+        cols.append('clustered')
+    result_cols_ix = dict(enumerate(cols))
+    debug_kwargs = {'debug': debug} if isinstance(connectable, SQLConnector) else {}
+
+    for i in range(0, len(tables), max(1, batchsize)):
+        batch_tables = tables[i:(i + batchsize)]
+        cols_indices_query = sqlalchemy.text(
+            _format_tables_query(
+                columns_indices_queries.get(flavor, columns_indices_queries['default']),
+                batch_tables,
+                flavor,
+                schema=schema,
             )
-        ]
-        ### NOTE: This may return incorrect columns if the schema is not explicitly stated.
-        if cols_types_docs and not cols_types_docs_filtered:
-            cols_types_docs_filtered = cols_types_docs
-
-        cols_indices = defaultdict(lambda: [])
-        for doc in cols_types_docs_filtered:
-            col = (
-                doc['column']
-                if flavor != 'oracle'
-                else (
-                    doc['column'].lower()
-                    if (doc['column'].isupper() and doc['column'].replace('_', '').isalpha())
-                    else doc['column']
+        )
+        if not debug_kwargs and debug:
+            dprint(cols_indices_query)
+
+        try:
+            result_rows = (
+                [
+                    row
+                    for row in connectable.execute(cols_indices_query, **debug_kwargs).fetchall()
+                ]
+                if flavor != 'duckdb'
+                else [
+                    tuple([doc[col] for col in cols])
+                    for doc in connectable.read(cols_indices_query, debug=debug).to_dict(orient='records')
+                ]
+            )
+            tables_docs = _group_docs_by_table(
+                [
+                    {
+                        result_cols_ix[i]: val
+                        for i, val in enumerate(row)
+                    }
+                    for row in result_rows
+                ],
+                batch_tables,
+                flavor,
+            )
+            for table in batch_tables:
+                tables_cols_indices[table] = _parse_cols_indices_docs(
+                    tables_docs.get(table, []),
+                    flavor=flavor,
+                    schema=schema,
+                    database=database,
                 )
+        except Exception as e:
+            warn(f"Failed to fetch indices for {len(batch_tables)} tables:\n{e}")
+            for table in batch_tables:
+                tables_cols_indices[table] = None
+
+    return tables_cols_indices
+
+
+def _parse_cols_indices_docs(
+    cols_indices_docs: List[Dict[str, Any]],
+    flavor: str,
+    schema: Optional[str] = None,
+    database: Optional[str] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build the columns indices dictionary from the rows of a `columns_indices_queries` query.
+    """
+    from collections import defaultdict
+    cols_indices_docs_filtered = [
+        doc
+        for doc in cols_indices_docs
+        if (
+            (
+                not schema
+                or doc['schema'] == schema
             )
-            index_doc = {
-                'name': doc.get('index', None),
-                'type': doc.get('index_type', None)
-            }
-            if flavor == 'mssql':
-                index_doc['clustered'] = doc.get('clustered', None)
-            cols_indices[col].append(index_doc)
+            and
+            (
+                not database
+                or doc['database'] == database
+            )
+        )
+    ]
+    ### NOTE: This may return incorrect columns if the schema is not explicitly stated.
+    if cols_indices_docs and not cols_indices_docs_filtered:
+        cols_indices_docs_filtered = cols_indices_docs
+
+    cols_indices = defaultdict(lambda: [])
+    for doc in cols_indices_docs_filtered:
+        col = (
+            doc['column']
+            if flavor != 'oracle'
+            else (
+                doc['column'].lower()
+                if (doc['column'].isupper() and doc['column'].replace('_', '').isalpha())
+                else doc['column']
+            )
+        )
+        index_doc = {
+            'name': doc.get('index', None),
+            'type': doc.get('index_type', None)
+        }
+        if flavor == 'mssql':
+            index_doc['clustered'] = doc.get('clustered', None)
+        cols_indices[col].append(index_doc)
 
-        return dict(cols_indices)
-    except Exception as e:
-        warn(f"Failed to fetch columns for table '{table}':\n{e}")
-        return {}
+    return dict(cols_indices)
 
 
 def get_update_queries(
@@ -2056,6 +2695,20 @@ def get_db_version(conn: 'SQLConnector', debug: bool = False) -> Union[str, None
     return conn.value(version_query, debug=debug)
 
 
+def get_db_max_connections(conn: 'SQLConnector', debug: bool = False) -> Union[int, None]:
+    """
+    Fetch the maximum number of concurrent connections the database server allows.
+    Returns `None` if the flavor has no such limit or it cannot be read.
+    """
+    max_connections_query = max_connections_queries.get(conn.flavor, None)
+    if max_connections_query is None:
+        return None
+    try:
+        return int(conn.value(max_connections_query, silent=True, debug=debug))
+    except Exception:
+        return None
+
+
 def get_rename_table_queries(
     old_table: str,
     new_table: str,
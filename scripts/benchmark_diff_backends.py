@@ -0,0 +1,143 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark the pandas and Polars diff backends (`pipes:sync:diff_backend`).
+
+The fixtures from `tests/test_filter_existing.py` are scaled up to `--rows` rows:
+`all_new` syncs only new rows, `all_duplicate` resyncs the existing rows,
+and `partial_update` changes a third of the rows, keeps a third, and adds a third.
+Each fixture is timed through `filter_unseen_df()` (in memory)
+and `Pipe.filter_existing()` (against each SQL flavor in the test databases).
+
+Start the databases with `cd tests && docker compose up -d`, then run from the repository root:
+
+    MRSM_TEST_FLAVORS=timescaledb,sqlite python scripts/benchmark_diff_backends.py --rows 100000
+"""
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+BACKENDS = ('pandas', 'polars')
+
+
+def build_docs(num_rows: int, offset: int = 0, val_offset: int = 0) -> dict:
+    """Build the columns of `num_rows` rows like the fixtures' `dt`, `id`, and `val`."""
+    from datetime import datetime, timedelta
+    start = datetime(2021, 1, 1)
+    ids = range(offset, offset + num_rows)
+    return {
+        'dt': [start + timedelta(minutes=i) for i in ids],
+        'id': list(ids),
+        'val': [i * 10 + val_offset for i in ids],
+    }
+
+
+def build_fixtures(num_rows: int) -> dict:
+    """Return the existing and incoming frames of each fixture."""
+    from meerschaum.utils.packages import import_pandas
+    pd = import_pandas()
+    existing_df = pd.DataFrame(build_docs(num_rows))
+    third = num_rows // 3
+    return {
+        'all_new': (existing_df, pd.DataFrame(build_docs(num_rows, offset=num_rows))),
+        'all_duplicate': (existing_df, existing_df.copy()),
+        'partial_update': (
+            existing_df,
+            pd.concat(
+                [
+                    pd.DataFrame(build_docs(third, val_offset=1)),
+                    pd.DataFrame(build_docs(third, offset=third)),
+                    pd.DataFrame(build_docs(third, offset=num_rows)),
+                ],
+                ignore_index=True,
+            ),
+        ),
+    }
+
+
+def time_it(func) -> float:
+    """Return how many seconds a call took."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def benchmark_in_memory(fixtures: dict) -> dict:
+    """Time `filter_unseen_df()` for each fixture and backend."""
+    from meerschaum.utils.dataframe import filter_unseen_df
+    return {
+        (name, backend): time_it(
+            lambda: filter_unseen_df(old_df, new_df, diff_backend=backend)
+        )
+        for name, (old_df, new_df) in fixtures.items()
+        for backend in BACKENDS
+    }
+
+
+def benchmark_flavor(conn, fixtures: dict) -> dict:
+    """Time `Pipe.filter_existing()` for each fixture and backend against one connector."""
+    import meerschaum as mrsm
+    results = {}
+    for name, (existing_df, incoming_df) in fixtures.items():
+        pipe = mrsm.Pipe(
+            'bench', 'diff_backends', name,
+            instance=conn,
+            columns={'datetime': 'dt', 'id': 'id'},
+            cache=False,
+        )
+        pipe.delete()
+        success, msg = pipe.sync(existing_df)
+        if not success:
+            raise RuntimeError(msg)
+        for backend in BACKENDS:
+            results[(name, backend)] = time_it(
+                lambda: pipe.filter_existing(incoming_df, diff_backend=backend)
+            )
+        pipe.delete()
+    return results
+
+
+def print_results(label: str, results: dict) -> None:
+    """Print one row per fixture with the seconds per backend and the speedup."""
+    for name in ('all_new', 'all_duplicate', 'partial_update'):
+        pandas_seconds, polars_seconds = (results[(name, backend)] for backend in BACKENDS)
+        print(
+            f"{label:<16}{name:<16}"
+            f"{pandas_seconds:>12.3f}{polars_seconds:>12.3f}"
+            f"{pandas_seconds / polars_seconds:>9.2f}x"
+        )
+
+
+def main():
+    """Print the seconds per backend for each fixture, in memory and for each flavor."""
+    from meerschaum.utils.packages import is_installed
+    from tests.connectors import conns, get_flavors
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+    if not is_installed('polars', venv=None):
+        print("Install `polars` to compare the backends.")
+        return
+
+    fixtures = build_fixtures(args.rows)
+    print(f"{'instance':<16}{'fixture':<16}{'pandas':>12}{'polars':>12}{'speedup':>10}")
+    print_results('in-memory', benchmark_in_memory(fixtures))
+    for flavor in get_flavors():
+        conn = conns.get(flavor, None)
+        if conn is None or conn.type != 'sql':
+            continue
+        try:
+            results = benchmark_flavor(conn, fixtures)
+        except Exception as e:
+            print(f"{flavor:<16}failed: {e}")
+            continue
+        print_results(flavor, results)
+
+
+if __name__ == '__main__':
+    main()
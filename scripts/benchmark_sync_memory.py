@@ -0,0 +1,122 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark the peak memory of syncing a large frame into a SQLite pipe.
+
+Each scenario runs in a fresh process, so the reported peak RSS (minus the RSS before the frame
+was built) only covers the frame itself and the copies made while syncing it.
+The ratio divides this by the frame's size, so the frame alone is 1.0x.
+
+- `safe_copy`: `pipe.sync(df)`, which syncs a copy and leaves the caller's frame untouched.
+- `owned`: `pipe.sync(df, safe_copy=False)`, which hands the frame to the sync.
+- `*_cow`: the same under pandas copy-on-write (always on for `pandas>=3`,
+  enabled in the scenario's own process for `pandas<3`).
+
+Run from the repository root:
+
+    python scripts/benchmark_sync_memory.py --rows 1000000
+"""
+from __future__ import annotations
+
+import sys
+import argparse
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SCENARIOS = {
+    'safe_copy': {'safe_copy': True, 'copy_on_write': False},
+    'owned': {'safe_copy': False, 'copy_on_write': False},
+    'safe_copy_cow': {'safe_copy': True, 'copy_on_write': True},
+    'owned_cow': {'safe_copy': False, 'copy_on_write': True},
+}
+
+
+def get_peak_rss_bytes() -> int:
+    """Return the peak resident set size of this process in bytes."""
+    import resource
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+def build_df(num_rows: int):
+    """Build a frame of `num_rows` rows with a spread of dtypes, without intermediate lists."""
+    from meerschaum.utils.packages import import_pandas, attempt_import
+    pd = import_pandas()
+    np = attempt_import('numpy')
+    ids = np.arange(num_rows, dtype='int64')
+    return pd.DataFrame({
+        'id': ids,
+        'dt': pd.date_range('2024-01-01', periods=num_rows, freq='s', tz='UTC'),
+        'value': ids.astype('float64') / 3,
+        'label': pd.Series(ids % 100).astype(str).radd('label_'),
+    })
+
+
+def run_scenario(num_rows: int, database: str, safe_copy: bool, copy_on_write: bool, results):
+    """Sync a frame in this (fresh) process and report its size and the peak RSS."""
+    import meerschaum as mrsm
+    from meerschaum.utils.packages import import_pandas
+    pd = import_pandas()
+    if copy_on_write and int(pd.__version__.split('.', maxsplit=1)[0]) == 2:
+        ### Only this scenario's process is affected.
+        pd.options.mode.copy_on_write = True
+
+    conn = mrsm.get_connector('sql', 'bench_sync_memory', flavor='sqlite', database=database)
+    pipe = mrsm.Pipe(
+        'bench', 'sync_memory',
+        instance=conn,
+        columns={'datetime': 'dt', 'id': 'id'},
+        dtypes={'label': 'str', 'value': 'float'},
+        cache=False,
+    )
+    pipe.delete()
+    success, msg = pipe.sync(build_df(10))
+    if not success:
+        raise RuntimeError(msg)
+
+    start_rss = get_peak_rss_bytes()
+    df = build_df(num_rows)
+    frame_bytes = int(df.memory_usage(deep=True).sum())
+    success, msg = pipe.sync(df, safe_copy=safe_copy)
+    if not success:
+        raise RuntimeError(msg)
+    peak_bytes = get_peak_rss_bytes() - start_rss
+    pipe.delete()
+    results.put((frame_bytes, peak_bytes))
+
+
+def main():
+    """Print the peak RSS of each scenario as a multiple of the frame's size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context('spawn')
+    print(f"{'scenario':<16}{'frame MiB':>12}{'peak MiB':>12}{'ratio':>8}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, kwargs in SCENARIOS.items():
+            results = ctx.Queue()
+            process = ctx.Process(
+                target=run_scenario,
+                args=(args.rows, str(Path(temp_dir) / f'{name}.db')),
+                kwargs={**kwargs, 'results': results},
+            )
+            process.start()
+            process.join()
+            if process.exitcode != 0 or results.empty():
+                print(f"{name:<16}failed (exit code {process.exitcode})")
+                continue
+            frame_bytes, peak_bytes = results.get()
+            print(
+                f"{name:<16}"
+                f"{frame_bytes / 2**20:>12.1f}"
+                f"{peak_bytes / 2**20:>12.1f}"
+                f"{peak_bytes / frame_bytes:>7.1f}x"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark staged bulk upserts against the test databases (`tests/docker-compose.yaml`).
+
+For each SQL flavor, time loading a staging table with the flavor's default `to_sql()` method
+versus its bulk loader (`bulk_insert=True`), and time a full upsert sync of updated rows.
+
+Start the databases with `cd tests && docker compose up -d`, then run from the repository root:
+
+    MRSM_TEST_FLAVORS=timescaledb,mysql,sqlite python scripts/benchmark_upsert.py --rows 100000
+"""
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def build_df(num_rows: int, offset: int = 0):
+    """Build a frame of `num_rows` rows with a spread of dtypes."""
+    from datetime import datetime, timedelta, timezone
+    from meerschaum.utils.packages import import_pandas
+    pd = import_pandas()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return pd.DataFrame({
+        'id': range(num_rows),
+        'dt': [start + timedelta(minutes=i) for i in range(num_rows)],
+        'value': [float(i + offset) for i in range(num_rows)],
+        'label': [f'label_{(i + offset) % 100}' for i in range(num_rows)],
+    })
+
+
+def time_it(func) -> float:
+    """Return how many seconds a call took."""
+    start = time.perf_counter()
+    result = func()
+    duration = time.perf_counter() - start
+    success = result[0] if isinstance(result, tuple) else result
+    if not success:
+        raise RuntimeError(f"Benchmark step failed: {result}")
+    return duration
+
+
+def benchmark_flavor(conn, num_rows: int) -> dict:
+    """Run the staging and upsert benchmarks for one connector."""
+    import meerschaum as mrsm
+    df = build_df(num_rows)
+    results = {}
+    for bulk_insert in (False, True):
+        table = f'_mrsm_bench_stage_{int(bulk_insert)}'
+        conn.exec(f"DROP TABLE IF EXISTS {table}")
+        results['stage_bulk' if bulk_insert else 'stage_default'] = time_it(
+            lambda: conn.to_sql(df, name=table, if_exists='replace', bulk_insert=bulk_insert)
+        )
+        conn.exec(f"DROP TABLE IF EXISTS {table}")
+
+    pipe = mrsm.Pipe(
+        'bench', 'upsert', str(conn.flavor).replace('-', '_'),
+        instance=conn,
+        columns={'primary': 'id', 'datetime': 'dt'},
+        upsert=True,
+        cache=False,
+    )
+    pipe.delete()
+    results['insert'] = time_it(lambda: pipe.sync(df))
+    results['upsert'] = time_it(lambda: pipe.sync(build_df(num_rows, offset=1)))
+    pipe.delete()
+    return results
+
+
+def main():
+    """Print a table of seconds per step for each flavor."""
+    from tests.connectors import conns, get_flavors
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    columns = ('stage_default', 'stage_bulk', 'insert', 'upsert')
+    print(f"{'flavor':<16}" + ''.join(f"{col:>16}" for col in columns))
+    for flavor in get_flavors():
+        conn = conns.get(flavor, None)
+        if conn is None or conn.type != 'sql':
+            continue
+        try:
+            results = benchmark_flavor(conn, args.rows)
+        except Exception as e:
+            print(f"{flavor:<16}failed: {e}")
+            continue
+        print(f"{flavor:<16}" + ''.join(f"{results[col]:>16.3f}" for col in columns))
+
+
+if __name__ == '__main__':
+    main()
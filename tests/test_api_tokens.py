@@ -0,0 +1,200 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+
+"""
+Test the API's cache of verified tokens.
+"""
+
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('fastapi')
+
+from meerschaum.core import Token
+from meerschaum.core.User import hash_password
+
+SECRET = 'foo-bar-baz'
+
+
+class FakeInstance:
+    """
+    Serve a single token and count the lookups.
+    """
+
+    def __init__(self, token: Token):
+        self.token = token
+        self.get_token_calls = 0
+
+    def get_token(self, token_id, debug: bool = False):
+        self.get_token_calls += 1
+        return self.token if token_id == self.token.id else None
+
+    def invalidate_token(self, token, debug: bool = False):
+        return True, "Success"
+
+    def delete_token(self, token, debug: bool = False):
+        return True, "Success"
+
+
+class FakeValkey:
+    """
+    Hold the tokens' generations like the Valkey cache connector shared by the workers.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.client = self
+
+    def get(self, key):
+        return self.values.get(key, None)
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, None) or 0) + 1)
+        return int(self.values[key])
+
+    def expire(self, key, seconds):
+        return True
+
+
+@pytest.fixture
+def tokens_cache(monkeypatch):
+    """
+    Patch the instance and cache connectors of the tokens module and clear its cache.
+    """
+    from meerschaum.api import _tokens
+    token = Token(
+        id=uuid.uuid4(),
+        secret=SECRET,
+        secret_hash=hash_password(SECRET, rounds=1),
+        scopes=['pipes:read'],
+        expiration=(datetime.now(timezone.utc) + timedelta(days=1)),
+    )
+    instance = FakeInstance(token)
+    valkey = FakeValkey()
+    verify_calls = []
+
+    def _verify_password(password, password_hash):
+        verify_calls.append(password)
+        return password_hash == token.secret_hash and password == SECRET
+
+    monkeypatch.setattr(_tokens, 'get_api_connector', lambda: instance)
+    monkeypatch.setattr(_tokens, 'get_cache_connector', lambda: valkey)
+    monkeypatch.setattr(_tokens, 'verify_password', _verify_password)
+    monkeypatch.setitem(_tokens.TOKENS_CACHE_CONFIG, 'enabled', True)
+    monkeypatch.setitem(_tokens.TOKENS_CACHE_CONFIG, 'ttl_seconds', 60)
+    monkeypatch.setattr(token, 'invalidate', lambda debug=False: (True, "Success"))
+    _tokens._tokens_cache.clear()
+    yield SimpleNamespace(
+        module=_tokens,
+        token=token,
+        instance=instance,
+        valkey=valkey,
+        verify_calls=verify_calls,
+    )
+    _tokens._tokens_cache.clear()
+
+
+def test_cache_hit(tokens_cache):
+    """
+    A second request with the same credential skips the lookup and secret hashing.
+    """
+    _tokens, token = tokens_cache.module, tokens_cache.token
+    assert _tokens.get_token_from_authorization(token.get_api_key()).id == token.id
+    assert _tokens.get_token_from_authorization(token.get_api_key()).id == token.id
+    assert tokens_cache.instance.get_token_calls == 1
+    assert len(tokens_cache.verify_calls) == 1
+
+    ### The cache is keyed by a hash of the credential, never the secret itself.
+    assert all(SECRET not in key for key in _tokens._tokens_cache)
+
+
+def test_wrong_secret_is_not_cached(tokens_cache):
+    """
+    A credential with the wrong secret is rejected every time.
+    """
+    from fastapi import HTTPException
+    _tokens, token = tokens_cache.module, tokens_cache.token
+    bad_token = Token(id=token.id, secret='wrong')
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            _tokens.get_token_from_authorization(bad_token.get_api_key())
+    assert len(tokens_cache.verify_calls) == 2
+    assert len(_tokens._tokens_cache) == 0
+
+
+def test_cache_ttl_expiry(tokens_cache, monkeypatch):
+    """
+    Cached tokens are verified again after `api:tokens:cache:ttl_seconds`.
+    """
+    _tokens, token = tokens_cache.module, tokens_cache.token
+    monkeypatch.setitem(_tokens.TOKENS_CACHE_CONFIG, 'ttl_seconds', 0.01)
+    _tokens.get_token_from_authorization(token.get_api_key())
+    time.sleep(0.05)
+    _tokens.get_token_from_authorization(token.get_api_key())
+    assert tokens_cache.instance.get_token_calls == 2
+    assert len(tokens_cache.verify_calls) == 2
+
+
+def test_cache_hit_checks_expiration(tokens_cache):
+    """
+    A cached token which has since expired is rejected and evicted.
+    """
+    from fastapi import HTTPException
+    _tokens, token = tokens_cache.module, tokens_cache.token
+    _tokens.get_token_from_authorization(token.get_api_key())
+    token.expiration = datetime.now(timezone.utc) - timedelta(seconds=1)
+    with pytest.raises(HTTPException) as exc_info:
+        _tokens.get_token_from_authorization(token.get_api_key())
+    assert exc_info.value.status_code == 401
+    assert len(_tokens._tokens_cache) == 0
+
+
+def test_generation_mismatch_is_a_miss(tokens_cache):
+    """
+    A token invalidated by another worker (which bumps its generation) is looked up again.
+    """
+    _tokens, token = tokens_cache.module, tokens_cache.token
+    _tokens.get_token_from_authorization(token.get_api_key())
+    tokens_cache.valkey.incr(_tokens.TOKEN_GENERATION_KEY_TEMPLATE.format(token_id=token.id))
+    _tokens.get_token_from_authorization(token.get_api_key())
+    assert tokens_cache.instance.get_token_calls == 2
+
+    _tokens.get_token_from_authorization(token.get_api_key())
+    assert tokens_cache.instance.get_token_calls == 2
+
+
+@pytest.mark.parametrize('action', ['edit', 'invalidate', 'delete'])
+def test_token_routes_evict_cache(tokens_cache, action: str, monkeypatch):
+    """
+    Editing, invalidating, or deleting a token evicts it and bumps its generation.
+    """
+    from meerschaum.api.routes import _tokens as tokens_routes
+    _tokens, token = tokens_cache.module, tokens_cache.token
+    monkeypatch.setattr(tokens_routes, 'get_api_connector', lambda: tokens_cache.instance)
+    monkeypatch.setattr(Token, 'edit', lambda self, debug=False: (True, "Success"))
+    _tokens.get_token_from_authorization(token.get_api_key())
+    assert len(_tokens._tokens_cache) == 1
+
+    if action == 'edit':
+        token_model = SimpleNamespace(
+            is_valid=True,
+            creation=None,
+            expiration=None,
+            scopes=['pipes:read', 'pipes:write'],
+            label='foo',
+        )
+        success, msg = tokens_routes.edit_token(str(token.id), token_model, curr_user=None)
+    elif action == 'invalidate':
+        success, msg = tokens_routes.invalidate_token(str(token.id), curr_user=None)
+    else:
+        success, msg = tokens_routes.delete_token(str(token.id), curr_user=None)
+
+    assert success, msg
+    assert len(_tokens._tokens_cache) == 0
+    generation_key = _tokens.TOKEN_GENERATION_KEY_TEMPLATE.format(token_id=token.id)
+    assert tokens_cache.valkey.get(generation_key) == '1'
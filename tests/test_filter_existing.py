@@ -83,7 +83,8 @@ def test_filter_existing_all_new(flavor: str):
 
 
 @pytest.mark.parametrize("flavor", get_flavors())
-def test_filter_existing_all_duplicate(flavor: str):
+@pytest.mark.parametrize("diff_method", ['merge', 'hash'])
+def test_filter_existing_all_duplicate(flavor: str, diff_method: str):
     """Syncing the same data again → all three DataFrames are empty."""
     conn = conns[flavor]
     pipe = mrsm.Pipe('test', 'filter_existing', 'all_dup', instance=conn,
@@ -100,7 +101,7 @@ def test_filter_existing_all_duplicate(flavor: str):
 
     pd = mrsm.attempt_import('pandas')
     dup_df = pd.DataFrame(rows)
-    unseen, update, delta = pipe.filter_existing(dup_df, debug=debug)
+    unseen, update, delta = pipe.filter_existing(dup_df, diff_method=diff_method, debug=debug)
 
     assert len(unseen) == 0
     assert len(update) == 0
@@ -108,7 +109,9 @@ def test_filter_existing_all_duplicate(flavor: str):
 
 
 @pytest.mark.parametrize("flavor", get_flavors())
-def test_filter_existing_partial_update(flavor: str):
+@pytest.mark.parametrize("diff_method", ['merge', 'hash'])
+@pytest.mark.parametrize("diff_backend", ['pandas', 'polars'])
+def test_filter_existing_partial_update(flavor: str, diff_method: str, diff_backend: str):
     """
     Some rows are new, some are updates.
     - id=1: value changed → update_df
@@ -136,7 +139,12 @@ def test_filter_existing_partial_update(flavor: str):
     ]
     pd = mrsm.attempt_import('pandas')
     incoming_df = pd.DataFrame(incoming)
-    unseen, update, delta = pipe.filter_existing(incoming_df, debug=debug)
+    unseen, update, delta = pipe.filter_existing(
+        incoming_df,
+        diff_method=diff_method,
+        diff_backend=diff_backend,
+        debug=debug,
+    )
 
     assert len(unseen) == 1
     assert int(unseen['id'].iloc[0]) == 3
@@ -149,6 +157,37 @@ def test_filter_existing_partial_update(flavor: str):
     assert delta_ids == [1, 3]
 
 
+@pytest.mark.parametrize("flavor", get_flavors())
+@pytest.mark.parametrize("diff_backend", ['pandas', 'polars'])
+def test_filter_existing_json_strings(flavor: str, diff_backend: str):
+    """
+    JSON columns which hold strings alongside objects are deserialized exactly once.
+    """
+    conn = conns[flavor]
+    pipe = mrsm.Pipe('test', 'filter_existing', 'json_strings', instance=conn)
+    pipe.delete()
+    pipe = mrsm.Pipe('test', 'filter_existing', 'json_strings', instance=conn,
+                     columns={'datetime': 'dt', 'id': 'id'}, dtypes={'meta': 'json'})
+    pipe.sync([{'dt': datetime(2021, 1, 1), 'id': 1, 'meta': {'a': 1}}], debug=debug)
+
+    pd = mrsm.attempt_import('pandas')
+    incoming_df = pd.DataFrame([
+        {'dt': datetime(2021, 1, 1), 'id': 1, 'meta': {'a': 2}},
+        {'dt': datetime(2021, 1, 2), 'id': 2, 'meta': 'foo'},
+    ])
+    unseen, update, delta = pipe.filter_existing(
+        incoming_df,
+        diff_backend=diff_backend,
+        debug=debug,
+    )
+
+    assert [int(val) for val in unseen['id']] == [2]
+    assert unseen['meta'].iloc[0] == 'foo'
+    assert [int(val) for val in update['id']] == [1]
+    assert update['meta'].iloc[0] == {'a': 2}
+    assert len(delta) == 2
+
+
 @pytest.mark.parametrize("flavor", get_flavors())
 def test_filter_existing_no_datetime_column(flavor: str):
     """Pipes without a datetime column still filter correctly by id."""
@@ -193,3 +232,59 @@ def test_filter_existing_no_pipe_data(flavor: str):
     assert len(unseen) == 2
     assert len(update) == 0
     assert len(delta) == 2
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_filter_existing_row_digests(flavor: str, monkeypatch):
+    """Row digests detect changes across syncs without re-reading unchanged rows."""
+    import meerschaum.config
+    get_config = meerschaum.config.get_config
+
+    def _get_config(*keys, **kwargs):
+        if keys == ('pipes', 'sync', 'server_digests'):
+            return True
+        return get_config(*keys, **kwargs)
+
+    monkeypatch.setattr(meerschaum.config, 'get_config', _get_config)
+    conn = conns[flavor]
+    pipe = mrsm.Pipe('test', 'filter_existing', 'digests', instance=conn,
+                     columns={'datetime': 'dt', 'id': 'id'})
+    pipe.delete()
+    pipe = mrsm.Pipe('test', 'filter_existing', 'digests', instance=conn,
+                     columns={'datetime': 'dt', 'id': 'id'})
+
+    existing = [
+        {'dt': datetime(2021, 1, 1), 'id': 1, 'val': 10},
+        {'dt': datetime(2021, 1, 2), 'id': 2, 'val': 20},
+    ]
+    pipe.sync(existing, debug=debug)
+
+    digests_df = pipe.instance_connector.get_pipe_rows_digests(pipe, debug=debug)
+    if digests_df is None:
+        pytest.skip(f"Row digests are not supported for '{flavor}'.")
+    assert len(digests_df) == 2
+    assert digests_df['_mrsm_digest'].nunique() == 2
+
+    pd = mrsm.attempt_import('pandas')
+    unseen, update, delta = pipe.filter_existing(
+        pd.DataFrame(existing),
+        diff_method='hash',
+        debug=debug,
+    )
+    assert len(delta) == 0
+    assert pipe._get_cached_value('rows_digests') is not None
+
+    pipe.sync([{'dt': datetime(2021, 1, 2), 'id': 2, 'val': 22}], debug=debug)
+    incoming = [
+        {'dt': datetime(2021, 1, 1), 'id': 1, 'val': 11},  # changed
+        {'dt': datetime(2021, 1, 2), 'id': 2, 'val': 22},  # changed on the server
+        {'dt': datetime(2021, 1, 3), 'id': 3, 'val': 30},  # new
+    ]
+    unseen, update, delta = pipe.filter_existing(
+        pd.DataFrame(incoming),
+        diff_method='hash',
+        debug=debug,
+    )
+    assert [int(val) for val in unseen['id']] == [3]
+    assert [int(val) for val in update['id']] == [1]
+    assert len(delta) == 2
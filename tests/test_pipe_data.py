@@ -318,3 +318,458 @@ def test_epoch_int_axis_datetime_begin(flavor: str):
     assert sorted(remaining['id'].tolist()) == [30, 31]
 
     pipe.delete()
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_get_data_parallel(flavor: str):
+    """
+    Test that reading ranges concurrently matches a serial read.
+    """
+    from datetime import datetime, timedelta
+    conn = conns[flavor]
+    pipe = Pipe('test', 'get_data_parallel', 'foo', instance=conn)
+    _ = pipe.delete()
+    pipe = Pipe(
+        'test', 'get_data_parallel', 'foo',
+        columns={'datetime': 'dt', 'id': 'id'},
+        parameters={'verify': {'chunk_minutes': 60 * 24}},
+        instance=conn,
+    )
+    start = datetime(2024, 1, 1)
+    docs = [
+        {'dt': start + timedelta(hours=i * 7), 'id': i, 'val': float(i)}
+        for i in range(100)
+    ]
+    success, msg = pipe.sync(docs, debug=debug)
+    assert success, msg
+
+    for order in ('asc', 'desc'):
+        serial_df = pipe.get_data(order=order, parallel=False, debug=debug)
+        parallel_df = pipe.get_data(order=order, parallel=True, workers=4, debug=debug)
+        assert parallel_df['id'].tolist() == serial_df['id'].tolist()
+
+    begin, end = start + timedelta(days=3), start + timedelta(days=10, hours=5)
+    serial_df = pipe.get_data(begin=begin, end=end, parallel=False, debug=debug)
+    parallel_df = pipe.get_data(begin=begin, end=end, parallel=True, workers=4, debug=debug)
+    assert parallel_df['id'].tolist() == serial_df['id'].tolist()
+    assert len(parallel_df) == len([doc for doc in docs if begin <= doc['dt'] < end])
+
+    pipe.delete()
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_async_reads(flavor: str):
+    """
+    Test that the async reads match their synchronous counterparts.
+    """
+    import asyncio
+    from datetime import datetime, timedelta, timezone
+    conn = conns[flavor]
+    if conn.type not in ('sql', 'api'):
+        return
+    pipe = Pipe('test', 'async_reads', 'foo', instance=conn)
+    _ = pipe.delete()
+    pipe = Pipe(
+        'test', 'async_reads', 'foo',
+        columns={'datetime': 'dt', 'id': 'id'},
+        instance=conn,
+    )
+    start = datetime(2024, 1, 1)
+    docs = [
+        {'dt': start + timedelta(hours=i), 'id': i % 3, 'val': float(i)}
+        for i in range(24)
+    ]
+    success, msg = pipe.sync(docs, debug=debug)
+    assert success, msg
+
+    ### The API server reads through the async methods below.
+    if conn.type == 'api':
+        assert pipe.get_sync_time(debug=debug) == datetime(2024, 1, 1, 23, tzinfo=timezone.utc)
+        assert pipe.get_sync_time(params={'id': [1]}, debug=debug) == datetime(
+            2024, 1, 1, 22, tzinfo=timezone.utc,
+        )
+        pipe.delete()
+        return
+
+    begin, end = start + timedelta(hours=2), start + timedelta(hours=20)
+    params = {'id': [1, 2]}
+
+    async def _read():
+        try:
+            return (
+                await conn.get_sync_time_async(pipe, params=params, debug=debug),
+                await conn.get_pipe_rowcount_async(pipe, begin=begin, end=end, debug=debug),
+                await pipe.get_data_async(begin=begin, end=end, params=params, debug=debug),
+                await conn.fetch_pipes_keys_async(metric_keys=['async_reads'], debug=debug),
+            )
+        finally:
+            await conn.dispose_async_engines()
+
+    sync_time, rowcount, df, keys = asyncio.run(_read())
+    assert pipe.parse_date_bounds(sync_time) == pipe.get_sync_time(params=params, debug=debug)
+    assert rowcount == pipe.get_rowcount(begin=begin, end=end, debug=debug)
+    expected_df = pipe.get_data(begin=begin, end=end, params=params, debug=debug)
+    assert df.dtypes.to_dict() == expected_df.dtypes.to_dict()
+    assert df.equals(expected_df)
+    assert tuple(list(keys.values())[0][:3]) == ('test', 'async_reads', 'foo')
+
+    pipe.delete()
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_async_engine(flavor: str):
+    """
+    Test that an async engine is created whenever the flavor's async driver is installed.
+    """
+    import asyncio
+    from meerschaum.utils.packages import attempt_import, is_installed
+    from meerschaum.connectors.sql._async import ASYNC_DRIVERS
+    conn = conns[flavor]
+    if conn.type != 'sql':
+        return
+    sqlalchemy = attempt_import('sqlalchemy', lazy=False)
+    url = sqlalchemy.engine.make_url(conn.URI)
+    backend = url.get_backend_name()
+    driver, driver_import_name = ASYNC_DRIVERS.get(backend, (None, None))
+    if driver is None or not is_installed(driver_import_name, venv=None):
+        return
+    if backend == 'sqlite' and url.database in (None, '', ':memory:'):
+        return
+
+    ### `greenlet` is installed alongside SQLAlchemy with the `sql` extra.
+    assert is_installed('greenlet', venv=None)
+
+    async def _get_async_engine():
+        try:
+            return conn.get_async_engine(debug=debug)
+        finally:
+            await conn.dispose_async_engines()
+
+    assert asyncio.run(_get_async_engine()) is not None
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_get_pipes_prefetch(flavor: str):
+    """
+    Test that batched metadata matches the per-pipe metadata.
+    """
+    import meerschaum as mrsm
+    from datetime import datetime, timedelta
+    conn = conns[flavor]
+    if conn.type != 'sql':
+        return
+    start = datetime(2024, 1, 1)
+    pipes = []
+    for i, location_key in enumerate(['a', 'b', 'c']):
+        pipe = Pipe('test', 'prefetch', location_key, instance=conn)
+        _ = pipe.delete()
+        pipe = Pipe(
+            'test', 'prefetch', location_key,
+            columns={'datetime': 'dt', 'id': 'id'},
+            dtypes={'dt': ('int' if location_key == 'c' else 'datetime')},
+            instance=conn,
+        )
+        docs = [
+            {
+                'dt': (i + j if location_key == 'c' else start + timedelta(hours=(i + j))),
+                'id': j,
+            }
+            for j in range(5)
+        ]
+        success, msg = pipe.sync(docs, debug=debug)
+        assert success, msg
+        pipes.append(pipe)
+
+    pipes_columns_types = conn.get_pipes_columns_types(pipes, debug=debug)
+    pipes_sync_times = conn.get_pipes_sync_times(
+        pipes,
+        pipes_columns_types=pipes_columns_types,
+        debug=debug,
+    )
+    for pipe in pipes:
+        assert pipes_columns_types[pipe] == conn.get_pipe_columns_types(pipe, debug=debug)
+        assert pipes_sync_times[pipe] == conn.get_sync_time(pipe, debug=debug)
+
+    prefetched_pipes = mrsm.get_pipes(
+        'test', 'prefetch',
+        instance=conn,
+        as_list=True,
+        prefetch=True,
+        debug=debug,
+    )
+    assert len(prefetched_pipes) == len(pipes)
+    for pipe in prefetched_pipes:
+        assert pipe._get_cached_value('_prefetched_sync_time', debug=debug) is not None
+        prefetched_sync_time = pipe.get_sync_time(debug=debug)
+        assert pipe._get_cached_value('_prefetched_sync_time', debug=debug) is None
+        assert prefetched_sync_time == pipe.get_sync_time(debug=debug)
+
+    for pipe in pipes:
+        pipe.delete()
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_get_pipes_prefetch_failed_batch(flavor: str, monkeypatch):
+    """
+    Test that a failed batch is not cached as missing tables.
+    """
+    import meerschaum as mrsm
+    import meerschaum.utils.sql
+    from meerschaum.connectors.sql._batch import REFLECTED_COLUMNS_TYPES_FLAVORS
+    conn = conns[flavor]
+    if conn.type != 'sql' or conn.flavor in REFLECTED_COLUMNS_TYPES_FLAVORS:
+        return
+    pipe = Pipe('test', 'prefetch_failed', instance=conn)
+    _ = pipe.delete()
+    pipe = Pipe('test', 'prefetch_failed', instance=conn, columns={'datetime': 'dt'})
+    success, msg = pipe.sync([{'dt': '2024-01-01', 'val': 1}], debug=debug)
+    assert success, msg
+
+    def _raise(*args, **kwargs):
+        raise Exception("Transient failure.")
+
+    monkeypatch.setattr(meerschaum.utils.sql, '_group_docs_by_table', _raise)
+    assert conn.get_pipes_columns_types([pipe], debug=debug)[pipe] is None
+    assert conn.get_pipes_columns_indices([pipe], debug=debug)[pipe] is None
+    assert pipe not in conn.get_pipes_sync_times([pipe], debug=debug)
+    prefetched_pipes = mrsm.get_pipes(
+        'test', 'prefetch_failed',
+        instance=conn,
+        as_list=True,
+        prefetch=True,
+        debug=debug,
+    )
+    monkeypatch.undo()
+
+    assert len(prefetched_pipes) == 1
+    prefetched_pipe = prefetched_pipes[0]
+    assert prefetched_pipe.exists(debug=debug)
+    assert 'dt' in prefetched_pipe.get_columns_types(debug=debug)
+
+    pipe.delete()
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_get_data_keyset_pages(flavor: str):
+    """
+    Test that paging with continuation tokens reads every row exactly once.
+    """
+    from datetime import datetime, timedelta
+    from meerschaum.utils.pipes import get_keyset_token
+    conn = conns[flavor]
+    if conn.type not in ('sql', 'api'):
+        return
+    pipe = Pipe('test', 'keyset_pages', 'foo', instance=conn)
+    _ = pipe.delete()
+    pipe = Pipe(
+        'test', 'keyset_pages', 'foo',
+        columns={'datetime': 'dt', 'id': 'id'},
+        instance=conn,
+    )
+    start = datetime(2024, 1, 1)
+    docs = [
+        {'dt': start + timedelta(hours=(i // 3)), 'id': i % 3, 'val': i}
+        for i in range(20)
+    ]
+    success, msg = pipe.sync(docs, debug=debug)
+    assert success, msg
+
+    for order in ('asc', 'desc'):
+        pages = []
+        after = None
+        while True:
+            page = pipe.get_data(limit=7, order=order, after=after, debug=debug)
+            pages.append(page)
+            after = get_keyset_token(pipe, page)
+            if len(page) < 7 or after is None:
+                break
+
+        vals = [val for page in pages for val in page['val'].tolist()]
+        assert len(pages) == 3
+        assert sorted(vals) == list(range(20))
+        assert vals == pipe.get_data(order=order, debug=debug)['val'].tolist()
+
+    pipe.delete()
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_get_data_stream(flavor: str):
+    """
+    Test that streaming a pipe's data chunk by chunk yields every row (up to `limit`).
+    """
+    from datetime import datetime, timedelta
+    conn = conns[flavor]
+    if conn.type != 'api':
+        return
+    pipe = Pipe('test', 'data_stream', 'foo', instance=conn)
+    _ = pipe.delete()
+    pipe = Pipe(
+        'test', 'data_stream', 'foo',
+        columns={'datetime': 'dt', 'id': 'id'},
+        instance=conn,
+    )
+    start = datetime(2024, 1, 1)
+    docs = [
+        {'dt': start + timedelta(days=i), 'id': i % 3, 'val': i}
+        for i in range(100)
+    ]
+    success, msg = pipe.sync(docs, debug=debug)
+    assert success, msg
+
+    chunks = list(conn.get_pipe_data_stream(pipe, chunksize=30, debug=debug))
+    assert len(chunks) > 1
+    vals = [val for chunk in chunks for val in chunk['val'].tolist()]
+    assert sorted(vals) == list(range(100))
+    assert chunks[0]['dt'][0] == start
+
+    limited_chunks = list(pipe.get_data(as_iterator=True, limit=42, debug=debug))
+    assert sum(len(chunk) for chunk in limited_chunks) == 42
+
+    pipe.delete()
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_sync_pipe_concurrent_uploads(flavor: str):
+    """
+    Test that chunks posted concurrently (or streamed in one request) are all synced.
+    """
+    from datetime import datetime, timedelta
+    from meerschaum.utils.packages import import_pandas
+    pd = import_pandas()
+    conn = conns[flavor]
+    if conn.type != 'api':
+        return
+    pipe = Pipe('test', 'concurrent_uploads', 'foo', instance=conn)
+    _ = pipe.delete()
+    pipe = Pipe(
+        'test', 'concurrent_uploads', 'foo',
+        columns={'datetime': 'dt', 'id': 'id'},
+        instance=conn,
+    )
+    start = datetime(2024, 1, 1)
+    df = pd.DataFrame([
+        {'dt': start + timedelta(hours=i), 'id': i % 3, 'val': i}
+        for i in range(100)
+    ])
+    success, msg = conn.sync_pipe(pipe, df, chunksize=10, upload_workers=4, debug=debug)
+    assert success, msg
+    assert pipe.get_rowcount(debug=debug) == 100
+
+    df['val'] = df['val'] * 10
+    success, msg = conn.sync_pipe(pipe, df, chunksize=10, stream=True, debug=debug)
+    assert success, msg
+    assert pipe.get_rowcount(debug=debug) == 100
+    assert sorted(pipe.get_data(debug=debug)['val'].tolist()) == [i * 10 for i in range(100)]
+
+    ### Chunks which update the same keys are applied in order.
+    updates_df = pd.DataFrame([
+        {'dt': start, 'id': 0, 'val': -i}
+        for i in range(50)
+    ])
+    success, msg = conn.sync_pipe(pipe, updates_df, chunksize=1, upload_workers=4, debug=debug)
+    assert success, msg
+    assert pipe.get_rowcount(debug=debug) == 100
+    assert pipe.get_data(params={'id': 0}, begin=start, end=(start + timedelta(hours=1)))['val'].tolist() == [-49]
+
+    pipe.delete()
+
+    ### Pipes without index columns are sent concurrently.
+    pipe = Pipe('test', 'concurrent_uploads', 'no_index', instance=conn)
+    _ = pipe.delete()
+    pipe = Pipe('test', 'concurrent_uploads', 'no_index', instance=conn)
+    success, msg = conn.sync_pipe(pipe, df, chunksize=10, upload_workers=4, debug=debug)
+    assert success, msg
+    assert pipe.get_rowcount(debug=debug) == 100
+
+    pipe.delete()
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_sync_pipe_concurrent_uploads_failure(flavor: str, monkeypatch):
+    """
+    Test that a failed chunk stops the upload and reports the chunks which were synced.
+    """
+    import threading
+    from meerschaum.utils.packages import attempt_import
+    requests_exceptions = attempt_import('requests.exceptions')
+    conn = conns[flavor]
+    if conn.type != 'api':
+        return
+    pipe = Pipe('test', 'concurrent_uploads', 'failure', instance=conn)
+    _ = pipe.delete()
+    pipe = Pipe('test', 'concurrent_uploads', 'failure', instance=conn)
+    docs = [{'num': i} for i in range(100)]
+
+    post = conn.post
+    posts = []
+    lock = threading.Lock()
+
+    def _post_fail_third(*args, **kwargs):
+        with lock:
+            posts.append(args)
+            num_posts = len(posts)
+        if num_posts == 3:
+            raise requests_exceptions.ReadTimeout("Timed out waiting for the response.")
+        return post(*args, **kwargs)
+
+    monkeypatch.setattr(conn, 'post', _post_fail_third)
+    success, msg = conn.sync_pipe(pipe, docs, chunksize=10, upload_workers=4, debug=debug)
+    assert not success
+    assert 'before failing' in msg
+    assert len(posts) < 10
+    assert pipe.get_rowcount(debug=debug) == (len(posts) - 1) * 10
+
+    pipe.delete()
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_sync_pipe_retries_only_undelivered_chunks(flavor: str, monkeypatch):
+    """
+    Test that only chunks which could not reach the server are resent.
+    """
+    import meerschaum.config
+    from meerschaum.utils.packages import attempt_import
+    requests_exceptions = attempt_import('requests.exceptions')
+    conn = conns[flavor]
+    if conn.type != 'api':
+        return
+    pipe = Pipe('test', 'retry_uploads', 'foo', instance=conn)
+    _ = pipe.delete()
+    pipe = Pipe('test', 'retry_uploads', 'foo', columns={'id': 'id'}, instance=conn)
+    docs = [{'id': i, 'val': i} for i in range(10)]
+
+    get_config = meerschaum.config.get_config
+
+    def _get_config(*keys, **kwargs):
+        if keys == ('system', 'connectors', 'api', 'uploads'):
+            return {'workers': 1, 'retries': 2, 'retry_backoff_seconds': 0}
+        return get_config(*keys, **kwargs)
+
+    monkeypatch.setattr(meerschaum.config, 'get_config', _get_config)
+    post = conn.post
+    posts = []
+
+    def _post_timeout(*args, **kwargs):
+        posts.append(args)
+        raise requests_exceptions.ReadTimeout("Timed out waiting for the response.")
+
+    monkeypatch.setattr(conn, 'post', _post_timeout)
+    success, msg = conn.sync_pipe(pipe, docs, debug=debug)
+    assert not success
+    assert len(posts) == 1
+
+    posts.clear()
+
+    def _post_refused_once(*args, **kwargs):
+        posts.append(args)
+        if len(posts) == 1:
+            raise requests_exceptions.ConnectTimeout("Timed out connecting.")
+        return post(*args, **kwargs)
+
+    monkeypatch.setattr(conn, 'post', _post_refused_once)
+    success, msg = conn.sync_pipe(pipe, docs, debug=debug)
+    assert success, msg
+    assert len(posts) == 2
+    assert pipe.get_rowcount(debug=debug) == 10
+
+    pipe.delete()
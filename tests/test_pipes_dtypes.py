@@ -1318,3 +1318,66 @@ def test_date_inferred(flavor: str):
 
     df = pipe.get_data(debug=debug)
     assert 'date32' in str(df.dtypes['day'])
+
+
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_special_cols_schema_cache(flavor: str):
+    """
+    Test that special columns are resolved once per schema and re-detected for new schemas.
+    """
+    conn = conns[flavor]
+    pipe = Pipe('special', 'cols', 'cache', columns={'primary': 'id'}, instance=conn)
+    pipe.delete(debug=debug)
+    pipe = Pipe('special', 'cols', 'cache', columns={'primary': 'id'}, instance=conn)
+
+    success, msg = pipe.sync([{'id': 1, 'a': None}], debug=debug)
+    assert success, msg
+    assert not pipe._get_cached_value('schemas_special_cols')
+
+    success, msg = pipe.sync([{'id': 2, 'a': {'b': 1}}], debug=debug)
+    assert success, msg
+    assert pipe.dtypes.get('a') == 'json'
+    schemas_special_cols = dict(pipe._get_cached_value('schemas_special_cols'))
+    assert schemas_special_cols
+    assert all(cols == {'a': 'json'} for cols in schemas_special_cols.values())
+
+    success, msg = pipe.sync([{'id': 3, 'a': {'b': 2}}], debug=debug)
+    assert success, msg
+    assert pipe._get_cached_value('schemas_special_cols') == schemas_special_cols
+
+    success, msg = pipe.sync([{'id': 4, 'a': {'b': 3}, 'c': Decimal('1.1')}], debug=debug)
+    assert success, msg
+    assert pipe.dtypes.get('c') == 'numeric'
+    new_schemas_special_cols = pipe._get_cached_value('schemas_special_cols')
+    assert len(new_schemas_special_cols) > len(schemas_special_cols)
+    assert {'a': 'json', 'c': 'numeric'} in new_schemas_special_cols.values()
+
+    df = pipe.get_data(debug=debug)
+    assert len(df) == 4
+    assert df['a'][df['id'] == 4].iloc[0] == {'b': 3}
+
+    ### Object columns of the same schema may hold a new kind of value.
+    pd = mrsm.attempt_import('pandas')
+    assert pipe._get_special_cols(pd.DataFrame({'id': [5], 'd': ['foo']}), debug=debug) == {}
+    assert pipe._get_special_cols(
+        pd.DataFrame({'id': [6], 'd': [UUID('00000000-0000-0000-0000-000000000001')]}),
+        debug=debug,
+    ) == {'d': 'uuid'}
+    assert pipe._get_special_cols(
+        pd.DataFrame({'id': [7], 'd': [Decimal('1.1')]}),
+        debug=debug,
+    ) == {'d': 'numeric'}
+
+    ### Geometry types are detected from every value, so they are never cached.
+    if not mrsm.utils.packages.is_installed('shapely', venv=None):
+        return
+    shapely_geometry = mrsm.attempt_import('shapely.geometry', lazy=False)
+    point, line = shapely_geometry.Point(0, 0), shapely_geometry.LineString([(0, 0), (1, 1)])
+    assert pipe._get_special_cols(
+        pd.DataFrame({'id': [8, 9], 'g': [point, point]}),
+        debug=debug,
+    ) == {'g': 'geometry[Point]'}
+    assert pipe._get_special_cols(
+        pd.DataFrame({'id': [8, 9], 'g': [point, line]}),
+        debug=debug,
+    ) == {'g': 'geometry'}
@@ -8,6 +8,8 @@ Test SQL utility functions.
 
 import datetime
 import pytest
+import meerschaum as mrsm
+from tests import debug
 from tests.connectors import conns, get_flavors
 from meerschaum.connectors.sql import SQLConnector
 from meerschaum.connectors.sql.tools import dateadd_str, table_exists, sql_item_name
@@ -36,6 +38,45 @@ def test_dateadd_str(flavor: str):
     assert ((dt + td_advance) - dt_val) <= td_margin
 
 
+@pytest.mark.parametrize("flavor", get_flavors())
+@pytest.mark.parametrize("stream_results", [True, False])
+def test_read_chunks(flavor: str, stream_results: bool, monkeypatch):
+    """
+    Verify that chunked reads (streamed from server-side cursors or not) return every row,
+    and that an iterator which is never consumed does not hold a pooled connection.
+    """
+    conn = conns[flavor]
+    if conn.type != 'sql':
+        return
+    monkeypatch.setitem(conn._sys_config, 'stream_results', stream_results)
+    pipe = mrsm.Pipe('test', 'read_chunks', instance=conn)
+    pipe.delete()
+    pipe = mrsm.Pipe('test', 'read_chunks', instance=conn, columns={'id': 'id'})
+    success, msg = pipe.sync([{'id': i} for i in range(10)], debug=debug)
+    assert success, msg
+
+    schema = conn.get_pipe_schema(pipe)
+    pool = conn.engine.pool
+    checkedout = pool.checkedout() if hasattr(pool, 'checkedout') else None
+    chunks = conn.read(pipe.target, schema=schema, chunksize=3, as_iterator=True, debug=debug)
+    if checkedout is not None:
+        assert pool.checkedout() == checkedout
+    assert sorted(int(val) for chunk in chunks for val in chunk['id']) == list(range(10))
+
+    hook_results = conn.read(
+        pipe.target,
+        schema=schema,
+        chunksize=3,
+        chunk_hook=(lambda chunk, **kw: len(chunk)),
+        as_hook_results=True,
+        debug=debug,
+    )
+    assert sum(hook_results) == 10
+    if checkedout is not None:
+        assert pool.checkedout() == checkedout
+    pipe.delete()
+
+
 @pytest.mark.parametrize("flavor", get_flavors())
 def test_exists(flavor: str):
     conn = conns[flavor]
@@ -112,3 +153,52 @@ def test_parse_uri(uri: str, expected_attributes):
     Text that parsing a URI string returns the expected dictionary.
     """
     assert SQLConnector.parse_uri(uri) == expected_attributes
+
+
+def test_sync_inplace_duckdb(tmp_path):
+    """
+    Test that in-place syncs on DuckDB (which fall back to syncing through pandas) succeed.
+    """
+    pytest.importorskip('duckdb')
+    pytest.importorskip('duckdb_engine')
+    conn = mrsm.get_connector(
+        'sql', 'test_inplace_duckdb',
+        database=str(tmp_path / 'test_inplace.duckdb'),
+        flavor='duckdb',
+    )
+    pipe = mrsm.Pipe(
+        'test', 'duckdb', 'source',
+        instance=conn,
+        columns={'datetime': 'dt', 'id': 'id'},
+    )
+    pipe_table = sql_item_name(pipe.target, conn.flavor)
+    inplace_pipe = mrsm.Pipe(
+        conn, 'duckdb', 'inplace',
+        instance=conn,
+        columns=pipe.columns,
+        parameters={
+            'fetch': {
+                'definition': f"SELECT * FROM {pipe_table}",
+                'pipe': pipe.keys(),
+            },
+            'parents': [pipe.meta],
+        },
+    )
+    docs = [
+        {'dt': '2024-01-01', 'id': 1, 'val': 1.0},
+        {'dt': '2024-01-02', 'id': 2, 'val': 2.0},
+    ]
+    success, msg = pipe.sync(docs, debug=debug)
+    assert success, msg
+
+    success, msg = inplace_pipe.sync(debug=debug)
+    assert success, msg
+    assert inplace_pipe.get_rowcount(debug=debug) == 2
+
+    success, msg = pipe.sync([{'dt': '2024-01-02', 'id': 2, 'val': 3.0}], debug=debug)
+    assert success, msg
+    success, msg = inplace_pipe.sync(begin='2024-01-01', debug=debug)
+    assert success, msg
+    df = inplace_pipe.get_data(debug=debug)
+    assert len(df) == 2
+    assert df['val'].tolist() == [1.0, 3.0]
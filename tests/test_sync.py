@@ -286,6 +286,66 @@ def test_sync_generators(flavor: str):
     assert rowcount == num_docs
 
 
+@pytest.mark.parametrize("flavor", get_flavors())
+def test_sync_generators_pipeline(flavor: str):
+    """
+    Verify that chunk generators are synced through the staged pipeline
+    and that per-stage throughput is reported.
+    """
+    conn = conns[flavor]
+    pipe = Pipe(
+        'test_generators', 'pipeline',
+        instance=conn,
+        columns={'datetime': 'dt', 'id': 'id'},
+    )
+    pipe.delete()
+    start_time = datetime(2023, 1, 1)
+    num_chunks, chunk_len = 10, 5
+    generator = (
+        [
+            {'dt': start_time + timedelta(days=i), 'id': j, 'val': i * j}
+            for j in range(chunk_len)
+        ]
+        for i in range(num_chunks)
+    )
+    success, msg = pipe.sync(generator, workers=2, debug=debug)
+    assert success, msg
+    assert f"{num_chunks} succeeded, 0 failed" in msg
+    assert 'Stage throughput' in msg
+    assert pipe.get_rowcount() == num_chunks * chunk_len
+
+
+def test_chunks_pipeline_reports_stage_failures():
+    """
+    Verify that a chunk whose stage keeps raising is reported as a failure rather than dropped.
+    """
+    from meerschaum.core.Pipe._sync import _run_chunks_pipeline
+    attempts = {}
+
+    def _transform(chunk):
+        attempts[chunk] = attempts.get(chunk, 0) + 1
+        if chunk == 2 or (chunk == 3 and attempts[chunk] == 1):
+            raise ValueError(f"Bad chunk {chunk}.")
+        return chunk
+
+    results = []
+    _ = _run_chunks_pipeline(
+        iter(range(5)),
+        [
+            ('transform', _transform, 2),
+            ('sync', lambda chunk: (True, str(chunk)), 1),
+        ],
+        results.append,
+        max_attempts=2,
+    )
+    assert len(results) == 5
+    failures = [msg for success, msg in results if not success]
+    assert len(failures) == 1
+    assert 'Bad chunk 2.' in failures[0]
+    assert attempts[2] == 2
+    assert attempts[3] == 2
+
+
 @pytest.mark.parametrize("flavor", get_flavors())
 def test_add_new_columns(flavor: str):
     """
@@ -0,0 +1,127 @@
+#! /usr/bin/env python3
+# vim:fenc=utf-8
+
+"""
+Test the compression of HTTP bodies.
+"""
+
+from typing import List, Optional
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "header,supported_encodings,expected_encoding",
+    [
+        ('gzip, deflate', ['zstd', 'gzip'], 'gzip'),
+        ('gzip;q=0.5, zstd', ['zstd', 'gzip'], 'zstd'),
+        ('zstd;q=0, gzip', ['zstd', 'gzip'], 'gzip'),
+        ('br', ['zstd', 'gzip'], None),
+        ('*', ['gzip'], 'gzip'),
+        (None, ['zstd', 'gzip'], None),
+    ]
+)
+def test_choose_encoding(
+    header: Optional[str],
+    supported_encodings: List[str],
+    expected_encoding: Optional[str],
+):
+    """
+    Test that the preferred supported encoding is chosen from an `Accept-Encoding` header.
+    """
+    from meerschaum.utils.compression import choose_encoding
+    assert choose_encoding(header, supported_encodings) == expected_encoding
+
+
+@pytest.mark.parametrize('encoding', ['zstd', 'gzip'])
+def test_stream_compression_roundtrip(encoding: str):
+    """
+    Test that streamed bodies may be decompressed piece by piece.
+    """
+    from meerschaum.utils.compression import (
+        get_supported_encodings,
+        compress_bytes,
+        decompress_bytes,
+        compress_iterator,
+        StreamDecompressor,
+    )
+    if encoding not in get_supported_encodings():
+        return
+
+    data = b'{"dt": "2026-01-01", "id": 1, "val": 1.5}\n' * 1000
+    compressed = compress_bytes(data, encoding)
+    assert len(compressed) < len(data)
+    assert decompress_bytes(compressed, encoding) == data
+
+    pieces = [data[:500], data[500:].decode('utf-8'), b'']
+    compressed_pieces = list(compress_iterator(pieces, encoding))
+    decompressor = StreamDecompressor(encoding)
+    assert decompressor.decompress(compressed_pieces[0]) == data[:500]
+    remaining = b''.join(decompressor.decompress(piece) for piece in compressed_pieces[1:])
+    assert data[:500] + remaining + decompressor.flush() == data
+
+
+@pytest.mark.parametrize('encoding', ['zstd', 'gzip'])
+def test_stream_decompressor_max_size(encoding: str):
+    """
+    Test that a body which decompresses beyond `max_size` is rejected before it is inflated.
+    """
+    from meerschaum.utils.compression import (
+        get_supported_encodings,
+        compress_bytes,
+        StreamDecompressor,
+        DecompressedSizeExceeded,
+    )
+    if encoding not in get_supported_encodings():
+        return
+
+    data = b'\0' * (64 * 1024 * 1024)
+    compressed = compress_bytes(data, encoding)
+    assert len(compressed) < 1024 * 1024
+
+    decompressor = StreamDecompressor(encoding, max_size=len(data))
+    assert decompressor.decompress(compressed) + decompressor.flush() == data
+
+    decompressor = StreamDecompressor(encoding, max_size=1024 * 1024)
+    with pytest.raises(DecompressedSizeExceeded):
+        for i in range(0, len(compressed), 4096):
+            decompressor.decompress(compressed[i:(i + 4096)])
+        decompressor.flush()
+    assert decompressor.size < 64 * 1024 * 1024
+
+
+def test_compression_middleware_rejects_large_bodies():
+    """
+    Test that the API rejects request bodies which decompress beyond the limit with 413.
+    """
+    import asyncio
+    fastapi = pytest.importorskip('fastapi')
+    from meerschaum.api._compression import CompressionMiddleware
+    from meerschaum.utils.compression import compress_bytes
+
+    async def app(scope, receive, send):
+        more_body = True
+        while more_body:
+            message = await receive()
+            more_body = message.get('more_body', False)
+
+    compressed = compress_bytes(b'\0' * (16 * 1024 * 1024), 'gzip')
+    messages = [
+        {'type': 'http.request', 'body': compressed[:1024], 'more_body': True},
+        {'type': 'http.request', 'body': compressed[1024:], 'more_body': False},
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        pass
+
+    scope = {
+        'type': 'http',
+        'headers': [(b'content-encoding', b'gzip')],
+    }
+    middleware = CompressionMiddleware(app, max_decompressed_size=1024 * 1024)
+    with pytest.raises(fastapi.HTTPException) as exc_info:
+        asyncio.run(middleware(scope, receive, send))
+    assert exc_info.value.status_code == 413
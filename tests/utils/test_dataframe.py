@@ -114,6 +114,65 @@ def test_filter_unseen_df(old_docs, new_docs, expected_docs):
     assert delta_df.to_dict(orient='records') == expected_docs
 
 
+@pytest.mark.parametrize(
+    'old_docs,new_docs,on_cols,expected_new,expected_changed',
+    [
+        (
+            [{'id': 1, 'a': 1}, {'id': 2, 'a': 2}],
+            [{'id': 1, 'a': 1}, {'id': 2, 'a': 9}, {'id': 3, 'a': 3}],
+            ['id'],
+            [False, False, True],
+            [False, True, False],
+        ),
+        (
+            [{'id': 1, 'a': 1.0}],
+            [{'id': 1, 'a': 1}],
+            ['id'],
+            [False],
+            [False],
+        ),
+        (
+            [{'id': 1, 'a': {'x': 1, 'y': 2}}],
+            [{'id': 1, 'a': {'y': 2, 'x': 1}}],
+            ['id'],
+            [False],
+            [False],
+        ),
+        (
+            [{'dt': datetime(2025, 1, 1, tzinfo=timezone.utc), 'a': None}],
+            [{'dt': datetime(2025, 1, 1), 'a': None}],
+            ['dt'],
+            [False],
+            [False],
+        ),
+        (
+            [{'a': 'foo'}],
+            [{'a': 'foo'}, {'a': 'bar'}],
+            [],
+            [False, True],
+            [False, False],
+        ),
+        (
+            [],
+            [{'id': 1, 'a': 1}],
+            ['id'],
+            [True],
+            [False],
+        ),
+    ]
+)
+def test_get_hash_diff_masks(old_docs, new_docs, on_cols, expected_new, expected_changed):
+    """
+    Test that rows are classified as new, changed, or unchanged by their hashes.
+    """
+    from meerschaum.utils.dataframe import get_hash_diff_masks
+    old_df = pd.DataFrame(old_docs, columns=list(new_docs[0]))
+    new_df = pd.DataFrame(new_docs)
+    new_mask, changed_mask = get_hash_diff_masks(old_df, new_df, on_cols=on_cols)
+    assert list(new_mask) == expected_new
+    assert list(changed_mask) == expected_changed
+
+
 @pytest.mark.parametrize(
     'df,expected_types,expected_tuples',
     [
@@ -147,3 +206,140 @@ def test_get_datetime_cols_types(df, expected_types, expected_tuples):
 
     dt_cols_tuples = get_datetime_cols(df, with_tz_precision=True)
     assert dt_cols_tuples == expected_tuples
+
+
+def test_parse_df_datetimes_fallback_cells():
+    """
+    Test that cells which fail ISO8601 parsing are parsed individually.
+    """
+    from meerschaum.utils.dataframe import parse_df_datetimes
+    docs = [
+        {'dt': '2024-01-01T00:00:00+00:00', 'val': 1},
+        {'dt': '2024-01-02 01:00:00-01:00', 'val': 2},
+        {'dt': 'Jan 3 2024 00:00', 'val': 3},
+        {'dt': None, 'val': 4},
+    ]
+    df = parse_df_datetimes(docs, dtypes={'dt': 'datetime'})
+    assert str(df['dt'].dtype) == MRSM_PD_DTYPES['datetime']
+    assert df['dt'][1] == datetime(2024, 1, 2, 2, 0, tzinfo=timezone.utc)
+    assert df['dt'][2] == datetime(2024, 1, 3, 0, 0, tzinfo=timezone.utc)
+    assert df['dt'].isna()[3]
+
+
+def test_parse_df_datetimes_sample_size():
+    """
+    Test that datetime columns are detected from a sample of the rows.
+    """
+    from meerschaum.utils.dataframe import parse_df_datetimes
+    docs = [
+        {'dt': f'2024-01-01 00:00:{i % 60:02d}', 'label': f'2024-01-01 00:00:00 {i}'}
+        for i in range(100)
+    ]
+    ### Row 55 falls between the sampled rows.
+    docs[55]['label'] = 'foo'
+    df = parse_df_datetimes(docs, sample_size=10, ignore_cols=['label'])
+    assert str(df['dt'].dtype) == MRSM_PD_DTYPES['datetime']
+    assert 'datetime' not in str(df['label'].dtype)
+
+    mixed_df = parse_df_datetimes(docs, sample_size=10)
+    assert str(mixed_df['dt'].dtype) == MRSM_PD_DTYPES['datetime']
+    assert 'datetime' not in str(mixed_df['label'].dtype)
+    assert mixed_df['label'][0] == '2024-01-01 00:00:00 0'
+    assert mixed_df['label'][55] == 'foo'
+
+    naive_df = parse_df_datetimes(docs, sample_size=10, ignore_cols=['label'], coerce_utc=False)
+    assert 'datetime' in str(naive_df['dt'].dtype)
+    assert 'UTC' not in str(naive_df['dt'].dtype)
+
+
+def test_copy_df():
+    """
+    Test that modifying a frame from `copy_df()` does not modify the original frame.
+    """
+    from meerschaum.utils.dataframe import copy_df, enforce_dtypes
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['1', '2', '3']})
+    copied_df = copy_df(df)
+    copied_df.loc[0, 'a'] = 100
+    enforced_df = enforce_dtypes(copied_df, {'b': 'int'}, safe_copy=False)
+    assert df['a'][0] == 1
+    assert df['b'][0] == '1'
+    assert enforced_df['a'][0] == 100
+    assert enforced_df['b'][0] == 1
+
+
+def test_enforce_dtypes_arrow():
+    """
+    Test that Arrow-backed dtypes are enforced where a lossless equivalent exists.
+    """
+    from decimal import Decimal
+    from meerschaum.utils.dataframe import enforce_dtypes
+    from meerschaum.utils.dtypes import to_arrow_dtype, is_arrow_dtype
+    df = pd.DataFrame({
+        'name': ['a', 'b', None],
+        'price': ['1.005', '2.1', None],
+        'meta': ['{"a": 1}', None, '{"b": 2}'],
+    })
+    dtypes = {'name': 'str', 'price': 'numeric[10,2]', 'meta': 'json'}
+    price_dtype = to_arrow_dtype('numeric[10,2]')
+    enforced_df = enforce_dtypes(df, dtypes, arrow=True)
+    assert enforced_df['name'].dtype == pd.StringDtype('pyarrow')
+    assert is_arrow_dtype(enforced_df['name'].dtype)
+    assert enforced_df['price'].dtype == price_dtype
+    assert enforced_df['price'][0] == Decimal('1.01')
+    assert enforced_df['meta'][0] == {'a': 1}
+
+    reenforced_df = enforce_dtypes(enforced_df, dtypes, arrow=True)
+    assert reenforced_df['name'].dtype == pd.StringDtype('pyarrow')
+    assert reenforced_df['price'].dtype == price_dtype
+
+
+def test_polars_anti_join_mask_matches_merge():
+    """
+    Test that the Polars anti-join flags the same rows as `filter_unseen_df()`'s merge.
+    """
+    from meerschaum.utils.dataframe import get_polars_anti_join_mask, filter_unseen_df
+    _ = attempt_import('polars', lazy=False)
+    old_df = pd.DataFrame({'id': [1, 2, None], 'val': ['a', 'b', 'c']})
+    new_df = pd.DataFrame({'id': [1, 2, None, 4], 'val': ['a', 'x', 'c', 'd']})
+
+    mask = get_polars_anti_join_mask(new_df, old_df)
+    assert list(mask) == [False, True, False, True]
+    assert list(get_polars_anti_join_mask(new_df, old_df, on_cols=['id'])) == [
+        False, False, False, True,
+    ]
+
+    pandas_delta_df = filter_unseen_df(old_df, new_df, diff_backend='pandas')
+    polars_delta_df = filter_unseen_df(old_df, new_df, diff_backend='polars')
+    assert pandas_delta_df.to_dict(orient='records') == polars_delta_df.to_dict(orient='records')
+
+
+@pytest.mark.parametrize('data_format', ['arrow', 'parquet'])
+def test_df_bytes_roundtrip(data_format: str):
+    """
+    Test that DataFrames survive the binary wire formats of the pipes data API.
+    """
+    import json
+    import uuid
+    from decimal import Decimal
+    from meerschaum.utils.dataframe import df_to_bytes, df_from_bytes
+    _ = attempt_import('pyarrow', lazy=False)
+    uuid_val = uuid.uuid4()
+    df = pd.DataFrame({
+        'dt': [datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 2, tzinfo=timezone.utc)],
+        'id': pd.Series([1, None], dtype='Int64'),
+        'num': [Decimal('1.1'), Decimal('2.2')],
+        'uuid': [uuid_val, None],
+        'meta': [{'a': 1}, None],
+    })
+    data = df_to_bytes(df, data_format=data_format)
+    assert isinstance(data, bytes)
+
+    roundtrip_df = df_from_bytes(data, data_format=data_format)
+    assert list(roundtrip_df.columns) == list(df.columns)
+    assert str(roundtrip_df['id'].dtype) == 'Int64'
+    assert roundtrip_df['id'][0] == 1
+    assert pd.isna(roundtrip_df['id'][1])
+    assert roundtrip_df['dt'][1] == df['dt'][1]
+    assert roundtrip_df['num'][0] == Decimal('1.1')
+    assert roundtrip_df['uuid'][0] == str(uuid_val)
+    assert json.loads(roundtrip_df['meta'][0]) == {'a': 1}
@@ -22,6 +22,15 @@ from meerschaum.utils.dtypes import (
     attempt_cast_to_geometry,
     get_next_precision_unit,
     datetime_to_int,
+    attempt_cast_to_numeric,
+    attempt_cast_to_uuid,
+    attempt_cast_to_bytes,
+    cast_series_to_numeric,
+    cast_series_to_uuid,
+    cast_series_to_bytes,
+    cast_series_to_json,
+    to_arrow_dtype,
+    is_arrow_dtype,
 )
 DEBUG: bool = True
 pd = import_pandas(debug=DEBUG)
@@ -47,6 +56,8 @@ shapely = mrsm.attempt_import('shapely')
         ('bytes', 'object', True),
         ('numeric', 'decimal', True),
         ('decimal[28,10]', 'numeric[28,10]', True),
+        ('decimal128(10, 2)[pyarrow]', 'numeric[10,2]', True),
+        ('string[pyarrow]', 'str', True),
     ]
 )
 def test_are_dtypes_equal(ldtype: str, rdtype: str, are_equal: bool):
@@ -305,3 +316,94 @@ def test_datetime_to_int_invalid_precision():
     """
     with pytest.raises(ValueError):
         datetime_to_int(datetime(2026, 5, 30, tzinfo=timezone.utc), 'invalid_precision')
+
+
+@pytest.mark.parametrize(
+    'values,cast_func,fallback_func',
+    [
+        (['1.5', '2', None, 'nan', ''], cast_series_to_numeric, attempt_cast_to_numeric),
+        ([1.5, None, 3.0], cast_series_to_numeric, attempt_cast_to_numeric),
+        ([Decimal('1.2'), None], cast_series_to_numeric, attempt_cast_to_numeric),
+        (['abc', '1'], cast_series_to_numeric, attempt_cast_to_numeric),
+        (['a3a49a82-3c8e-4e8c-9e1c-6d6b4f9a3a01', None, ''], cast_series_to_uuid, attempt_cast_to_uuid),
+        (['not-a-uuid', 'a3a49a82-3c8e-4e8c-9e1c-6d6b4f9a3a01'], cast_series_to_uuid, attempt_cast_to_uuid),
+        (['\\x666f6f', 'Zm9v', None, ''], cast_series_to_bytes, attempt_cast_to_bytes),
+        ([b'foo', None], cast_series_to_bytes, attempt_cast_to_bytes),
+    ]
+)
+def test_cast_series_matches_per_element(values, cast_func, fallback_func):
+    """
+    Test that the vectorized casts produce the same values as the per-element functions.
+    """
+    series = pd.Series(values, dtype=object)
+    assert [str(val) for val in cast_func(series)] == [
+        str(val) for val in series.apply(fallback_func)
+    ]
+
+
+def test_cast_series_to_numeric_quantize():
+    """
+    Test that vectorized numeric casts are quantized to the precision and scale.
+    """
+    series = pd.Series(['1.005', 2, None], dtype=object)
+    assert list(cast_series_to_numeric(series, quantize=True, precision=10, scale=2))[:2] == [
+        Decimal('1.01'),
+        Decimal('2.00'),
+    ]
+
+
+def test_cast_series_to_uuid_from_bytes():
+    """
+    Test that 16-byte values are parsed as UUIDs.
+    """
+    uuid_val = UUID('a3a49a82-3c8e-4e8c-9e1c-6d6b4f9a3a01')
+    assert list(cast_series_to_uuid(pd.Series([uuid_val.bytes, None]))) == [uuid_val, None]
+
+
+def test_cast_series_to_json():
+    """
+    Test that only the JSON strings of a series are decoded.
+    """
+    series = pd.Series(['{"a": 1}', '[1, 2]', {'b': 2}, None], dtype=object)
+    assert list(cast_series_to_json(series)) == [{'a': 1}, [1, 2], {'b': 2}, None]
+
+
+@pytest.mark.parametrize(
+    'dtype,expected_arrow_dtype',
+    [
+        ('str', 'string[pyarrow]'),
+        ('string', 'string[pyarrow]'),
+        ('numeric[10,2]', 'decimal128(10, 2)[pyarrow]'),
+        ('numeric', None),
+        ('numeric[50,2]', None),
+        ('json', None),
+        ('uuid', None),
+        ('int', None),
+    ]
+)
+def test_to_arrow_dtype(dtype: str, expected_arrow_dtype):
+    """
+    Test that Meerschaum dtypes map to Arrow-backed dtypes only where lossless.
+    """
+    arrow_dtype = to_arrow_dtype(dtype)
+    assert (str(arrow_dtype) if arrow_dtype is not None else None) == expected_arrow_dtype
+
+
+@pytest.mark.parametrize(
+    'dtype,expected',
+    [
+        ('string[pyarrow]', True),
+        ('int64[pyarrow]', True),
+        ('object', False),
+        ('string[python]', False),
+        ('datetime64[ns, UTC]', False),
+        ('not a dtype', False),
+    ]
+)
+def test_is_arrow_dtype(dtype: str, expected: bool):
+    """
+    Test that Arrow-backed dtypes are detected from dtype objects rather than their strings.
+    """
+    assert is_arrow_dtype(dtype) == expected
+    if expected:
+        assert is_arrow_dtype(pd.api.types.pandas_dtype(dtype))
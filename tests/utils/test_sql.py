@@ -10,9 +10,11 @@ from typing import Dict, List, Any, Tuple
 import pytest
 from meerschaum.utils.sql import (
     build_where,
+    build_keyset_where,
     clean,
     dateadd_str,
     get_pd_type,
+    get_params_shape,
 )
 from meerschaum.utils.dtypes.sql import get_numeric_precision_scale
 import meerschaum as mrsm
@@ -237,3 +239,271 @@ def test_build_where_escapes_values(injection_params: Dict[str, Any]):
     raw_value = list(injection_params.values())[0]
     # Either aborted entirely or the raw unescaped value is absent
     assert result == '' or raw_value not in result
+
+
+def test_adaptive_chunksize_aimd():
+    """
+    The adaptive chunksize grows additively while throughput holds up,
+    halves when it drops, and stays within its bounds.
+    """
+    from meerschaum.connectors.sql._chunksize import AdaptiveChunksize
+    controller = AdaptiveChunksize(
+        chunksize=1000,
+        min_chunksize=500,
+        max_chunksize=1200,
+        step=100,
+        tolerance=0.1,
+    )
+    assert controller.update(1000, 1.0) == 1100
+    assert controller.update(1100, 1.0) == 1200
+    assert controller.update(1200, 1.0) == 1200
+    assert controller.update(1200, 10.0) == 600
+    assert controller.update(600, 0.0, success=False) == 500
+
+    ### Trailing partial batches do not move the chunksize.
+    assert controller.update(10, 100.0) == 500
+
+    restored = AdaptiveChunksize.from_dict(controller.to_dict(), min_chunksize=1, step=1)
+    assert restored.chunksize == 500
+    assert restored.rows_per_sec == controller.rows_per_sec
+
+    capped = AdaptiveChunksize(chunksize=1000, min_chunksize=10, max_batch_bytes=1000)
+    assert capped.get_batch_size(row_bytes=100) == 10
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('0', (0, 0, 0x0000, 0, ())),
+        ('0.5', (1, -1, 0x0000, 1, (5000,))),
+        ('0.001', (1, -1, 0x0000, 3, (10,))),
+        ('12345.678', (3, 1, 0x0000, 3, (1, 2345, 6780))),
+        ('-100000000', (1, 2, 0x4000, 0, (1,))),
+        ('1E+5', (1, 1, 0x0000, 0, (10,))),
+    ]
+)
+def test_encode_pg_numeric(value: str, expected: Tuple[int, int, int, int, Tuple[int, ...]]):
+    """
+    Decimals are encoded into PostgreSQL's binary NUMERIC format (base-10000 digits).
+    """
+    import struct
+    from meerschaum.connectors.sql._copy import _encode_pg_numeric
+    encoded = _encode_pg_numeric(value)
+    ndigits, weight, sign, dscale = struct.unpack('>hhHH', encoded[:8])
+    digits = struct.unpack(f'>{ndigits}H', encoded[8:])
+    assert (ndigits, weight, sign, dscale, digits) == expected
+
+
+def test_encode_pg_binary_copy():
+    """
+    Binary COPY tuples carry each row's field count and each field's length and payload,
+    with a length of -1 for nulls.
+    """
+    import struct
+    import uuid
+    from datetime import datetime, timezone
+    from meerschaum.connectors.sql._copy import (
+        iterate_pg_binary_copy,
+        PG_BINARY_COPY_HEADER,
+        PG_BINARY_COPY_TRAILER,
+        PG_EPOCH_MICROSECONDS,
+    )
+    pd = mrsm.attempt_import('pandas')
+    uuid_val = uuid.uuid4()
+    df = pd.DataFrame({
+        'dt': [datetime(2024, 1, 1, tzinfo=timezone.utc), None],
+        'id': pd.Series([1, None], dtype='Int64'),
+        'name': ['a\0b', None],
+        'uuid': [uuid_val, None],
+        'meta': [{'a': 1}, None],
+    })
+    cols_types = {
+        'dt': 'timestamptz',
+        'id': 'int4',
+        'name': 'text',
+        'uuid': 'uuid',
+        'meta': 'jsonb',
+    }
+    buffers = list(iterate_pg_binary_copy(df, list(df.columns), cols_types, block_size=1))
+    assert buffers[0] == PG_BINARY_COPY_HEADER
+    assert buffers[-1] == PG_BINARY_COPY_TRAILER
+    assert len(buffers) == 4
+
+    expected_dt = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp() * 1_000_000)
+    assert buffers[1] == (
+        struct.pack('>h', 5)
+        + struct.pack('>iq', 8, expected_dt - PG_EPOCH_MICROSECONDS)
+        + struct.pack('>ii', 4, 1)
+        + struct.pack('>i', 2) + b'ab'
+        + struct.pack('>i', 16) + uuid_val.bytes
+        + struct.pack('>i', 9) + b'\x01{"a": 1}'
+    )
+    assert buffers[2] == struct.pack('>h', 5) + (struct.pack('>i', -1) * 5)
+
+
+@pytest.mark.parametrize(
+    'values,typ',
+    [
+        ([1, 2_147_483_648], 'int4'),
+        ([1, -32_769], 'int2'),
+        ([1.0, 2.5], 'int8'),
+        ([1.0, 2.0 ** 63], 'int8'),
+    ]
+)
+def test_encode_pg_binary_copy_rejects_invalid_ints(values: List[Any], typ: str):
+    """
+    Integers which do not fit the column's type fall back to the CSV COPY
+    instead of being wrapped or truncated.
+    """
+    from meerschaum.connectors.sql._copy import iterate_pg_binary_copy, BinaryCopyUnsupported
+    pd = mrsm.attempt_import('pandas')
+    df = pd.DataFrame({'id': values})
+    with pytest.raises(BinaryCopyUnsupported):
+        iterate_pg_binary_copy(df, ['id'], {'id': typ})
+
+
+def test_duckdb_native_read_write(tmp_path):
+    """
+    DuckDB writes by registering the frame and reads natively into Arrow.
+    """
+    pytest.importorskip('duckdb')
+    pytest.importorskip('duckdb_engine')
+    pytest.importorskip('pyarrow')
+    pd = mrsm.attempt_import('pandas')
+    conn = mrsm.get_connector(
+        'sql', 'test_duckdb_native',
+        flavor='duckdb',
+        database=str(tmp_path / 'native.duckdb'),
+    )
+    df = pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', None]})
+    stats = conn.to_sql(df, name='native_test', if_exists='replace', as_dict=True)
+    assert stats['success'], stats['msg']
+    assert 'duckdb_insert_register' in stats['method']
+
+    read_df = conn.read('native_test')
+    assert read_df['id'].tolist() == [1, 2, 3]
+    assert read_df['name'].isna().tolist() == [False, False, True]
+
+    arrow_df = conn.read('SELECT * FROM native_test ORDER BY id', arrow=True)
+    assert 'pyarrow' in str(arrow_df.dtypes['id'])
+
+    chunks = conn.read('native_test', as_chunks=True)
+    assert len(chunks) == 1 and len(chunks[0]) == 3
+
+
+@pytest.mark.parametrize(
+    'params',
+    [
+        {'a': 1},
+        {'a': '_1', 'b': None, 'c': '_None'},
+        {'a': [1, '_2', None, '_None'], 'b': {'x': "it's"}},
+    ]
+)
+def test_build_where_bind_params(params: Dict[str, Any]):
+    """
+    Test that the bound `WHERE` clause depends only on the shape of the params.
+    """
+    bind_params = {}
+    where = build_where(params, flavor='postgresql', bind_params=bind_params)
+    assert "'" not in where
+
+    shape_bind_params = {}
+    shape = get_params_shape(params, bind_params=shape_bind_params)
+    assert shape_bind_params == bind_params
+
+    assert get_params_shape(params) == shape
+
+    unbound_where = build_where(params, flavor='postgresql')
+    for name, value in bind_params.items():
+        unbound_where = unbound_where.replace("'" + value.replace("'", "''") + "'", f":{name}", 1)
+    assert unbound_where == where
+
+
+def test_metered_poolclass():
+    """
+    The metered pool class records every checkout and survives recreating the pool.
+    """
+    import sqlite3
+    from sqlalchemy.pool import QueuePool
+    from meerschaum.connectors.sql._pool import PoolMetrics, get_metered_poolclass
+    metrics = PoolMetrics(smoothing=0.5)
+    poolclass = get_metered_poolclass(QueuePool, metrics)
+    pool = poolclass(lambda: sqlite3.connect(':memory:'), pool_size=1, max_overflow=0)
+    for _ in range(3):
+        connection = pool.connect()
+        connection.close()
+
+    stats = metrics.get_stats()
+    assert stats['checkouts'] == 3
+    assert stats['failures'] == 0
+    assert stats['max_wait_seconds'] >= stats['mean_wait_seconds'] >= 0
+
+    recreated_pool = pool.recreate()
+    assert isinstance(recreated_pool, poolclass)
+    recreated_pool.connect().close()
+    assert metrics.get_stats()['checkouts'] == 4
+
+    metrics.update(1.0)
+    assert metrics.get_stats()['wait_seconds'] >= 0.5
+
+
+@pytest.mark.parametrize(
+    'keys,flavor,order,expected',
+    [
+        (
+            [('id', 1), ('name', 'a')],
+            'sqlite',
+            'asc',
+            "\"id\" >= 1 AND (\"id\" > 1 OR (\"id\" = 1 AND \"name\" > 'a'))",
+        ),
+        (
+            [('id', 1), ('name', 'a')],
+            'mssql',
+            'desc',
+            (
+                "([id] < 1 OR [id] IS NULL OR ([id] = 1 AND "
+                "([name] < 'a' OR [name] IS NULL)))"
+            ),
+        ),
+        (
+            [('id', 1), ('name', None)],
+            'sqlite',
+            'asc',
+            "\"id\" >= 1 AND (\"id\" > 1 OR (\"id\" = 1 AND \"name\" IS NOT NULL))",
+        ),
+        (
+            [('id', 1), ('name', None)],
+            'postgresql',
+            'asc',
+            "(\"id\" > 1 OR \"id\" IS NULL)",
+        ),
+        (
+            [('id', None)],
+            'duckdb',
+            'asc',
+            "1 = 0",
+        ),
+        ([], 'postgresql', 'asc', ''),
+    ]
+)
+def test_build_keyset_where(keys: List[Tuple[str, Any]], flavor: str, order: str, expected: str):
+    """
+    Test that keyset conditions follow each flavor's ordering of nulls.
+    """
+    assert build_keyset_where(keys, flavor=flavor, order=order) == expected
+
+
+def test_build_keyset_where_sqlite_datetime():
+    """
+    Test that SQLite datetime bounds match the stored text so the boundary rows are excluded.
+    """
+    from datetime import datetime, timezone
+    boundary = "'2024-01-01 02:00:00.000000'"
+    where = build_keyset_where(
+        [('dt', datetime(2024, 1, 1, 2, tzinfo=timezone.utc)), ('id', 0)],
+        flavor='sqlite',
+        datetime_column='dt',
+    )
+    assert where == (
+        f"\"dt\" >= {boundary} AND (\"dt\" > {boundary} OR (\"dt\" = {boundary} AND \"id\" > 0))"
+    )